@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Rebuild analytics rollups from existing data.
+
+Run once per workspace that predates the analytics rollup stream
+consumer (or to repair drift). Rollups are replaced, so run it while the
+workspace is quiet: stream updates that land mid-rebuild can be lost.
+
+Usage:
+    python scripts/backfill_analytics_rollups.py --stage dev ws-123 ws-456
+"""
+
+import argparse
+import os
+import sys
+
+# Add the shared layer to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "layers", "shared", "python"))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Rebuild analytics rollups")
+    parser.add_argument("workspace_ids", nargs="+", help="Workspaces to rebuild")
+    parser.add_argument("--stage", default="dev", help="Deployment stage")
+    args = parser.parse_args()
+
+    os.environ["TABLE_NAME"] = f"complens-{args.stage}"
+
+    from complens.services.analytics_rollups import rebuild_workspace_rollups
+
+    for workspace_id in args.workspace_ids:
+        totals = rebuild_workspace_rollups(workspace_id)
+        print(f"{workspace_id}: {totals.counts()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark DynamoDB item deserialization for common models.
+
+Compares the schema-driven BaseModel.from_dynamodb against the previous
+generic deserializer, which tried datetime parsing on every string.
+
+Usage:
+    python scripts/benchmark_deserialization.py --iterations 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+# Add the shared layer to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "layers", "shared", "python"))
+
+from complens.models.contact import Contact
+from complens.models.page import Page, PageBlock
+from complens.models.workflow import Workflow, WorkflowEdge
+from complens.models.workflow_node import WorkflowNode
+
+
+def legacy_deserialize(value: Any) -> Any:
+    """Previous generic deserializer (datetime parse attempt per string)."""
+    if isinstance(value, dict):
+        return {k: legacy_deserialize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [legacy_deserialize(item) for item in value]
+    if isinstance(value, Decimal):
+        if value % 1 == 0:
+            return int(value)
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    return value
+
+
+def sample_items() -> dict[str, tuple[type, dict]]:
+    """Build representative DynamoDB items for each model."""
+    contact = Contact(
+        workspace_id="ws-bench",
+        email="jane@example.com",
+        first_name="Jane",
+        last_name="Doe",
+        phone="+15555550100",
+        tags=["lead", "newsletter", "vip"],
+        custom_fields={f"field_{i}": f"value {i}" for i in range(20)},
+    )
+
+    page = Page(
+        workspace_id="ws-bench",
+        name="Landing",
+        slug="landing",
+        headline="Grow your business",
+        blocks=[
+            PageBlock(
+                type="features",
+                order=i,
+                config={
+                    "title": f"Feature {i}",
+                    "items": [
+                        {"title": f"Item {j}", "description": "Lorem ipsum dolor sit amet " * 4}
+                        for j in range(3)
+                    ],
+                },
+            )
+            for i in range(100)
+        ],
+    )
+
+    nodes = [WorkflowNode(id="n0", node_type="trigger_tag_added", data={"config": {"tag_name": "vip"}})]
+    nodes += [
+        WorkflowNode(
+            id=f"n{i}",
+            node_type="action_send_email",
+            position={"x": i * 120.5, "y": 40.25},
+            data={"label": f"Email {i}", "config": {"email_subject": "Hi", "email_body": "Hello {{contact.first_name}}"}},
+        )
+        for i in range(1, 30)
+    ]
+    workflow = Workflow(
+        workspace_id="ws-bench",
+        name="Nurture",
+        nodes=nodes,
+        edges=[WorkflowEdge(id=f"e{i}", source=f"n{i}", target=f"n{i + 1}") for i in range(29)],
+    )
+
+    return {
+        "Contact": (Contact, contact.to_dynamodb()),
+        "Page": (Page, page.to_dynamodb()),
+        "Workflow": (Workflow, workflow.to_dynamodb()),
+    }
+
+
+def items_per_second(fn, item: dict, iterations: int) -> float:
+    """Time a deserializer over repeated calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(item)
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark from_dynamodb")
+    parser.add_argument("--iterations", type=int, default=2000, help="Items per measurement")
+    args = parser.parse_args()
+
+    print(f"{'model':<10} {'before (items/s)':>18} {'after (items/s)':>18} {'speedup':>8}")
+    for name, (model_cls, item) in sample_items().items():
+        before = items_per_second(
+            lambda i, model_cls=model_cls: model_cls.model_validate(legacy_deserialize(i)),
+            item,
+            args.iterations,
+        )
+        after = items_per_second(model_cls.from_dynamodb, item, args.iterations)
+        print(f"{name:<10} {before:>18,.0f} {after:>18,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Simulate distributed fair scheduling across tenant tiers.
+
+Replays synthetic queue traffic (10k msgs/min by default, with one noisy
+free-tier tenant flooding the queue) through several FairScheduler
+"containers" sharing a moto-backed DynamoDB table. Containers take turns
+handling SQS-sized batches and release stale leases after each batch, as
+the sharded queue processor does.
+
+Reports, per tier, the throughput each tenant got against its token
+bucket allowance (burst plus refill), and DynamoDB round trips per
+message with per-message credits (lease of 1, released every batch)
+versus leased credits.
+
+Usage:
+    python scripts/benchmark_fair_scheduler.py --rate 10000 --minutes 2 --containers 8
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+from collections import Counter
+
+# Add the shared layer to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "layers", "shared", "python"))
+
+import boto3
+import structlog
+from moto import mock_aws
+
+from complens.queue.fair_scheduler import (
+    DEFAULT_LEASE_HOLD_SECONDS,
+    DEFAULT_LEASE_SIZE,
+    TIER_CREDITS,
+    FairScheduler,
+    TenantTier,
+)
+
+TABLE_NAME = "complens-scheduler-benchmark"
+
+# (tier, tenants, offered msgs/min per tenant)
+TENANT_MIX = [
+    (TenantTier.ENTERPRISE, 2, 1500),
+    (TenantTier.PROFESSIONAL, 5, 300),
+    (TenantTier.STARTER, 10, 100),
+    (TenantTier.FREE, 30, 20),
+]
+NOISY_TENANT = ("free-noisy", TenantTier.FREE)
+
+
+class Clock:
+    """Simulated time source shared by all containers."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def tenants(rate: int) -> list[tuple[str, TenantTier, float]]:
+    """Tenants with their offered load; the noisy tenant fills up to rate."""
+    mix = [
+        (f"{tier.value}-{i}", tier, per_minute)
+        for tier, count, per_minute in TENANT_MIX
+        for i in range(count)
+    ]
+    noisy = max(0, rate - sum(per_minute for _, _, per_minute in mix))
+    return mix + [(*NOISY_TENANT, noisy)]
+
+
+def traffic(mix, minutes: float, seed: int) -> list[tuple[float, str]]:
+    """Generate (offset seconds, workspace id) arrivals sorted by time."""
+    rng = random.Random(seed)
+    events = []
+    for workspace_id, _, per_minute in mix:
+        for _ in range(int(per_minute * minutes)):
+            events.append((rng.uniform(0, minutes * 60), workspace_id))
+    return sorted(events)
+
+
+def create_table():
+    """Create the credits table."""
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+    return dynamodb.create_table(
+        TableName=TABLE_NAME,
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "PK", "AttributeType": "S"},
+            {"AttributeName": "SK", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+def run(events, mix, containers: int, batch_size: int, lease_size: int, hold: float) -> dict:
+    """Replay traffic through containers sharing one table.
+
+    Returns:
+        Dict with allowed counts per tenant and remote calls.
+    """
+    tiers = {workspace_id: tier for workspace_id, tier, _ in mix}
+    with mock_aws():
+        table = create_table()
+        clock = Clock(1_700_000_000.0)
+        schedulers = [
+            FairScheduler(
+                use_dynamodb=True,
+                table=table,
+                lease_size=lease_size,
+                lease_hold_seconds=hold,
+                clock=clock,
+            )
+            for _ in range(containers)
+        ]
+
+        allowed: Counter[str] = Counter()
+        for batch_number, start in enumerate(range(0, len(events), batch_size)):
+            scheduler = schedulers[batch_number % containers]
+            for offset, workspace_id in events[start:start + batch_size]:
+                clock.now = 1_700_000_000.0 + offset
+                tier = tiers[workspace_id]
+                if scheduler.should_process(workspace_id, tier=tier).allowed:
+                    scheduler.consume_credit(workspace_id, tier=tier)
+                    allowed[workspace_id] += 1
+            scheduler.release_leases(max_hold=scheduler.lease_hold_seconds)
+        for scheduler in schedulers:
+            scheduler.release_leases()
+
+    return {
+        "allowed": allowed,
+        "remote_calls": sum(scheduler.remote_calls for scheduler in schedulers),
+    }
+
+
+def report_fairness(mix, allowed: Counter, minutes: float) -> None:
+    """Print per-tenant throughput by tier against the bucket allowance."""
+    print(f"{'tenant group':<14} {'tenants':>7} {'offered/min':>12} {'allowed/min':>12} "
+          f"{'allowance/min':>14} {'of allowance':>13}")
+    noisy = NOISY_TENANT[0]
+    groups = [(tier.value, tier) for tier, _, _ in TENANT_MIX] + [NOISY_TENANT]
+    for name, tier in groups:
+        members = [
+            (workspace_id, per_minute)
+            for workspace_id, member_tier, per_minute in mix
+            if member_tier == tier and (workspace_id == noisy) == (name == noisy)
+        ]
+        offered = sum(per_minute for _, per_minute in members) / len(members)
+        got = sum(allowed[workspace_id] for workspace_id, _ in members) / len(members) / minutes
+        # A full bucket (one window of credits) plus the refill rate
+        allowance = min(offered, TIER_CREDITS[tier] * (1 + 1 / minutes))
+        print(f"{name:<14} {len(members):>7} {offered:>12,.0f} {got:>12,.1f} "
+              f"{allowance:>14,.0f} {got / allowance:>13.0%}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Simulate distributed fair scheduling")
+    parser.add_argument("--rate", type=int, default=10000, help="Messages per minute")
+    parser.add_argument("--minutes", type=float, default=2, help="Minutes of traffic")
+    parser.add_argument("--containers", type=int, default=8, help="Concurrent consumers")
+    parser.add_argument("--batch-size", type=int, default=10, help="SQS batch size")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Throttling is logged per message; keep the report readable
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        os.environ.setdefault(name, "testing")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+    mix = tenants(args.rate)
+    events = traffic(mix, args.minutes, args.seed)
+    print(f"{len(events):,} messages over {args.minutes:g} min, "
+          f"{args.containers} containers, batches of {args.batch_size}\n")
+
+    configs = {
+        "per-message": (1, 0.0),
+        "leased": (DEFAULT_LEASE_SIZE, DEFAULT_LEASE_HOLD_SECONDS),
+    }
+    results = {
+        name: run(events, mix, args.containers, args.batch_size, lease_size, hold)
+        for name, (lease_size, hold) in configs.items()
+    }
+
+    report_fairness(mix, results["leased"]["allowed"], args.minutes)
+
+    print(f"\n{'credits':<12} {'remote calls/msg':>17} {'admitted/min':>13}")
+    for name, result in results.items():
+        admitted = sum(result["allowed"].values()) / args.minutes
+        print(f"{name:<12} {result['remote_calls'] / len(events):>17.2f} {admitted:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
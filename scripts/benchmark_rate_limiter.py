@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark DynamoDB round trips made by the rate limiter modes.
+
+Replays the same synthetic traffic (a few heavy clients plus a long tail
+of one-off visitors, spread over several warm containers) through each
+RateLimiter mode against an in-memory table, and reports remote calls
+per 1,000 requests alongside how many requests each mode allowed.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py --requests 10000 --containers 4
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+
+# Add the shared layer to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "layers", "shared", "python"))
+
+import structlog
+from botocore.exceptions import ClientError
+
+from complens.utils.rate_limiter import RateLimiter, RateLimitMode
+
+
+class InMemoryTable:
+    """The subset of the DynamoDB Table API used by RateLimiter."""
+
+    def __init__(self):
+        self.items: dict[tuple[str, str], dict] = {}
+
+    def update_item(self, Key, ExpressionAttributeValues, **kwargs):
+        item = self.items.setdefault((Key["PK"], Key["SK"]), {**Key, "count": 0})
+        item["count"] += ExpressionAttributeValues[":inc"]
+        return {"Attributes": dict(item)}
+
+    def get_item(self, Key, **kwargs):
+        item = self.items.get((Key["PK"], Key["SK"]))
+        return {"Item": dict(item)} if item else {}
+
+    def put_item(self, Item, ExpressionAttributeValues=None, **kwargs):
+        current = self.items.get((Item["PK"], Item["SK"]))
+        expected = (ExpressionAttributeValues or {}).get(":version")
+        if (current is None) != (expected is None) or (
+            current is not None and current["version"] != expected
+        ):
+            raise ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException"}}, "PutItem"
+            )
+        self.items[(Item["PK"], Item["SK"])] = Item
+
+
+class Clock:
+    """Simulated time source shared by all containers."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def traffic(requests: int, duration: float, seed: int) -> list[tuple[float, str]]:
+    """Generate (offset seconds, client id) pairs sorted by time."""
+    rng = random.Random(seed)
+    heavy = [f"heavy-{i}" for i in range(5)]
+    events = []
+    for _ in range(requests):
+        client = rng.choice(heavy) if rng.random() < 0.3 else f"visitor-{rng.randrange(requests)}"
+        events.append((rng.uniform(0, duration), client))
+    return sorted(events)
+
+
+def run(mode: RateLimitMode, events, containers: int, per_minute: int, per_hour: int):
+    """Replay traffic through one mode.
+
+    Returns:
+        Tuple of (remote calls, allowed requests).
+    """
+    table = InMemoryTable()
+    clock = Clock(1_700_000_000.0)
+    limiters = [RateLimiter(mode=mode, table=table, clock=clock) for _ in range(containers)]
+
+    allowed = 0
+    for i, (offset, client) in enumerate(events):
+        clock.now = 1_700_000_000.0 + offset
+        if limiters[i % containers].check(client, "form_submit", per_minute, per_hour).allowed:
+            allowed += 1
+
+    return sum(limiter.remote_calls for limiter in limiters), allowed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark rate limiter round trips")
+    parser.add_argument("--requests", type=int, default=10000, help="Requests to replay")
+    parser.add_argument("--duration", type=float, default=600, help="Seconds of traffic")
+    parser.add_argument("--containers", type=int, default=4, help="Warm containers")
+    parser.add_argument("--per-minute", type=int, default=5, help="Requests per minute limit")
+    parser.add_argument("--per-hour", type=int, default=30, help="Requests per hour limit")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Denials are logged as warnings; keep the report readable
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    events = traffic(args.requests, args.duration, args.seed)
+
+    print(f"{'mode':<14} {'remote calls/1k':>16} {'allowed':>9}")
+    for mode in RateLimitMode:
+        calls, allowed = run(mode, events, args.containers, args.per_minute, args.per_hour)
+        print(f"{mode.value:<14} {calls * 1000 / len(events):>16,.0f} {allowed:>9,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Simulate shard batch dispatch for mixed-tier workloads.
+
+Replays synthetic traffic for one queue shard (2,500 msgs/min by default:
+tenants on every tier plus one free-tier tenant flooding the shard)
+through the sharded queue processor's admission logic, with simulated
+time and in-memory fair scheduling:
+
+- arrival: batches admitted grouped by workspace in arrival order, and
+  throttled messages failed back to the queue for the visibility timeout
+  (maxReceiveCount 3).
+- drr: batches ordered by tier-weighted deficit round-robin, and
+  throttled messages deferred with computed visibility delays
+  (maxReceiveCount 10).
+
+Reports per tier how many messages were started, start latency
+percentiles, receives per started message and dead-lettered messages.
+
+Usage:
+    python scripts/simulate_dispatch.py --rate 2500 --minutes 5 --drain 30
+"""
+
+import argparse
+import heapq
+import itertools
+import logging
+import os
+import random
+import statistics
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+# Add the shared layer to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "layers", "shared", "python"))
+
+import structlog
+
+from complens.queue.batch_processor import group_by
+from complens.queue.dispatch import DeferralSchedule, plan_dispatch
+from complens.queue.fair_scheduler import FairScheduler, TenantTier
+
+# (tier, tenants, offered msgs/min per tenant) for one shard
+TENANT_MIX = [
+    (TenantTier.ENTERPRISE, 1, 400),
+    (TenantTier.PROFESSIONAL, 3, 100),
+    (TenantTier.STARTER, 6, 40),
+    (TenantTier.FREE, 20, 8),
+]
+NOISY_TENANT = ("free-noisy", TenantTier.FREE)
+
+# Default visibility timeout of the shard queues (template.yaml)
+VISIBILITY_TIMEOUT = 300
+
+POLICIES = {
+    # name: (DRR + deferral, maxReceiveCount)
+    "arrival": (False, 3),
+    "drr": (True, 10),
+}
+
+
+@dataclass
+class Message:
+    """A simulated queue message."""
+
+    workspace_id: str
+    arrival: float
+    receives: int = 0
+    priority: str = "normal"
+
+
+class Clock:
+    """Simulated time source."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def tenants(rate: int) -> list[tuple[str, TenantTier, float]]:
+    """Tenants with their offered load; the noisy tenant fills up to rate."""
+    mix = [
+        (f"{tier.value}-{i}", tier, per_minute)
+        for tier, count, per_minute in TENANT_MIX
+        for i in range(count)
+    ]
+    noisy = max(0, rate - sum(per_minute for _, _, per_minute in mix))
+    return mix + [(*NOISY_TENANT, noisy)]
+
+
+def traffic(mix, minutes: float, seed: int) -> list[Message]:
+    """Generate messages sorted by arrival offset (seconds)."""
+    rng = random.Random(seed)
+    messages = [
+        Message(workspace_id=workspace_id, arrival=rng.uniform(0, minutes * 60))
+        for workspace_id, _, per_minute in mix
+        for _ in range(int(per_minute * minutes))
+    ]
+    return sorted(messages, key=lambda m: m.arrival)
+
+
+def run(policy: str, messages: list[Message], mix, args) -> dict:
+    """Replay traffic through one dispatch policy.
+
+    Returns:
+        Dict with start latencies and receive counts per tenant, and
+        dead-lettered and still-queued message counts.
+    """
+    use_drr, max_receives = POLICIES[policy]
+    tiers = {workspace_id: tier for workspace_id, tier, _ in mix}
+    clock = Clock(0.0)
+    scheduler = FairScheduler(refresh_interval=60, use_dynamodb=False, clock=clock)
+    deferrals = DeferralSchedule()
+
+    counter = itertools.count()
+    queue = [(m.arrival, next(counter), Message(m.workspace_id, m.arrival)) for m in messages]
+    heapq.heapify(queue)
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    receives: dict[str, list[int]] = defaultdict(list)
+    dead_lettered: dict[str, int] = defaultdict(int)
+    horizon = (args.minutes + args.drain) * 60
+
+    while queue and clock.now < horizon:
+        for _ in range(args.batches_per_second):
+            batch = []
+            while queue and queue[0][0] <= clock.now and len(batch) < args.batch_size:
+                message = heapq.heappop(queue)[2]
+                message.receives += 1
+                if message.receives > max_receives:
+                    dead_lettered[message.workspace_id] += 1
+                    continue
+                batch.append(message)
+            if not batch:
+                break
+
+            flows = group_by(batch, lambda m: m.workspace_id)
+            if use_drr:
+                plan = plan_dispatch(
+                    flows, scheduler, tiers, priority=lambda m: m.priority, deferrals=deferrals
+                )
+                admitted = [message for _, message in plan.admitted]
+                retries = [(message, delay) for _, message, delay in plan.deferred]
+            else:
+                admitted, retries = [], []
+                for workspace_id, group in flows.items():
+                    for message in group:
+                        tier = tiers[workspace_id]
+                        if scheduler.should_process(workspace_id, tier=tier).allowed:
+                            scheduler.consume_credit(workspace_id, tier=tier)
+                            admitted.append(message)
+                        else:
+                            retries.append((message, VISIBILITY_TIMEOUT))
+
+            # Step Functions starts run args.concurrency at a time, in dispatch order
+            for position, message in enumerate(admitted):
+                started = clock.now + (position // args.concurrency + 1) * args.start_seconds
+                latencies[message.workspace_id].append(started - message.arrival)
+                receives[message.workspace_id].append(message.receives)
+            for message, delay in retries:
+                heapq.heappush(queue, (clock.now + delay, next(counter), message))
+
+        clock.now += 1
+
+    return {
+        "latencies": latencies,
+        "receives": receives,
+        "dead_lettered": dead_lettered,
+        "queued": defaultdict(int, _count_by_workspace(entry[2] for entry in queue)),
+    }
+
+
+def _count_by_workspace(messages) -> dict[str, int]:
+    counts: dict[str, int] = defaultdict(int)
+    for message in messages:
+        counts[message.workspace_id] += 1
+    return counts
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def report(policy: str, result: dict, mix, minutes: float) -> None:
+    """Print per-tier outcomes for one policy."""
+    print(f"\n{policy}")
+    print(f"{'tenant group':<14} {'offered':>8} {'started':>8} {'p50 s':>7} {'p95 s':>7} "
+          f"{'recv/msg':>9} {'DLQ':>6} {'queued':>7}")
+    noisy = NOISY_TENANT[0]
+    groups = [(tier.value, tier) for tier, _, _ in TENANT_MIX] + [NOISY_TENANT]
+    for name, tier in groups:
+        members = [
+            (workspace_id, per_minute)
+            for workspace_id, member_tier, per_minute in mix
+            if member_tier == tier and (workspace_id == noisy) == (name == noisy)
+        ]
+        offered = int(sum(per_minute for _, per_minute in members) * minutes)
+        latencies = [v for ws, _ in members for v in result["latencies"][ws]]
+        receives = [v for ws, _ in members for v in result["receives"][ws]]
+        dead = sum(result["dead_lettered"][ws] for ws, _ in members)
+        queued = sum(result["queued"][ws] for ws, _ in members)
+        print(f"{name:<14} {offered:>8,} {len(latencies):>8,} "
+              f"{_percentile(latencies, 50):>7.1f} {_percentile(latencies, 95):>7.1f} "
+              f"{statistics.mean(receives) if receives else 0:>9.2f} {dead:>6,} {queued:>7,}")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Simulate shard batch dispatch")
+    parser.add_argument("--rate", type=int, default=2500, help="Messages per minute")
+    parser.add_argument("--minutes", type=float, default=5, help="Minutes of traffic")
+    parser.add_argument("--drain", type=float, default=30, help="Minutes simulated after traffic")
+    parser.add_argument("--batch-size", type=int, default=50, help="SQS batch size")
+    parser.add_argument("--batches-per-second", type=int, default=1, help="Invocations per second")
+    parser.add_argument("--concurrency", type=int, default=10, help="QUEUE_MAX_CONCURRENCY")
+    parser.add_argument("--start-seconds", type=float, default=0.1, help="Time per execution start")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Throttling is logged per message; keep the report readable
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR))
+
+    mix = tenants(args.rate)
+    messages = traffic(mix, args.minutes, args.seed)
+    print(f"{len(messages):,} messages over {args.minutes:g} min (+{args.drain:g} min drain), "
+          f"batches of {args.batch_size}, {args.batches_per_second}/s")
+
+    for policy in POLICIES:
+        report(policy, run(policy, messages, mix, args), mix, args.minutes)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ from complens.repositories.page import PageRepository
 from complens.repositories.workflow import WorkflowRepository
 from complens.repositories.workspace import WorkspaceRepository
 from complens.services.admin_service import AdminService
+from complens.services.feature_gate import invalidate_workspace_cache
 from complens.utils.auth import get_auth_context, require_super_admin
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import error, forbidden, not_found, success, validation_error
@@ -280,6 +281,7 @@ def update_workspace(workspace_id: str, event: dict) -> dict:
             setattr(workspace, field, body[field])
 
     ws_repo.update_workspace(workspace, check_version=False)
+    invalidate_workspace_cache(workspace_id)
 
     logger.info(
         "Workspace updated by admin",
@@ -6,7 +6,7 @@ Provides endpoints for:
 - Block content improvement
 - Image generation
 - Workflow generation from natural language
-- Page synthesis (unified synthesis engine)
+- Page synthesis (unified synthesis engine), synchronously or as a queued job
 """
 
 import base64
@@ -30,8 +30,10 @@ from complens.models.synthesis import (
     SynthesizePageRequest,
     SynthesizePlanRequest,
 )
+from complens.models.synthesis_job import SynthesisJob, SynthesisJobStatus
 from complens.repositories.business_profile import BusinessProfileRepository
-from complens.services import ai_service
+from complens.repositories.synthesis_job import SynthesisJobRepository
+from complens.services import ai_service, static_pages
 from complens.services.synthesis_engine import SynthesisEngine
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError
@@ -104,6 +106,8 @@ def handler(event: dict[str, Any], context: Any) -> dict:
         POST   /workspaces/{workspace_id}/ai/synthesize-page - Unified synthesis engine for complete page
         POST   /workspaces/{workspace_id}/ai/synthesize-page/plan - Plan phase (fast, 1 Haiku call)
         POST   /workspaces/{workspace_id}/ai/synthesize-page/generate - Generate phase (batch of ≤3 blocks)
+        POST   /workspaces/{workspace_id}/ai/synthesize-page/jobs - Queue a synthesis job
+        GET    /workspaces/{workspace_id}/ai/synthesize-page/jobs/{job_id} - Synthesis job status
     """
     try:
         http_method = event.get("httpMethod", "").upper()
@@ -163,6 +167,11 @@ def handler(event: dict[str, Any], context: Any) -> dict:
         elif "/ai/refine-page-content" in path and http_method == "POST":
             _check_ai_rate_limit(auth, workspace_id)
             return refine_page_content(workspace_id, event)
+        elif "/ai/synthesize-page/jobs/" in path and http_method == "GET":
+            return get_synthesis_job(workspace_id, path_params.get("job_id"))
+        elif "/ai/synthesize-page/jobs" in path and http_method == "POST":
+            _check_ai_rate_limit(auth, workspace_id)
+            return create_synthesis_job(workspace_id, event)
         elif "/ai/synthesize-page/plan" in path and http_method == "POST":
             _check_ai_rate_limit(auth, workspace_id)
             return synthesize_plan(workspace_id, event)
@@ -246,6 +255,7 @@ def update_business_profile(
             setattr(profile, field, value)
 
     profile = repo.update_profile(profile)
+    static_pages.republish_profile_pages(profile)
 
     logger.info(
         "Business profile updated",
@@ -291,6 +301,7 @@ def analyze_content_for_profile(
                     setattr(profile, field, value)
 
             profile = repo.update_profile(profile)
+            static_pages.republish_profile_pages(profile)
             return success({
                 "extracted": extracted,
                 "profile": profile.model_dump(mode="json"),
@@ -404,6 +415,7 @@ def submit_onboarding_answer(workspace_id: str, event: dict) -> dict:
     if mark_complete:
         profile.onboarding_completed = True
         profile = repo.update_profile(profile)
+        static_pages.republish_profile_pages(profile)
 
     return success({
         "profile": profile.model_dump(mode="json"),
@@ -926,6 +938,7 @@ def analyze_domain(workspace_id: str, event: dict) -> dict:
                         value=str(value)[:100],
                     )
             profile = repo.update_profile(profile)
+            static_pages.republish_profile_pages(profile)
 
             logger.info(
                 "Domain analysis auto-updated profile",
@@ -1211,3 +1224,58 @@ def synthesize_page(workspace_id: str, event: dict) -> dict:
     except Exception as e:
         logger.error("Page synthesis failed", error=str(e))
         return error(f"Page synthesis failed: {str(e)}", 500)
+
+
+def create_synthesis_job(workspace_id: str, event: dict) -> dict:
+    """Queue a page synthesis job on the AI processing queue.
+
+    Takes the same body as POST /ai/synthesize-page. The AI processor runs
+    the pipeline without the API Gateway timeout and broadcasts
+    synthesis_progress events to the workspace as each stage and block
+    batch completes; poll GET /ai/synthesize-page/jobs/{job_id} for the
+    saved progress and the final result.
+    """
+    try:
+        body = json.loads(event.get("body") or "{}")
+        request = SynthesizePageRequest.model_validate(body)
+    except PydanticValidationError as e:
+        return validation_error([
+            {"field": ".".join(str(x) for x in err["loc"]), "message": err["msg"]}
+            for err in e.errors()
+        ])
+    except json.JSONDecodeError:
+        return error("Invalid JSON body", 400)
+
+    job = SynthesisJob(workspace_id=workspace_id, request=request.model_dump(mode="json"))
+    jobs = SynthesisJobRepository()
+    job = jobs.create_job(job)
+
+    try:
+        boto3.client("sqs").send_message(
+            QueueUrl=os.environ["AI_QUEUE_URL"],
+            MessageBody=json.dumps({
+                "type": "synthesis_job",
+                "workspace_id": workspace_id,
+                "job_id": job.id,
+            }),
+        )
+    except Exception as e:
+        # Nothing will ever pick the job up, so don't leave it pending
+        logger.exception("Failed to queue synthesis job", job_id=job.id, workspace_id=workspace_id)
+        job.status = SynthesisJobStatus.FAILED
+        job.error_message = f"Failed to queue job: {e}"
+        jobs.update_job(job)
+        return error("Failed to queue synthesis job", 503)
+
+    logger.info("Synthesis job created", job_id=job.id, workspace_id=workspace_id)
+
+    return success(job.model_dump(mode="json"), 202)
+
+
+def get_synthesis_job(workspace_id: str, job_id: str) -> dict:
+    """Get the status, saved progress and result of a synthesis job."""
+    job = SynthesisJobRepository().get_by_id(workspace_id, job_id)
+    if not job:
+        return not_found("SynthesisJob", job_id)
+
+    return success(job.model_dump(mode="json"))
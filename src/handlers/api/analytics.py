@@ -5,6 +5,8 @@ from typing import Any
 
 import structlog
 
+from complens.models.analytics_rollup import AnalyticsRollup
+from complens.repositories.analytics_rollup import AnalyticsRollupRepository
 from complens.repositories.contact import ContactRepository
 from complens.repositories.form import FormRepository
 from complens.repositories.page import PageRepository
@@ -22,7 +24,6 @@ PERIODS = {
     "90d": 90,
 }
 
-
 def handler(event: dict[str, Any], context: Any) -> dict:
     """Handle analytics API requests.
 
@@ -57,7 +58,11 @@ def handler(event: dict[str, Any], context: Any) -> dict:
 
 
 def get_analytics(workspace_id: str, event: dict) -> dict:
-    """Get analytics data for a workspace."""
+    """Get analytics data for a workspace.
+
+    Time series and period totals come from the stream-maintained daily
+    rollups, so the cost is one item per day regardless of tenant size.
+    """
     query_params = event.get("queryStringParameters", {}) or {}
     period = query_params.get("period", "30d")
     include = query_params.get("include", "")
@@ -68,40 +73,38 @@ def get_analytics(workspace_id: str, event: dict) -> dict:
     include_sections = [s.strip() for s in include.split(",") if s.strip()]
 
     days = PERIODS[period]
-    now = datetime.now(timezone.utc)
-    start_date = now - timedelta(days=days)
+    today = datetime.now(timezone.utc).date()
+    dates = [(today - timedelta(days=days - 1 - i)).isoformat() for i in range(days)]
 
-    contact_repo = ContactRepository()
+    rollup_repo = AnalyticsRollupRepository()
     workflow_repo = WorkflowRepository()
-    run_repo = WorkflowRunRepository()
 
-    # Get contacts
     try:
-        contacts, _ = contact_repo.query(
-            pk=f"WS#{workspace_id}",
-            sk_begins_with="CONTACT#",
-            limit=1000,
-        )
+        rollups = {
+            r.period: r
+            for r in rollup_repo.list_days(workspace_id, today - timedelta(days=days - 1), today)
+        }
+        totals = rollup_repo.get_totals(workspace_id)
     except Exception as e:
-        logger.error("Failed to query contacts for analytics", workspace_id=workspace_id, error=str(e))
-        contacts = []
+        logger.error("Failed to query analytics rollups", workspace_id=workspace_id, error=str(e))
+        rollups, totals = {}, None
+
+    empty = AnalyticsRollup(workspace_id=workspace_id, period="")
+    daily = [rollups.get(day, empty) for day in dates]
 
     # Get workflows
     try:
-        workflows, _ = workflow_repo.list_by_workspace(workspace_id, limit=100)
+        workflows = list(workflow_repo.iter_query(pk=f"WS#{workspace_id}", sk_begins_with="WF#"))
     except Exception as e:
         logger.error("Failed to query workflows for analytics", workspace_id=workspace_id, error=str(e))
         workflows = []
 
-    # Contact growth - bucket by day
-    contact_growth = _bucket_by_day(contacts, days, start_date)
-
-    # Total contacts
-    total_contacts = len(contacts)
-    contacts_in_period = sum(
-        1 for c in contacts
-        if hasattr(c, 'created_at') and c.created_at >= start_date
-    )
+    # Contact growth
+    contact_growth = [
+        {"date": day, "count": rollup.contacts_created} for day, rollup in zip(dates, daily, strict=True)
+    ]
+    contacts_in_period = sum(r.contacts_created for r in daily)
+    total_contacts = max(0, totals.contacts_created - totals.contacts_deleted) if totals else 0
 
     # Workflow stats
     total_workflows = len(workflows)
@@ -135,28 +138,14 @@ def get_analytics(workspace_id: str, event: dict) -> dict:
     workflow_performance.sort(key=lambda x: x["total"], reverse=True)
     top_workflows = workflow_performance[:5]
 
-    # Build workflow runs time series from top 5 workflows by total_runs
-    all_runs = []
-    sorted_wfs = sorted(workflows, key=lambda w: getattr(w, "total_runs", 0) or 0, reverse=True)
-    for wf in sorted_wfs[:5]:
-        try:
-            runs = run_repo.list_by_workflow(wf.id, limit=200)
-            all_runs.extend(runs)
-        except Exception as e:
-            logger.error("Failed to query runs for time series", workflow_id=wf.id, error=str(e))
-
-    workflow_runs_by_day = _bucket_runs_by_day(all_runs, days, start_date)
+    workflow_runs_by_day = [
+        {"date": day, "success": rollup.runs_completed, "failed": rollup.runs_failed}
+        for day, rollup in zip(dates, daily, strict=True)
+    ]
 
     # Calculate trends
-    mid_point = start_date + timedelta(days=days // 2)
-    contacts_first_half = sum(
-        1 for c in contacts
-        if hasattr(c, 'created_at') and start_date <= c.created_at < mid_point
-    )
-    contacts_second_half = sum(
-        1 for c in contacts
-        if hasattr(c, 'created_at') and c.created_at >= mid_point
-    )
+    contacts_first_half = sum(r.contacts_created for r in daily[:days // 2])
+    contacts_second_half = sum(r.contacts_created for r in daily[days // 2:])
     contact_trend = _calc_trend(contacts_first_half, contacts_second_half)
 
     result = {
@@ -171,9 +160,22 @@ def get_analytics(workspace_id: str, event: dict) -> dict:
             "successful_runs": successful_runs,
             "failed_runs": failed_runs,
             "success_rate": round(successful_runs / total_runs * 100) if total_runs > 0 else 0,
+            "runs_in_period": sum(r.runs_started for r in daily),
+            "page_views_in_period": sum(r.page_views for r in daily),
+            "form_submissions_in_period": sum(r.form_submissions for r in daily),
+            "chat_sessions_in_period": sum(r.chat_sessions for r in daily),
         },
         "contact_growth": contact_growth,
         "workflow_runs": workflow_runs_by_day,
+        "engagement": [
+            {
+                "date": day,
+                "page_views": rollup.page_views,
+                "form_submissions": rollup.form_submissions,
+                "chat_sessions": rollup.chat_sessions,
+            }
+            for day, rollup in zip(dates, daily, strict=True)
+        ],
         "top_workflows": top_workflows,
     }
 
@@ -187,7 +189,7 @@ def get_analytics(workspace_id: str, event: dict) -> dict:
 
     # Recent activity
     if "activity" in include_sections:
-        result["recent_activity"] = _get_recent_activity(workspace_id, all_runs, contacts)
+        result["recent_activity"] = _get_recent_activity(workspace_id, workflows)
 
     return success(result)
 
@@ -204,7 +206,7 @@ def _get_page_analytics(workspace_id: str) -> dict:
     page_repo = PageRepository()
 
     try:
-        pages, _ = page_repo.list_by_workspace(workspace_id, limit=100)
+        pages = list(page_repo.iter_query(pk=f"WS#{workspace_id}", sk_begins_with="PAGE#"))
     except Exception:
         pages = []
 
@@ -262,7 +264,7 @@ def _get_form_analytics(workspace_id: str) -> dict:
     form_repo = FormRepository()
 
     try:
-        pages, _ = page_repo.list_by_workspace(workspace_id, limit=100)
+        pages = list(page_repo.iter_query(pk=f"WS#{workspace_id}", sk_begins_with="PAGE#"))
     except Exception:
         pages = []
 
@@ -270,7 +272,7 @@ def _get_form_analytics(workspace_id: str) -> dict:
 
     # Single query for all forms in workspace (1 query instead of N per-page queries)
     try:
-        forms, _ = form_repo.list_by_workspace(workspace_id, limit=500)
+        forms = list(form_repo.iter_query(pk=f"WS#{workspace_id}", sk_begins_with="FORM#"))
     except Exception:
         forms = []
 
@@ -306,51 +308,6 @@ def _get_status(entity) -> str:
     return status.value if hasattr(status, 'value') else str(status)
 
 
-def _bucket_by_day(items: list, days: int, start_date: datetime) -> list[dict]:
-    """Bucket items by day based on created_at."""
-    buckets: dict[str, int] = {}
-    now = datetime.now(timezone.utc)
-
-    for i in range(days):
-        day = start_date + timedelta(days=i)
-        if day <= now:
-            buckets[day.strftime("%Y-%m-%d")] = 0
-
-    for item in items:
-        if hasattr(item, 'created_at') and item.created_at >= start_date:
-            day_key = item.created_at.strftime("%Y-%m-%d")
-            if day_key in buckets:
-                buckets[day_key] += 1
-
-    return [{"date": k, "count": v} for k, v in sorted(buckets.items())]
-
-
-def _bucket_runs_by_day(runs: list, days: int, start_date: datetime) -> list[dict]:
-    """Bucket workflow runs by day with success/failure counts."""
-    buckets: dict[str, dict] = {}
-    now = datetime.now(timezone.utc)
-
-    for i in range(days):
-        day = start_date + timedelta(days=i)
-        if day <= now:
-            buckets[day.strftime("%Y-%m-%d")] = {"success": 0, "failed": 0}
-
-    for run in runs:
-        if hasattr(run, 'created_at') and run.created_at >= start_date:
-            day_key = run.created_at.strftime("%Y-%m-%d")
-            if day_key in buckets:
-                status = _get_status(run)
-                if status == "completed":
-                    buckets[day_key]["success"] += 1
-                elif status == "failed":
-                    buckets[day_key]["failed"] += 1
-
-    return [
-        {"date": k, "success": v["success"], "failed": v["failed"]}
-        for k, v in sorted(buckets.items())
-    ]
-
-
 def _calc_trend(first_half: int, second_half: int) -> float:
     """Calculate percentage trend between two periods."""
     if first_half == 0:
@@ -358,23 +315,32 @@ def _calc_trend(first_half: int, second_half: int) -> float:
     return round(((second_half - first_half) / first_half) * 100, 1)
 
 
-def _get_recent_activity(workspace_id: str, runs: list, contacts: list) -> list[dict]:
+def _get_recent_activity(workspace_id: str, workflows: list) -> list[dict]:
     """Get recent activity feed for the dashboard.
 
-    Combines workflow runs and new contacts into a unified activity feed.
+    Combines the latest runs of the busiest workflows and the newest
+    contacts into a unified activity feed.
 
     Args:
         workspace_id: Workspace ID.
-        runs: List of workflow runs.
-        contacts: List of contacts.
+        workflows: The workspace's workflows.
 
     Returns:
         List of recent activity items, sorted by timestamp descending.
     """
     activities = []
+    run_repo = WorkflowRunRepository()
+
+    runs = []
+    busiest = sorted(workflows, key=lambda w: getattr(w, "total_runs", 0) or 0, reverse=True)
+    for wf in busiest[:5]:
+        try:
+            runs.extend(run_repo.list_by_workflow(wf.id, limit=10))
+        except Exception as e:
+            logger.error("Failed to query runs for activity", workflow_id=wf.id, error=str(e))
 
     # Add workflow runs to activity feed
-    for run in runs[:50]:  # Limit to last 50
+    for run in runs:
         status = _get_status(run)
         status_map = {
             "completed": "success",
@@ -396,8 +362,16 @@ def _get_recent_activity(workspace_id: str, runs: list, contacts: list) -> list[
                 "link": f"/workflows/{getattr(run, 'workflow_id', '')}",
             })
 
-    # Add recent contacts
-    for contact in contacts[:20]:  # Limit to last 20
+    # Add newest contacts (IDs are ULIDs, so newest first by sort key)
+    try:
+        contacts, _ = ContactRepository().query(
+            pk=f"WS#{workspace_id}", sk_begins_with="CONTACT#", limit=20, scan_forward=False
+        )
+    except Exception as e:
+        logger.error("Failed to query contacts for activity", workspace_id=workspace_id, error=str(e))
+        contacts = []
+
+    for contact in contacts:
         created_at = getattr(contact, "created_at", None)
         if created_at:
             email = getattr(contact, "email", "") or "Unknown"
@@ -7,7 +7,8 @@ import structlog
 
 from complens.repositories.workspace import WorkspaceRepository
 from complens.services.billing_service import get_billing_service
-from complens.services.feature_gate import count_resources, get_usage_summary
+from complens.services.feature_gate import get_usage_summary
+from complens.services.resource_counters import get_resource_counts
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import error, forbidden, not_found, success, validation_error
@@ -72,40 +73,17 @@ def get_billing_status(workspace_id: str, auth: dict) -> dict:
     subscription_status = getattr(workspace, "subscription_status", None)
     stripe_customer_id = getattr(workspace, "stripe_customer_id", None)
 
-    # Get current usage counts using efficient DynamoDB COUNT queries
-    import boto3
-    import os
-
-    table_name = os.environ.get("TABLE_NAME", "complens-dev")
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(table_name)
-
-    try:
-        contact_count = count_resources(table, workspace_id, "CONTACT#")
-    except Exception:
-        contact_count = 0
-
-    try:
-        page_count = count_resources(table, workspace_id, "PAGE#")
-    except Exception:
-        page_count = 0
-
-    try:
-        workflow_count = count_resources(table, workspace_id, "WF#")
-    except Exception:
-        workflow_count = 0
-
+    # Current usage from the maintained resource counters (one GetItem)
     try:
-        site_count = count_resources(table, workspace_id, "SITE#")
+        resource_counts = get_resource_counts(workspace_id)
+        counts = {
+            "contacts": resource_counts.contacts,
+            "pages": resource_counts.pages,
+            "workflows": resource_counts.workflows,
+            "sites": resource_counts.sites,
+        }
     except Exception:
-        site_count = 0
-
-    counts = {
-        "contacts": contact_count,
-        "pages": page_count,
-        "workflows": workflow_count,
-        "sites": site_count,
-    }
+        counts = {"contacts": 0, "pages": 0, "workflows": 0, "sites": 0}
 
     usage = get_usage_summary(plan, counts)
 
@@ -4,21 +4,37 @@ import base64
 import csv
 import io
 import json
+import os
 from typing import Any
 
+import boto3
 import structlog
 from pydantic import ValidationError as PydanticValidationError
 
 from complens.models.contact import Contact, CreateContactRequest, UpdateContactRequest
+from complens.models.contact_export import (
+    ContactExport,
+    ContactExportStatus,
+    CreateContactExportRequest,
+)
+from complens.models.contact_import import ContactImport, CreateContactImportRequest
 from complens.models.contact_note import ContactNote, CreateContactNoteRequest, UpdateContactNoteRequest
 from complens.repositories.contact import ContactRepository
+from complens.repositories.contact_export import ContactExportRepository
+from complens.repositories.contact_import import ContactImportRepository
 from complens.repositories.contact_note import ContactNoteRepository
 from complens.repositories.workspace import WorkspaceRepository
-from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan, count_resources
+from complens.services.contact_export import EXPORT_FIELDNAMES, contact_to_csv_row
+from complens.services.contact_import import ContactImporter
+from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan
+from complens.services.resource_counters import get_resource_count
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import created, error, not_found, success, validation_error
 
+STAGE = os.environ.get("STAGE", "dev")
+CONTACT_FILES_BUCKET = os.environ.get("CONTACT_FILES_BUCKET", f"complens-{STAGE}-contact-files")
+
 logger = structlog.get_logger()
 
 
@@ -37,7 +53,11 @@ def handler(event: dict[str, Any], context: Any) -> dict:
         PUT    /workspaces/{workspace_id}/contacts/{contact_id}/notes/{note_id}
         DELETE /workspaces/{workspace_id}/contacts/{contact_id}/notes/{note_id}
         POST   /workspaces/{workspace_id}/contacts/import
+        POST   /workspaces/{workspace_id}/contacts/imports
+        GET    /workspaces/{workspace_id}/contacts/imports/{import_id}
         GET    /workspaces/{workspace_id}/contacts/export
+        POST   /workspaces/{workspace_id}/contacts/exports
+        GET    /workspaces/{workspace_id}/contacts/exports/{export_id}
     """
     try:
         http_method = event.get("httpMethod", "").upper()
@@ -83,6 +103,26 @@ def handler(event: dict[str, Any], context: Any) -> dict:
                 return import_contacts(repo, workspace_id, event)
             return error("Method not allowed", 405)
 
+        if resource.endswith("/imports"):
+            if http_method == "POST":
+                return create_import_job(repo, workspace_id, event)
+            return error("Method not allowed", 405)
+
+        if resource.endswith("/imports/{import_id}"):
+            if http_method == "GET":
+                return get_import_job(workspace_id, path_params.get("import_id"))
+            return error("Method not allowed", 405)
+
+        if resource.endswith("/exports"):
+            if http_method == "POST":
+                return create_export_job(workspace_id, event)
+            return error("Method not allowed", 405)
+
+        if resource.endswith("/exports/{export_id}"):
+            if http_method == "GET":
+                return get_export_job(workspace_id, path_params.get("export_id"))
+            return error("Method not allowed", 405)
+
         if resource.endswith("/export"):
             if http_method == "GET":
                 return export_contacts(repo, workspace_id)
@@ -184,7 +224,7 @@ def create_contact(
     """Create a new contact."""
     # Enforce plan limit for contacts
     plan = get_workspace_plan(workspace_id)
-    contact_count = count_resources(repo.table, workspace_id, "CONTACT#")
+    contact_count = get_resource_count(workspace_id, "contacts")
     enforce_limit(plan, "contacts", contact_count)
 
     try:
@@ -533,6 +573,9 @@ def import_contacts(
 ) -> dict:
     """Import contacts from CSV data.
 
+    Suitable for small files; large files should be uploaded through
+    an import job (POST /contacts/imports) and processed asynchronously.
+
     Expects JSON body with:
         csv_data: string - Raw CSV content
         mapping: dict - Column name -> contact field mapping
@@ -553,129 +596,151 @@ def import_contacts(
 
     # Enforce plan limit for contacts before import
     plan = get_workspace_plan(workspace_id)
-    contact_count = count_resources(repo.table, workspace_id, "CONTACT#")
+    contact_count = get_resource_count(workspace_id, "contacts")
     enforce_limit(plan, "contacts", contact_count)
 
-    reader = csv.DictReader(io.StringIO(csv_data))
-
-    imported = 0
-    skipped = 0
-    errors_list: list[dict] = []
-
-    def _sanitize_csv_value(value: str) -> str:
-        """Prefix CSV fields that start with formula characters to prevent injection."""
-        if value and value[0] in ("=", "+", "-", "@"):
-            return f"'{value}"
-        return value
-
-    for row_num, row in enumerate(reader, start=2):
-        try:
-            contact_data: dict[str, Any] = {}
-            custom_fields: dict[str, Any] = {}
-
-            for csv_col, contact_field in mapping.items():
-                value = _sanitize_csv_value(row.get(csv_col, "").strip())
-                if not value:
-                    continue
-
-                if contact_field in ("email", "phone", "first_name", "last_name", "source", "status"):
-                    contact_data[contact_field] = value
-                elif contact_field == "tags":
-                    contact_data["tags"] = [t.strip() for t in value.split(",") if t.strip()]
-                elif contact_field.startswith("custom_fields."):
-                    field_name = contact_field.replace("custom_fields.", "")
-                    custom_fields[field_name] = value
-                else:
-                    custom_fields[contact_field] = value
-
-            if custom_fields:
-                contact_data["custom_fields"] = custom_fields
-
-            # Must have email or phone
-            if not contact_data.get("email") and not contact_data.get("phone"):
-                skipped += 1
-                continue
-
-            # Dedup by email
-            if contact_data.get("email"):
-                existing = repo.get_by_email(workspace_id, contact_data["email"])
-                if existing:
-                    skipped += 1
-                    continue
-
-            contact = Contact(workspace_id=workspace_id, **contact_data)
-            repo.create_contact(contact)
-            imported += 1
-
-        except Exception as e:
-            errors_list.append({"row": row_num, "error": str(e)})
-
-    logger.info(
-        "Contacts imported",
-        workspace_id=workspace_id,
-        imported=imported,
-        skipped=skipped,
-        errors=len(errors_list),
-    )
+    importer = ContactImporter(workspace_id, mapping, repo=repo, existing_count=contact_count)
+    progress = importer.run(io.StringIO(csv_data))
 
     return success({
-        "imported": imported,
-        "skipped": skipped,
-        "errors": errors_list,
+        "imported": progress.imported,
+        "skipped": progress.skipped,
+        "errors": progress.errors,
     })
 
 
-def export_contacts(
+def create_import_job(
     repo: ContactRepository,
     workspace_id: str,
+    event: dict,
 ) -> dict:
-    """Export all contacts as CSV."""
-    all_contacts: list[Contact] = []
-    last_key = None
+    """Start an asynchronous contact import.
+
+    Returns a presigned URL for uploading the CSV. The upload triggers the
+    contact import worker, which reports progress over WebSocket and on
+    the import job record.
+    """
+    try:
+        body = json.loads(event.get("body", "{}"))
+        request = CreateContactImportRequest.model_validate(body)
+    except PydanticValidationError as e:
+        return validation_error([
+            {"field": ".".join(str(x) for x in err["loc"]), "message": err["msg"]}
+            for err in e.errors()
+        ])
+    except json.JSONDecodeError:
+        return error("Invalid JSON body", 400)
 
-    # Paginate through all contacts
-    while True:
-        contacts, next_key = repo.list_by_workspace(workspace_id, limit=100, last_key=last_key)
-        all_contacts.extend(contacts)
-        if not next_key:
-            break
-        last_key = next_key
+    # Enforce plan limit for contacts before accepting the upload
+    plan = get_workspace_plan(workspace_id)
+    contact_count = get_resource_count(workspace_id, "contacts")
+    enforce_limit(plan, "contacts", contact_count)
+
+    job = ContactImport(workspace_id=workspace_id, mapping=request.mapping)
+    job.file_key = f"imports/{workspace_id}/{job.id}.csv"
+    job = ContactImportRepository().create_import(job)
+
+    upload_url = boto3.client("s3").generate_presigned_url(
+        "put_object",
+        Params={
+            "Bucket": CONTACT_FILES_BUCKET,
+            "Key": job.file_key,
+            "ContentType": "text/csv",
+        },
+        ExpiresIn=900,
+    )
 
-    # Build CSV
+    logger.info("Contact import job created", import_id=job.id, workspace_id=workspace_id)
+
+    return created({
+        "import": job.model_dump(mode="json"),
+        "upload_url": upload_url,
+    })
+
+
+def get_import_job(workspace_id: str, import_id: str) -> dict:
+    """Get the status and progress of a contact import job."""
+    job = ContactImportRepository().get_by_id(workspace_id, import_id)
+    if not job:
+        return not_found("ContactImport", import_id)
+
+    return success(job.model_dump(mode="json"))
+
+
+def export_contacts(
+    repo: ContactRepository,
+    workspace_id: str,
+) -> dict:
+    """Export all contacts as CSV inline.
+
+    The response is bounded by Lambda's payload limit; large workspaces
+    should use an export job (POST /contacts/exports) instead.
+    """
+    # Build CSV, streaming contacts across pages
     output = io.StringIO()
-    fieldnames = [
-        "id", "email", "phone", "first_name", "last_name",
-        "status", "source", "tags", "sms_opt_in", "email_opt_in",
-        "total_messages_sent", "total_messages_received",
-        "last_contacted_at", "last_response_at",
-        "created_at", "updated_at",
-    ]
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
+    writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDNAMES)
     writer.writeheader()
 
-    for contact in all_contacts:
-        writer.writerow({
-            "id": contact.id,
-            "email": contact.email or "",
-            "phone": contact.phone or "",
-            "first_name": contact.first_name or "",
-            "last_name": contact.last_name or "",
-            "status": contact.status,
-            "source": contact.source or "",
-            "tags": ",".join(contact.tags),
-            "sms_opt_in": str(contact.sms_opt_in),
-            "email_opt_in": str(contact.email_opt_in),
-            "total_messages_sent": contact.total_messages_sent,
-            "total_messages_received": contact.total_messages_received,
-            "last_contacted_at": contact.last_contacted_at or "",
-            "last_response_at": contact.last_response_at or "",
-            "created_at": contact.created_at.isoformat(),
-            "updated_at": contact.updated_at.isoformat(),
-        })
+    count = 0
+    for contact in repo.iter_query(pk=f"WS#{workspace_id}", sk_begins_with="CONTACT#"):
+        count += 1
+        writer.writerow(contact_to_csv_row(contact))
 
     csv_content = output.getvalue()
 
     return success({
         "csv_data": csv_content,
-        "count": len(all_contacts),
+        "count": count,
     })
+
+
+def create_export_job(workspace_id: str, event: dict) -> dict:
+    """Start an asynchronous contact export to S3.
+
+    The contact export worker streams contacts into the export file;
+    poll GET /contacts/exports/{export_id} for status and the download URL.
+    """
+    try:
+        body = json.loads(event.get("body") or "{}")
+        request = CreateContactExportRequest.model_validate(body)
+    except PydanticValidationError as e:
+        return validation_error([
+            {"field": ".".join(str(x) for x in err["loc"]), "message": err["msg"]}
+            for err in e.errors()
+        ])
+    except json.JSONDecodeError:
+        return error("Invalid JSON body", 400)
+
+    job = ContactExport(workspace_id=workspace_id, format=request.format, gzip=request.gzip)
+    job.file_key = f"exports/{workspace_id}/{job.file_name}"
+    job = ContactExportRepository().create_export(job)
+
+    boto3.client("sqs").send_message(
+        QueueUrl=os.environ["CONTACT_EXPORT_QUEUE_URL"],
+        MessageBody=json.dumps({"workspace_id": workspace_id, "export_id": job.id}),
+    )
+
+    logger.info("Contact export job created", export_id=job.id, workspace_id=workspace_id)
+
+    return success(job.model_dump(mode="json"), 202)
+
+
+def get_export_job(workspace_id: str, export_id: str) -> dict:
+    """Get the status of a contact export job, with a download URL once complete."""
+    job = ContactExportRepository().get_by_id(workspace_id, export_id)
+    if not job:
+        return not_found("ContactExport", export_id)
+
+    data = job.model_dump(mode="json")
+    if job.status == ContactExportStatus.COMPLETED:
+        data["download_url"] = boto3.client("s3").generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": CONTACT_FILES_BUCKET,
+                "Key": job.file_key,
+                "ResponseContentDisposition": f'attachment; filename="{job.file_name}"',
+            },
+            ExpiresIn=3600,
+        )
+
+    return success(data)
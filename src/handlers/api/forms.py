@@ -13,6 +13,7 @@ from complens.models.form import (
     UpdateFormRequest,
 )
 from complens.repositories.form import FormRepository, FormSubmissionRepository
+from complens.services import static_pages
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import created, error, not_found, success, validation_error
@@ -148,6 +149,7 @@ def create_form(
     )
 
     form = repo.create_form(form)
+    static_pages.republish_form_pages(form)
 
     logger.info("Form created", form_id=form.id, workspace_id=workspace_id)
 
@@ -205,6 +207,7 @@ def update_form(
 
     # Save
     form = repo.update_form(form)
+    static_pages.republish_form_pages(form)
 
     logger.info("Form updated", form_id=form_id, workspace_id=workspace_id)
 
@@ -217,11 +220,14 @@ def delete_form(
     form_id: str,
 ) -> dict:
     """Delete a form."""
-    deleted = repo.delete_form(workspace_id, form_id)
+    form = repo.get_by_id(workspace_id, form_id)
+    deleted = form is not None and repo.delete_form(workspace_id, form_id)
 
     if not deleted:
         return not_found("Form", form_id)
 
+    static_pages.republish_form_pages(form)
+
     logger.info("Form deleted", form_id=form_id, workspace_id=workspace_id)
 
     return success({"deleted": True, "id": form_id})
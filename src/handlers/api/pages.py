@@ -62,9 +62,10 @@ from complens.models.workflow_node import WorkflowNode
 from complens.repositories.form import FormRepository
 from complens.repositories.page import PageRepository
 from complens.repositories.workflow import WorkflowRepository
-from complens.services.cdn_service import invalidate_page_cache
 from complens.repositories.workspace import WorkspaceRepository
-from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan, require_feature, count_resources
+from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan, require_feature
+from complens.services.resource_counters import get_resource_count
+from complens.services import static_pages
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import created, error, not_found, success, validation_error
@@ -347,7 +348,7 @@ def create_page(
 
     # Enforce plan limit for pages
     plan = get_workspace_plan(workspace_id)
-    page_count = count_resources(repo.table, workspace_id, "PAGE#")
+    page_count = get_resource_count(workspace_id, "pages")
     enforce_limit(plan, "pages", page_count)
 
     # Check if slug already exists
@@ -440,6 +441,9 @@ def update_page(
             if repo.subdomain_exists(subdomain, exclude_page_id=page_id):
                 return error(f"Subdomain '{subdomain}' is already taken", 400, error_code="SUBDOMAIN_EXISTS")
 
+    # Routes currently serving the page, to take down any it stops serving
+    previous_routes = static_pages.page_routes(page) if static_pages.is_published(page) else []
+
     # Apply updates
     if request.name is not None:
         page.name = request.name
@@ -520,28 +524,8 @@ def update_page(
     # Save
     page = repo.update_page(page)
 
-    # Invalidate CDN cache if page has subdomain or custom domain
-    if page.subdomain or page.custom_domain:
-        try:
-            invalidation_result = invalidate_page_cache(
-                subdomain=page.subdomain,
-                custom_domain=page.custom_domain,
-                page_id=page_id,
-            )
-            logger.info(
-                "CDN cache invalidated",
-                page_id=page_id,
-                subdomain=page.subdomain,
-                custom_domain=page.custom_domain,
-                result=invalidation_result,
-            )
-        except Exception as e:
-            # Log but don't fail the request - cache will expire naturally
-            logger.warning(
-                "Failed to invalidate CDN cache",
-                page_id=page_id,
-                error=str(e),
-            )
+    # Re-render static HTML and invalidate only the routes that changed
+    static_pages.sync_page(page, previous_routes)
 
     # Serialize for response
     response_data = page.model_dump(mode="json")
@@ -562,11 +546,14 @@ def delete_page(
     page_id: str,
 ) -> dict:
     """Delete a page and cascade-delete associated forms, workflows, and profile."""
-    deleted = repo.delete_page(workspace_id, page_id)
+    page = repo.get_by_id(workspace_id, page_id)
+    deleted = page is not None and repo.delete_page(workspace_id, page_id)
 
     if not deleted:
         return not_found("Page", page_id)
 
+    static_pages.remove_page(page)
+
     # Cascade delete associated resources — failures are logged but don't block
     _cascade_delete_page_resources(workspace_id, page_id)
 
@@ -777,7 +764,7 @@ def create_complete_page(
 
     # CREATE MODE: Enforce plan limit for pages
     plan = get_workspace_plan(workspace_id)
-    page_count = count_resources(repo.table, workspace_id, "PAGE#")
+    page_count = get_resource_count(workspace_id, "pages")
     enforce_limit(plan, "pages", page_count)
 
     # Validate required fields for create
@@ -809,6 +796,7 @@ def create_complete_page(
 
         # Delete the page itself
         repo.delete_page(workspace_id, existing_page.id)
+        static_pages.remove_page(existing_page)
         logger.info("Deleted existing page", page_id=existing_page.id)
 
     # Check subdomain if provided
@@ -1097,6 +1085,9 @@ def create_complete_page(
             logger.error("Rollback failed for page", error=str(rollback_err))
         return error("Failed to create complete package", 500)
 
+    # Publish static HTML now that the page's forms exist
+    static_pages.sync_page(page)
+
     logger.info(
         "Complete package created",
         page_id=page.id,
@@ -1340,22 +1331,8 @@ def _update_complete_page(
     elif existing_workflows:
         result["workflow"] = existing_workflows[0].model_dump(mode="json", by_alias=True)
 
-    # Invalidate CDN cache if page has subdomain or custom domain
-    if page.subdomain or page.custom_domain:
-        try:
-            invalidation_result = invalidate_page_cache(
-                subdomain=page.subdomain,
-                custom_domain=page.custom_domain,
-                page_id=page.id,
-            )
-            logger.info(
-                "CDN cache invalidated for updated page",
-                page_id=page.id,
-                subdomain=page.subdomain,
-                result=invalidation_result,
-            )
-        except Exception as e:
-            logger.warning("Failed to invalidate CDN cache", page_id=page.id, error=str(e))
+    # Re-render static HTML and invalidate only the routes that changed
+    static_pages.sync_page(page)
 
     logger.info(
         "Page update complete",
@@ -1727,7 +1704,13 @@ def generate_page_content(event: dict) -> dict:
 
     AI generates the text content, we merge it into a beautiful template.
     Much more reliable than AI-generated HTML.
+
+    This is a single Haiku call, so unlike the multi-stage synthesis pipeline
+    it stays synchronous. The Bedrock client is capped below the API Gateway
+    timeout so a slow model call fails with a clean error instead of a 504.
     """
+    from botocore.config import Config
+
     from complens.services.page_templates import fill_template, get_template, list_templates
 
     path_params = event.get("pathParameters", {}) or {}
@@ -1797,7 +1780,14 @@ RULES:
 Return only JSON."""
 
     try:
-        bedrock = boto3.client("bedrock-runtime")
+        bedrock = boto3.client(
+            "bedrock-runtime",
+            config=Config(
+                read_timeout=25,
+                connect_timeout=3,
+                retries={"max_attempts": 1, "mode": "standard"},
+            ),
+        )
 
         response = bedrock.invoke_model(
             modelId="us.anthropic.claude-haiku-4-5-20251001-v1:0",
@@ -2004,6 +1994,7 @@ def create_page_form(
     )
 
     form = repo.create_form(form)
+    static_pages.republish_form_pages(form)
 
     logger.info("Form created", form_id=form.id, workspace_id=workspace_id, page_id=page_id)
 
@@ -2062,6 +2053,7 @@ def update_page_form(
         form.recaptcha_enabled = request.recaptcha_enabled
 
     form = repo.update_form(form)
+    static_pages.republish_form_pages(form)
 
     logger.info("Form updated", form_id=form_id, workspace_id=workspace_id, page_id=page_id)
 
@@ -2086,6 +2078,8 @@ def delete_page_form(
     if not deleted:
         return not_found("Form", form_id)
 
+    static_pages.republish_form_pages(form)
+
     logger.info("Form deleted", form_id=form_id, workspace_id=workspace_id, page_id=page_id)
 
     return success({"deleted": True, "id": form_id})
@@ -2175,7 +2169,7 @@ def create_page_workflow(
     """Create a new workflow for a page."""
     # Enforce plan limit for workflows
     plan = get_workspace_plan(workspace_id)
-    wf_count = count_resources(repo.table, workspace_id, "WF#")
+    wf_count = get_resource_count(workspace_id, "workflows")
     enforce_limit(plan, "workflows", wf_count)
 
     try:
@@ -35,10 +35,10 @@ from complens.models.contact import Contact
 from complens.models.form import FormSubmission, SubmitFormRequest
 from complens.repositories.contact import ContactRepository
 from complens.repositories.form import FormRepository, FormSubmissionRepository
-from complens.repositories.business_profile import BusinessProfileRepository
 from complens.repositories.page import PageRepository
 from complens.repositories.visitor import VisitorRepository
-from complens.services.page_templates import render_full_page
+from complens.services import static_pages
+from complens.services.page_views import PageView, record_page_view
 from complens.utils.rate_limiter import (
     check_rate_limit,
     get_client_ip,
@@ -178,11 +178,11 @@ def get_public_page(slug: str, workspace_id: str | None) -> dict:
     if status_value != "published":
         return not_found("Page", slug)
 
-    # Increment view count (fire and forget)
+    # Count the view (fire and forget)
     try:
-        repo.increment_view_count(workspace_id, page.id)
+        record_page_view(PageView(workspace_id=workspace_id, page_id=page.id))
     except Exception as e:
-        logger.warning("Failed to increment view count", page_id=page.id, error=str(e))
+        logger.warning("Failed to record page view", page_id=page.id, error=str(e))
 
     # Return page without sensitive fields
     page_data = page.model_dump(mode="json")
@@ -331,6 +331,9 @@ def get_site_chat_config(site_id: str, workspace_id: str | None, event: dict) ->
 def get_page_by_subdomain(subdomain: str) -> dict:
     """Get and render a page by subdomain (e.g., mypage.dev.complens.ai).
 
+    Serves the pre-rendered HTML from S3 when it exists; otherwise renders
+    the page and stores it for later requests.
+
     Returns full HTML for the page, suitable for serving directly.
     """
     if not subdomain:
@@ -340,6 +343,12 @@ def get_page_by_subdomain(subdomain: str) -> dict:
     subdomain = subdomain.lower().strip()
     logger.info("Looking up page by subdomain", subdomain=subdomain)
 
+    # Serve the pre-rendered page if one is stored
+    route = static_pages.subdomain_route(subdomain)
+    html = static_pages.get_static_html(route)
+    if html:
+        return _page_response(html)
+
     # Look up page by subdomain using GSI3
     try:
         repo = PageRepository()
@@ -375,107 +384,24 @@ def get_page_by_subdomain(subdomain: str) -> dict:
 </body></html>""",
         }
 
-    # Increment view count
-    try:
-        repo.increment_view_count(page.workspace_id, page.id)
-    except Exception as e:
-        logger.warning("Failed to increment view count", page_id=page.id, error=str(e))
-
-    # Fetch forms associated with this page
-    # Supports both legacy (form_ids list) and new (page_id field on forms)
-    forms = []
-    form_repo = FormRepository()
-
-    # New way: forms with page_id set
-    page_forms, _ = form_repo.list_by_page(page.id)
-    for form in page_forms:
-        forms.append(form.model_dump(mode="json"))
-
-    # Legacy way: forms referenced by form_ids (for backwards compatibility)
-    form_ids_set = set(f.get("id") for f in forms)  # Avoid duplicates
-    if page.form_ids:
-        for form_id in page.form_ids:
-            if form_id not in form_ids_set:
-                form = form_repo.get_by_id(page.workspace_id, form_id)
-                if form:
-                    forms.append(form.model_dump(mode="json"))
-
-    # Derive API/WS URLs from domain name to avoid circular CloudFormation dependencies
-    domain_name = os.environ.get("DOMAIN_NAME", "dev.complens.ai")
-    api_url = f"https://api.{domain_name}"
-    ws_url = f"wss://ws.{domain_name}"
-
-    # Render full HTML page with forms
-    page_data = page.model_dump(mode="json")
-
-    logger.info(
-        "Page data for rendering",
-        subdomain=subdomain,
-        page_id=page.id,
-        has_blocks=len(page.blocks) > 0,
-        block_count=len(page.blocks),
-        has_body_content=bool(page.body_content),
-        blocks_in_data="blocks" in page_data,
-        blocks_count_in_data=len(page_data.get("blocks", [])),
-    )
-
-    # Fetch business profile for structured data (AEO)
-    profile_repo = BusinessProfileRepository()
-    site_id = getattr(page, "site_id", None)
-    profile = profile_repo.get_effective_profile(page.workspace_id, page.id, site_id)
-    profile_data = profile.model_dump(mode="json") if profile else None
-
-    stage = os.environ.get("STAGE", "dev")
-    subdomain_suffix = "complens.ai" if stage == "prod" else f"{stage}.complens.ai"
-    canonical = f"https://{subdomain}.{subdomain_suffix}"
-    html = render_full_page(
-        page_data, ws_url, api_url,
-        forms=forms, canonical_url=canonical,
-        business_profile=profile_data,
-    )
+    html = _render_and_store(page, route)
 
     logger.info(
         "Rendered page for subdomain",
         subdomain=subdomain,
         page_id=page.id,
         workspace_id=page.workspace_id,
-        form_count=len(forms),
     )
 
-    # Build CSP header
-    csp_directives = [
-        "default-src 'self'",
-        f"script-src 'self' 'unsafe-inline' cdn.tailwindcss.com",
-        f"style-src 'self' 'unsafe-inline' cdn.tailwindcss.com fonts.googleapis.com",
-        "font-src 'self' fonts.gstatic.com",
-        "img-src 'self' data: https: blob:",
-        f"connect-src 'self' {api_url} {ws_url}",
-        "frame-ancestors 'none'",
-        "base-uri 'self'",
-        "form-action 'self'",
-    ]
-    csp_header = "; ".join(csp_directives)
-
-    return {
-        "statusCode": 200,
-        "headers": {
-            "Content-Type": "text/html; charset=utf-8",
-            "Cache-Control": "public, max-age=300",
-            "Content-Security-Policy": csp_header,
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-        },
-        "body": html,
-    }
+    return _page_response(html)
 
 
 def get_page_by_domain(domain: str) -> dict:
     """Get and render a page by custom domain.
 
     Supports both root domain (e.g., itsross.com) and subdomain.rootdomain
-    patterns (e.g., findme.itsross.com).
+    patterns (e.g., findme.itsross.com). Serves the pre-rendered HTML from
+    S3 when it exists; otherwise renders the page and stores it.
 
     Returns full HTML for the page, suitable for serving directly.
     """
@@ -485,9 +411,14 @@ def get_page_by_domain(domain: str) -> dict:
     # Normalize domain
     domain = domain.lower().strip()
 
+    # Serve the pre-rendered page if one is stored
+    route = static_pages.domain_route(domain)
+    html = static_pages.get_static_html(route)
+    if html:
+        return _page_response(html)
+
     repo = PageRepository()
     page = None
-    canonical_domain = domain
 
     from complens.repositories.site import SiteRepository
     site_repo = SiteRepository()
@@ -506,8 +437,6 @@ def get_page_by_domain(domain: str) -> dict:
             site = site_repo.get_by_id(page.workspace_id, page.site_id)
             if not site or site.domain_name != root_domain:
                 page = None  # Wrong site — don't serve
-            else:
-                canonical_domain = domain  # subdomain.rootdomain
         elif page:
             page = None  # No site association, can't verify domain ownership
 
@@ -559,60 +488,35 @@ def get_page_by_domain(domain: str) -> dict:
 </body></html>""",
         }
 
-    # Increment view count
-    try:
-        repo.increment_view_count(page.workspace_id, page.id)
-    except Exception as e:
-        logger.warning("Failed to increment view count", page_id=page.id, error=str(e))
+    html = _render_and_store(page, route)
 
-    # Fetch forms associated with this page
-    # Supports both legacy (form_ids list) and new (page_id field on forms)
-    forms = []
-    form_repo = FormRepository()
+    logger.info(
+        "Rendered page for custom domain",
+        domain=domain,
+        page_id=page.id,
+        workspace_id=page.workspace_id,
+    )
+
+    return _page_response(html)
 
-    # New way: forms with page_id set
-    page_forms, _ = form_repo.list_by_page(page.id)
-    for form in page_forms:
-        forms.append(form.model_dump(mode="json"))
 
-    # Legacy way: forms referenced by form_ids (for backwards compatibility)
-    form_ids_set = set(f.get("id") for f in forms)  # Avoid duplicates
-    if page.form_ids:
-        for form_id in page.form_ids:
-            if form_id not in form_ids_set:
-                form = form_repo.get_by_id(page.workspace_id, form_id)
-                if form:
-                    forms.append(form.model_dump(mode="json"))
+def _render_and_store(page: Any, route: static_pages.StaticRoute) -> str:
+    """Render a page for a route and store it so later requests skip rendering."""
+    html = static_pages.render_page(page, [route])[route.key]
+    try:
+        static_pages.store_route(page, route, html)
+    except Exception as e:
+        logger.warning("Failed to store static page", page_id=page.id, error=str(e))
+    return html
+
 
+def _page_response(html: str) -> dict:
+    """Build the HTML response for a rendered landing page."""
     # Derive API/WS URLs from domain name to avoid circular CloudFormation dependencies
     domain_name = os.environ.get("DOMAIN_NAME", "dev.complens.ai")
     api_url = f"https://api.{domain_name}"
     ws_url = f"wss://ws.{domain_name}"
 
-    # Render full HTML page with forms
-    page_data = page.model_dump(mode="json")
-
-    # Fetch business profile for structured data (AEO)
-    profile_repo = BusinessProfileRepository()
-    site_id = getattr(page, "site_id", None)
-    profile = profile_repo.get_effective_profile(page.workspace_id, page.id, site_id)
-    profile_data = profile.model_dump(mode="json") if profile else None
-
-    canonical = f"https://{canonical_domain}"
-    html = render_full_page(
-        page_data, ws_url, api_url,
-        forms=forms, canonical_url=canonical,
-        business_profile=profile_data,
-    )
-
-    logger.info(
-        "Rendered page for custom domain",
-        domain=domain,
-        page_id=page.id,
-        workspace_id=page.workspace_id,
-        form_count=len(forms),
-    )
-
     # Build CSP header - restrict content sources for XSS protection
     # Note: 'unsafe-inline' for scripts/styles needed for embedded chat widget
     # In future, could use nonces for tighter security
@@ -633,7 +537,8 @@ def get_page_by_domain(domain: str) -> dict:
         "statusCode": 200,
         "headers": {
             "Content-Type": "text/html; charset=utf-8",
-            "Cache-Control": "public, max-age=300",  # Cache for 5 minutes
+            # CloudFront keeps the page until a republish invalidates it
+            "Cache-Control": static_pages.HTML_CACHE_CONTROL,
             "Content-Security-Policy": csp_header,
             "X-Content-Type-Options": "nosniff",
             "X-Frame-Options": "DENY",
@@ -868,12 +773,14 @@ p {{ color: #4b5563; line-height: 1.6; margin: 0; }}
 def track_page_view(event: dict) -> dict:
     """Track an anonymous page view from the JS beacon.
 
-    Creates/updates a Visitor record with attribution data and fires
-    a trigger_page_visit event to the workflow queue.
+    Validates the view and hands it to the page view queue. The page view
+    aggregator counts it, upserts the Visitor record with attribution data
+    and fires trigger_page_visit, coalescing views per page and visitor.
     """
     origin = _get_origin(event)
 
-    # Rate limit: 10 requests/minute per IP
+    # Rate limit: 10 requests/minute per IP, before anything is enqueued.
+    # The aggregator's per-batch cap only bounds a single batch.
     client_ip = get_client_ip(event)
     rate_check = check_rate_limit(
         identifier=client_ip,
@@ -882,11 +789,7 @@ def track_page_view(event: dict) -> dict:
         requests_per_hour=120,
     )
     if not rate_check.allowed:
-        return {
-            "statusCode": 204,
-            "headers": _cors_headers(origin),
-            "body": "",
-        }
+        return {"statusCode": 204, "headers": _cors_headers(origin), "body": ""}
 
     try:
         body = json.loads(event.get("body", "{}"))
@@ -905,48 +808,26 @@ def track_page_view(event: dict) -> dict:
     if not visitor_id.startswith("v_") or len(visitor_id) > 20:
         return {"statusCode": 204, "headers": _cors_headers(origin), "body": ""}
 
-    referrer = (body.get("referrer") or "")[:2000]
-    utm_source = (body.get("utm_source") or "")[:200]
-    utm_medium = (body.get("utm_medium") or "")[:200]
-    utm_campaign = (body.get("utm_campaign") or "")[:200]
-    utm_content = (body.get("utm_content") or "")[:200]
-    utm_term = (body.get("utm_term") or "")[:200]
-
     headers = event.get("headers", {}) or {}
-    user_agent = (headers.get("User-Agent") or "")[:500]
 
-    # Upsert visitor record
-    try:
-        visitor_repo = VisitorRepository()
-        visitor_repo.upsert_page_view(
-            workspace_id=workspace_id,
-            visitor_id=visitor_id,
-            page_id=page_id,
-            referrer=referrer or None,
-            utm_source=utm_source or None,
-            utm_medium=utm_medium or None,
-            utm_campaign=utm_campaign or None,
-            utm_content=utm_content or None,
-            utm_term=utm_term or None,
-            ip=client_ip,
-            user_agent=user_agent or None,
-        )
-    except Exception as e:
-        logger.warning("Visitor upsert failed", error=str(e), visitor_id=visitor_id)
+    view = PageView(
+        workspace_id=workspace_id[:64],
+        page_id=page_id[:64],
+        visitor_id=visitor_id,
+        referrer=(body.get("referrer") or "")[:2000] or None,
+        utm_source=(body.get("utm_source") or "")[:200] or None,
+        utm_medium=(body.get("utm_medium") or "")[:200] or None,
+        utm_campaign=(body.get("utm_campaign") or "")[:200] or None,
+        utm_content=(body.get("utm_content") or "")[:200] or None,
+        utm_term=(body.get("utm_term") or "")[:200] or None,
+        ip=client_ip,
+        user_agent=(headers.get("User-Agent") or "")[:500] or None,
+    )
 
-    # Fire trigger_page_visit to workflow queue
     try:
-        _trigger_page_visit(
-            workspace_id=workspace_id,
-            visitor_id=visitor_id,
-            page_id=page_id,
-            referrer=referrer,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            utm_campaign=utm_campaign,
-        )
+        record_page_view(view)
     except Exception as e:
-        logger.warning("Page visit trigger failed", error=str(e))
+        logger.warning("Failed to record page view", error=str(e), visitor_id=visitor_id)
 
     return {"statusCode": 204, "headers": _cors_headers(origin), "body": ""}
 
@@ -961,42 +842,6 @@ def _cors_headers(origin: str | None) -> dict:
     }
 
 
-def _trigger_page_visit(
-    workspace_id: str,
-    visitor_id: str,
-    page_id: str,
-    referrer: str,
-    utm_source: str,
-    utm_medium: str,
-    utm_campaign: str,
-) -> None:
-    """Fire trigger_page_visit to the SQS workflow queue."""
-    sqs = boto3.client("sqs")
-    queue_url = os.environ.get("WORKFLOW_QUEUE_URL")
-
-    if not queue_url:
-        return
-
-    message_body = {
-        "detail": {
-            "trigger_type": "trigger_page_visit",
-            "workspace_id": workspace_id,
-            "visitor_id": visitor_id,
-            "page_id": page_id,
-            "referrer": referrer,
-            "utm_source": utm_source,
-            "utm_medium": utm_medium,
-            "utm_campaign": utm_campaign,
-        }
-    }
-
-    sqs.send_message(
-        QueueUrl=queue_url,
-        MessageBody=json.dumps(message_body),
-        MessageGroupId=workspace_id,
-    )
-
-
 def _get_origin(event: dict) -> str | None:
     """Extract Origin header from request (case-insensitive)."""
     headers = event.get("headers", {}) or {}
@@ -11,7 +11,9 @@ from pydantic import ValidationError as PydanticValidationError
 from complens.models.site import CreateSiteRequest, Site, UpdateSiteRequest
 from complens.repositories.page import PageRepository
 from complens.repositories.site import SiteRepository
-from complens.services.feature_gate import FeatureGateError, count_resources, enforce_limit, get_workspace_plan
+from complens.services import static_pages
+from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan
+from complens.services.resource_counters import get_resource_count
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import created, error, not_found, success, validation_error
@@ -241,7 +243,7 @@ def create_site(
 
     # Enforce sites limit
     plan = get_workspace_plan(workspace_id)
-    site_count = count_resources(repo.table, workspace_id, "SITE#")
+    site_count = get_resource_count(workspace_id, "sites")
     enforce_limit(plan, "sites", site_count)
 
     # Check for duplicate domain in this workspace (skip for sites with no domain)
@@ -302,6 +304,7 @@ def update_site(
                 error_code="DUPLICATE_DOMAIN",
             )
 
+    previous = site.model_copy(deep=True)
     update_data = request.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         if value is not None:
@@ -309,6 +312,13 @@ def update_site(
 
     site = repo.update_site(site)
 
+    # Domain and default page decide which hosts serve the site's pages
+    if (
+        site.domain_name != previous.domain_name
+        or site.settings.get("default_page_id") != previous.settings.get("default_page_id")
+    ):
+        static_pages.sync_site(workspace_id, site_id, previous, site)
+
     logger.info("Site updated", site_id=site_id, workspace_id=workspace_id)
 
     return success(site.model_dump(mode="json"))
@@ -320,10 +330,13 @@ def delete_site(
     site_id: str,
 ) -> dict:
     """Delete a site."""
-    deleted = repo.delete_site(workspace_id, site_id)
+    site = repo.get_by_id(workspace_id, site_id)
+    deleted = site is not None and repo.delete_site(workspace_id, site_id)
     if not deleted:
         return not_found("Site", site_id)
 
+    static_pages.sync_site(workspace_id, site_id, site, None)
+
     logger.info("Site deleted", site_id=site_id, workspace_id=workspace_id)
 
     return success({"deleted": True, "id": site_id})
@@ -353,7 +366,7 @@ def copy_site(
 
     # Enforce sites limit
     plan = get_workspace_plan(workspace_id)
-    site_count = count_resources(repo.table, workspace_id, "SITE#")
+    site_count = get_resource_count(workspace_id, "sites")
     enforce_limit(plan, "sites", site_count)
 
     # Create new site (no domain — user sets later)
@@ -22,7 +22,8 @@ from complens.repositories.contact import ContactRepository
 from complens.repositories.workflow import WorkflowRepository, WorkflowRunRepository
 from complens.services.workflow_engine import WorkflowEngine
 from complens.repositories.workspace import WorkspaceRepository
-from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan, count_resources
+from complens.services.feature_gate import FeatureGateError, enforce_limit, get_workspace_plan
+from complens.services.resource_counters import get_resource_count
 from complens.utils.auth import get_auth_context, require_workspace_access
 from complens.utils.exceptions import ForbiddenError, NotFoundError, ValidationError
 from complens.utils.responses import created, error, not_found, success, validation_error
@@ -157,7 +158,7 @@ def create_workflow(
     """Create a new workflow."""
     # Enforce plan limit for workflows
     plan = get_workspace_plan(workspace_id)
-    wf_count = count_resources(repo.table, workspace_id, "WF#")
+    wf_count = get_resource_count(workspace_id, "workflows")
     enforce_limit(plan, "workflows", wf_count)
 
     try:
@@ -6,6 +6,7 @@ from typing import Any
 import structlog
 
 from complens.repositories.workspace import WorkspaceRepository
+from complens.services.feature_gate import invalidate_workspace_cache
 
 logger = structlog.get_logger()
 
@@ -68,6 +69,7 @@ def _handle_checkout_completed(event_data: dict) -> None:
     workspace.subscription_status = "active"
 
     ws_repo.update_workspace(workspace, check_version=False)
+    invalidate_workspace_cache(workspace.id)
 
     logger.info(
         "Workspace linked to Stripe customer",
@@ -115,6 +117,7 @@ def _handle_subscription_change(event_data: dict) -> None:
         workspace.plan_period_end = datetime.fromtimestamp(period_end, tz=timezone.utc)
 
     ws_repo.update_workspace(workspace, check_version=False)
+    invalidate_workspace_cache(workspace.id)
 
     logger.info(
         "Subscription updated",
@@ -143,6 +146,7 @@ def _handle_subscription_deleted(event_data: dict) -> None:
     workspace.subscription_status = "canceled"
 
     ws_repo.update_workspace(workspace, check_version=False)
+    invalidate_workspace_cache(workspace.id)
 
     logger.info("Subscription canceled, reverted to free", workspace_id=workspace_id)
 
@@ -166,6 +170,7 @@ def _handle_payment_failed(event_data: dict) -> None:
         if workspace:
             workspace.subscription_status = "past_due"
             ws_repo.update_workspace(workspace, check_version=False)
+            invalidate_workspace_cache(workspace.id)
 
     logger.warning(
         "Billing payment failed",
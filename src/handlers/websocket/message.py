@@ -511,6 +511,11 @@ def _generate_chat_response(system_prompt: str, user_message: str) -> str:
 def handle_subscribe(connection_id: str, data: dict) -> dict:
     """Handle subscription request.
 
+    Subscriptions are stored as "<channel>:<resource_id>". Channel "run"
+    with a workflow run ID opts the connection into every event of that
+    run, which the workflow event broadcaster otherwise folds into
+    per-second summary frames during bulk runs.
+
     Args:
         connection_id: WebSocket connection ID.
         data: Subscription data.
@@ -1,6 +1,8 @@
 """AI processor worker.
 
-Processes AI-related tasks from the SQS queue.
+Processes AI-related tasks from the SQS queue, including page synthesis
+jobs, which run without the API Gateway timeout and stream their
+progress to the workspace over WebSocket.
 """
 
 import asyncio
@@ -12,6 +14,14 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Blocks per Bedrock call for synthesis jobs (synchronous requests use 3)
+SYNTHESIS_JOB_BATCH_SIZE = int(os.environ.get("SYNTHESIS_JOB_BATCH_SIZE", "5"))
+
+# Seconds a synthesis job's block batch stage may take before defaults are used
+SYNTHESIS_JOB_BATCH_TIMEOUT_SECONDS = float(
+    os.environ.get("SYNTHESIS_JOB_BATCH_TIMEOUT_SECONDS", "90")
+)
+
 
 def handler(event: dict[str, Any], context: Any) -> dict:
     """Process AI tasks from SQS queue.
@@ -37,6 +47,8 @@ def handler(event: dict[str, Any], context: Any) -> dict:
                 result = process_inbound_message(body)
             elif message_type == "generate_response":
                 result = process_generate_response(body)
+            elif message_type == "synthesis_job":
+                result = process_synthesis_job(body)
             else:
                 logger.warning("Unknown message type", type=message_type)
                 result = {"success": False, "error": "Unknown message type"}
@@ -202,6 +214,115 @@ def process_generate_response(data: dict) -> dict:
     }
 
 
+def process_synthesis_job(data: dict) -> dict:
+    """Run a queued page synthesis job.
+
+    Each stage's output is saved on the job and broadcast to the
+    workspace as a synthesis_progress event; block batches carry their
+    generated blocks. The final SynthesisResult is only saved on the
+    job, since it may exceed the WebSocket frame size.
+
+    Args:
+        data: Message data with workspace_id and job_id.
+
+    Returns:
+        Processing result. Failed jobs are recorded, not retried.
+    """
+    from complens.models.synthesis import SynthesizePageRequest
+    from complens.models.synthesis_job import SynthesisJobStatus
+    from complens.repositories.synthesis_job import SynthesisJobRepository
+    from complens.services.synthesis_engine import SynthesisEngine
+
+    workspace_id = data.get("workspace_id")
+    job_id = data.get("job_id")
+
+    jobs = SynthesisJobRepository()
+    job = jobs.get_by_id(workspace_id, job_id)
+    if not job:
+        logger.warning("Synthesis job not found", workspace_id=workspace_id, job_id=job_id)
+        return {"success": False, "error": "Synthesis job not found"}
+
+    # Messages are delivered at least once; an interrupted job is rerun
+    if job.status in (SynthesisJobStatus.COMPLETED, SynthesisJobStatus.FAILED):
+        logger.info("Synthesis job already finished", job_id=job_id, status=job.status)
+        return {"success": True, "skipped": True}
+
+    job.status = SynthesisJobStatus.PROCESSING
+    job.stage = None
+    job.stages_completed = []
+    job.stage_outputs = {}
+    job.blocks = []
+    jobs.update_job(job)
+    _emit_synthesis_progress(job)
+
+    def report(stage: str, output: dict) -> None:
+        if stage == "block_batch":
+            job.blocks.extend(output["blocks"])
+        else:
+            job.stage_outputs[stage] = output
+        job.stage = stage
+        job.stages_completed.append(stage)
+        jobs.update_job(job)
+        _emit_synthesis_progress(job, output)
+
+    try:
+        request = SynthesizePageRequest.model_validate(job.request)
+        engine = SynthesisEngine(
+            max_batch_size=SYNTHESIS_JOB_BATCH_SIZE,
+            batch_timeout_seconds=SYNTHESIS_JOB_BATCH_TIMEOUT_SECONDS,
+        )
+        result = engine.synthesize(
+            workspace_id=workspace_id,
+            description=request.description,
+            page_id=request.page_id,
+            intent_hints=request.intent_hints,
+            style_preference=request.style_preference,
+            include_form=request.include_form,
+            include_chat=request.include_chat,
+            block_types=request.block_types,
+            site_id=request.site_id,
+            on_progress=report,
+        )
+        job.result = result.model_dump(mode="json")
+        job.status = SynthesisJobStatus.COMPLETED
+    except Exception as e:
+        logger.exception("Synthesis job failed", workspace_id=workspace_id, job_id=job_id)
+        job.status = SynthesisJobStatus.FAILED
+        job.error_message = str(e)
+
+    jobs.update_job(job)
+    _emit_synthesis_progress(job)
+
+    logger.info(
+        "Synthesis job finished",
+        job_id=job_id,
+        status=job.status,
+        blocks=len(job.blocks),
+    )
+    return {"success": True, "status": job.status}
+
+
+def _emit_synthesis_progress(job, output: dict | None = None) -> None:
+    """Broadcast synthesis job progress to the workspace's WebSocket clients."""
+    from complens.services.workflow_events import emit_workspace_event
+
+    try:
+        emit_workspace_event(
+            job.workspace_id,
+            "synthesis_progress",
+            {
+                "job_id": job.id,
+                "status": job.status,
+                "stage": job.stage,
+                "stages_completed": job.stages_completed,
+                "output": output,
+                "error_message": job.error_message,
+            },
+        )
+    except Exception as e:
+        logger.warning("Failed to broadcast synthesis progress", job_id=job.id, error=str(e))
+
+
 def _get_message_history(conversation_id: str, limit: int = 10) -> list[dict]:
     """Get message history for a conversation.
 
@@ -0,0 +1,60 @@
+"""Analytics rollup worker.
+
+Consumes the main table's stream and maintains the per-workspace, per-day
+analytics rollups read by the analytics API. The same batch also feeds the
+per-workspace resource counters used for plan-limit enforcement, so the
+table stream keeps only two Lambda readers (this one and the workflow
+trigger).
+"""
+
+from typing import Any
+
+import structlog
+
+from complens.services.analytics_rollups import RollupAggregator
+from complens.services.resource_counters import ResourceCounterAggregator
+
+logger = structlog.get_logger()
+
+
+def handler(event: dict[str, Any], context: Any) -> dict:
+    """Fold a batch of DynamoDB stream records into the rollups and counters.
+
+    Args:
+        event: DynamoDB stream event.
+        context: Lambda context.
+
+    Returns:
+        Write stats for the batch.
+    """
+    records = event.get("Records", [])
+    aggregator = RollupAggregator()
+    counters = ResourceCounterAggregator()
+
+    deltas = 0
+    changes = 0
+    for record in records:
+        try:
+            deltas += aggregator.add_record(record)
+        except Exception as e:
+            logger.warning("Skipping unreadable stream record", error=str(e))
+        try:
+            changes += counters.add_record(record)
+        except Exception as e:
+            logger.warning("Skipping unreadable stream record for counters", error=str(e))
+
+    stats = aggregator.flush()
+    counter_stats = counters.flush()
+    logger.info(
+        "Rollup batch processed",
+        records=len(records),
+        deltas=deltas,
+        counter_changes=changes,
+        **stats,
+    )
+    return {
+        "records": len(records),
+        "deltas": deltas,
+        **stats,
+        "counters": {"changes": changes, **counter_stats},
+    }
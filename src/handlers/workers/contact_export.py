@@ -0,0 +1,94 @@
+"""Contact export worker.
+
+Processes export jobs queued by the contacts API: streams the
+workspace's contacts into an S3 multipart upload and records progress
+and the final size on the ContactExport job.
+"""
+
+import json
+import os
+from typing import Any
+
+import boto3
+import structlog
+
+from complens.models.contact_export import ContactExportStatus
+from complens.repositories.contact_export import ContactExportRepository
+from complens.services.contact_export import ContactExporter
+
+logger = structlog.get_logger()
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """Get S3 client (lazy initialization)."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def handler(event: dict[str, Any], context: Any) -> dict:
+    """Process contact export jobs from SQS."""
+    processed = 0
+
+    for record in event.get("Records", []):
+        try:
+            message = json.loads(record.get("body", "{}"))
+        except json.JSONDecodeError:
+            logger.warning("Invalid export message", message_id=record.get("messageId"))
+            continue
+
+        if run_export(message.get("workspace_id", ""), message.get("export_id", "")):
+            processed += 1
+
+    return {"processed": processed}
+
+
+def run_export(workspace_id: str, export_id: str) -> bool:
+    """Run a pending export job.
+
+    Args:
+        workspace_id: Workspace ID.
+        export_id: Export job ID.
+
+    Returns:
+        True if the job was pending and has now been processed.
+    """
+    jobs = ContactExportRepository()
+    job = jobs.get_by_id(workspace_id, export_id)
+
+    if not job:
+        logger.warning("Export job not found", workspace_id=workspace_id, export_id=export_id)
+        return False
+
+    # SQS delivers at least once
+    if job.status != ContactExportStatus.PENDING:
+        logger.info("Export job already started", export_id=export_id, status=job.status)
+        return False
+
+    job.status = ContactExportStatus.PROCESSING
+    jobs.update_export(job)
+
+    def report(count: int) -> None:
+        job.rows_exported = count
+        jobs.update_export(job)
+
+    try:
+        exporter = ContactExporter(
+            workspace_id, job.format, compress=job.gzip, on_progress=report
+        )
+        job.rows_exported, job.size_bytes = exporter.run(
+            _get_s3_client(),
+            os.environ.get("CONTACT_FILES_BUCKET", ""),
+            job.file_key,
+        )
+        job.status = ContactExportStatus.COMPLETED
+    except Exception as e:
+        logger.exception("Contact export failed", workspace_id=workspace_id, export_id=export_id)
+        job.status = ContactExportStatus.FAILED
+        job.error_message = str(e)
+
+    jobs.update_export(job)
+    return True
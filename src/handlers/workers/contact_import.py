@@ -0,0 +1,139 @@
+"""Contact import worker.
+
+Processes CSV files uploaded to the contact files bucket. Each upload
+belongs to a ContactImport job created by the contacts API; rows are
+streamed from S3 and imported in batches, with progress saved on the
+job and broadcast to the workspace over WebSocket.
+"""
+
+import io
+from typing import Any
+from urllib.parse import unquote_plus
+
+import boto3
+import structlog
+
+from complens.models.contact_import import ContactImport, ContactImportStatus
+from complens.repositories.contact import ContactRepository
+from complens.repositories.contact_import import ContactImportRepository
+from complens.services.contact_import import ContactImporter, ImportProgress
+from complens.services.resource_counters import get_resource_count
+from complens.services.workflow_events import emit_workspace_event
+
+logger = structlog.get_logger()
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """Get S3 client (lazy initialization)."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def handler(event: dict[str, Any], context: Any) -> dict:
+    """Process S3 ObjectCreated notifications for contact import uploads."""
+    processed = 0
+
+    for record in event.get("Records", []):
+        s3_info = record.get("s3", {})
+        bucket = s3_info.get("bucket", {}).get("name")
+        key = unquote_plus(s3_info.get("object", {}).get("key", ""))
+
+        if bucket and key and process_upload(bucket, key):
+            processed += 1
+
+    return {"processed": processed}
+
+
+def process_upload(bucket: str, key: str) -> bool:
+    """Import the contacts in an uploaded CSV.
+
+    Args:
+        bucket: S3 bucket name.
+        key: Object key (imports/{workspace_id}/{import_id}.csv).
+
+    Returns:
+        True if the upload matched a pending import job and was processed.
+    """
+    parts = key.split("/")
+    if len(parts) != 3 or parts[0] != "imports" or not parts[2].endswith(".csv"):
+        logger.warning("Ignoring unexpected object in contact files bucket", key=key)
+        return False
+
+    workspace_id, import_id = parts[1], parts[2].removesuffix(".csv")
+    jobs = ContactImportRepository()
+    job = jobs.get_by_id(workspace_id, import_id)
+
+    if not job:
+        logger.warning("No import job for upload", workspace_id=workspace_id, import_id=import_id)
+        return False
+
+    # S3 notifications are delivered at least once
+    if job.status != ContactImportStatus.PENDING_UPLOAD:
+        logger.info("Import job already started", import_id=import_id, status=job.status)
+        return False
+
+    job.status = ContactImportStatus.PROCESSING
+    jobs.update_import(job)
+    _emit_progress(job)
+
+    def report(progress: ImportProgress) -> None:
+        _apply_progress(job, progress)
+        jobs.update_import(job)
+        _emit_progress(job)
+
+    try:
+        contact_repo = ContactRepository()
+        body = _get_s3_client().get_object(Bucket=bucket, Key=key)["Body"]
+
+        importer = ContactImporter(
+            workspace_id,
+            job.mapping,
+            repo=contact_repo,
+            existing_count=get_resource_count(workspace_id, "contacts"),
+            on_progress=report,
+        )
+        progress = importer.run(io.TextIOWrapper(body, encoding="utf-8-sig", newline=""))
+
+        _apply_progress(job, progress)
+        job.status = ContactImportStatus.COMPLETED
+    except Exception as e:
+        logger.exception("Contact import failed", workspace_id=workspace_id, import_id=import_id)
+        job.status = ContactImportStatus.FAILED
+        job.error_message = str(e)
+
+    jobs.update_import(job)
+    _emit_progress(job)
+    return True
+
+
+def _apply_progress(job: ContactImport, progress: ImportProgress) -> None:
+    """Copy running totals onto the import job."""
+    job.rows_processed = progress.rows_processed
+    job.imported = progress.imported
+    job.skipped = progress.skipped
+    job.error_count = progress.error_count
+    job.errors = list(progress.errors)
+
+
+def _emit_progress(job: ContactImport) -> None:
+    """Broadcast import progress to the workspace's WebSocket clients."""
+    try:
+        emit_workspace_event(
+            job.workspace_id,
+            "contact_import_progress",
+            {
+                "import_id": job.id,
+                "status": job.status,
+                "rows_processed": job.rows_processed,
+                "imported": job.imported,
+                "skipped": job.skipped,
+                "error_count": job.error_count,
+                "error_message": job.error_message,
+            },
+        )
+    except Exception as e:
+        logger.warning("Failed to broadcast import progress", import_id=job.id, error=str(e))
@@ -0,0 +1,33 @@
+"""Page view aggregator worker.
+
+Consumes the page view queue in large batches (see the event source
+batching window in the template) and writes coalesced page counters,
+visitor upserts and page-visit triggers.
+"""
+
+from typing import Any
+
+import structlog
+
+from complens.services.page_views import PageView, PageViewAggregator
+
+logger = structlog.get_logger()
+
+
+def handler(event: dict[str, Any], context: Any) -> dict:
+    """Aggregate a batch of page view messages from SQS."""
+    aggregator = PageViewAggregator()
+    invalid = 0
+
+    for record in event.get("Records", []):
+        try:
+            view = PageView.from_message(record.get("body", "{}"))
+        except (ValueError, TypeError):
+            invalid += 1
+            continue
+        aggregator.add(view)
+
+    if invalid:
+        logger.warning("Skipped invalid page view messages", count=invalid)
+
+    return aggregator.flush().to_dict()
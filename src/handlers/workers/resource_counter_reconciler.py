@@ -0,0 +1,28 @@
+"""Resource counter reconciliation worker.
+
+Runs daily: recounts every workspace's resources with a parallel scan
+and corrects counters that drifted from the items.
+"""
+
+import os
+from typing import Any
+
+import structlog
+
+from complens.services.resource_counters import RECONCILE_SEGMENTS, reconcile_all
+
+logger = structlog.get_logger()
+
+
+def handler(event: dict[str, Any], context: Any) -> dict:
+    """Reconcile all resource counters.
+
+    Args:
+        event: Schedule event.
+        context: Lambda context.
+
+    Returns:
+        Reconciliation stats.
+    """
+    segments = int(os.environ.get("RECONCILE_SEGMENTS", RECONCILE_SEGMENTS))
+    return reconcile_all(total_segments=segments)
@@ -2,7 +2,10 @@
 
 Processes workflow trigger events from sharded standard SQS queues.
 Integrates with the fair scheduler to ensure multi-tenant fairness
-and prevents any single workspace from monopolizing processing.
+and prevents any single workspace from monopolizing processing: each
+batch is dispatched by tier-weighted deficit round-robin across
+workspaces, and over-quota messages are deferred rather than retried
+after the full visibility timeout.
 
 This replaces the FIFO queue processor for workspaces that have been
 migrated to the new sharded queue architecture.
@@ -10,16 +13,30 @@ migrated to the new sharded queue architecture.
 
 import json
 import os
+from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
-import boto3
 import structlog
 
 from complens.models.base import generate_ulid
+from complens.queue.batch_processor import (
+    BatchResult,
+    BatchTask,
+    get_sfn_client,
+    group_by,
+    is_batch_mode_enabled,
+    run_tasks,
+)
+from complens.queue.dispatch import Deferral, defer_messages, plan_dispatch
 from complens.queue.fair_scheduler import FairScheduler, TenantTier, get_fair_scheduler
 from complens.queue.feature_flags import FeatureFlag, is_flag_enabled
-from complens.repositories.workflow import WorkflowRepository
-from complens.repositories.workspace import WorkspaceRepository
+from complens.queue.trigger_index import (
+    TriggerIndex,
+    TriggerIndexEntry,
+    get_trigger_index_cache,
+)
+from complens.services.feature_gate import get_cached_workspace
 
 logger = structlog.get_logger()
 
@@ -38,7 +55,6 @@ def handler(event: dict[str, Any], context: Any) -> dict:
         Batch item failures for partial retry.
     """
     records = event.get("Records", [])
-    batch_item_failures = []
 
     # Get the shard index from the event source ARN
     shard_index = _extract_shard_index(event)
@@ -51,6 +67,27 @@ def handler(event: dict[str, Any], context: Any) -> dict:
 
     # Initialize scheduler
     scheduler = get_fair_scheduler()
+    try:
+        if is_batch_mode_enabled():
+            return process_batch(records, scheduler, shard_index)
+        return _process_records(records, scheduler, shard_index)
+    finally:
+        # Hand back credits leased more than a few seconds ago
+        scheduler.release_leases(max_hold=scheduler.lease_hold_seconds)
+
+
+def _process_records(records: list[dict], scheduler: FairScheduler, shard_index: int) -> dict:
+    """Process records one at a time, reporting throttled ones as failures.
+
+    Args:
+        records: SQS records.
+        scheduler: Fair scheduler instance.
+        shard_index: Current shard index.
+
+    Returns:
+        Batch item failures for partial retry.
+    """
+    batch_item_failures = []
 
     for record in records:
         try:
@@ -105,20 +142,26 @@ def _extract_shard_index(event: dict) -> int:
     return -1
 
 
-def process_queue_record(
-    record: dict,
-    scheduler: FairScheduler,
-    shard_index: int,
-) -> bool:
-    """Process a single SQS record with fair scheduling.
+@dataclass
+class QueueRecord:
+    """A parsed sharded-queue message."""
+
+    message_id: str | None
+    workspace_id: str
+    priority: str
+    event_data: dict
+    receipt_handle: str | None = None
+    source_arn: str = ""
+
+
+def parse_queue_record(record: dict) -> QueueRecord | None:
+    """Parse a single SQS record.
 
     Args:
         record: SQS record.
-        scheduler: Fair scheduler instance.
-        shard_index: Current shard index.
 
     Returns:
-        True if processed successfully, False if throttled.
+        Parsed record, or None if the message should be dropped.
     """
     message_id = record.get("messageId")
     body = record.get("body", "{}")
@@ -133,7 +176,7 @@ def process_queue_record(
         event_data = json.loads(body)
     except json.JSONDecodeError:
         logger.error("Invalid JSON in queue message", message_id=message_id)
-        return True  # Don't retry invalid JSON
+        return None  # Don't retry invalid JSON
 
     # Get workspace ID from body if not in attributes
     if not workspace_id:
@@ -144,7 +187,200 @@ def process_queue_record(
             "Missing workspace_id in message",
             message_id=message_id,
         )
-        return True  # Don't retry messages without workspace
+        return None  # Don't retry messages without workspace
+
+    return QueueRecord(
+        message_id=message_id,
+        workspace_id=workspace_id,
+        priority=priority,
+        event_data=event_data,
+        receipt_handle=record.get("receiptHandle"),
+        source_arn=record.get("eventSourceARN", ""),
+    )
+
+
+def process_batch(
+    records: list[dict],
+    scheduler: FairScheduler,
+    shard_index: int,
+) -> dict:
+    """Process a whole SQS batch with deficit round-robin dispatch.
+
+    Feature flags, tenant tier and the trigger index are loaded once per
+    workspace. The batch is ordered by tier-weighted deficit round-robin
+    across workspaces and admitted through the fair scheduler in that
+    order, consuming credits at admission so a single batch cannot
+    overdraw a tenant. Admitted work then runs concurrently, started in
+    dispatch order. Over-quota records are deferred with a computed
+    visibility delay; they and failed records are reported for retry.
+
+    Args:
+        records: SQS records.
+        scheduler: Fair scheduler instance.
+        shard_index: Current shard index.
+
+    Returns:
+        Batch item failures for partial retry.
+    """
+    result = BatchResult()
+    tasks: list[BatchTask] = []
+    parsed_records: list[QueueRecord] = []
+
+    for record in records:
+        try:
+            parsed = parse_queue_record(record)
+        except Exception as e:
+            logger.exception(
+                "Failed to parse queue record",
+                message_id=record.get("messageId"),
+                error=str(e),
+            )
+            result.fail(record.get("messageId"))
+            continue
+
+        if parsed is not None:
+            parsed_records.append(parsed)
+
+    groups = group_by(parsed_records, lambda r: r.workspace_id)
+    fair_workspaces: set[str] = set()
+    tiers: dict[str, TenantTier] = {}
+
+    for workspace_id, group in list(groups.items()):
+        try:
+            if is_flag_enabled(FeatureFlag.USE_FAIR_SCHEDULER, workspace_id):
+                fair_workspaces.add(workspace_id)
+            tiers[workspace_id] = _get_workspace_tier(workspace_id)
+        except Exception as e:
+            logger.exception(
+                "Failed to prepare workspace group",
+                workspace_id=workspace_id,
+                error=str(e),
+            )
+            for parsed in group:
+                result.fail(parsed.message_id)
+            del groups[workspace_id]
+
+    plan = plan_dispatch(
+        groups,
+        scheduler,
+        tiers,
+        priority=lambda r: r.priority,
+        scheduled=fair_workspaces,
+    )
+
+    if plan.deferred:
+        defer_messages([
+            Deferral(
+                message_id=parsed.message_id,
+                receipt_handle=parsed.receipt_handle,
+                source_arn=parsed.source_arn,
+                delay_seconds=delay,
+            )
+            for _, parsed, delay in plan.deferred
+        ])
+        # Reported as failures so Lambda leaves them on the queue
+        for _, parsed, _ in plan.deferred:
+            result.fail(parsed.message_id)
+
+    indexes: dict[str, TriggerIndex] = {}
+    for workspace_id, parsed in plan.admitted:
+        try:
+            tasks.extend(_build_record_tasks(workspace_id, parsed, indexes))
+        except Exception as e:
+            logger.exception(
+                "Failed to prepare queue record",
+                workspace_id=workspace_id,
+                message_id=parsed.message_id,
+                error=str(e),
+            )
+            result.fail(parsed.message_id)
+
+    run_tasks(tasks, result)
+
+    logger.info(
+        "Sharded queue batch complete",
+        record_count=len(records),
+        workspace_count=len(groups),
+        execution_count=len(tasks),
+        deferred_count=len(plan.deferred),
+        failed_count=len(result.failed_message_ids),
+        shard_index=shard_index,
+    )
+
+    return result.to_response()
+
+
+def _build_record_tasks(
+    workspace_id: str,
+    parsed: QueueRecord,
+    indexes: dict[str, TriggerIndex],
+) -> list[BatchTask]:
+    """Build the execution tasks for an admitted record.
+
+    Args:
+        workspace_id: Workspace ID of the record.
+        parsed: Parsed record.
+        indexes: Trigger indexes loaded so far in this batch, by workspace.
+
+    Returns:
+        Tasks to run for the record.
+    """
+    event_data = parsed.event_data
+
+    if event_data.get("action") == "resume_workflow":
+        return [BatchTask(
+            message_id=parsed.message_id,
+            run=partial(handle_workflow_resume, event_data),
+            description="resume_workflow",
+        )]
+
+    trigger_type = event_data.get("trigger_type")
+    if not trigger_type:
+        return []
+
+    if workspace_id not in indexes:
+        indexes[workspace_id] = get_trigger_index_cache().get(workspace_id)
+
+    return [
+        BatchTask(
+            message_id=parsed.message_id,
+            run=partial(
+                start_workflow_execution,
+                workflow_id=entry.workflow_id,
+                workspace_id=workspace_id,
+                contact_id=event_data.get("contact_id"),
+                trigger_type=trigger_type,
+                trigger_data=event_data,
+            ),
+            description=f"start:{entry.workflow_id}",
+        )
+        for entry in match_workflows(indexes[workspace_id], trigger_type, event_data)
+    ]
+
+
+def process_queue_record(
+    record: dict,
+    scheduler: FairScheduler,
+    shard_index: int,
+) -> bool:
+    """Process a single SQS record with fair scheduling.
+
+    Args:
+        record: SQS record.
+        scheduler: Fair scheduler instance.
+        shard_index: Current shard index.
+
+    Returns:
+        True if processed successfully, False if throttled.
+    """
+    parsed = parse_queue_record(record)
+    if parsed is None:
+        return True
+
+    message_id = parsed.message_id
+    workspace_id = parsed.workspace_id
+    priority = parsed.priority
+    event_data = parsed.event_data
 
     # Check if fair scheduling is enabled
     if is_flag_enabled(FeatureFlag.USE_FAIR_SCHEDULER, workspace_id):
@@ -227,8 +463,7 @@ def _get_workspace_tier(workspace_id: str) -> TenantTier:
         TenantTier enum value.
     """
     try:
-        workspace_repo = WorkspaceRepository()
-        workspace = workspace_repo.get_by_id(workspace_id)
+        workspace = get_cached_workspace(workspace_id)
 
         if workspace:
             tier_str = workspace.settings.get("subscription_tier", "free")
@@ -274,7 +509,7 @@ def handle_workflow_resume(event_data: dict) -> None:
         logger.error("WORKFLOW_STATE_MACHINE_ARN not configured")
         return
 
-    sfn = boto3.client("stepfunctions")
+    sfn = get_sfn_client()
 
     execution_input = {
         "workflow_run_id": workflow_run_id,
@@ -325,29 +560,21 @@ def find_and_trigger_workflows(
         trigger_type: Type of trigger.
         trigger_data: Trigger event data.
     """
-    repo = WorkflowRepository()
-    workflows = repo.list_active(workspace_id)
+    index = get_trigger_index_cache().get(workspace_id)
 
     triggered_count = 0
 
-    for workflow in workflows:
-        trigger_node = workflow.get_trigger_node()
-        if not trigger_node or trigger_node.node_type != trigger_type:
-            continue
-
-        if not _matches_trigger_config(trigger_node, trigger_type, trigger_data):
-            continue
-
+    for entry in match_workflows(index, trigger_type, trigger_data):
         logger.info(
             "Triggering workflow",
-            workflow_id=workflow.id,
-            workflow_name=workflow.name,
+            workflow_id=entry.workflow_id,
+            workflow_name=entry.workflow_name,
             trigger_type=trigger_type,
             contact_id=contact_id,
         )
 
         start_workflow_execution(
-            workflow_id=workflow.id,
+            workflow_id=entry.workflow_id,
             workspace_id=workspace_id,
             contact_id=contact_id,
             trigger_type=trigger_type,
@@ -363,6 +590,28 @@ def find_and_trigger_workflows(
     )
 
 
+def match_workflows(
+    index: TriggerIndex,
+    trigger_type: str,
+    trigger_data: dict,
+) -> list[TriggerIndexEntry]:
+    """Get the workflows an event should start.
+
+    Args:
+        index: Workspace trigger index.
+        trigger_type: Type of trigger.
+        trigger_data: Trigger event data.
+
+    Returns:
+        Matching index entries.
+    """
+    return [
+        entry
+        for entry in index.lookup(trigger_type, trigger_data)
+        if _matches_trigger_config(entry.trigger_node, trigger_type, trigger_data)
+    ]
+
+
 def _matches_trigger_config(
     trigger_node: Any,
     trigger_type: str,
@@ -429,7 +678,7 @@ def start_workflow_execution(
         logger.warning("WORKFLOW_STATE_MACHINE_ARN not configured")
         return None
 
-    sfn = boto3.client("stepfunctions")
+    sfn = get_sfn_client()
 
     workflow_run_id = f"run-{generate_ulid()}"
 
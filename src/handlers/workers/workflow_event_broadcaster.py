@@ -0,0 +1,42 @@
+"""Workflow event broadcaster worker.
+
+Consumes the broadcast queue that emit_workflow_event() and
+emit_workspace_event() write to when BROADCAST_QUEUE_URL is set, and
+fans each event out to the workspace's WebSocket connections. Workflow
+events are coalesced per batch (see broadcast_workflow_events), so the
+batching window in template.yaml bounds how stale a summary frame can
+be. Events are best effort: failures are logged, never retried.
+"""
+
+import json
+from typing import Any
+
+import structlog
+
+from complens.services.workflow_events import broadcast_workflow_events
+
+logger = structlog.get_logger()
+
+
+def handler(event: dict[str, Any], context: Any) -> dict:
+    """Broadcast a batch of queued workflow events."""
+    broadcasts = []
+    invalid = 0
+
+    for record in event.get("Records", []):
+        try:
+            body = json.loads(record.get("body", "{}"))
+            broadcasts.append({
+                "workspace_id": body["workspace_id"],
+                "message": body["message"],
+                "connections_table": body["connections_table"],
+                "ws_endpoint": body["ws_endpoint"],
+            })
+        except (ValueError, KeyError, TypeError):
+            invalid += 1
+
+    if invalid:
+        logger.warning("Skipped invalid broadcast messages", count=invalid)
+
+    sent = broadcast_workflow_events(broadcasts) if broadcasts else 0
+    return {"events": len(event.get("Records", [])), "sent": sent, "invalid": invalid}
@@ -10,20 +10,25 @@ the USE_NODE_DISPATCHER feature flag is enabled.
 import asyncio
 import json
 import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import boto3
 import structlog
 
+from complens.execution.circuit_breaker import get_circuit_breaker_registry
+from complens.execution.context_cache import get_execution_context_cache
 from complens.execution.node_dispatcher import dispatch_node, get_node_dispatcher
+from complens.execution.workflow_classifier import get_workflow_classifier
+from complens.models.contact import Contact
+from complens.models.workflow import Workflow
 from complens.models.workflow_run import RunStatus, WorkflowRun
 from complens.nodes.base import NodeContext, NodeResult
 from complens.queue.feature_flags import FeatureFlag, is_flag_enabled
 from complens.repositories.contact import ContactRepository
-from complens.repositories.site import SiteRepository
-from complens.repositories.workflow import WorkflowRepository, WorkflowRunRepository
-from complens.repositories.workspace import WorkspaceRepository
+from complens.repositories.workflow import WorkflowRunRepository
 from complens.services.workflow_engine import WorkflowEngine
 from complens.services.workflow_events import (
     emit_node_completed,
@@ -36,6 +41,96 @@ from complens.services.workflow_events import (
 
 logger = structlog.get_logger()
 
+# Default wall-clock budget for fusing nodes into one invocation
+DEFAULT_FUSION_BUDGET_MS = 60_000
+
+# Time kept in reserve before the Lambda timeout when fusing nodes
+FUSION_SAFETY_MARGIN_MS = 10_000
+
+# Event loop reused across warm invocations
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the container-level event loop, creating it if needed.
+
+    Returns:
+        Event loop for running async node code.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
+@dataclass
+class _FusionPlan:
+    """Boundaries for executing several nodes in one invocation."""
+
+    deadline: float  # time.monotonic() deadline
+    barriers: frozenset[str]  # node IDs that must run as their own task
+
+    def can_continue(self, result: dict, workflow: Workflow) -> bool:
+        """Check whether the next node can run in this invocation.
+
+        Args:
+            result: Result of the node that just ran.
+            workflow: Workflow definition.
+
+        Returns:
+            True if the next node should be executed in-process.
+        """
+        next_node_id = result.get("next_node_id")
+        if not result.get("success") or result.get("status") != "completed" or not next_node_id:
+            return False
+
+        if next_node_id in self.barriers:
+            return False
+
+        next_node = workflow.get_node_by_id(next_node_id)
+        if not next_node:
+            return False
+
+        # Only start nodes expected to finish within the remaining budget
+        estimate = get_workflow_classifier().estimate_node_seconds(next_node.node_type)
+        return self.deadline - time.monotonic() > estimate
+
+
+def _get_fusion_plan(event: dict, workflow: Workflow, lambda_context: Any) -> _FusionPlan | None:
+    """Build the node fusion plan for an Express execution.
+
+    Fusion only applies to Express executions (Standard executions keep
+    per-node state history) with the ENABLE_NODE_FUSION flag on.
+
+    Args:
+        event: Step Functions input.
+        workflow: Workflow definition.
+        lambda_context: Lambda context (None outside Lambda).
+
+    Returns:
+        Fusion plan, or None if nodes should run one per invocation.
+    """
+    if event.get("execution_type") != "express":
+        return None
+
+    if not is_flag_enabled(FeatureFlag.ENABLE_NODE_FUSION, workflow.workspace_id):
+        return None
+
+    budget_ms = int(os.environ.get("NODE_FUSION_BUDGET_MS", DEFAULT_FUSION_BUDGET_MS))
+    if lambda_context is not None:
+        budget_ms = min(
+            budget_ms,
+            lambda_context.get_remaining_time_in_millis() - FUSION_SAFETY_MARGIN_MS,
+        )
+
+    if budget_ms <= 0:
+        return None
+
+    return _FusionPlan(
+        deadline=time.monotonic() + budget_ms / 1000,
+        barriers=get_workflow_classifier().get_fusion_barriers(workflow),
+    )
+
 
 def handler(event: dict[str, Any], context: Any) -> dict:
     """Execute workflow step from Step Functions.
@@ -55,9 +150,9 @@ def handler(event: dict[str, Any], context: Any) -> dict:
         if action == "initialize":
             return initialize_workflow(event)
         elif action == "execute_node":
-            return execute_node(event)
+            return execute_node(event, context)
         elif action == "resume_after_wait":
-            return resume_after_wait(event)
+            return resume_after_wait(event, context)
         elif action == "schedule_resume":
             return schedule_long_wait_resume(event)
         elif action == "complete":
@@ -72,6 +167,21 @@ def handler(event: dict[str, Any], context: Any) -> dict:
             "error": str(e),
         }
 
+    finally:
+        _flush_circuit_breakers()
+
+
+def _flush_circuit_breakers() -> None:
+    """Flush write-behind circuit breaker counts before the container freezes.
+
+    Node outcomes are aggregated in the container; without a flush they
+    would be lost when it is frozen or recycled and never shared.
+    """
+    try:
+        get_circuit_breaker_registry().flush()
+    except Exception as e:
+        logger.warning("Failed to flush circuit breaker state", error=str(e))
+
 
 def initialize_workflow(event: dict) -> dict:
     """Initialize a new workflow run.
@@ -88,9 +198,9 @@ def initialize_workflow(event: dict) -> dict:
     trigger_type = event.get("trigger_type", "manual")
     trigger_data = event.get("trigger_data", {})
 
-    # Get workflow
-    workflow_repo = WorkflowRepository()
-    workflow = workflow_repo.get_by_id(workspace_id, workflow_id)
+    # Get workflow (cached per container; edits propagate within the TTL)
+    cache = get_execution_context_cache()
+    workflow = cache.get_workflow(workspace_id, workflow_id)
 
     if not workflow:
         raise ValueError(f"Workflow {workflow_id} not found")
@@ -127,6 +237,7 @@ def initialize_workflow(event: dict) -> dict:
 
     # Store the run
     run = run_repo.create_run(run)
+    cache.remember_run(run)
 
     # Get trigger node
     trigger_node = workflow.get_trigger_node()
@@ -153,14 +264,18 @@ def initialize_workflow(event: dict) -> dict:
         "workflow_run_id": run.id,
         "current_node_id": trigger_node.id,
         "variables": {},
+        # Only the version travels in state (it lands in execution history);
+        # the run and settings are resolved from the container cache
+        "cached_context": {"workflow_version": workflow.version},
     }
 
 
-def execute_node(event: dict) -> dict:
-    """Execute a single workflow node.
+def execute_node(event: dict, lambda_context: Any = None) -> dict:
+    """Execute a workflow node, fusing following nodes when possible.
 
     Args:
         event: Event data with run_id, node_id, variables.
+        lambda_context: Lambda context (bounds the node fusion budget).
 
     Returns:
         Node execution result.
@@ -168,55 +283,115 @@ def execute_node(event: dict) -> dict:
     workflow_run_id = event.get("workflow_run_id")
     current_node_id = event.get("current_node_id")
     variables = event.get("variables", {})
-
-    # Get workflow run
-    run_repo = WorkflowRunRepository()
-    workflow_repo = WorkflowRepository()
-    contact_repo = ContactRepository()
-    workspace_repo = WorkspaceRepository()
-
-    # Find the run
-    # Note: We need to know the workflow_id to get the run
-    # For Step Functions, we should pass workflow_id in the event
     workflow_id = event.get("workflow_id")
     workspace_id = event.get("workspace_id")
 
+    # Context captured at initialize (absent for executions started before
+    # it was introduced, in which case the latest definition is used)
+    cached_context = event.get("cached_context") or {}
+    cache = get_execution_context_cache()
+
     if not workflow_id:
         raise ValueError("workflow_id is required")
 
-    run = run_repo.get_by_id(workflow_id, workflow_run_id)
+    run = cache.get_run(workspace_id, workflow_id, workflow_run_id)
     if not run:
         raise ValueError(f"Workflow run {workflow_run_id} not found")
 
-    workflow = workflow_repo.get_by_id(workspace_id, workflow_id)
+    workflow = cache.get_workflow(
+        workspace_id, workflow_id, version=cached_context.get("workflow_version")
+    )
     if not workflow:
         raise ValueError(f"Workflow {workflow_id} not found")
 
-    # Contact may be None for form submissions that don't create contacts
+    # Contact is mutable (tags, fields) so it is always read fresh.
+    # It may be None for form submissions that don't create contacts.
     contact = None
     if run.contact_id:
-        contact = contact_repo.get_by_id(workspace_id, run.contact_id)
-
-    # Load workspace for settings (notification_email, from_email, etc.)
-    workspace = workspace_repo.get_by_id(workspace_id)
-    workspace_settings = {}
-    if workspace:
-        # Merge explicit fields and settings dict for template access
-        workspace_settings = {
-            **workspace.settings,
-            "notification_email": workspace.notification_email or "",
-            "from_email": workspace.from_email or "",
-            "name": workspace.name,
-            "twilio_phone_number": workspace.twilio_phone_number or "",
-        }
+        contact = ContactRepository().get_by_id(workspace_id, run.contact_id)
+
+    # Workspace settings (notification_email, from_email, etc.)
+    workspace_settings = cache.get_workspace_settings(workspace_id)
+
+    # Site settings if workflow is scoped to a site
+    site_settings = cache.get_site_settings(workspace_id, workflow.site_id)
+
+    loop = _get_event_loop()
+    engine = WorkflowEngine()
+
+    result = _run_node(
+        loop=loop,
+        engine=engine,
+        workflow=workflow,
+        run=run,
+        contact=contact,
+        current_node_id=current_node_id,
+        variables=variables,
+        workspace_settings=workspace_settings,
+        site_settings=site_settings,
+    )
+
+    # Node fusion: keep executing non-waiting nodes in this invocation
+    # instead of paying a Lambda invoke and state transitions per node
+    fusion = _get_fusion_plan(event, workflow, lambda_context)
+    nodes_executed = 1
+
+    while fusion and fusion.can_continue(result, workflow):
+        result = _run_node(
+            loop=loop,
+            engine=engine,
+            workflow=workflow,
+            run=run,
+            contact=contact,
+            current_node_id=result["next_node_id"],
+            variables=result["variables"],
+            workspace_settings=workspace_settings,
+            site_settings=site_settings,
+        )
+        nodes_executed += 1
+
+    if nodes_executed > 1:
+        logger.info(
+            "Fused node execution",
+            workflow_run_id=workflow_run_id,
+            nodes_executed=nodes_executed,
+            next_node_id=result["next_node_id"],
+        )
 
-    # Load site settings if workflow is scoped to a site
-    site_settings: dict = {}
-    if workflow.site_id:
-        site_repo = SiteRepository()
-        site = site_repo.get_by_id(workspace_id, workflow.site_id)
-        if site:
-            site_settings = site.settings or {}
+    result["nodes_executed"] = nodes_executed
+    return result
+
+
+def _run_node(
+    loop: asyncio.AbstractEventLoop,
+    engine: WorkflowEngine,
+    workflow: Workflow,
+    run: WorkflowRun,
+    contact: Contact | None,
+    current_node_id: str,
+    variables: dict,
+    workspace_settings: dict,
+    site_settings: dict,
+) -> dict:
+    """Execute one node and determine where the run goes next.
+
+    Args:
+        loop: Event loop for async node code.
+        engine: Workflow engine (node registry).
+        workflow: Workflow definition.
+        run: Workflow run.
+        contact: Contact (may be None for form submissions).
+        current_node_id: ID of the node to execute.
+        variables: Variables accumulated so far.
+        workspace_settings: Flattened workspace settings.
+        site_settings: Site settings.
+
+    Returns:
+        Node execution result for Step Functions.
+    """
+    workspace_id = workflow.workspace_id
+    workflow_id = workflow.id
+    workflow_run_id = run.id
 
     # Get node definition
     node_def = workflow.get_node_by_id(current_node_id)
@@ -224,7 +399,6 @@ def execute_node(event: dict) -> dict:
         raise ValueError(f"Node {current_node_id} not found")
 
     # Execute the node
-    engine = WorkflowEngine()
     node_class = engine.get_node_class(node_def.node_type)
 
     if not node_class:
@@ -254,31 +428,26 @@ def execute_node(event: dict) -> dict:
         node_label=node_label,
     )
 
-    # Execute the node
-    loop = asyncio.new_event_loop()
-    try:
-        # Check if node dispatcher is enabled for fault tolerance
-        if is_flag_enabled(FeatureFlag.USE_NODE_DISPATCHER, workspace_id):
-            # Use node dispatcher with circuit breaker and retry
-            dispatch_result = loop.run_until_complete(
-                dispatch_node(node, context)
-            )
-            result = dispatch_result.node_result
-
-            # Log dispatcher metrics
-            logger.info(
-                "Node dispatched",
-                node_id=current_node_id,
-                category=dispatch_result.category.value,
-                retry_attempts=dispatch_result.retry_attempts,
-                execution_time_ms=dispatch_result.execution_time_ms,
-                circuit_state=dispatch_result.circuit_state.value if dispatch_result.circuit_state else None,
-            )
-        else:
-            # Direct execution (legacy path)
-            result = loop.run_until_complete(node.execute(context))
-    finally:
-        loop.close()
+    # Check if node dispatcher is enabled for fault tolerance
+    if is_flag_enabled(FeatureFlag.USE_NODE_DISPATCHER, workspace_id):
+        # Use node dispatcher with circuit breaker and retry
+        dispatch_result = loop.run_until_complete(
+            dispatch_node(node, context)
+        )
+        result = dispatch_result.node_result
+
+        # Log dispatcher metrics
+        logger.info(
+            "Node dispatched",
+            node_id=current_node_id,
+            category=dispatch_result.category.value,
+            retry_attempts=dispatch_result.retry_attempts,
+            execution_time_ms=dispatch_result.execution_time_ms,
+            circuit_state=dispatch_result.circuit_state.value if dispatch_result.circuit_state else None,
+        )
+    else:
+        # Direct execution (legacy path)
+        result = loop.run_until_complete(node.execute(context))
 
     logger.info(
         "Node executed",
@@ -329,18 +498,19 @@ def execute_node(event: dict) -> dict:
     }
 
 
-def resume_after_wait(event: dict) -> dict:
+def resume_after_wait(event: dict, lambda_context: Any = None) -> dict:
     """Resume workflow after a wait.
 
     Args:
         event: Event data.
+        lambda_context: Lambda context.
 
     Returns:
         Resume result.
     """
     # This is essentially the same as execute_node
     # but called after Step Functions Wait state
-    return execute_node(event)
+    return execute_node(event, lambda_context)
 
 
 def complete_workflow(event: dict) -> dict:
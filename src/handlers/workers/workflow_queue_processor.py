@@ -9,17 +9,50 @@ import hashlib
 import hmac
 import json
 import os
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
-import boto3
 import structlog
 
 from complens.models.base import generate_ulid
-from complens.repositories.workflow import WorkflowRepository
+from complens.queue.batch_processor import (
+    BatchResult,
+    BatchTask,
+    GroupedMessage,
+    get_sfn_client,
+    group_by,
+    is_batch_mode_enabled,
+    run_message_groups,
+)
+from complens.queue.trigger_index import (
+    TriggerIndex,
+    TriggerIndexEntry,
+    get_trigger_index_cache,
+)
 
 logger = structlog.get_logger()
 
 
+# Trigger types that may fire without a contact
+CONTACTLESS_TRIGGER_TYPES = (
+    "trigger_form_submitted", "trigger_webhook", "trigger_schedule",
+    "trigger_page_visit", "trigger_chat_started", "trigger_chat_message",
+)
+
+
+@dataclass
+class QueueRecord:
+    """A parsed, validated queue message."""
+
+    message_id: str | None
+    workspace_id: str | None = None
+    contact_id: str | None = None
+    trigger_type: str | None = None
+    trigger_data: dict = field(default_factory=dict)
+    resume_data: dict | None = None
+
+
 def handler(event: dict[str, Any], context: Any) -> dict:
     """Process workflow trigger events from SQS FIFO queue.
 
@@ -34,10 +67,14 @@ def handler(event: dict[str, Any], context: Any) -> dict:
         Batch item failures for partial retry.
     """
     records = event.get("Records", [])
-    batch_item_failures = []
 
     logger.info("Processing workflow queue", record_count=len(records))
 
+    if is_batch_mode_enabled():
+        return process_batch(records)
+
+    batch_item_failures = []
+
     for record in records:
         try:
             process_queue_record(record)
@@ -57,8 +94,104 @@ def handler(event: dict[str, Any], context: Any) -> dict:
     }
 
 
-def process_queue_record(record: dict) -> None:
-    """Process a single SQS record.
+def process_batch(records: list[dict]) -> dict:
+    """Process a whole SQS batch grouped by FIFO message group.
+
+    The trigger index is loaded once per workspace and every matching
+    workflow start is collected up front. Message groups then run
+    concurrently, but the messages within a group run serially in arrival
+    order. When a message fails, it and every later message in its group
+    are reported for retry so the group keeps its FIFO order.
+
+    Args:
+        records: SQS records.
+
+    Returns:
+        Batch item failures for partial retry.
+    """
+    result = BatchResult()
+    groups: dict[str, list[GroupedMessage]] = {}
+    triggers: list[tuple[GroupedMessage, QueueRecord]] = []
+
+    for record in records:
+        message_id = record.get("messageId")
+        message = GroupedMessage(message_id=message_id)
+        try:
+            parsed = parse_queue_record(record)
+        except Exception as e:
+            logger.exception(
+                "Failed to parse queue record",
+                message_id=message_id,
+                error=str(e),
+            )
+            parsed = None
+            result.fail(message_id)
+
+        group_id = (
+            record.get("attributes", {}).get("MessageGroupId")
+            or (parsed.workspace_id if parsed else None)
+            or message_id
+            or ""
+        )
+        groups.setdefault(group_id, []).append(message)
+
+        if parsed is None:
+            continue
+
+        if parsed.resume_data is not None:
+            message.tasks.append(BatchTask(
+                message_id=message_id,
+                run=partial(handle_workflow_resume, parsed.resume_data),
+                description="resume_workflow",
+            ))
+        else:
+            triggers.append((message, parsed))
+
+    index_cache = get_trigger_index_cache()
+
+    for workspace_id, group in group_by(triggers, lambda t: t[1].workspace_id).items():
+        try:
+            index = index_cache.get(workspace_id)
+        except Exception as e:
+            logger.exception(
+                "Failed to load trigger index",
+                workspace_id=workspace_id,
+                error=str(e),
+            )
+            for message, _ in group:
+                result.fail(message.message_id)
+            continue
+
+        for message, parsed in group:
+            for entry in match_workflows(index, parsed.trigger_type, parsed.trigger_data):
+                message.tasks.append(BatchTask(
+                    message_id=parsed.message_id,
+                    run=partial(
+                        start_workflow_execution,
+                        workflow_id=entry.workflow_id,
+                        workspace_id=workspace_id,
+                        contact_id=parsed.contact_id,
+                        trigger_type=parsed.trigger_type,
+                        trigger_data=parsed.trigger_data,
+                    ),
+                    description=f"start:{entry.workflow_id}",
+                ))
+
+    run_message_groups(groups.values(), result)
+
+    logger.info(
+        "Workflow queue batch complete",
+        record_count=len(records),
+        group_count=len(groups),
+        execution_count=sum(len(m.tasks) for group in groups.values() for m in group),
+        failed_count=len(result.failed_message_ids),
+    )
+
+    return result.to_response()
+
+
+def parse_queue_record(record: dict) -> QueueRecord | None:
+    """Parse and validate a single SQS record.
 
     The record body contains either:
     - An EventBridge event detail (for new triggers)
@@ -66,6 +199,9 @@ def process_queue_record(record: dict) -> None:
 
     Args:
         record: SQS record.
+
+    Returns:
+        Parsed record, or None if the message should be dropped.
     """
     message_id = record.get("messageId")
     body = record.get("body", "{}")
@@ -75,12 +211,11 @@ def process_queue_record(record: dict) -> None:
         event_data = json.loads(body)
     except json.JSONDecodeError:
         logger.error("Invalid JSON in queue message", message_id=message_id)
-        return
+        return None
 
     # Check if this is a resume action from a scheduled wait
     if event_data.get("action") == "resume_workflow":
-        handle_workflow_resume(event_data)
-        return
+        return QueueRecord(message_id=message_id, resume_data=event_data)
 
     # EventBridge puts the actual event detail in "detail"
     # But if sent directly from SQS, it might be the raw detail
@@ -94,7 +229,6 @@ def process_queue_record(record: dict) -> None:
     workspace_id = detail.get("workspace_id")
     contact_id = detail.get("contact_id")
     trigger_type = detail.get("trigger_type")
-    trigger_data = detail
 
     # workspace_id and trigger_type are always required
     if not workspace_id or not trigger_type:
@@ -104,35 +238,55 @@ def process_queue_record(record: dict) -> None:
             workspace_id=workspace_id,
             trigger_type=trigger_type,
         )
-        return
+        return None
 
     # contact_id is optional for form submission, webhook, schedule, and visitor triggers
     # but required for other trigger types like tag_added, etc.
-    if not contact_id and trigger_type not in (
-        "trigger_form_submitted", "trigger_webhook", "trigger_schedule",
-        "trigger_page_visit", "trigger_chat_started", "trigger_chat_message",
-    ):
+    if not contact_id and trigger_type not in CONTACTLESS_TRIGGER_TYPES:
         logger.warning(
             "Missing contact_id for trigger that requires it",
             message_id=message_id,
             workspace_id=workspace_id,
             trigger_type=trigger_type,
         )
-        return
+        return None
 
-    logger.info(
-        "Processing workflow trigger",
+    return QueueRecord(
+        message_id=message_id,
         workspace_id=workspace_id,
         contact_id=contact_id,
         trigger_type=trigger_type,
+        trigger_data=detail,
+    )
+
+
+def process_queue_record(record: dict) -> None:
+    """Process a single SQS record.
+
+    Args:
+        record: SQS record.
+    """
+    parsed = parse_queue_record(record)
+    if parsed is None:
+        return
+
+    if parsed.resume_data is not None:
+        handle_workflow_resume(parsed.resume_data)
+        return
+
+    logger.info(
+        "Processing workflow trigger",
+        workspace_id=parsed.workspace_id,
+        contact_id=parsed.contact_id,
+        trigger_type=parsed.trigger_type,
     )
 
     # Find matching workflows
     find_and_trigger_workflows(
-        workspace_id=workspace_id,
-        contact_id=contact_id,
-        trigger_type=trigger_type,
-        trigger_data=trigger_data,
+        workspace_id=parsed.workspace_id,
+        contact_id=parsed.contact_id,
+        trigger_type=parsed.trigger_type,
+        trigger_data=parsed.trigger_data,
     )
 
 
@@ -163,7 +317,7 @@ def handle_workflow_resume(event_data: dict) -> None:
         logger.error("WORKFLOW_STATE_MACHINE_ARN not configured")
         return
 
-    sfn = boto3.client("stepfunctions")
+    sfn = get_sfn_client()
 
     # The execution input includes the current state
     execution_input = {
@@ -216,34 +370,21 @@ def find_and_trigger_workflows(
         trigger_type: Type of trigger.
         trigger_data: Trigger event data.
     """
-    repo = WorkflowRepository()
-
-    # Get active workflows for workspace
-    workflows = repo.list_active(workspace_id)
+    index = get_trigger_index_cache().get(workspace_id)
 
     triggered_count = 0
 
-    for workflow in workflows:
-        # Check if workflow has matching trigger
-        trigger_node = workflow.get_trigger_node()
-        if not trigger_node or trigger_node.node_type != trigger_type:
-            continue
-
-        # Check trigger configuration matches
-        if not _matches_trigger_config(trigger_node, trigger_type, trigger_data):
-            continue
-
-        # Trigger matches - start workflow
+    for entry in match_workflows(index, trigger_type, trigger_data):
         logger.info(
             "Triggering workflow",
-            workflow_id=workflow.id,
-            workflow_name=workflow.name,
+            workflow_id=entry.workflow_id,
+            workflow_name=entry.workflow_name,
             trigger_type=trigger_type,
             contact_id=contact_id,
         )
 
         start_workflow_execution(
-            workflow_id=workflow.id,
+            workflow_id=entry.workflow_id,
             workspace_id=workspace_id,
             contact_id=contact_id,
             trigger_type=trigger_type,
@@ -259,6 +400,31 @@ def find_and_trigger_workflows(
     )
 
 
+def match_workflows(
+    index: TriggerIndex,
+    trigger_type: str,
+    trigger_data: dict,
+) -> list[TriggerIndexEntry]:
+    """Get the workflows an event should start.
+
+    The compiled index narrows candidates by trigger type and key; the
+    remaining configuration (operation, keywords, signature) is checked here.
+
+    Args:
+        index: Workspace trigger index.
+        trigger_type: Type of trigger.
+        trigger_data: Trigger event data.
+
+    Returns:
+        Matching index entries.
+    """
+    return [
+        entry
+        for entry in index.lookup(trigger_type, trigger_data)
+        if _matches_trigger_config(entry.trigger_node, trigger_type, trigger_data)
+    ]
+
+
 def _matches_trigger_config(
     trigger_node: Any,
     trigger_type: str,
@@ -384,7 +550,7 @@ def start_workflow_execution(
         logger.warning("WORKFLOW_STATE_MACHINE_ARN not configured")
         return None
 
-    sfn = boto3.client("stepfunctions")
+    sfn = get_sfn_client()
 
     # Generate a unique run ID
     workflow_run_id = f"run-{generate_ulid()}"
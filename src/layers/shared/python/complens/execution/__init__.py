@@ -4,11 +4,13 @@ This module provides the components for reliable workflow execution:
 - CircuitBreaker: Prevents cascade failures from failing providers
 - RetryPolicy: Exponential backoff with jitter for transient errors
 - NodeDispatcher: Routes node execution to appropriate handlers
+- ExecutionContextCache: Warm-container cache of workflows and settings
 """
 
 from complens.execution.circuit_breaker import (
     CircuitBreakerConfig,
     CircuitBreakerError,
+    CircuitBreakerMode,
     CircuitBreakerRegistry,
     CircuitBreakerState,
     CircuitMetrics,
@@ -16,6 +18,11 @@ from complens.execution.circuit_breaker import (
     get_circuit_breaker_registry,
     with_circuit_breaker,
 )
+from complens.execution.context_cache import (
+    ExecutionContextCache,
+    build_workspace_settings,
+    get_execution_context_cache,
+)
 from complens.execution.node_dispatcher import (
     DispatchMetrics,
     DispatchResult,
@@ -48,12 +55,17 @@ __all__ = [
     # Circuit breaker
     "CircuitBreakerConfig",
     "CircuitBreakerError",
+    "CircuitBreakerMode",
     "CircuitBreakerRegistry",
     "CircuitBreakerState",
     "CircuitMetrics",
     "CircuitState",
     "get_circuit_breaker_registry",
     "with_circuit_breaker",
+    # Context cache
+    "ExecutionContextCache",
+    "build_workspace_settings",
+    "get_execution_context_cache",
     # Node dispatcher
     "DispatchMetrics",
     "DispatchResult",
@@ -14,6 +14,17 @@ Transitions:
 - OPEN → HALF_OPEN: After recovery_timeout seconds
 - HALF_OPEN → CLOSED: After success_threshold consecutive successes
 - HALF_OPEN → OPEN: On any failure
+
+Persistence modes (CIRCUIT_BREAKER_MODE):
+- local: state lives only in the container.
+- write_through: the whole circuit is written to DynamoDB after every
+  recorded call (last writer wins between containers).
+- write_behind: outcomes are aggregated in the container and flushed as
+  atomic ADD deltas every few seconds or calls. Only state transitions
+  are written synchronously, with a version-conditional update; a
+  container that loses the race adopts the stored state. Each sync also
+  reads back the stored state, so containers converge within one sync
+  interval without per-call writes.
 """
 
 import os
@@ -32,6 +43,19 @@ logger = structlog.get_logger()
 T = TypeVar("T")
 
 
+# Write-behind sync tuning
+SYNC_BATCH_SIZE = 20  # Unsynced calls per circuit before forcing a sync
+SYNC_INTERVAL_SECONDS = 5.0  # Max age of unsynced counts / remote state
+
+
+class CircuitBreakerMode(str, Enum):
+    """Where circuit breaker state is persisted."""
+
+    LOCAL = "local"
+    WRITE_THROUGH = "write_through"
+    WRITE_BEHIND = "write_behind"
+
+
 class CircuitState(str, Enum):
     """Circuit breaker states."""
 
@@ -129,6 +153,12 @@ class CircuitBreakerState:
     metrics: CircuitMetrics = field(default_factory=CircuitMetrics)
     half_open_calls: int = 0
 
+    # Stored state version (write-behind mode) and transition hook
+    version: int = 0
+    on_transition: Callable[["CircuitBreakerState", CircuitState], None] | None = field(
+        default=None, repr=False, compare=False
+    )
+
     def should_allow_request(self) -> bool:
         """Check if a request should be allowed through.
 
@@ -202,6 +232,9 @@ class CircuitBreakerState:
             consecutive_successes=self.metrics.consecutive_successes,
         )
 
+        if self.on_transition:
+            self.on_transition(self, old_state)
+
 
 class CircuitBreakerError(Exception):
     """Raised when circuit is open and request is rejected."""
@@ -212,6 +245,23 @@ class CircuitBreakerError(Exception):
         super().__init__(f"Circuit breaker '{circuit_id}' is {state.value}")
 
 
+@dataclass
+class _SyncState:
+    """Counters already flushed for a circuit and when it last synced."""
+
+    synced: dict[str, int] = field(default_factory=dict)
+    last_sync: float = 0.0
+
+
+# Metrics flushed as ADD deltas in write-behind mode
+_COUNTER_FIELDS = ("total_calls", "successful_calls", "failed_calls", "rejected_calls")
+
+
+def _counters(metrics: CircuitMetrics) -> dict[str, int]:
+    """Current values of the flushed counters."""
+    return {name: getattr(metrics, name) for name in _COUNTER_FIELDS}
+
+
 class CircuitBreakerRegistry:
     """Registry for managing multiple circuit breakers.
 
@@ -240,26 +290,46 @@ class CircuitBreakerRegistry:
         default_config: CircuitBreakerConfig | None = None,
         use_dynamodb: bool | None = None,
         table_name: str | None = None,
+        mode: CircuitBreakerMode | str | None = None,
+        sync_batch_size: int = SYNC_BATCH_SIZE,
+        sync_interval: float = SYNC_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
     ):
         """Initialize the circuit breaker registry.
 
         Args:
             default_config: Default configuration for new circuit breakers.
-            use_dynamodb: Whether to persist state to DynamoDB.
+            use_dynamodb: Whether to persist state to DynamoDB (write-behind
+                unless a mode is given).
             table_name: DynamoDB table name for persistence.
+            mode: Persistence mode; defaults to CIRCUIT_BREAKER_MODE.
+            sync_batch_size: Unsynced calls per circuit before a write-behind sync.
+            sync_interval: Max seconds between write-behind syncs of a circuit.
+            clock: Time source for sync scheduling.
         """
         self.default_config = default_config or CircuitBreakerConfig()
-        self.use_dynamodb = use_dynamodb if use_dynamodb is not None else (
-            os.environ.get("CIRCUIT_BREAKER_USE_DYNAMODB", "false").lower() == "true"
-        )
+        if use_dynamodb is None:
+            use_dynamodb = os.environ.get("CIRCUIT_BREAKER_USE_DYNAMODB", "false").lower() == "true"
+        if mode is None:
+            mode = os.environ.get("CIRCUIT_BREAKER_MODE") or (
+                CircuitBreakerMode.WRITE_BEHIND if use_dynamodb else CircuitBreakerMode.LOCAL
+            )
+        self.mode = CircuitBreakerMode(mode)
+        self.use_dynamodb = self.mode != CircuitBreakerMode.LOCAL
         self.table_name = table_name or os.environ.get(
             "CIRCUIT_BREAKER_TABLE_NAME", "complens-circuit-breakers"
         )
+        self.sync_batch_size = sync_batch_size
+        self.sync_interval = sync_interval
+        self.clock = clock
 
         self._circuits: dict[str, CircuitBreakerState] = {}
+        self._sync: dict[str, _SyncState] = {}
         self._dynamodb = None
         self.logger = logger.bind(service="circuit_breaker_registry")
 
+        self.remote_calls = 0
+
     @property
     def dynamodb(self):
         """Get DynamoDB resource (lazy initialization)."""
@@ -281,21 +351,27 @@ class CircuitBreakerRegistry:
         Returns:
             CircuitBreakerState instance.
         """
-        if circuit_id not in self._circuits:
-            # Try to load from DynamoDB
-            if self.use_dynamodb:
-                state = self._load_from_dynamodb(circuit_id)
-                if state:
-                    self._circuits[circuit_id] = state
-                    return state
-
-            # Create new circuit breaker
-            self._circuits[circuit_id] = CircuitBreakerState(
+        circuit = self._circuits.get(circuit_id)
+        if circuit is not None:
+            self._maybe_sync(circuit)
+            return circuit
+
+        # Try to load from DynamoDB, else create a new circuit breaker
+        circuit = self._load_from_dynamodb(circuit_id) if self.use_dynamodb else None
+        if circuit is None:
+            circuit = CircuitBreakerState(
                 circuit_id=circuit_id,
                 config=config or self.default_config,
             )
 
-        return self._circuits[circuit_id]
+        if self.mode == CircuitBreakerMode.WRITE_BEHIND:
+            circuit.on_transition = self._persist_transition
+            self._sync[circuit_id] = _SyncState(
+                synced=_counters(circuit.metrics), last_sync=self.clock()
+            )
+
+        self._circuits[circuit_id] = circuit
+        return circuit
 
     def get_circuit_for_provider(
         self,
@@ -325,9 +401,7 @@ class CircuitBreakerRegistry:
         if circuit_id in self._circuits:
             circuit = self._circuits[circuit_id]
             circuit.record_success()
-
-            if self.use_dynamodb:
-                self._save_to_dynamodb(circuit)
+            self._after_record(circuit)
 
     def record_failure(self, circuit_id: str) -> None:
         """Record a failed request.
@@ -338,9 +412,7 @@ class CircuitBreakerRegistry:
         if circuit_id in self._circuits:
             circuit = self._circuits[circuit_id]
             circuit.record_failure()
-
-            if self.use_dynamodb:
-                self._save_to_dynamodb(circuit)
+            self._after_record(circuit)
 
     def is_open(self, circuit_id: str) -> bool:
         """Check if a circuit is open.
@@ -363,6 +435,7 @@ class CircuitBreakerRegistry:
         """
         if circuit_id in self._circuits:
             circuit = self._circuits[circuit_id]
+            old_state = circuit.state
             circuit.state = CircuitState.CLOSED
             circuit.metrics = CircuitMetrics()
             circuit.half_open_calls = 0
@@ -372,9 +445,31 @@ class CircuitBreakerRegistry:
                 circuit_id=circuit_id,
             )
 
-            if self.use_dynamodb:
+            if self.mode == CircuitBreakerMode.WRITE_BEHIND:
+                self._sync[circuit_id] = _SyncState(synced=_counters(circuit.metrics))
+                self._persist_transition(circuit, old_state)
+            elif self.use_dynamodb:
                 self._save_to_dynamodb(circuit)
 
+    def flush(self) -> int:
+        """Sync every circuit with unflushed counts (write-behind mode).
+
+        Call at the end of an invocation so counts are not held in a
+        container that may be frozen.
+
+        Returns:
+            Number of circuits synced.
+        """
+        if self.mode != CircuitBreakerMode.WRITE_BEHIND:
+            return 0
+
+        synced = 0
+        for circuit in list(self._circuits.values()):
+            if any(self._pending_deltas(circuit).values()):
+                self._sync_circuit(circuit)
+                synced += 1
+        return synced
+
     def get_all_circuits(self) -> dict[str, dict[str, Any]]:
         """Get status of all circuit breakers.
 
@@ -404,6 +499,160 @@ class CircuitBreakerRegistry:
             for circuit_id, circuit in self._circuits.items()
         }
 
+    def _after_record(self, circuit: CircuitBreakerState) -> None:
+        """Persist a recorded outcome according to the mode."""
+        if self.mode == CircuitBreakerMode.WRITE_THROUGH:
+            self._save_to_dynamodb(circuit)
+        elif self.mode == CircuitBreakerMode.WRITE_BEHIND:
+            self._maybe_sync(circuit)
+
+    def _pending_deltas(self, circuit: CircuitBreakerState) -> dict[str, int]:
+        """Counts recorded locally since the last flush."""
+        synced = self._sync.setdefault(circuit.circuit_id, _SyncState()).synced
+        return {
+            name: value - synced.get(name, 0)
+            for name, value in _counters(circuit.metrics).items()
+        }
+
+    def _maybe_sync(self, circuit: CircuitBreakerState) -> None:
+        """Sync a circuit once enough calls or time have accumulated."""
+        if self.mode != CircuitBreakerMode.WRITE_BEHIND:
+            return
+
+        sync = self._sync.setdefault(circuit.circuit_id, _SyncState())
+        pending = self._pending_deltas(circuit)["total_calls"]
+        if pending >= self.sync_batch_size or self.clock() - sync.last_sync >= self.sync_interval:
+            self._sync_circuit(circuit)
+
+    def _sync_circuit(self, circuit: CircuitBreakerState) -> None:
+        """Flush a circuit's counter deltas and adopt newer stored state.
+
+        Deltas are applied with ADD and the updated item is returned, so a
+        flush also refreshes the state; with nothing to flush the item is
+        read instead. A failed flush keeps the deltas for the next sync.
+        """
+        sync = self._sync.setdefault(circuit.circuit_id, _SyncState())
+        sync.last_sync = self.clock()
+        deltas = {name: n for name, n in self._pending_deltas(circuit).items() if n}
+        key = {"PK": f"CIRCUIT#{circuit.circuit_id}", "SK": "STATE"}
+
+        try:
+            table = self.dynamodb.Table(self.table_name)
+            self.remote_calls += 1
+            if deltas:
+                item = table.update_item(
+                    Key=key,
+                    UpdateExpression=(
+                        "SET circuit_id = :circuit_id, updated_at = :now ADD "
+                        + ", ".join(f"{name} :{name}" for name in deltas)
+                    ),
+                    ExpressionAttributeValues={
+                        ":circuit_id": circuit.circuit_id,
+                        ":now": datetime.now(timezone.utc).isoformat(),
+                        **{f":{name}": n for name, n in deltas.items()},
+                    },
+                    ReturnValues="ALL_NEW",
+                )["Attributes"]
+            else:
+                item = table.get_item(Key=key).get("Item")
+        except ClientError as e:
+            self.logger.warning(
+                "Failed to sync circuit with DynamoDB",
+                circuit_id=circuit.circuit_id,
+                error=str(e),
+            )
+            return
+
+        for name, n in deltas.items():
+            sync.synced[name] = sync.synced.get(name, 0) + n
+        if item:
+            self._adopt_remote(circuit, item)
+
+    def _adopt_remote(self, circuit: CircuitBreakerState, item: dict) -> None:
+        """Adopt stored state written by another container, if newer."""
+        remote_version = int(item.get("version", 0))
+        if remote_version <= circuit.version:
+            return
+
+        old_state = circuit.state
+        circuit.state = CircuitState(item.get("state", CircuitState.CLOSED.value))
+        circuit.version = remote_version
+        circuit.half_open_calls = 0
+        circuit.metrics.consecutive_failures = 0
+        circuit.metrics.consecutive_successes = 0
+        circuit.metrics.state_changed_at = float(item.get("state_changed_at", time.time()))
+
+        if old_state != circuit.state:
+            self.logger.info(
+                "Circuit breaker state adopted from DynamoDB",
+                circuit_id=circuit.circuit_id,
+                old_state=old_state.value,
+                new_state=circuit.state.value,
+                version=remote_version,
+            )
+
+    def _persist_transition(self, circuit: CircuitBreakerState, old_state: CircuitState) -> None:
+        """Store a state transition if no other container transitioned first.
+
+        The write is conditional on the version this container last saw.
+        If it fails, another container changed the state in the meantime
+        and its stored state replaces this one.
+        """
+        table = self.dynamodb.Table(self.table_name)
+        key = {"PK": f"CIRCUIT#{circuit.circuit_id}", "SK": "STATE"}
+        try:
+            self.remote_calls += 1
+            table.update_item(
+                Key=key,
+                UpdateExpression=(
+                    "SET #state = :state, state_changed_at = :changed_at, version = :next, "
+                    "circuit_id = :circuit_id, failure_threshold = :failure_threshold, "
+                    "success_threshold = :success_threshold, "
+                    "recovery_timeout = :recovery_timeout, updated_at = :now"
+                ),
+                ConditionExpression="attribute_not_exists(version) OR version = :expected",
+                ExpressionAttributeNames={"#state": "state"},
+                ExpressionAttributeValues={
+                    ":state": circuit.state.value,
+                    ":changed_at": str(circuit.metrics.state_changed_at),
+                    ":next": circuit.version + 1,
+                    ":expected": circuit.version,
+                    ":circuit_id": circuit.circuit_id,
+                    ":failure_threshold": circuit.config.failure_threshold,
+                    ":success_threshold": circuit.config.success_threshold,
+                    ":recovery_timeout": str(circuit.config.recovery_timeout),
+                    ":now": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+            circuit.version += 1
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                self.logger.warning(
+                    "Failed to persist circuit transition",
+                    circuit_id=circuit.circuit_id,
+                    error=str(e),
+                )
+                return
+
+            self.logger.info(
+                "Circuit transition lost to another container",
+                circuit_id=circuit.circuit_id,
+                attempted_state=circuit.state.value,
+                previous_state=old_state.value,
+            )
+            try:
+                self.remote_calls += 1
+                item = table.get_item(Key=key, ConsistentRead=True).get("Item")
+            except ClientError as read_error:
+                self.logger.warning(
+                    "Failed to load circuit from DynamoDB",
+                    circuit_id=circuit.circuit_id,
+                    error=str(read_error),
+                )
+                return
+            if item:
+                self._adopt_remote(circuit, item)
+
     def _load_from_dynamodb(self, circuit_id: str) -> CircuitBreakerState | None:
         """Load circuit state from DynamoDB.
 
@@ -415,6 +664,7 @@ class CircuitBreakerRegistry:
         """
         try:
             table = self.dynamodb.Table(self.table_name)
+            self.remote_calls += 1
             response = table.get_item(
                 Key={"PK": f"CIRCUIT#{circuit_id}", "SK": "STATE"},
             )
@@ -444,6 +694,7 @@ class CircuitBreakerRegistry:
                 state=CircuitState(item.get("state", "closed")),
                 config=config,
                 metrics=metrics,
+                version=int(item.get("version", 0)),
             )
 
         except ClientError as e:
@@ -0,0 +1,344 @@
+"""Warm-container cache for workflow execution context.
+
+Every Step Functions node invocation needs the workflow definition plus
+workspace and site settings. These change rarely compared to how often
+nodes execute, so they are cached in the Lambda container:
+
+- Workflow definitions are keyed on (workspace_id, workflow_id, version).
+  The version is captured when the run is initialized and carried in the
+  Step Functions state, so an edited workflow never serves a stale cached
+  definition to a run. This does not pin a run to its starting definition:
+  only the current definition is stored, so on a cold container (or after
+  eviction) a mid-run edit means the run continues on the new version.
+- New runs (no version yet) and workspace and site settings are cached for
+  the settings TTL, so they can lag an edit by up to that long in a warm
+  container.
+- The immutable fields of a run (contact ID, trigger type and data) are
+  cached per run ID, so most node executions only need to re-read the
+  contact.
+
+Only the workflow version travels in the Step Functions state
+(``cached_context``). Settings hold integration secrets and trigger data
+can be large, so neither is written to execution history.
+"""
+
+import os
+from typing import Any
+
+import structlog
+
+from complens.models.workflow import Workflow
+from complens.models.workflow_run import RunStatus, WorkflowRun
+from complens.models.workspace import Workspace
+from complens.utils.cache import DEFAULT_MAX_ENTRIES, TTLCache
+
+logger = structlog.get_logger()
+
+# Default TTLs in seconds
+DEFAULT_WORKFLOW_TTL_SECONDS = 300
+DEFAULT_SETTINGS_TTL_SECONDS = 60
+
+# Run fields that never change after initialization
+_IMMUTABLE_RUN_FIELDS = ("contact_id", "trigger_type", "trigger_data")
+
+
+def build_workspace_settings(workspace: Workspace | None) -> dict[str, Any]:
+    """Flatten a workspace into the settings dict nodes use for templates.
+
+    Args:
+        workspace: Workspace model or None.
+
+    Returns:
+        Settings dict (empty if workspace is None).
+    """
+    if not workspace:
+        return {}
+
+    # Merge explicit fields and settings dict for template access
+    return {
+        **workspace.settings,
+        "notification_email": workspace.notification_email or "",
+        "from_email": workspace.from_email or "",
+        "name": workspace.name,
+        "twilio_phone_number": workspace.twilio_phone_number or "",
+    }
+
+
+class ExecutionContextCache:
+    """Container-level cache for workflow definitions, runs and settings.
+
+    Example:
+        cache = get_execution_context_cache()
+        workflow = cache.get_workflow(workspace_id, workflow_id, version=3)
+        run = cache.get_run(workspace_id, workflow_id, run_id)
+        settings = cache.get_workspace_settings(workspace_id)
+    """
+
+    def __init__(
+        self,
+        workflow_ttl_seconds: float | None = None,
+        settings_ttl_seconds: float | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        workflow_repo: Any = None,
+        workspace_repo: Any = None,
+        site_repo: Any = None,
+        run_repo: Any = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            workflow_ttl_seconds: TTL for workflow definitions.
+            settings_ttl_seconds: TTL for workspace and site settings.
+            max_entries: Maximum entries per cached kind.
+            workflow_repo: Optional WorkflowRepository.
+            workspace_repo: Optional WorkspaceRepository.
+            site_repo: Optional SiteRepository.
+            run_repo: Optional WorkflowRunRepository.
+        """
+        workflow_ttl = workflow_ttl_seconds if workflow_ttl_seconds is not None else float(
+            os.environ.get("EXECUTION_CACHE_WORKFLOW_TTL", DEFAULT_WORKFLOW_TTL_SECONDS)
+        )
+        settings_ttl = settings_ttl_seconds if settings_ttl_seconds is not None else float(
+            os.environ.get("EXECUTION_CACHE_SETTINGS_TTL", DEFAULT_SETTINGS_TTL_SECONDS)
+        )
+
+        self._workflows = TTLCache(workflow_ttl, max_entries)
+        self._latest_workflows = TTLCache(settings_ttl, max_entries)
+        self._workspace_settings = TTLCache(settings_ttl, max_entries)
+        self._site_settings = TTLCache(settings_ttl, max_entries)
+        self._runs = TTLCache(workflow_ttl, max_entries)
+
+        self._workflow_repo = workflow_repo
+        self._workspace_repo = workspace_repo
+        self._site_repo = site_repo
+        self._run_repo = run_repo
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def workflow_repo(self):
+        """Get the workflow repository (lazy initialization)."""
+        if self._workflow_repo is None:
+            from complens.repositories.workflow import WorkflowRepository
+
+            self._workflow_repo = WorkflowRepository()
+        return self._workflow_repo
+
+    @property
+    def workspace_repo(self):
+        """Get the workspace repository (lazy initialization)."""
+        if self._workspace_repo is None:
+            from complens.repositories.workspace import WorkspaceRepository
+
+            self._workspace_repo = WorkspaceRepository()
+        return self._workspace_repo
+
+    @property
+    def site_repo(self):
+        """Get the site repository (lazy initialization)."""
+        if self._site_repo is None:
+            from complens.repositories.site import SiteRepository
+
+            self._site_repo = SiteRepository()
+        return self._site_repo
+
+    @property
+    def run_repo(self):
+        """Get the workflow run repository (lazy initialization)."""
+        if self._run_repo is None:
+            from complens.repositories.workflow import WorkflowRunRepository
+
+            self._run_repo = WorkflowRunRepository()
+        return self._run_repo
+
+    def get_workflow(
+        self,
+        workspace_id: str,
+        workflow_id: str,
+        version: int | None = None,
+    ) -> Workflow | None:
+        """Get a workflow definition.
+
+        With a version, the cached definition for exactly that version is
+        returned. Without one (new runs), the latest definition is cached
+        for the shorter settings TTL so edits propagate quickly.
+
+        Args:
+            workspace_id: Workspace ID.
+            workflow_id: Workflow ID.
+            version: Workflow version captured at run initialization.
+
+        Returns:
+            Workflow or None if not found.
+        """
+        if version is not None:
+            found, workflow = self._workflows.get((workspace_id, workflow_id, version))
+        else:
+            found, workflow = self._latest_workflows.get((workspace_id, workflow_id))
+
+        if found:
+            self.hits += 1
+            return workflow
+
+        self.misses += 1
+        workflow = self.workflow_repo.get_by_id(workspace_id, workflow_id)
+        if workflow is None:
+            return None
+
+        if version is not None and workflow.version != version:
+            logger.info(
+                "Workflow changed since run started, using current definition",
+                workflow_id=workflow_id,
+                run_version=version,
+                current_version=workflow.version,
+            )
+
+        self._workflows.set((workspace_id, workflow_id, workflow.version), workflow)
+        self._latest_workflows.set((workspace_id, workflow_id), workflow)
+        return workflow
+
+    def remember_run(self, run: WorkflowRun) -> None:
+        """Cache the immutable fields of a run that was just created.
+
+        Args:
+            run: The new workflow run.
+        """
+        self._runs.set(
+            (run.workflow_id, run.id),
+            {name: getattr(run, name) for name in _IMMUTABLE_RUN_FIELDS},
+        )
+
+    def get_run(self, workspace_id: str, workflow_id: str, run_id: str) -> WorkflowRun | None:
+        """Get a workflow run for node execution.
+
+        A cached run is rebuilt from its immutable fields only; nodes read
+        nothing else from it and the executor tracks progress in state.
+
+        Args:
+            workspace_id: Workspace ID.
+            workflow_id: Workflow ID.
+            run_id: Workflow run ID.
+
+        Returns:
+            WorkflowRun or None if not found.
+        """
+        found, fields = self._runs.get((workflow_id, run_id))
+        if found:
+            self.hits += 1
+            return WorkflowRun(
+                id=run_id,
+                workflow_id=workflow_id,
+                workspace_id=workspace_id,
+                status=RunStatus.RUNNING,
+                **fields,
+            )
+
+        self.misses += 1
+        run = self.run_repo.get_by_id(workflow_id, run_id)
+        if run is not None:
+            self.remember_run(run)
+        return run
+
+    def get_workspace_settings(self, workspace_id: str) -> dict[str, Any]:
+        """Get flattened workspace settings.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Settings dict (empty if the workspace does not exist).
+        """
+        found, settings = self._workspace_settings.get(workspace_id)
+        if found:
+            self.hits += 1
+            return settings
+
+        self.misses += 1
+        settings = build_workspace_settings(self.workspace_repo.get_by_id(workspace_id))
+        self._workspace_settings.set(workspace_id, settings)
+        return settings
+
+    def get_site_settings(self, workspace_id: str, site_id: str | None) -> dict[str, Any]:
+        """Get site settings for a site-scoped workflow.
+
+        Args:
+            workspace_id: Workspace ID.
+            site_id: Site ID (None for unassigned workflows).
+
+        Returns:
+            Site settings dict (empty if no site).
+        """
+        if not site_id:
+            return {}
+
+        found, settings = self._site_settings.get((workspace_id, site_id))
+        if found:
+            self.hits += 1
+            return settings
+
+        self.misses += 1
+        site = self.site_repo.get_by_id(workspace_id, site_id)
+        settings = (site.settings or {}) if site else {}
+        self._site_settings.set((workspace_id, site_id), settings)
+        return settings
+
+    def invalidate_workflow(self, workspace_id: str, workflow_id: str) -> None:
+        """Drop every cached version of a workflow.
+
+        Args:
+            workspace_id: Workspace ID.
+            workflow_id: Workflow ID.
+        """
+        self._workflows.pop_matching(lambda key: key[:2] == (workspace_id, workflow_id))
+        self._latest_workflows.pop_matching(lambda key: key == (workspace_id, workflow_id))
+
+    def invalidate_workspace(self, workspace_id: str) -> None:
+        """Drop cached settings and workflows for a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+        """
+        self._workspace_settings.pop_matching(lambda key: key == workspace_id)
+        self._site_settings.pop_matching(lambda key: key[0] == workspace_id)
+        self._workflows.pop_matching(lambda key: key[0] == workspace_id)
+        self._latest_workflows.pop_matching(lambda key: key[0] == workspace_id)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        self._workflows.clear()
+        self._latest_workflows.clear()
+        self._workspace_settings.clear()
+        self._site_settings.clear()
+        self._runs.clear()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counts and entry counts.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "workflows": len(self._workflows),
+            "workspace_settings": len(self._workspace_settings),
+            "site_settings": len(self._site_settings),
+            "runs": len(self._runs),
+        }
+
+
+# Singleton instance
+_execution_context_cache: ExecutionContextCache | None = None
+
+
+def get_execution_context_cache() -> ExecutionContextCache:
+    """Get the global ExecutionContextCache instance.
+
+    Returns:
+        ExecutionContextCache instance.
+    """
+    global _execution_context_cache
+    if _execution_context_cache is None:
+        _execution_context_cache = ExecutionContextCache()
+    return _execution_context_cache
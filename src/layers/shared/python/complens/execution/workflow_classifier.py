@@ -80,6 +80,11 @@ STANDARD_REQUIRED_NODES = {
     "action_wait_for_webhook",
 }
 
+# Node types that must run as their own Step Functions task. They hand
+# control back to the state machine (Wait states, callbacks), so node
+# fusion never runs them in-process.
+FUSION_BARRIER_NODES = STANDARD_REQUIRED_NODES
+
 # Node types that strongly suggest Standard
 STANDARD_PREFERRED_NODES = {
     # External API calls may take time
@@ -296,6 +301,32 @@ class WorkflowClassifier:
         analysis = self.classify_workflow(workflow)
         return analysis.execution_type
 
+    def get_fusion_barriers(self, workflow: Any) -> frozenset[str]:
+        """Get the IDs of nodes that end a fused chain of node executions.
+
+        Args:
+            workflow: Workflow model instance.
+
+        Returns:
+            Node IDs that must be executed as separate Step Functions tasks.
+        """
+        return frozenset(
+            self._get_node_id(node)
+            for node in self._get_workflow_nodes(workflow)
+            if self._get_node_type(node) in FUSION_BARRIER_NODES
+        )
+
+    def estimate_node_seconds(self, node_type: str) -> float:
+        """Get the estimated execution time for a node type.
+
+        Args:
+            node_type: Node type string.
+
+        Returns:
+            Estimated seconds (1s for unknown types).
+        """
+        return NODE_EXECUTION_TIMES.get(node_type, 1.0)
+
     def _get_workflow_nodes(self, workflow: Any) -> list[dict]:
         """Get nodes from a workflow.
 
@@ -320,6 +351,20 @@ class WorkflowClassifier:
 
         return []
 
+    def _get_node_id(self, node: dict | Any) -> str:
+        """Get the ID of a node.
+
+        Args:
+            node: Node dictionary or object.
+
+        Returns:
+            Node ID string.
+        """
+        if isinstance(node, dict):
+            return node.get("id", "")
+
+        return getattr(node, "id", "")
+
     def _get_node_type(self, node: dict | Any) -> str:
         """Get node type from a node.
 
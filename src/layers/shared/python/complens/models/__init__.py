@@ -1,7 +1,19 @@
 """Pydantic models for Complens entities."""
 
 from complens.models.base import BaseModel, TimestampMixin
+from complens.models.analytics_rollup import AnalyticsRollup, ROLLUP_METRICS
 from complens.models.contact import Contact, CreateContactRequest, UpdateContactRequest
+from complens.models.contact_export import (
+    ContactExport,
+    ContactExportFormat,
+    ContactExportStatus,
+    CreateContactExportRequest,
+)
+from complens.models.contact_import import (
+    ContactImport,
+    ContactImportStatus,
+    CreateContactImportRequest,
+)
 from complens.models.conversation import Conversation, CreateConversationRequest
 from complens.models.message import Message, CreateMessageRequest, MessageDirection, MessageChannel
 from complens.models.workflow import (
@@ -54,6 +66,7 @@ from complens.models.synthesis import (
     DesignSystem,
     SynthesisMetadata,
 )
+from complens.models.synthesis_job import SynthesisJob, SynthesisJobStatus
 from complens.models.block_schemas import (
     BLOCK_SCHEMAS,
     validate_block_config,
@@ -66,6 +79,7 @@ from complens.models.warmup_domain import (
     WarmupStatusResponse,
     DEFAULT_WARMUP_SCHEDULE,
 )
+from complens.models.resource_counts import ResourceCounts, RESOURCE_PREFIXES
 from complens.models.site import Site, CreateSiteRequest, UpdateSiteRequest
 from complens.models.deferred_email import DeferredEmail
 from complens.models.plan_config import PlanConfig, UpdatePlanConfigRequest
@@ -74,10 +88,22 @@ __all__ = [
     # Base
     "BaseModel",
     "TimestampMixin",
+    # Analytics Rollup
+    "AnalyticsRollup",
+    "ROLLUP_METRICS",
     # Contact
     "Contact",
     "CreateContactRequest",
     "UpdateContactRequest",
+    # Contact Export
+    "ContactExport",
+    "ContactExportFormat",
+    "ContactExportStatus",
+    "CreateContactExportRequest",
+    # Contact Import
+    "ContactImport",
+    "ContactImportStatus",
+    "CreateContactImportRequest",
     # Conversation
     "Conversation",
     "CreateConversationRequest",
@@ -109,6 +135,9 @@ __all__ = [
     "Workspace",
     "CreateWorkspaceRequest",
     "UpdateWorkspaceRequest",
+    # Resource Counts
+    "ResourceCounts",
+    "RESOURCE_PREFIXES",
     # Page
     "Page",
     "PageStatus",
@@ -137,6 +166,9 @@ __all__ = [
     "BlockPlan",
     "DesignSystem",
     "SynthesisMetadata",
+    # Synthesis Job
+    "SynthesisJob",
+    "SynthesisJobStatus",
     # Block Schemas
     "BLOCK_SCHEMAS",
     "validate_block_config",
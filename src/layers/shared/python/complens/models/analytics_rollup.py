@@ -0,0 +1,71 @@
+"""Analytics rollup model.
+
+Per-workspace counters maintained from the table's stream so dashboards
+read one item per day instead of aggregating raw entities.
+
+DynamoDB keys:
+    PK: WS#{workspace_id}#ROLLUP
+    SK: DAY#{YYYY-MM-DD} | TOTAL
+"""
+
+from typing import ClassVar
+
+from pydantic import Field
+
+from complens.models.base import BaseModel
+
+# Counter attributes carried by every rollup item
+ROLLUP_METRICS = (
+    "contacts_created",
+    "contacts_deleted",
+    "runs_started",
+    "runs_completed",
+    "runs_failed",
+    "form_submissions",
+    "page_views",
+    "chat_sessions",
+)
+
+# Period of the all-time rollup item
+TOTAL_PERIOD = "TOTAL"
+
+
+class AnalyticsRollup(BaseModel):
+    """Counters for one workspace and one day (or all time)."""
+
+    _pk_prefix: ClassVar[str] = "WS#"
+    _sk_prefix: ClassVar[str] = "DAY#"
+
+    workspace_id: str = Field(..., description="Workspace ID")
+    period: str = Field(..., description="UTC day (YYYY-MM-DD) or TOTAL")
+
+    contacts_created: int = 0
+    contacts_deleted: int = 0
+    runs_started: int = 0
+    runs_completed: int = 0
+    runs_failed: int = 0
+    form_submissions: int = 0
+    page_views: int = 0
+    chat_sessions: int = 0
+
+    def get_pk(self) -> str:
+        """Get partition key: WS#{workspace_id}#ROLLUP."""
+        return rollup_pk(self.workspace_id)
+
+    def get_sk(self) -> str:
+        """Get sort key: DAY#{period} or TOTAL."""
+        return rollup_sk(self.period)
+
+    def counts(self) -> dict[str, int]:
+        """Counter values keyed by metric name."""
+        return {metric: getattr(self, metric) for metric in ROLLUP_METRICS}
+
+
+def rollup_pk(workspace_id: str) -> str:
+    """Partition key holding a workspace's rollups."""
+    return f"WS#{workspace_id}#ROLLUP"
+
+
+def rollup_sk(period: str) -> str:
+    """Sort key for a rollup period."""
+    return TOTAL_PERIOD if period == TOTAL_PERIOD else f"DAY#{period}"
@@ -1,8 +1,11 @@
 """Base Pydantic models with DynamoDB serialization."""
 
-from datetime import datetime, timezone
+import types
+from collections.abc import Callable
+from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any, ClassVar, Self
+from enum import Enum
+from typing import Any, ClassVar, Self, Union, get_args, get_origin
 
 from pydantic import BaseModel as PydanticBaseModel, ConfigDict, Field
 from ulid import ULID
@@ -18,6 +21,114 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Field converter: None means the raw DynamoDB value is passed through
+FieldConverter = Callable[[Any], Any] | None
+
+# Annotations whose DynamoDB values never need conversion
+_PASSTHROUGH_TYPES = (str, bool, datetime, date, Enum)
+
+# Per-model deserialization plans (field name/alias -> converter)
+_DESERIALIZATION_PLANS: dict[type, dict[str, FieldConverter]] = {}
+
+
+def convert_decimals(value: Any) -> Any:
+    """Recursively convert DynamoDB Decimals to ints or floats.
+
+    Strings are left untouched, so free-form dicts (settings, trigger
+    data, block config) keep their values as stored.
+    """
+    if isinstance(value, Decimal):
+        # Convert Decimal back to int or float
+        if value % 1 == 0:
+            return int(value)
+        return float(value)
+    if isinstance(value, dict):
+        return {k: convert_decimals(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [convert_decimals(item) for item in value]
+    return value
+
+
+def _converter_for(annotation: Any) -> FieldConverter:
+    """Build the converter for a field annotation.
+
+    Args:
+        annotation: Field type annotation.
+
+    Returns:
+        Converter callable, or None for pass-through fields.
+    """
+    origin = get_origin(annotation)
+
+    # Optional[X] / X | None: use X's converter
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _converter_for(args[0])
+        return convert_decimals
+
+    if isinstance(annotation, type) and origin is None:
+        if issubclass(annotation, _PASSTHROUGH_TYPES):
+            return None
+        if issubclass(annotation, PydanticBaseModel):
+            return lambda value: (
+                deserialize_model_data(annotation, value) if isinstance(value, dict) else value
+            )
+
+    if origin is list:
+        args = get_args(annotation)
+        item_converter = _converter_for(args[0]) if args else convert_decimals
+        if item_converter is None:
+            return None
+        return lambda value: (
+            [item_converter(item) for item in value] if isinstance(value, list) else value
+        )
+
+    return convert_decimals
+
+
+def _get_deserialization_plan(model_cls: type[PydanticBaseModel]) -> dict[str, FieldConverter]:
+    """Get (building once) the field converters for a model class.
+
+    Args:
+        model_cls: Pydantic model class.
+
+    Returns:
+        Dict of field name and alias to converter.
+    """
+    plan = _DESERIALIZATION_PLANS.get(model_cls)
+    if plan is None:
+        plan = {}
+        for name, field_info in model_cls.model_fields.items():
+            converter = _converter_for(field_info.annotation)
+            plan[name] = converter
+            if field_info.alias:
+                plan[field_info.alias] = converter
+        _DESERIALIZATION_PLANS[model_cls] = plan
+    return plan
+
+
+def deserialize_model_data(model_cls: type[PydanticBaseModel], item: dict[str, Any]) -> dict[str, Any]:
+    """Prepare a DynamoDB item for validation into a model.
+
+    Only fields whose schema can hold Decimals are converted; unknown
+    attributes (keys, GSI attributes) are converted generically.
+
+    Args:
+        model_cls: Pydantic model class.
+        item: DynamoDB item.
+
+    Returns:
+        Data ready for model_validate.
+    """
+    plan = _get_deserialization_plan(model_cls)
+    data = {}
+    for key, value in item.items():
+        converter = plan.get(key, convert_decimals)
+        data[key] = converter(value) if converter is not None else value
+    return data
+
+
 class TimestampMixin(PydanticBaseModel):
     """Mixin for created_at and updated_at timestamps."""
 
@@ -75,34 +186,12 @@ class BaseModel(TimestampMixin):
     def from_dynamodb(cls, item: dict[str, Any]) -> Self:
         """Deserialize DynamoDB item to model instance.
 
-        Converts ISO strings back to datetime objects.
+        Converts Decimals back to ints/floats using the model schema;
+        datetime strings are parsed by Pydantic validation.
         """
-        data = cls._deserialize_value(item)
+        data = deserialize_model_data(cls, item)
         return cls.model_validate(data)
 
-    @classmethod
-    def _deserialize_value(cls, value: Any) -> Any:
-        """Recursively deserialize values from DynamoDB.
-
-        Converts Decimals back to floats and ISO strings to datetimes.
-        """
-        if isinstance(value, dict):
-            return {k: cls._deserialize_value(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [cls._deserialize_value(item) for item in value]
-        if isinstance(value, Decimal):
-            # Convert Decimal back to int or float
-            if value % 1 == 0:
-                return int(value)
-            return float(value)
-        if isinstance(value, str):
-            # Try to parse as datetime
-            try:
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
-            except ValueError:
-                return value
-        return value
-
     def get_pk(self) -> str:
         """Get the partition key for this entity."""
         raise NotImplementedError("Subclasses must implement get_pk()")
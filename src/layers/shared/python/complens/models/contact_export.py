@@ -0,0 +1,68 @@
+"""Contact export job model for asynchronous exports to S3."""
+
+from enum import Enum
+from typing import ClassVar
+
+from pydantic import BaseModel as PydanticBaseModel, Field
+
+from complens.models.base import BaseModel
+
+
+class ContactExportStatus(str, Enum):
+    """Contact export job status."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ContactExportFormat(str, Enum):
+    """Contact export file format."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ContactExport(BaseModel):
+    """Contact export job - streams a workspace's contacts to a file in S3.
+
+    Key Pattern:
+        PK: WS#{workspace_id}
+        SK: EXPORT#{id}
+    """
+
+    _pk_prefix: ClassVar[str] = "WS#"
+    _sk_prefix: ClassVar[str] = "EXPORT#"
+
+    workspace_id: str = Field(..., description="Parent workspace ID")
+    format: ContactExportFormat = Field(default=ContactExportFormat.CSV, description="File format")
+    gzip: bool = Field(default=False, description="Whether the file is gzip-compressed")
+    file_key: str = Field(default="", description="S3 object key of the export file")
+    status: ContactExportStatus = Field(
+        default=ContactExportStatus.PENDING, description="Export status"
+    )
+    rows_exported: int = Field(default=0, description="Contacts written so far")
+    size_bytes: int = Field(default=0, description="Size of the export file")
+    error_message: str | None = Field(None, description="Error message if the export failed")
+
+    def get_pk(self) -> str:
+        """Get partition key: WS#{workspace_id}."""
+        return f"WS#{self.workspace_id}"
+
+    def get_sk(self) -> str:
+        """Get sort key: EXPORT#{id}."""
+        return f"EXPORT#{self.id}"
+
+    @property
+    def file_name(self) -> str:
+        """Download file name, e.g. contacts-{id}.csv.gz."""
+        name = f"contacts-{self.id}.{ContactExportFormat(self.format).value}"
+        return f"{name}.gz" if self.gzip else name
+
+
+class CreateContactExportRequest(PydanticBaseModel):
+    """Request model for starting an asynchronous contact export."""
+
+    format: ContactExportFormat = Field(default=ContactExportFormat.CSV)
+    gzip: bool = Field(default=False)
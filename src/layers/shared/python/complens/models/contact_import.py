@@ -0,0 +1,60 @@
+"""Contact import job model for asynchronous CSV imports."""
+
+from enum import Enum
+from typing import ClassVar
+
+from pydantic import BaseModel as PydanticBaseModel, Field
+
+from complens.models.base import BaseModel
+
+
+class ContactImportStatus(str, Enum):
+    """Contact import job status."""
+
+    PENDING_UPLOAD = "pending_upload"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ContactImport(BaseModel):
+    """Contact import job - tracks a CSV uploaded to S3 for bulk import.
+
+    Key Pattern:
+        PK: WS#{workspace_id}
+        SK: IMPORT#{id}
+    """
+
+    _pk_prefix: ClassVar[str] = "WS#"
+    _sk_prefix: ClassVar[str] = "IMPORT#"
+
+    workspace_id: str = Field(..., description="Parent workspace ID")
+    file_key: str = Field(default="", description="S3 object key of the uploaded CSV")
+    mapping: dict[str, str] = Field(..., description="CSV column -> contact field mapping")
+    status: ContactImportStatus = Field(
+        default=ContactImportStatus.PENDING_UPLOAD, description="Import status"
+    )
+
+    # Progress counters
+    rows_processed: int = Field(default=0, description="CSV rows read so far")
+    imported: int = Field(default=0, description="Contacts created")
+    skipped: int = Field(default=0, description="Rows skipped (duplicates or missing email/phone)")
+    errors: list[dict] = Field(default_factory=list, description="First row errors encountered")
+    error_count: int = Field(default=0, description="Total rows that failed")
+    error_message: str | None = Field(None, description="Error message if the import failed")
+
+    def get_pk(self) -> str:
+        """Get partition key: WS#{workspace_id}."""
+        return f"WS#{self.workspace_id}"
+
+    def get_sk(self) -> str:
+        """Get sort key: IMPORT#{id}."""
+        return f"IMPORT#{self.id}"
+
+
+class CreateContactImportRequest(PydanticBaseModel):
+    """Request model for starting an asynchronous contact import."""
+
+    mapping: dict[str, str] = Field(
+        ..., min_length=1, description="CSV column -> contact field mapping"
+    )
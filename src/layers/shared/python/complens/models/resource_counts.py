@@ -0,0 +1,55 @@
+"""Resource counts model for plan-limit enforcement.
+
+DynamoDB keys:
+    PK: WS#{workspace_id}
+    SK: COUNTERS
+"""
+
+from datetime import datetime
+from typing import ClassVar
+
+from pydantic import Field
+
+from complens.models.base import BaseModel
+
+# Counted resources and the sort key prefix of their items in WS#{id}
+RESOURCE_PREFIXES = {
+    "contacts": "CONTACT#",
+    "pages": "PAGE#",
+    "workflows": "WF#",
+    "forms": "FORM#",
+    "sites": "SITE#",
+}
+
+
+class ResourceCounts(BaseModel):
+    """Maintained per-workspace resource counters."""
+
+    _pk_prefix: ClassVar[str] = "WS#"
+    _sk_prefix: ClassVar[str] = "COUNTERS"
+
+    workspace_id: str = Field(..., description="Workspace ID")
+
+    contacts: int = 0
+    pages: int = 0
+    workflows: int = 0
+    forms: int = 0
+    sites: int = 0
+
+    reconciled_at: datetime | None = Field(None, description="Last recount from the items")
+    counted_at: int | None = Field(
+        None,
+        description="Epoch second the recount started; stream changes at or before it are included",
+    )
+
+    def get_pk(self) -> str:
+        """Get partition key: WS#{workspace_id}."""
+        return f"WS#{self.workspace_id}"
+
+    def get_sk(self) -> str:
+        """Get sort key: COUNTERS."""
+        return "COUNTERS"
+
+    def counts(self) -> dict[str, int]:
+        """Counter values keyed by resource name."""
+        return {resource: getattr(self, resource) for resource in RESOURCE_PREFIXES}
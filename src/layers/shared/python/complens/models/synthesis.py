@@ -231,6 +231,9 @@ class SynthesisMetadata(PydanticBaseModel):
     generation_stages: list[str] = Field(
         default_factory=list, description="Stages that were executed"
     )
+    stage_timings_ms: dict[str, float] = Field(
+        default_factory=dict, description="Stage name -> duration in milliseconds"
+    )
 
 
 class PageBlock(PydanticBaseModel):
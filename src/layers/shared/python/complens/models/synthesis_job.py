@@ -0,0 +1,60 @@
+"""Synthesis job model for asynchronous page synthesis."""
+
+from enum import Enum
+from typing import Any, ClassVar
+
+from pydantic import Field
+
+from complens.models.base import BaseModel
+
+
+class SynthesisJobStatus(str, Enum):
+    """Synthesis job status."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SynthesisJob(BaseModel):
+    """Synthesis job - runs the page synthesis pipeline on the AI queue.
+
+    Intermediate stage outputs and generated blocks are saved as the
+    pipeline progresses, so clients that miss WebSocket progress events
+    can catch up by polling the job.
+
+    Key Pattern:
+        PK: WS#{workspace_id}
+        SK: SYNTHJOB#{id}
+    """
+
+    _pk_prefix: ClassVar[str] = "WS#"
+    _sk_prefix: ClassVar[str] = "SYNTHJOB#"
+
+    workspace_id: str = Field(..., description="Parent workspace ID")
+    request: dict[str, Any] = Field(..., description="SynthesizePageRequest body")
+    status: SynthesisJobStatus = Field(
+        default=SynthesisJobStatus.PENDING, description="Job status"
+    )
+
+    # Progress
+    stage: str | None = Field(None, description="Last completed stage")
+    stages_completed: list[str] = Field(default_factory=list, description="Completed stages")
+    stage_outputs: dict[str, Any] = Field(
+        default_factory=dict, description="Stage name -> intermediate output"
+    )
+    blocks: list[dict[str, Any]] = Field(
+        default_factory=list, description="Synthesized block content generated so far"
+    )
+
+    result: dict[str, Any] | None = Field(None, description="SynthesisResult once completed")
+    error_message: str | None = Field(None, description="Error message if the job failed")
+
+    def get_pk(self) -> str:
+        """Get partition key: WS#{workspace_id}."""
+        return f"WS#{self.workspace_id}"
+
+    def get_sk(self) -> str:
+        """Get sort key: SYNTHJOB#{id}."""
+        return f"SYNTHJOB#{self.id}"
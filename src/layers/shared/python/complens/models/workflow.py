@@ -1,9 +1,10 @@
 """Workflow model for visual automation builder."""
 
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, ClassVar
 
-from pydantic import BaseModel as PydanticBaseModel, Field
+from pydantic import BaseModel as PydanticBaseModel, Field, PrivateAttr
 
 from complens.models.base import BaseModel
 from complens.models.workflow_node import WorkflowNode
@@ -56,6 +57,77 @@ class TriggerConfig(PydanticBaseModel):
     config: dict = Field(default_factory=dict)
 
 
+@dataclass
+class WorkflowGraph:
+    """Compiled adjacency for a workflow's nodes and edges.
+
+    Built once per workflow instance so node, edge and trigger lookups
+    during execution are dict lookups instead of list scans.
+    """
+
+    nodes_by_id: dict[str, WorkflowNode] = field(default_factory=dict)
+    outgoing: dict[str, list[WorkflowEdge]] = field(default_factory=dict)
+    trigger_node: WorkflowNode | None = None
+
+    # Revision and list identities the graph was built from
+    signature: tuple = ()
+
+    @staticmethod
+    def signature_for(
+        nodes: list[WorkflowNode],
+        edges: list[WorkflowEdge],
+        revision: tuple = (),
+    ) -> tuple:
+        """Get the signature used to detect changed node/edge lists.
+
+        The workflow's revision (version and updated_at) changes whenever
+        the workflow is saved, which covers nodes or edges replaced in
+        place. List identity and size cover reassignment and appends on
+        an unsaved instance.
+
+        Args:
+            nodes: Workflow nodes.
+            edges: Workflow edges.
+            revision: Values that change with every saved edit.
+
+        Returns:
+            Signature tuple.
+        """
+        return (*revision, id(nodes), len(nodes), id(edges), len(edges))
+
+    @classmethod
+    def build(
+        cls,
+        nodes: list[WorkflowNode],
+        edges: list[WorkflowEdge],
+        revision: tuple = (),
+    ) -> "WorkflowGraph":
+        """Compile the adjacency tables.
+
+        Lookups keep list semantics: the first node with a given ID wins
+        and outgoing edges keep their definition order.
+
+        Args:
+            nodes: Workflow nodes.
+            edges: Workflow edges.
+            revision: Values that change with every saved edit.
+
+        Returns:
+            Compiled WorkflowGraph.
+        """
+        graph = cls(signature=cls.signature_for(nodes, edges, revision))
+
+        for node in nodes:
+            graph.nodes_by_id.setdefault(node.id, node)
+            if graph.trigger_node is None and node.node_type.startswith("trigger_"):
+                graph.trigger_node = node
+
+        for edge in edges:
+            graph.outgoing.setdefault(edge.source, []).append(edge)
+
+        return graph
+
+
 class Workflow(BaseModel):
     """Workflow entity - represents a visual automation workflow.
 
@@ -112,6 +184,9 @@ class Workflow(BaseModel):
         description="Workflow settings",
     )
 
+    # Compiled adjacency (built lazily, see graph)
+    _graph: WorkflowGraph | None = PrivateAttr(default=None)
+
     def get_pk(self) -> str:
         """Get partition key: WS#{workspace_id}."""
         return f"WS#{self.workspace_id}"
@@ -139,28 +214,35 @@ class Workflow(BaseModel):
             "GSI2SK": f"{status_value}#{self.id}",
         }
 
+    @property
+    def graph(self) -> WorkflowGraph:
+        """Get the compiled adjacency, rebuilding it if nodes or edges changed.
+
+        Code that replaces nodes or edges in place on an unsaved workflow
+        must call update_timestamp() so the next lookup sees the change.
+        """
+        revision = (self.version, self.updated_at)
+        signature = WorkflowGraph.signature_for(self.nodes, self.edges, revision)
+        if self._graph is None or self._graph.signature != signature:
+            self._graph = WorkflowGraph.build(self.nodes, self.edges, revision)
+        return self._graph
+
     def get_node_by_id(self, node_id: str) -> WorkflowNode | None:
         """Get a node by its ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self.graph.nodes_by_id.get(node_id)
 
     def get_trigger_node(self) -> WorkflowNode | None:
         """Get the trigger node (first node with trigger type)."""
-        for node in self.nodes:
-            if node.node_type.startswith("trigger_"):
-                return node
-        return None
+        return self.graph.trigger_node
 
     def get_next_nodes(self, node_id: str) -> list[WorkflowNode]:
         """Get nodes connected as targets from the given node."""
-        next_node_ids = [edge.target for edge in self.edges if edge.source == node_id]
+        next_node_ids = {edge.target for edge in self.get_outgoing_edges(node_id)}
         return [node for node in self.nodes if node.id in next_node_ids]
 
     def get_outgoing_edges(self, node_id: str) -> list[WorkflowEdge]:
         """Get all edges going out from a node."""
-        return [edge for edge in self.edges if edge.source == node_id]
+        return list(self.graph.outgoing.get(node_id, ()))
 
     def validate_graph(self) -> list[str]:
         """Validate the workflow graph structure.
@@ -5,8 +5,18 @@ This module provides the components for the sharded queue architecture:
 - FairScheduler: Ensures fair processing across tenants
 - FeatureFlagService: Controls gradual rollout of new architecture
 - WorkflowRouter: Unified interface for routing workflow triggers
+- TriggerIndex: Compiled per-workspace trigger lookup for queue processors
+- plan_dispatch: Deficit round-robin ordering and deferral of queue batches
 """
 
+from complens.queue.dispatch import (
+    Deferral,
+    DeferralSchedule,
+    DispatchPlan,
+    deficit_round_robin,
+    defer_messages,
+    plan_dispatch,
+)
 from complens.queue.fair_scheduler import (
     FairScheduler,
     SchedulingDecision,
@@ -23,11 +33,18 @@ from complens.queue.feature_flags import (
     is_flag_enabled,
 )
 from complens.queue.tenant_router import (
+    HashRing,
     QueueMessage,
     RoutingResult,
     TenantRouter,
     get_tenant_router,
 )
+from complens.queue.trigger_index import (
+    TriggerIndex,
+    TriggerIndexCache,
+    TriggerIndexEntry,
+    get_trigger_index_cache,
+)
 from complens.queue.workflow_router import (
     WorkflowRouter,
     WorkflowTriggerMessage,
@@ -38,6 +55,7 @@ from complens.queue.workflow_router import (
 __all__ = [
     # Tenant router
     "TenantRouter",
+    "HashRing",
     "QueueMessage",
     "RoutingResult",
     "get_tenant_router",
@@ -48,12 +66,24 @@ __all__ = [
     "SchedulingDecision",
     "TIER_CREDITS",
     "get_fair_scheduler",
+    # Dispatch
+    "DispatchPlan",
+    "Deferral",
+    "DeferralSchedule",
+    "deficit_round_robin",
+    "defer_messages",
+    "plan_dispatch",
     # Feature flags
     "FeatureFlagService",
     "FeatureFlag",
     "FlagConfig",
     "get_feature_flags",
     "is_flag_enabled",
+    # Trigger index
+    "TriggerIndex",
+    "TriggerIndexCache",
+    "TriggerIndexEntry",
+    "get_trigger_index_cache",
     # Workflow router
     "WorkflowRouter",
     "WorkflowTriggerMessage",
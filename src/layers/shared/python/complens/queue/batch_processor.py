@@ -0,0 +1,229 @@
+"""Batch helpers for the workflow queue processors.
+
+The queue processors receive SQS batches that usually contain several
+messages for the same workspace (tag-change storms, bulk imports). Instead
+of handling records one at a time, the processors:
+
+1. Group records by workspace and load per-workspace state (trigger index,
+   tier, feature flags) once per group.
+2. Collect every Step Functions start the batch needs as a list of tasks.
+3. Run the tasks concurrently on a bounded thread pool. FIFO consumers run
+   each message group serially instead and fan out only across groups.
+4. Report only the records whose tasks failed via ``batchItemFailures``.
+
+Clients are cached at module level so warm containers reuse connections.
+"""
+
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import boto3
+import structlog
+
+logger = structlog.get_logger()
+
+# Default number of Step Functions starts issued in parallel per invocation
+DEFAULT_MAX_CONCURRENCY = 10
+
+_sfn_client = None
+
+
+def get_sfn_client():
+    """Get a container-cached Step Functions client.
+
+    boto3 clients are thread-safe, so the same client is shared by the
+    worker threads that start executions.
+
+    Returns:
+        Step Functions client.
+    """
+    global _sfn_client
+    if _sfn_client is None:
+        _sfn_client = boto3.client("stepfunctions")
+    return _sfn_client
+
+
+def is_batch_mode_enabled() -> bool:
+    """Check whether grouped, concurrent batch processing is enabled.
+
+    Controlled by the QUEUE_BATCH_MODE environment variable (default on);
+    set it to "false" to fall back to record-at-a-time processing.
+
+    Returns:
+        True if batch mode is enabled.
+    """
+    return os.environ.get("QUEUE_BATCH_MODE", "true").lower() in ("true", "1", "yes")
+
+
+def group_by(records: Iterable[Any], key: Callable[[Any], str]) -> dict[str, list[Any]]:
+    """Group items by key, preserving arrival order within each group.
+
+    Args:
+        records: Items to group.
+        key: Function returning the group key for an item.
+
+    Returns:
+        Dict of key to items, in first-seen key order.
+    """
+    groups: dict[str, list[Any]] = {}
+    for record in records:
+        groups.setdefault(key(record), []).append(record)
+    return groups
+
+
+@dataclass
+class BatchTask:
+    """A unit of work tied to the SQS message that requested it."""
+
+    message_id: str
+    run: Callable[[], Any]
+    description: str = ""
+
+
+@dataclass
+class GroupedMessage:
+    """An SQS message and the tasks it requested, in FIFO group order."""
+
+    message_id: str | None
+    tasks: list[BatchTask] = field(default_factory=list)
+
+
+@dataclass
+class BatchResult:
+    """Tracks failed messages for partial batch responses."""
+
+    # Dict used as an ordered set; safe to update from worker threads
+    _failed: dict[str, None] = field(default_factory=dict)
+
+    def fail(self, message_id: str | None) -> None:
+        """Mark a message as failed (idempotent)."""
+        if message_id:
+            self._failed[message_id] = None
+
+    def is_failed(self, message_id: str | None) -> bool:
+        """Check whether a message has been marked as failed."""
+        return message_id in self._failed
+
+    @property
+    def failed_message_ids(self) -> list[str]:
+        """Failed message IDs in the order they were reported."""
+        return list(self._failed)
+
+    def to_response(self) -> dict:
+        """Build the Lambda partial batch response."""
+        return {
+            "batchItemFailures": [
+                {"itemIdentifier": message_id} for message_id in self._failed
+            ],
+        }
+
+
+def run_tasks(
+    tasks: list[BatchTask],
+    result: BatchResult,
+    max_concurrency: int | None = None,
+) -> None:
+    """Run tasks concurrently and record failures against their messages.
+
+    Args:
+        tasks: Tasks to run.
+        result: Batch result to record failures in.
+        max_concurrency: Thread pool size. Defaults to the
+            QUEUE_MAX_CONCURRENCY environment variable.
+    """
+    if not tasks:
+        return
+
+    workers = max_concurrency or int(
+        os.environ.get("QUEUE_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+    )
+
+    if workers <= 1 or len(tasks) == 1:
+        for task in tasks:
+            _run_task(task, result)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(_run_task, task, result) for task in tasks]
+        for future in futures:
+            future.result()
+
+
+def run_message_groups(
+    groups: Iterable[list[GroupedMessage]],
+    result: BatchResult,
+    max_concurrency: int | None = None,
+) -> None:
+    """Run FIFO message groups concurrently, each group serially in order.
+
+    Once a message fails, every later message in its group is reported as
+    failed without running, so SQS redelivers the rest of the group in
+    order instead of letting later messages overtake the failed one.
+
+    Args:
+        groups: Message groups, each in arrival order.
+        result: Batch result to record failures in. Messages already
+            marked as failed block the rest of their group.
+        max_concurrency: Thread pool size. Defaults to the
+            QUEUE_MAX_CONCURRENCY environment variable.
+    """
+    groups = [group for group in groups if group]
+    if not groups:
+        return
+
+    workers = max_concurrency or int(
+        os.environ.get("QUEUE_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+    )
+
+    if workers <= 1 or len(groups) == 1:
+        for group in groups:
+            _run_group(group, result)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as pool:
+        futures = [pool.submit(_run_group, group, result) for group in groups]
+        for future in futures:
+            future.result()
+
+
+def _run_group(group: list[GroupedMessage], result: BatchResult) -> None:
+    """Run one message group in order, stopping at the first failure.
+
+    Args:
+        group: Messages in arrival order.
+        result: Batch result to record failures in.
+    """
+    blocked = False
+    for message in group:
+        if blocked or result.is_failed(message.message_id):
+            blocked = True
+            result.fail(message.message_id)
+            continue
+
+        for task in message.tasks:
+            _run_task(task, result)
+            if result.is_failed(message.message_id):
+                blocked = True
+                break
+
+
+def _run_task(task: BatchTask, result: BatchResult) -> None:
+    """Run a single task, converting exceptions into message failures.
+
+    Args:
+        task: Task to run.
+        result: Batch result to record failures in.
+    """
+    try:
+        task.run()
+    except Exception as e:
+        logger.exception(
+            "Batch task failed",
+            message_id=task.message_id,
+            task=task.description,
+            error=str(e),
+        )
+        result.fail(task.message_id)
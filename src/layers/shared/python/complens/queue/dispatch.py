@@ -0,0 +1,294 @@
+"""Deficit round-robin dispatch for sharded queue batches.
+
+An SQS batch holds messages from many workspaces in arrival order, so a
+tenant flooding a shard fills most of every batch and its work is started
+ahead of everyone else's. The dispatch stage reorders a batch by weighted
+deficit round-robin: each workspace is a flow whose quantum is its tier's
+TIER_CREDITS allocation relative to the free tier, and on each visit a
+flow dispatches messages while its deficit covers their PRIORITY_WEIGHTS
+cost. Workspaces interleave in proportion to their plan.
+
+Messages the FairScheduler rejects are not failed back to the queue for
+the full visibility timeout. Each is deferred with ChangeMessageVisibility
+for about the time until its workspace will have a credit for it: the
+scheduler's wait for the first rejected message, plus one refill interval
+per rejected message ahead of it, including those deferred by earlier
+batches in the same container.
+"""
+
+import math
+from collections import deque
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import boto3
+import structlog
+from botocore.exceptions import ClientError
+
+from complens.queue.fair_scheduler import (
+    PRIORITY_WEIGHTS,
+    TIER_CREDITS,
+    FairScheduler,
+    TenantTier,
+)
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# SQS caps a message's visibility timeout at 12 hours
+MAX_VISIBILITY_TIMEOUT = 43200
+
+# Entries accepted by one ChangeMessageVisibilityBatch call
+VISIBILITY_BATCH_SIZE = 10
+
+_sqs_client = None
+
+
+def get_sqs_client():
+    """Get a container-cached SQS client."""
+    global _sqs_client
+    if _sqs_client is None:
+        _sqs_client = boto3.client("sqs")
+    return _sqs_client
+
+
+def tier_weight(tier: TenantTier | None) -> float:
+    """Round-robin quantum for a tier, relative to the free tier."""
+    credits = TIER_CREDITS.get(tier or TenantTier.FREE, TIER_CREDITS[TenantTier.FREE])
+    return credits / TIER_CREDITS[TenantTier.FREE]
+
+
+def deficit_round_robin(
+    flows: Mapping[str, list[T]],
+    weights: Mapping[str, float],
+    cost: Callable[[T], float] = lambda _: 1,
+) -> list[tuple[str, T]]:
+    """Order items from several flows by weighted deficit round-robin.
+
+    Flows are visited in their mapping order. Each visit adds the flow's
+    weight to its deficit and dispatches items, in order, while the
+    deficit covers the next item's cost. A flow's deficit is dropped once
+    it has nothing left to send.
+
+    Args:
+        flows: Items per flow key, in arrival order.
+        weights: Quantum per flow key (missing keys get 1).
+        cost: Cost of dispatching an item.
+
+    Returns:
+        (flow key, item) pairs in dispatch order.
+    """
+    queues = {key: deque(items) for key, items in flows.items() if items}
+    deficits = dict.fromkeys(queues, 0.0)
+    order: list[tuple[str, T]] = []
+
+    while queues:
+        for key in list(queues):
+            queue = queues[key]
+            deficits[key] += max(weights.get(key, 1.0), 1e-9)
+            while queue and cost(queue[0]) <= deficits[key]:
+                deficits[key] -= cost(queue[0])
+                order.append((key, queue.popleft()))
+            if not queue:
+                del queues[key]
+
+    return order
+
+
+class DeferralSchedule:
+    """Spreads deferred messages over the time their workspace earns credits.
+
+    Each workspace has a next free slot. A deferred message is scheduled
+    no earlier than the scheduler's suggested wait, and no earlier than
+    the slot; the slot then advances by one refill interval. Slots carry
+    over between batches in a warm container, so a tenant's backlog is
+    spread out instead of every batch's deferrals coming back together.
+    """
+
+    def __init__(self):
+        self._next_slot: dict[str, float] = {}
+
+    def delay(
+        self,
+        workspace_id: str,
+        wait_seconds: int,
+        refill_seconds: float,
+        now: float,
+    ) -> int:
+        """Schedule a rejected message and return its visibility delay.
+
+        Args:
+            workspace_id: Workspace of the message.
+            wait_seconds: Scheduler's suggested wait for the workspace.
+            refill_seconds: Seconds between the workspace's credits.
+            now: Current time (epoch seconds).
+
+        Returns:
+            Delay in seconds, between 1 and the SQS maximum.
+        """
+        slot = max(now + max(1, wait_seconds), self._next_slot.get(workspace_id, 0.0))
+        self._next_slot[workspace_id] = slot + refill_seconds
+        return min(math.ceil(slot - now), MAX_VISIBILITY_TIMEOUT)
+
+    def prune(self, now: float) -> None:
+        """Forget workspaces whose slots have passed."""
+        self._next_slot = {ws: slot for ws, slot in self._next_slot.items() if slot > now}
+
+
+# Per-container schedule shared by warm invocations
+_deferral_schedule = DeferralSchedule()
+
+
+@dataclass
+class DispatchPlan:
+    """Admitted items in dispatch order and deferred items with delays."""
+
+    admitted: list[tuple[str, Any]] = field(default_factory=list)
+    deferred: list[tuple[str, Any, int]] = field(default_factory=list)
+
+
+def plan_dispatch(
+    flows: Mapping[str, list[T]],
+    scheduler: FairScheduler,
+    tiers: Mapping[str, TenantTier],
+    priority: Callable[[T], str],
+    scheduled: Collection[str] | None = None,
+    deferrals: DeferralSchedule | None = None,
+) -> DispatchPlan:
+    """Order a batch by tier-weighted DRR and admit it through the scheduler.
+
+    Credits are consumed as items are admitted, so the order decides
+    which workspaces' messages go first, never how many each may send.
+
+    Args:
+        flows: Items per workspace, in arrival order.
+        scheduler: Fair scheduler instance.
+        tiers: Tier per workspace.
+        priority: Message priority of an item.
+        scheduled: Workspaces subject to the fair scheduler (default all).
+        deferrals: Deferral schedule (defaults to the container's).
+
+    Returns:
+        The dispatch plan.
+    """
+    weights = {workspace_id: tier_weight(tiers.get(workspace_id)) for workspace_id in flows}
+    order = deficit_round_robin(
+        flows, weights, cost=lambda item: PRIORITY_WEIGHTS.get(priority(item), 1)
+    )
+
+    deferrals = deferrals or _deferral_schedule
+    now = scheduler.clock()
+    deferrals.prune(now)
+
+    plan = DispatchPlan()
+    rejected: dict[str, int] = {}
+    for workspace_id, item in order:
+        if scheduled is not None and workspace_id not in scheduled:
+            plan.admitted.append((workspace_id, item))
+            continue
+
+        tier = tiers.get(workspace_id)
+        item_priority = priority(item)
+        decision = scheduler.should_process(workspace_id, priority=item_priority, tier=tier)
+        if decision.allowed:
+            scheduler.consume_credit(workspace_id, item_priority, tier)
+            plan.admitted.append((workspace_id, item))
+            continue
+
+        rejected[workspace_id] = rejected.get(workspace_id, 0) + 1
+        delay = deferrals.delay(
+            workspace_id, decision.wait_seconds, scheduler.refill_seconds(tier), now
+        )
+        plan.deferred.append((workspace_id, item, delay))
+
+    if rejected:
+        logger.info(
+            "Messages deferred by fair scheduler",
+            deferred=len(plan.deferred),
+            workspaces=rejected,
+        )
+    return plan
+
+
+def queue_url_from_arn(arn: str) -> str | None:
+    """Build an SQS queue URL from a queue ARN.
+
+    Args:
+        arn: arn:aws:sqs:region:account:queue-name
+
+    Returns:
+        Queue URL, or None if the ARN is not an SQS queue ARN.
+    """
+    parts = arn.split(":")
+    if len(parts) != 6 or parts[2] != "sqs":
+        return None
+    _, partition, _, region, account, name = parts
+    domain = "amazonaws.com.cn" if partition == "aws-cn" else "amazonaws.com"
+    return f"https://sqs.{region}.{domain}/{account}/{name}"
+
+
+@dataclass
+class Deferral:
+    """A received SQS message to hide for a while."""
+
+    message_id: str | None
+    receipt_handle: str | None
+    source_arn: str
+    delay_seconds: int
+
+
+def defer_messages(deferrals: list[Deferral]) -> int:
+    """Hide received messages until their delay passes.
+
+    The messages must still be reported as batch item failures so that
+    Lambda does not delete them. Messages whose visibility cannot be
+    changed come back after the queue's visibility timeout instead.
+
+    Args:
+        deferrals: Messages and their delays.
+
+    Returns:
+        Number of messages whose visibility was changed.
+    """
+    by_queue: dict[str, list[Deferral]] = {}
+    for deferral in deferrals:
+        queue_url = queue_url_from_arn(deferral.source_arn)
+        if queue_url and deferral.receipt_handle:
+            by_queue.setdefault(queue_url, []).append(deferral)
+
+    changed = 0
+    for queue_url, queued in by_queue.items():
+        for start in range(0, len(queued), VISIBILITY_BATCH_SIZE):
+            chunk = queued[start:start + VISIBILITY_BATCH_SIZE]
+            try:
+                response = get_sqs_client().change_message_visibility_batch(
+                    QueueUrl=queue_url,
+                    Entries=[
+                        {
+                            "Id": str(i),
+                            "ReceiptHandle": deferral.receipt_handle,
+                            "VisibilityTimeout": deferral.delay_seconds,
+                        }
+                        for i, deferral in enumerate(chunk)
+                    ],
+                )
+            except ClientError as e:
+                logger.warning(
+                    "Failed to defer messages",
+                    queue_url=queue_url,
+                    count=len(chunk),
+                    error=str(e),
+                )
+                continue
+
+            changed += len(response.get("Successful", []))
+            for failure in response.get("Failed", []):
+                logger.warning(
+                    "Failed to defer message",
+                    message_id=chunk[int(failure["Id"])].message_id,
+                    code=failure.get("Code"),
+                )
+
+    return changed
@@ -9,14 +9,27 @@ Credit System:
 - Processing a message costs 1 credit
 - Credits refresh periodically (e.g., every minute)
 - Tenants with depleted credits are deprioritized
+
+In DynamoDB mode each tenant has a shared token bucket (capacity = the
+tier's credits per window, refilled continuously at capacity / window).
+Refill is computed lazily from ``last_refresh`` when a container finds
+the bucket short, and written with a compare-and-set on the values it
+read. Containers lease credits in batches with a conditional atomic
+decrement, spend them locally across warm invocations, and return the
+unused remainder once a lease has been held for a few seconds, so the
+common case is one DynamoDB write per lease instead of two calls per
+message. A tenant whose bucket is short is rejected locally until the
+missing credits can have accrued.
 """
 
+import math
 import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 import boto3
 import structlog
@@ -52,6 +65,15 @@ PRIORITY_WEIGHTS: dict[str, int] = {
 # Default refresh interval in seconds
 DEFAULT_REFRESH_INTERVAL = 60
 
+# Credits a container leases from a tenant's shared bucket at once
+DEFAULT_LEASE_SIZE = 10
+
+# Longest a warm container holds unspent leased credits between invocations
+DEFAULT_LEASE_HOLD_SECONDS = 10
+
+# Compare-and-set attempts before a contended refill gives up
+MAX_REFILL_ATTEMPTS = 3
+
 
 @dataclass
 class TenantCredits:
@@ -65,16 +87,21 @@ class TenantCredits:
     messages_processed: int = 0
     messages_throttled: int = 0
 
-    def refresh_if_needed(self, refresh_interval: int = DEFAULT_REFRESH_INTERVAL) -> bool:
+    def refresh_if_needed(
+        self,
+        refresh_interval: int = DEFAULT_REFRESH_INTERVAL,
+        now: float | None = None,
+    ) -> bool:
         """Refresh credits if the window has elapsed.
 
         Args:
             refresh_interval: Seconds between refreshes.
+            now: Current time (epoch seconds); defaults to the system clock.
 
         Returns:
             True if credits were refreshed.
         """
-        now = time.time()
+        now = time.time() if now is None else now
         if now - self.last_refresh >= refresh_interval:
             self.credits_remaining = self.credits_per_window
             self.last_refresh = now
@@ -124,6 +151,19 @@ class SchedulingDecision:
     wait_seconds: int = 0  # Suggested wait time if not allowed
 
 
+@dataclass
+class CreditLease:
+    """Credits a container has leased from a tenant's shared bucket."""
+
+    workspace_id: str
+    tier: TenantTier | None = None  # Known tier (None until seen)
+    credits: int = 0  # Leased and not yet spent
+    processed: int = 0  # Messages processed since the last release
+    throttled: int = 0  # Messages throttled since the last release
+    blocked_until: float = 0.0  # Bucket known to be short until then
+    opened_at: float = 0.0  # First activity since the last release
+
+
 class FairScheduler:
     """Fair scheduler for multi-tenant workflow processing.
 
@@ -150,6 +190,10 @@ class FairScheduler:
         refresh_interval: int | None = None,
         use_dynamodb: bool | None = None,
         table_name: str | None = None,
+        lease_size: int | None = None,
+        lease_hold_seconds: float | None = None,
+        table=None,
+        clock: Callable[[], float] = time.time,
     ):
         """Initialize the fair scheduler.
 
@@ -157,6 +201,11 @@ class FairScheduler:
             refresh_interval: Seconds between credit refreshes.
             use_dynamodb: Whether to use DynamoDB for shared state.
             table_name: DynamoDB table name for credit tracking.
+            lease_size: Credits leased from the shared bucket at once.
+            lease_hold_seconds: Age after which release_leases(max_hold=...)
+                returns a lease's unspent credits.
+            table: DynamoDB Table to use instead of table_name.
+            clock: Time source (epoch seconds).
         """
         self.refresh_interval = refresh_interval or int(
             os.environ.get("SCHEDULER_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL)
@@ -166,9 +215,22 @@ class FairScheduler:
         )
         self.table_name = table_name or os.environ.get("SCHEDULER_TABLE_NAME", "complens-scheduler")
 
+        self.lease_size = lease_size or int(
+            os.environ.get("SCHEDULER_LEASE_SIZE", DEFAULT_LEASE_SIZE)
+        )
+        self.lease_hold_seconds = lease_hold_seconds if lease_hold_seconds is not None else float(
+            os.environ.get("SCHEDULER_LEASE_HOLD_SECONDS", DEFAULT_LEASE_HOLD_SECONDS)
+        )
+        self.clock = clock
+
         # In-memory credit tracking (for single-instance or testing)
         self._credits: dict[str, TenantCredits] = {}
+        # Credits leased from DynamoDB buckets, per workspace
+        self._leases: dict[str, CreditLease] = {}
         self._dynamodb = None
+        self._table = table
+
+        self.remote_calls = 0
 
         self.logger = logger.bind(
             service="fair_scheduler",
@@ -182,6 +244,13 @@ class FairScheduler:
             self._dynamodb = boto3.resource("dynamodb")
         return self._dynamodb
 
+    @property
+    def table(self):
+        """Get the credits table (lazy initialization)."""
+        if self._table is None:
+            self._table = self.dynamodb.Table(self.table_name)
+        return self._table
+
     def get_tenant_credits(
         self,
         workspace_id: str,
@@ -222,6 +291,7 @@ class FairScheduler:
                 tier=effective_tier,
                 credits_remaining=credits_per_window,
                 credits_per_window=credits_per_window,
+                last_refresh=self.clock(),
             )
 
         credits = self._credits[workspace_id]
@@ -232,7 +302,7 @@ class FairScheduler:
             credits.credits_per_window = TIER_CREDITS.get(tier, 10)
 
         # Refresh credits if window elapsed
-        credits.refresh_if_needed(self.refresh_interval)
+        credits.refresh_if_needed(self.refresh_interval, now=self.clock())
 
         return credits
 
@@ -241,7 +311,9 @@ class FairScheduler:
         workspace_id: str,
         tier: TenantTier | None = None,
     ) -> TenantCredits:
-        """Get credits from DynamoDB with atomic operations.
+        """Read a tenant's shared bucket, with the lazy refill applied.
+
+        This is a read-only snapshot; scheduling goes through leases.
 
         Args:
             workspace_id: Workspace identifier.
@@ -250,74 +322,270 @@ class FairScheduler:
         Returns:
             TenantCredits.
         """
-        table = self.dynamodb.Table(self.table_name)
-
         try:
-            # Try to get existing record
-            response = table.get_item(
-                Key={"PK": f"CREDITS#{workspace_id}", "SK": "CURRENT"},
-            )
-            item = response.get("Item")
+            self.remote_calls += 1
+            item = self.table.get_item(Key=self._bucket_key(workspace_id)).get("Item")
+        except ClientError as e:
+            self.logger.error("DynamoDB error", error=str(e))
+            # Fall back to in-memory
+            return self._get_credits_from_memory(workspace_id, tier)
 
-            if item:
-                credits = TenantCredits(
-                    workspace_id=workspace_id,
-                    tier=TenantTier(item.get("tier", "free")),
-                    credits_remaining=int(item.get("credits_remaining", 0)),
-                    credits_per_window=int(item.get("credits_per_window", 10)),
-                    last_refresh=float(item.get("last_refresh", 0)),
-                    messages_processed=int(item.get("messages_processed", 0)),
-                    messages_throttled=int(item.get("messages_throttled", 0)),
-                )
+        effective_tier, capacity, tokens, refreshed_at = self._refill(item, tier, self.clock())
+        return TenantCredits(
+            workspace_id=workspace_id,
+            tier=effective_tier,
+            credits_remaining=tokens,
+            credits_per_window=capacity,
+            last_refresh=refreshed_at,
+            messages_processed=int((item or {}).get("messages_processed", 0)),
+            messages_throttled=int((item or {}).get("messages_throttled", 0)),
+        )
 
-                # Check if refresh needed
-                if credits.refresh_if_needed(self.refresh_interval):
-                    self._save_credits_to_dynamodb(credits)
+    @staticmethod
+    def _bucket_key(workspace_id: str) -> dict[str, str]:
+        """Key of a tenant's shared credit bucket."""
+        return {"PK": f"CREDITS#{workspace_id}", "SK": "CURRENT"}
 
-                return credits
+    def _refill(
+        self,
+        item: dict | None,
+        tier: TenantTier | None,
+        now: float,
+    ) -> tuple[TenantTier, int, int, float]:
+        """Apply the lazy refill to a stored bucket.
 
-            # Create new record
-            effective_tier = tier or TenantTier.FREE
-            credits_per_window = TIER_CREDITS.get(effective_tier, 10)
-            credits = TenantCredits(
-                workspace_id=workspace_id,
-                tier=effective_tier,
-                credits_remaining=credits_per_window,
-                credits_per_window=credits_per_window,
-            )
-            self._save_credits_to_dynamodb(credits)
-            return credits
+        Credits accrue at capacity / refresh_interval per second since
+        ``last_refresh``; ``last_refresh`` advances only by whole credits so
+        fractional accrual is not lost.
 
-        except ClientError as e:
-            self.logger.error("DynamoDB error", error=str(e))
-            # Fall back to in-memory
-            return self._get_credits_from_memory(workspace_id, tier)
+        Args:
+            item: Stored bucket, or None if the tenant has none yet.
+            tier: Optional tier override.
+            now: Current time.
 
-    def _save_credits_to_dynamodb(self, credits: TenantCredits) -> None:
-        """Save credits to DynamoDB.
+        Returns:
+            Tuple of (tier, capacity, available credits, new last_refresh).
+        """
+        effective_tier = tier or TenantTier((item or {}).get("tier", TenantTier.FREE.value))
+        capacity = TIER_CREDITS.get(effective_tier, 10)
+        if not item:
+            return effective_tier, capacity, capacity, now
+
+        stored = int(item.get("credits_remaining", 0))
+        last_refresh = float(item.get("last_refresh", 0))
+        rate = capacity / self.refresh_interval
+        accrued = int(max(0.0, now - last_refresh) * rate)
+        tokens = min(capacity, stored + accrued)
+        refreshed_at = now if tokens >= capacity else last_refresh + accrued / rate
+        return effective_tier, capacity, tokens, refreshed_at
+
+    def _lease_credits(
+        self,
+        workspace_id: str,
+        tier: TenantTier | None,
+        needed: int,
+    ) -> tuple[int, int, TenantTier | None]:
+        """Lease credits from a tenant's shared bucket.
+
+        Tries an atomic conditional decrement of a full lease first. If
+        the bucket is short, refills it lazily and takes what is there
+        with a compare-and-set, retrying when another container wrote in
+        between.
 
         Args:
-            credits: Credits to save.
+            workspace_id: Workspace identifier.
+            tier: Optional tier override.
+            needed: Minimum credits required.
+
+        Returns:
+            Tuple of (credits leased, seconds until enough accrue, tier
+            stored on the bucket if it was read).
+        """
+        # Lease at most a quarter of the bucket so one container can't drain it
+        capacity = TIER_CREDITS.get(tier or TenantTier.FREE, 10)
+        wanted = max(needed, min(self.lease_size, max(1, capacity // 4)))
+        key = self._bucket_key(workspace_id)
+
+        try:
+            self.remote_calls += 1
+            self.table.update_item(
+                Key=key,
+                UpdateExpression="SET credits_remaining = credits_remaining - :n",
+                ConditionExpression="credits_remaining >= :n",
+                ExpressionAttributeValues={":n": wanted},
+            )
+            return wanted, 0, None
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+
+        for _ in range(MAX_REFILL_ATTEMPTS):
+            self.remote_calls += 1
+            item = self.table.get_item(Key=key, ConsistentRead=True).get("Item")
+            now = self.clock()
+            effective_tier, capacity, tokens, refreshed_at = self._refill(item, tier, now)
+
+            if tokens < needed:
+                # Time for the missing credits to accrue from refreshed_at
+                rate = capacity / self.refresh_interval
+                wait_seconds = max(1, math.ceil(refreshed_at + (needed - tokens) / rate - now))
+                return 0, wait_seconds, effective_tier
+
+            taken = min(wanted, tokens)
+            values = {
+                ":left": tokens - taken,
+                ":refreshed": Decimal(str(round(refreshed_at, 3))),
+                ":tier": effective_tier.value,
+                ":capacity": capacity,
+                ":workspace_id": workspace_id,
+                ":now": datetime.now(timezone.utc).isoformat(),
+            }
+            if item:
+                condition = "credits_remaining = :seen AND last_refresh = :seen_refresh"
+                values[":seen"] = item["credits_remaining"]
+                values[":seen_refresh"] = item["last_refresh"]
+            else:
+                condition = "attribute_not_exists(PK)"
+
+            try:
+                self.remote_calls += 1
+                self.table.update_item(
+                    Key=key,
+                    UpdateExpression=(
+                        "SET credits_remaining = :left, last_refresh = :refreshed, "
+                        "tier = :tier, credits_per_window = :capacity, "
+                        "workspace_id = :workspace_id, updated_at = :now"
+                    ),
+                    ConditionExpression=condition,
+                    ExpressionAttributeValues=values,
+                )
+                return taken, 0, effective_tier
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+
+        self.logger.warning("Credit bucket contended", workspace_id=workspace_id)
+        return 0, 1, None
+
+    def _acquire(
+        self,
+        workspace_id: str,
+        cost: int,
+        tier: TenantTier | None,
+    ) -> tuple[CreditLease, int]:
+        """Make sure a tenant's lease covers a cost, leasing more if needed.
+
+        Returns:
+            Tuple of (lease, seconds to wait if it still falls short).
         """
-        table = self.dynamodb.Table(self.table_name)
+        now = self.clock()
+        lease = self._leases.get(workspace_id)
+        if lease is None:
+            lease = CreditLease(workspace_id=workspace_id, tier=tier)
+            self._leases[workspace_id] = lease
+        if tier:
+            lease.tier = tier
+        if not lease.opened_at:
+            lease.opened_at = now
+        if lease.credits >= cost:
+            return lease, 0
+
+        # Don't ask the bucket again before the missing credits can accrue
+        if now < lease.blocked_until:
+            return lease, max(1, math.ceil(lease.blocked_until - now))
 
         try:
-            table.put_item(
-                Item={
-                    "PK": f"CREDITS#{credits.workspace_id}",
-                    "SK": "CURRENT",
-                    "workspace_id": credits.workspace_id,
-                    "tier": credits.tier.value,
-                    "credits_remaining": credits.credits_remaining,
-                    "credits_per_window": credits.credits_per_window,
-                    "last_refresh": credits.last_refresh,
-                    "messages_processed": credits.messages_processed,
-                    "messages_throttled": credits.messages_throttled,
-                    "updated_at": datetime.now(timezone.utc).isoformat(),
-                }
+            leased, wait_seconds, stored_tier = self._lease_credits(
+                workspace_id, lease.tier, cost - lease.credits
             )
         except ClientError as e:
-            self.logger.error("Failed to save credits", error=str(e))
+            self.logger.error("DynamoDB error", error=str(e))
+            # Fall back to in-memory credits for this request
+            credits = self._get_credits_from_memory(workspace_id, tier)
+            if credits.credits_remaining >= cost:
+                lease.credits += cost
+                credits.credits_remaining -= cost
+                return lease, 0
+            return lease, max(1, int(self.refresh_interval - (self.clock() - credits.last_refresh)))
+
+        lease.credits += leased
+        lease.tier = lease.tier or stored_tier
+        if wait_seconds:
+            lease.blocked_until = now + wait_seconds
+        return lease, wait_seconds
+
+    def release_leases(self, max_hold: float | None = None) -> int:
+        """Return unspent leased credits and flush message counters.
+
+        Call at the end of each invocation with max_hold so credits are
+        not held for long by a container that may be frozen (at most one
+        lease per tenant is ever stranded). Credits that would overfill a
+        bucket (it refilled meanwhile) are dropped.
+
+        Args:
+            max_hold: Only release leases held at least this many seconds;
+                None releases everything.
+
+        Returns:
+            Number of credits returned.
+        """
+        now = self.clock()
+        returned = 0
+        for workspace_id, lease in list(self._leases.items()):
+            if not (lease.credits or lease.processed or lease.throttled):
+                continue
+            if max_hold is not None and now - lease.opened_at < max_hold:
+                continue
+
+            update = "ADD messages_processed :processed, messages_throttled :throttled"
+            values = {":processed": lease.processed, ":throttled": lease.throttled}
+            try:
+                self.remote_calls += 1
+                if lease.credits:
+                    capacity = TIER_CREDITS.get(lease.tier or TenantTier.FREE, 10)
+                    try:
+                        self.table.update_item(
+                            Key=self._bucket_key(workspace_id),
+                            UpdateExpression=update + ", credits_remaining :credits",
+                            ConditionExpression="credits_remaining <= :max_before",
+                            ExpressionAttributeValues={
+                                **values,
+                                ":credits": lease.credits,
+                                ":max_before": capacity - lease.credits,
+                            },
+                        )
+                        returned += lease.credits
+                    except ClientError as e:
+                        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                            raise
+                        self.remote_calls += 1
+                        self.table.update_item(
+                            Key=self._bucket_key(workspace_id),
+                            UpdateExpression=update,
+                            ExpressionAttributeValues=values,
+                        )
+                else:
+                    self.table.update_item(
+                        Key=self._bucket_key(workspace_id),
+                        UpdateExpression=update,
+                        ExpressionAttributeValues=values,
+                    )
+            except ClientError as e:
+                self.logger.warning(
+                    "Failed to release credit lease",
+                    workspace_id=workspace_id,
+                    error=str(e),
+                )
+            lease.credits = lease.processed = lease.throttled = 0
+            lease.opened_at = 0.0
+
+        # Drop idle leases unless they remember a short bucket
+        self._leases = {
+            workspace_id: lease
+            for workspace_id, lease in self._leases.items()
+            if lease.opened_at or lease.blocked_until > now
+        }
+        return returned
 
     def should_process(
         self,
@@ -335,6 +603,9 @@ class FairScheduler:
         Returns:
             SchedulingDecision with allowed status and reason.
         """
+        if self.use_dynamodb:
+            return self._should_process_leased(workspace_id, priority, tier)
+
         credits = self.get_tenant_credits(workspace_id, tier)
 
         # High priority always allowed (emergency/admin actions)
@@ -356,7 +627,7 @@ class FairScheduler:
             )
 
         # Calculate wait time until next refresh
-        time_since_refresh = time.time() - credits.last_refresh
+        time_since_refresh = self.clock() - credits.last_refresh
         wait_seconds = max(0, int(self.refresh_interval - time_since_refresh))
 
         return SchedulingDecision(
@@ -367,6 +638,42 @@ class FairScheduler:
             wait_seconds=wait_seconds,
         )
 
+    def _should_process_leased(
+        self,
+        workspace_id: str,
+        priority: str,
+        tier: TenantTier | None,
+    ) -> SchedulingDecision:
+        """Scheduling decision backed by a lease on the shared bucket."""
+        if priority == "high":
+            lease = self._leases.get(workspace_id)
+            return SchedulingDecision(
+                allowed=True,
+                workspace_id=workspace_id,
+                credits_remaining=lease.credits if lease else 0,
+                reason="high_priority",
+            )
+
+        lease, wait_seconds = self._acquire(
+            workspace_id, PRIORITY_WEIGHTS.get(priority, 1), tier
+        )
+        if not wait_seconds:
+            return SchedulingDecision(
+                allowed=True,
+                workspace_id=workspace_id,
+                credits_remaining=lease.credits,
+                reason="credits_available",
+            )
+
+        lease.throttled += 1
+        return SchedulingDecision(
+            allowed=False,
+            workspace_id=workspace_id,
+            credits_remaining=0,
+            reason="credits_exhausted",
+            wait_seconds=wait_seconds,
+        )
+
     def consume_credit(
         self,
         workspace_id: str,
@@ -385,14 +692,29 @@ class FairScheduler:
         Returns:
             True if credit was consumed.
         """
+        if self.use_dynamodb:
+            cost = PRIORITY_WEIGHTS.get(priority, 1)
+            lease, wait_seconds = self._acquire(workspace_id, cost, tier)
+            if wait_seconds:
+                lease.throttled += 1
+                return False
+            lease.credits -= cost
+            lease.processed += 1
+            return True
+
         credits = self.get_tenant_credits(workspace_id, tier)
-        consumed = credits.consume_credit(priority)
+        return credits.consume_credit(priority)
 
-        # Save to DynamoDB if using shared state
-        if self.use_dynamodb:
-            self._save_credits_to_dynamodb(credits)
+    def refill_seconds(self, tier: TenantTier | None = None) -> float:
+        """Average seconds between credits for a tier.
 
-        return consumed
+        Args:
+            tier: Tenant tier (defaults to free).
+
+        Returns:
+            Refresh interval divided by the tier's credits per window.
+        """
+        return self.refresh_interval / TIER_CREDITS.get(tier or TenantTier.FREE, 10)
 
     def get_all_credits(self) -> dict[str, TenantCredits]:
         """Get all tracked tenant credits (in-memory only).
@@ -412,6 +734,8 @@ class FairScheduler:
             "refresh_interval": self.refresh_interval,
             "use_dynamodb": self.use_dynamodb,
             "tenants_tracked": len(self._credits),
+            "leases_held": sum(lease.credits for lease in self._leases.values()),
+            "remote_calls": self.remote_calls,
             "total_processed": sum(c.messages_processed for c in self._credits.values()),
             "total_throttled": sum(c.messages_throttled for c in self._credits.values()),
         }
@@ -435,13 +759,12 @@ class FairScheduler:
         Args:
             workspace_id: Workspace to reset.
         """
-        if workspace_id in self._credits:
-            del self._credits[workspace_id]
+        self._credits.pop(workspace_id, None)
+        self._leases.pop(workspace_id, None)
 
         if self.use_dynamodb:
-            table = self.dynamodb.Table(self.table_name)
             try:
-                table.delete_item(
+                self.table.delete_item(
                     Key={"PK": f"CREDITS#{workspace_id}", "SK": "CURRENT"},
                 )
             except ClientError:
@@ -461,6 +784,35 @@ class FairScheduler:
         Returns:
             Updated TenantCredits.
         """
+        if self.use_dynamodb:
+            credits_per_window = TIER_CREDITS.get(tier, 10)
+            now = self.clock()
+            try:
+                self.remote_calls += 1
+                self.table.update_item(
+                    Key=self._bucket_key(workspace_id),
+                    UpdateExpression=(
+                        "SET tier = :tier, credits_per_window = :capacity, "
+                        "credits_remaining = :capacity, last_refresh = :now, "
+                        "workspace_id = :workspace_id"
+                    ),
+                    ExpressionAttributeValues={
+                        ":tier": tier.value,
+                        ":capacity": credits_per_window,
+                        ":now": Decimal(str(round(now, 3))),
+                        ":workspace_id": workspace_id,
+                    },
+                )
+            except ClientError as e:
+                self.logger.error("Failed to save credits", error=str(e))
+            return TenantCredits(
+                workspace_id=workspace_id,
+                tier=tier,
+                credits_remaining=credits_per_window,
+                credits_per_window=credits_per_window,
+                last_refresh=now,
+            )
+
         credits = self.get_tenant_credits(workspace_id, tier)
         credits.tier = tier
         credits.credits_per_window = TIER_CREDITS.get(tier, 10)
@@ -469,16 +821,20 @@ class FairScheduler:
         if credits.credits_remaining < credits.credits_per_window:
             credits.credits_remaining = credits.credits_per_window
 
-        if self.use_dynamodb:
-            self._save_credits_to_dynamodb(credits)
-
         return credits
 
 
+# Singleton instance (leases and in-memory credits survive warm invocations)
+_fair_scheduler: FairScheduler | None = None
+
+
 def get_fair_scheduler() -> FairScheduler:
-    """Get a configured FairScheduler instance.
+    """Get the global FairScheduler instance.
 
     Returns:
         FairScheduler instance.
     """
-    return FairScheduler()
+    global _fair_scheduler
+    if _fair_scheduler is None:
+        _fair_scheduler = FairScheduler()
+    return _fair_scheduler
@@ -40,6 +40,7 @@ class FeatureFlag(str, Enum):
     # Node execution flags
     USE_NODE_DISPATCHER = "use_node_dispatcher"
     USE_CIRCUIT_BREAKER = "use_circuit_breaker"
+    ENABLE_NODE_FUSION = "enable_node_fusion"
 
     # DLQ handling flags
     ENABLE_DLQ_REMEDIATION = "enable_dlq_remediation"
@@ -90,6 +91,11 @@ DEFAULT_FLAG_CONFIGS: dict[FeatureFlag, FlagConfig] = {
         rollout_percentage=0,
         description="Enable circuit breaker for provider calls",
     ),
+    FeatureFlag.ENABLE_NODE_FUSION: FlagConfig(
+        flag=FeatureFlag.ENABLE_NODE_FUSION,
+        rollout_percentage=0,
+        description="Run chains of non-waiting nodes in one Express task invocation",
+    ),
     FeatureFlag.ENABLE_DLQ_REMEDIATION: FlagConfig(
         flag=FeatureFlag.ENABLE_DLQ_REMEDIATION,
         rollout_percentage=0,
@@ -9,12 +9,32 @@ Benefits over FIFO:
 - Horizontal scaling via shard count
 - Better fault isolation (one shard failure doesn't affect others)
 - Consistent routing ensures related messages go to same shard
+
+SHARD_PLACEMENT selects how workspaces are placed:
+
+- ``modulo`` (default): MD5 modulo shard count. Changing SHARD_COUNT
+  remaps about (N-1)/N of workspaces.
+- ``ring``: a hash ring where each shard owns SHARD_VIRTUAL_NODES
+  points, so changing SHARD_COUNT from N to N+1 moves only about
+  1/(N+1) of workspaces.
+
+Switching placement (or SHARD_COUNT) moves workspaces to new shards, and
+messages still queued on their old shard are no longer ordered with new
+ones. Make either change while the shards are drained
+(get_shard_statistics() reports their backlog).
+
+SHARD_OVERRIDES (JSON) pins a workspace to one shard (``{"ws_123": 2}``)
+or spreads a hot tenant that does not need ordering across several
+(``{"ws_big": [1, 2, 3]}``).
 """
 
+import bisect
 import hashlib
+import itertools
 import json
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 import boto3
@@ -27,6 +47,108 @@ logger = structlog.get_logger()
 DEFAULT_SHARD_COUNT = 4
 MAX_SHARD_COUNT = 16
 
+# Points each shard owns on the hash ring
+DEFAULT_VIRTUAL_NODES = 256
+
+# Workspace placement strategies (see SHARD_PLACEMENT)
+PLACEMENT_MODULO = "modulo"
+PLACEMENT_RING = "ring"
+
+
+def _hash(key: str) -> int:
+    """64-bit MD5-based hash of a key."""
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], byteorder="big")
+
+
+def modulo_shard(key: str, shard_count: int) -> int:
+    """Place a key with MD5 modulo shard count.
+
+    Args:
+        key: Key to place, e.g. a workspace ID.
+        shard_count: Number of shards.
+
+    Returns:
+        Shard index.
+    """
+    return _hash(key) % shard_count
+
+
+class HashRing:
+    """Consistent-hash ring over shard indices with virtual nodes.
+
+    Example:
+        ring = HashRing(shard_count=4)
+        shard = ring.get_shard("ws_123")
+    """
+
+    def __init__(self, shard_count: int, virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        """Build the ring.
+
+        Args:
+            shard_count: Number of shards (indices 0 to shard_count - 1).
+            virtual_nodes: Points per shard.
+        """
+        self.shard_count = shard_count
+        self.virtual_nodes = virtual_nodes
+        points = sorted(
+            (_hash(f"shard-{shard}#{node}"), shard)
+            for shard in range(shard_count)
+            for node in range(virtual_nodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def get_shard(self, key: str) -> int:
+        """Get the shard owning a key (the first point clockwise of its hash).
+
+        Args:
+            key: Key to place, e.g. a workspace ID.
+
+        Returns:
+            Shard index.
+        """
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._shards[index]
+
+
+@lru_cache(maxsize=8)
+def get_hash_ring(shard_count: int, virtual_nodes: int = DEFAULT_VIRTUAL_NODES) -> HashRing:
+    """Get a (cached) ring for a shard count."""
+    return HashRing(shard_count, virtual_nodes)
+
+
+def parse_shard_overrides(
+    raw: str | dict[str, int | list[int]] | None,
+    shard_count: int,
+) -> dict[str, list[int]]:
+    """Parse shard overrides into workspace -> shard list.
+
+    Args:
+        raw: Dict (or its JSON, as in SHARD_OVERRIDES) mapping workspace
+            IDs to a shard index or a list of shard indices.
+        shard_count: Number of shards; out-of-range indices are dropped.
+
+    Returns:
+        Dict of workspace ID to its shards (one shard means pinned).
+    """
+    if not raw:
+        return {}
+    try:
+        parsed = json.loads(raw) if isinstance(raw, str) else raw
+    except json.JSONDecodeError:
+        logger.warning("Invalid SHARD_OVERRIDES, ignoring")
+        return {}
+
+    overrides = {}
+    for workspace_id, shards in parsed.items():
+        shard_list = shards if isinstance(shards, list) else [shards]
+        valid = [s for s in shard_list if isinstance(s, int) and 0 <= s < shard_count]
+        if valid:
+            overrides[workspace_id] = valid
+        else:
+            logger.warning("Ignoring shard override", workspace_id=workspace_id, shards=shards)
+    return overrides
+
 
 @dataclass
 class QueueMessage:
@@ -60,6 +182,10 @@ class TenantRouter:
     2. Load is evenly distributed across shards
     3. Adding/removing shards minimizes message redistribution
 
+    Spread workspaces (see SHARD_OVERRIDES) give up ordering: messages
+    with a message_group_id stay together, others rotate across the
+    workspace's shards.
+
     Example:
         router = TenantRouter(shard_count=4)
         result = await router.route_message(QueueMessage(
@@ -73,6 +199,9 @@ class TenantRouter:
         shard_count: int | None = None,
         shard_queue_urls: dict[int, str] | None = None,
         priority_queue_url: str | None = None,
+        overrides: dict[str, int | list[int]] | None = None,
+        virtual_nodes: int | None = None,
+        placement: str | None = None,
     ):
         """Initialize the tenant router.
 
@@ -81,11 +210,33 @@ class TenantRouter:
             shard_queue_urls: Dict mapping shard index to queue URL.
                 Defaults to loading from SHARD_QUEUE_URL_N env vars.
             priority_queue_url: URL for priority queue. Defaults to PRIORITY_QUEUE_URL.
+            overrides: Workspace ID to pinned shard or list of shards.
+                Defaults to the SHARD_OVERRIDES env var (JSON).
+            virtual_nodes: Ring points per shard. Defaults to SHARD_VIRTUAL_NODES.
+            placement: ``modulo`` or ``ring``. Defaults to SHARD_PLACEMENT
+                or ``modulo``.
         """
         self.shard_count = min(
             shard_count or int(os.environ.get("SHARD_COUNT", DEFAULT_SHARD_COUNT)),
             MAX_SHARD_COUNT,
         )
+        self.placement = placement or os.environ.get("SHARD_PLACEMENT", PLACEMENT_MODULO)
+        if self.placement not in (PLACEMENT_MODULO, PLACEMENT_RING):
+            logger.warning("Invalid SHARD_PLACEMENT, using modulo", placement=self.placement)
+            self.placement = PLACEMENT_MODULO
+        self.virtual_nodes = virtual_nodes or int(
+            os.environ.get("SHARD_VIRTUAL_NODES", DEFAULT_VIRTUAL_NODES)
+        )
+        self.ring = (
+            get_hash_ring(self.shard_count, self.virtual_nodes)
+            if self.placement == PLACEMENT_RING
+            else None
+        )
+        self.overrides = parse_shard_overrides(
+            overrides if overrides is not None else os.environ.get("SHARD_OVERRIDES"),
+            self.shard_count,
+        )
+        self._spread_counter = itertools.count()
 
         # Load shard queue URLs from environment or use provided dict
         self.shard_queue_urls = shard_queue_urls or self._load_shard_urls()
@@ -122,9 +273,10 @@ class TenantRouter:
         return self._sqs_client
 
     def get_shard_for_workspace(self, workspace_id: str) -> int:
-        """Get the shard index for a workspace using consistent hashing.
+        """Get the home shard index for a workspace.
 
-        Uses MD5 hash for even distribution across shards.
+        Pinned and spread workspaces use their first override shard;
+        everyone else is placed by SHARD_PLACEMENT.
 
         Args:
             workspace_id: Workspace identifier.
@@ -132,11 +284,32 @@ class TenantRouter:
         Returns:
             Shard index (0 to shard_count - 1).
         """
-        # Use MD5 for consistent, well-distributed hashing
-        hash_bytes = hashlib.md5(workspace_id.encode()).digest()
-        # Use first 8 bytes as integer
-        hash_int = int.from_bytes(hash_bytes[:8], byteorder="big")
-        return hash_int % self.shard_count
+        override = self.overrides.get(workspace_id)
+        if override:
+            return override[0]
+        if self.ring is not None:
+            return self.ring.get_shard(workspace_id)
+        return modulo_shard(workspace_id, self.shard_count)
+
+    def get_shard_for_message(self, message: QueueMessage) -> int:
+        """Get the shard index for a message.
+
+        Messages of a spread workspace go to one of its shards: by
+        message_group_id when set (keeping the group together), otherwise
+        in rotation.
+
+        Args:
+            message: Message to route.
+
+        Returns:
+            Shard index (0 to shard_count - 1).
+        """
+        shards = self.overrides.get(message.workspace_id)
+        if not shards or len(shards) == 1:
+            return self.get_shard_for_workspace(message.workspace_id)
+        if message.message_group_id:
+            return shards[_hash(f"{message.workspace_id}#{message.message_group_id}") % len(shards)]
+        return shards[next(self._spread_counter) % len(shards)]
 
     def get_queue_url_for_shard(self, shard_index: int) -> str:
         """Get the queue URL for a shard index.
@@ -187,7 +360,7 @@ class TenantRouter:
             )
 
         # Route to shard based on workspace
-        shard_index = self.get_shard_for_workspace(message.workspace_id)
+        shard_index = self.get_shard_for_message(message)
         queue_url = self.get_queue_url_for_shard(shard_index)
 
         return self._send_to_queue(
@@ -216,7 +389,7 @@ class TenantRouter:
             if message.priority == "high" and self.priority_queue_url:
                 priority_batch.append(message)
             else:
-                shard_index = self.get_shard_for_workspace(message.workspace_id)
+                shard_index = self.get_shard_for_message(message)
                 if shard_index not in shard_batches:
                     shard_batches[shard_index] = []
                 shard_batches[shard_index].append(message)
@@ -412,6 +585,8 @@ class TenantRouter:
         """
         stats = {
             "shard_count": self.shard_count,
+            "placement": self.placement,
+            "overrides": self.overrides,
             "configured_shards": list(self.shard_queue_urls.keys()),
             "priority_queue_url": self.priority_queue_url,
             "shards": {},
@@ -0,0 +1,322 @@
+"""Compiled trigger index for fast workflow matching.
+
+The queue processors need to answer "which active workflows in this
+workspace fire for this event?" for every SQS record. Loading and
+deserializing every active workflow (full node/edge graphs) per record
+makes tag-change storms the hottest path in the system.
+
+Instead, each workspace gets a compact, precompiled index item:
+
+    trigger_type -> match key (tag / form_id / page_id / webhook_path) -> entries
+
+The index is rebuilt by WorkflowRepository whenever a workflow is created,
+updated or deleted, and stamped with a fresh version. Queue processors keep
+the index in a warm-container cache and only re-read it when the stored
+version changes, so matching is a dict lookup plus residual checks
+(tag operation, keywords, webhook signatures) on a handful of candidates.
+
+Key Pattern:
+    PK: WS#{workspace_id}
+    SK: TRIGGER_INDEX
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+
+from complens.models.base import generate_ulid
+from complens.models.workflow import Workflow
+from complens.models.workflow_node import WorkflowNode
+
+logger = structlog.get_logger()
+
+TRIGGER_INDEX_SK = "TRIGGER_INDEX"
+
+# Seconds a cached index is trusted before its version stamp is re-checked
+DEFAULT_CACHE_TTL_SECONDS = 30
+
+# Trigger types that can be narrowed by a single config value.
+# Maps trigger_type -> (node config key, trigger event data key).
+TRIGGER_MATCH_FIELDS: dict[str, tuple[str, str]] = {
+    "trigger_tag_added": ("tag_name", "tag"),
+    "trigger_form_submitted": ("form_id", "form_id"),
+    "trigger_webhook": ("webhook_path", "webhook_path"),
+    "trigger_page_visit": ("page_id", "page_id"),
+    "trigger_chat_started": ("page_id", "page_id"),
+    "trigger_chat_message": ("page_id", "page_id"),
+}
+
+
+def _normalize_match_key(trigger_type: str, value: Any) -> str:
+    """Normalize a match value so config and event data compare equal.
+
+    Args:
+        trigger_type: Type of trigger.
+        value: Raw config or event value.
+
+    Returns:
+        Normalized key string.
+    """
+    key = str(value) if value is not None else ""
+    if trigger_type == "trigger_webhook":
+        return key.strip("/")
+    return key
+
+
+@dataclass
+class TriggerIndexEntry:
+    """A single active workflow reachable from the index."""
+
+    workflow_id: str
+    workflow_name: str
+    trigger_node: WorkflowNode
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the entry for storage."""
+        return {
+            "workflow_id": self.workflow_id,
+            "workflow_name": self.workflow_name,
+            "trigger_node": {
+                "id": self.trigger_node.id,
+                "type": self.trigger_node.node_type,
+                "data": self.trigger_node.data,
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TriggerIndexEntry":
+        """Deserialize an entry from storage."""
+        return cls(
+            workflow_id=data["workflow_id"],
+            workflow_name=data.get("workflow_name", ""),
+            trigger_node=WorkflowNode.model_validate(data["trigger_node"]),
+        )
+
+
+@dataclass
+class TriggerIndex:
+    """Per-workspace index of active workflow triggers."""
+
+    workspace_id: str
+    version: str = field(default_factory=generate_ulid)
+    entries: list[TriggerIndexEntry] = field(default_factory=list)
+
+    # Derived lookup tables (built in __post_init__)
+    _by_key: dict[str, dict[str, list[TriggerIndexEntry]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _wildcard: dict[str, list[TriggerIndexEntry]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the lookup tables from the entry list."""
+        for entry in self.entries:
+            trigger_type = entry.trigger_node.node_type
+            match_field = TRIGGER_MATCH_FIELDS.get(trigger_type)
+            configured = (
+                entry.trigger_node.get_config().get(match_field[0]) if match_field else None
+            )
+
+            if configured:
+                key = _normalize_match_key(trigger_type, configured)
+                self._by_key.setdefault(trigger_type, {}).setdefault(key, []).append(entry)
+            else:
+                self._wildcard.setdefault(trigger_type, []).append(entry)
+
+    @classmethod
+    def build(cls, workspace_id: str, workflows: list[Workflow]) -> "TriggerIndex":
+        """Compile an index from a list of active workflows.
+
+        Args:
+            workspace_id: Workspace ID.
+            workflows: Active workflows for the workspace.
+
+        Returns:
+            A freshly versioned TriggerIndex.
+        """
+        entries = []
+        for workflow in workflows:
+            trigger_node = workflow.get_trigger_node()
+            if not trigger_node:
+                continue
+            entries.append(
+                TriggerIndexEntry(
+                    workflow_id=workflow.id,
+                    workflow_name=workflow.name,
+                    trigger_node=trigger_node,
+                )
+            )
+        return cls(workspace_id=workspace_id, entries=entries)
+
+    def lookup(self, trigger_type: str, trigger_data: dict) -> list[TriggerIndexEntry]:
+        """Get candidate workflows for an event.
+
+        Candidates are narrowed by trigger type and match key only; callers
+        still apply residual checks (tag operation, keywords, signatures).
+
+        Args:
+            trigger_type: Type of trigger.
+            trigger_data: Trigger event data.
+
+        Returns:
+            Candidate index entries.
+        """
+        candidates = list(self._wildcard.get(trigger_type, []))
+
+        match_field = TRIGGER_MATCH_FIELDS.get(trigger_type)
+        if match_field:
+            key = _normalize_match_key(trigger_type, trigger_data.get(match_field[1]))
+            candidates.extend(self._by_key.get(trigger_type, {}).get(key, []))
+
+        return candidates
+
+    def to_item(self) -> dict[str, Any]:
+        """Serialize the index to a DynamoDB item.
+
+        Entries are stored as a JSON string so reads skip per-attribute
+        type conversion.
+        """
+        return {
+            "PK": f"WS#{self.workspace_id}",
+            "SK": TRIGGER_INDEX_SK,
+            "workspace_id": self.workspace_id,
+            "index_version": self.version,
+            "workflow_count": len(self.entries),
+            "entries": json.dumps([entry.to_dict() for entry in self.entries]),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> "TriggerIndex":
+        """Deserialize an index from a DynamoDB item."""
+        return cls(
+            workspace_id=item["workspace_id"],
+            version=item["index_version"],
+            entries=[
+                TriggerIndexEntry.from_dict(entry)
+                for entry in json.loads(item.get("entries") or "[]")
+            ],
+        )
+
+
+@dataclass
+class _CachedIndex:
+    """Cached index plus the time its version was last confirmed."""
+
+    index: TriggerIndex
+    checked_at: float
+
+
+class TriggerIndexCache:
+    """Warm-container cache of trigger indexes with version invalidation.
+
+    Within the TTL a cached index is used as-is. After the TTL only the
+    version stamp is read (a tiny projected get_item); the full index is
+    re-read only when the version has changed.
+
+    Example:
+        cache = get_trigger_index_cache()
+        for entry in cache.get(workspace_id).lookup(trigger_type, trigger_data):
+            ...
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int | None = None,
+        repository: Any = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds before the version stamp is re-checked.
+            repository: Optional WorkflowRepository (created lazily).
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(
+            os.environ.get("TRIGGER_INDEX_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS)
+        )
+        self._repository = repository
+        self._indexes: dict[str, _CachedIndex] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def repository(self):
+        """Get the workflow repository (lazy initialization)."""
+        if self._repository is None:
+            from complens.repositories.workflow import WorkflowRepository
+
+            self._repository = WorkflowRepository()
+        return self._repository
+
+    def get(self, workspace_id: str) -> TriggerIndex:
+        """Get the trigger index for a workspace.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Current TriggerIndex.
+        """
+        now = time.monotonic()
+        cached = self._indexes.get(workspace_id)
+
+        if cached and now - cached.checked_at < self.ttl_seconds:
+            self.hits += 1
+            return cached.index
+
+        if cached:
+            stored_version = self.repository.get_trigger_index_version(workspace_id)
+            if stored_version == cached.index.version:
+                cached.checked_at = now
+                self.hits += 1
+                return cached.index
+
+        self.misses += 1
+        index = self.repository.get_trigger_index(workspace_id)
+        if index is None:
+            # Workspaces predating the index get it built on first use
+            index = self.repository.rebuild_trigger_index(workspace_id)
+
+        self._indexes[workspace_id] = _CachedIndex(index=index, checked_at=now)
+
+        logger.debug(
+            "Trigger index loaded",
+            workspace_id=workspace_id,
+            version=index.version,
+            workflow_count=len(index.entries),
+        )
+
+        return index
+
+    def invalidate(self, workspace_id: str | None = None) -> None:
+        """Drop cached indexes.
+
+        Args:
+            workspace_id: Workspace to drop, or None to clear everything.
+        """
+        if workspace_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(workspace_id, None)
+
+
+# Container-level cache shared across invocations
+_trigger_index_cache: TriggerIndexCache | None = None
+
+
+def get_trigger_index_cache() -> TriggerIndexCache:
+    """Get the global TriggerIndexCache instance.
+
+    Returns:
+        TriggerIndexCache instance.
+    """
+    global _trigger_index_cache
+    if _trigger_index_cache is None:
+        _trigger_index_cache = TriggerIndexCache()
+    return _trigger_index_cache
@@ -1,19 +1,27 @@
 """Repository classes for DynamoDB data access."""
 
+from complens.repositories.analytics_rollup import AnalyticsRollupRepository
 from complens.repositories.base import BaseRepository
 from complens.repositories.contact import ContactRepository
+from complens.repositories.contact_export import ContactExportRepository
+from complens.repositories.contact_import import ContactImportRepository
 from complens.repositories.conversation import ConversationRepository
 from complens.repositories.domain import DomainRepository
 from complens.repositories.form import FormRepository, FormSubmissionRepository
 from complens.repositories.page import PageRepository
+from complens.repositories.resource_counts import ResourceCountsRepository
 from complens.repositories.site import SiteRepository
+from complens.repositories.synthesis_job import SynthesisJobRepository
 from complens.repositories.warmup_domain import WarmupDomainRepository
 from complens.repositories.workflow import WorkflowRepository
 from complens.repositories.workspace import WorkspaceRepository
 from complens.repositories.plan_config import PlanConfigRepository
 
 __all__ = [
+    "AnalyticsRollupRepository",
     "BaseRepository",
+    "ContactExportRepository",
+    "ContactImportRepository",
     "ContactRepository",
     "ConversationRepository",
     "DomainRepository",
@@ -21,7 +29,9 @@ __all__ = [
     "FormSubmissionRepository",
     "PageRepository",
     "PlanConfigRepository",
+    "ResourceCountsRepository",
     "SiteRepository",
+    "SynthesisJobRepository",
     "WarmupDomainRepository",
     "WorkflowRepository",
     "WorkspaceRepository",
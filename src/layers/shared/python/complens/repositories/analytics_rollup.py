@@ -0,0 +1,105 @@
+"""Repository for analytics rollups."""
+
+from datetime import date
+
+from boto3.dynamodb.conditions import Key
+
+from complens.models.analytics_rollup import (
+    TOTAL_PERIOD,
+    AnalyticsRollup,
+    rollup_pk,
+    rollup_sk,
+)
+from complens.models.base import utc_now
+from complens.repositories.base import BaseRepository
+
+
+class AnalyticsRollupRepository(BaseRepository[AnalyticsRollup]):
+    """Repository for AnalyticsRollup items."""
+
+    def __init__(self, table_name: str | None = None):
+        """Initialize analytics rollup repository."""
+        super().__init__(AnalyticsRollup, table_name)
+
+    def add_counts(self, workspace_id: str, period: str, counts: dict[str, int]) -> None:
+        """Atomically add to a rollup's counters, creating it if needed.
+
+        Args:
+            workspace_id: The workspace ID.
+            period: UTC day (YYYY-MM-DD) or TOTAL.
+            counts: Metric name -> amount to add (may be negative).
+        """
+        counts = {metric: n for metric, n in counts.items() if n}
+        if not counts:
+            return
+
+        names = {f"#m{i}": metric for i, metric in enumerate(counts)}
+        values = {f":m{i}": n for i, n in enumerate(counts.values())}
+        self.table.update_item(
+            Key={"PK": rollup_pk(workspace_id), "SK": rollup_sk(period)},
+            UpdateExpression=(
+                "SET workspace_id = :ws, #period = :period, updated_at = :now "
+                "ADD " + ", ".join(f"{name} {value}" for name, value in zip(names, values, strict=True))
+            ),
+            ExpressionAttributeNames={**names, "#period": "period"},
+            ExpressionAttributeValues={
+                **values,
+                ":ws": workspace_id,
+                ":period": period,
+                ":now": utc_now().isoformat(),
+            },
+        )
+
+    def list_days(self, workspace_id: str, start: date, end: date) -> list[AnalyticsRollup]:
+        """List daily rollups between two UTC days (inclusive).
+
+        Days without activity have no item.
+
+        Args:
+            workspace_id: The workspace ID.
+            start: First day.
+            end: Last day.
+
+        Returns:
+            Rollups ordered by day.
+        """
+        kwargs = {
+            "KeyConditionExpression": Key("PK").eq(rollup_pk(workspace_id))
+            & Key("SK").between(rollup_sk(start.isoformat()), rollup_sk(end.isoformat())),
+        }
+        return [
+            AnalyticsRollup.from_dynamodb(item)
+            for page in self._iter_query_pages(kwargs, prefetch=False)
+            for item in page
+        ]
+
+    def get_totals(self, workspace_id: str) -> AnalyticsRollup | None:
+        """Get a workspace's all-time rollup.
+
+        Args:
+            workspace_id: The workspace ID.
+
+        Returns:
+            The TOTAL rollup, or None if nothing has been counted yet.
+        """
+        return self.get(rollup_pk(workspace_id), rollup_sk(TOTAL_PERIOD))
+
+    def replace_all(self, workspace_id: str, rollups: list[AnalyticsRollup]) -> None:
+        """Replace a workspace's rollups with recomputed ones.
+
+        Args:
+            workspace_id: The workspace ID.
+            rollups: Every rollup the workspace should have.
+        """
+        kwargs = {
+            "KeyConditionExpression": Key("PK").eq(rollup_pk(workspace_id)),
+            "ProjectionExpression": "PK, SK",
+        }
+        keep = {rollup.get_sk() for rollup in rollups}
+        self.batch_delete(
+            (item["PK"], item["SK"])
+            for page in self._iter_query_pages(kwargs, prefetch=False)
+            for item in page
+            if item["SK"] not in keep
+        )
+        self.batch_write(rollups)
@@ -1,6 +1,12 @@
 """Base repository class for DynamoDB operations."""
 
 import os
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Generic, TypeVar
 
 import boto3
@@ -9,11 +15,68 @@ from botocore.exceptions import ClientError
 from pydantic import BaseModel as PydanticBaseModel
 
 from complens.models.base import BaseModel
-from complens.utils.exceptions import ConflictError, NotFoundError
+from complens.utils.exceptions import ConflictError, ExternalServiceError, NotFoundError
 
 logger = structlog.get_logger()
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# DynamoDB batch API limits
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+
+# Retry policy for unprocessed batch keys/items (exponential backoff, full jitter)
+BATCH_MAX_RETRIES = 8
+BATCH_RETRY_BASE_DELAY = 0.05
+BATCH_RETRY_MAX_DELAY = 2.0
+
+# Number of GSIs on the main table (GSI1..GSI4)
+GSI_COUNT = 4
+
+
+def _chunks(values: list, size: int) -> list[list]:
+    """Split a list into chunks of at most size items."""
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+def _map_chunks(
+    fn: Callable[[list], R],
+    chunks: list[list],
+    max_workers: int = 1,
+) -> Iterator[R]:
+    """Apply fn to each chunk, optionally on a thread pool, yielding in order.
+
+    At most max_workers chunks are in flight, so results can be consumed
+    lazily without materializing every chunk at once.
+
+    Args:
+        fn: Function to apply to each chunk.
+        chunks: Chunks to process.
+        max_workers: Maximum concurrent chunks (1 = serial).
+
+    Yields:
+        fn(chunk) for each chunk, in chunk order.
+    """
+    if max_workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield fn(chunk)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+        remaining = iter(chunks)
+        pending = deque(pool.submit(fn, chunk) for chunk in islice(remaining, max_workers))
+        while pending:
+            result = pending.popleft().result()
+            next_chunk = next(remaining, None)
+            if next_chunk is not None:
+                pending.append(pool.submit(fn, next_chunk))
+            yield result
+
+
+def _retry_delay(attempt: int) -> float:
+    """Get the backoff delay before retrying unprocessed batch work."""
+    return random.uniform(0, min(BATCH_RETRY_MAX_DELAY, BATCH_RETRY_BASE_DELAY * (2**attempt)))
 
 
 class BaseRepository(Generic[T]):
@@ -52,10 +115,40 @@ class BaseRepository(Generic[T]):
             self._table = self.dynamodb.Table(self.table_name)
         return self._table
 
+    @property
+    def client(self):
+        """Get the resource's low-level client.
+
+        Unlike resources, clients are thread-safe, so batch operations that
+        fan out across threads use it. Values are still native Python types.
+        """
+        return self.dynamodb.meta.client
+
     def _build_key(self, pk: str, sk: str) -> dict[str, str]:
         """Build key dictionary for DynamoDB operations."""
         return {"PK": pk, "SK": sk}
 
+    @staticmethod
+    def _get_all_gsi_keys(item: BaseModel) -> dict[str, str]:
+        """Collect the GSI key attributes an item defines.
+
+        Calls every get_gsiN_keys() method the model implements.
+
+        Args:
+            item: Model instance.
+
+        Returns:
+            Merged GSI key attributes (empty if none).
+        """
+        keys: dict[str, str] = {}
+        for index in range(1, GSI_COUNT + 1):
+            getter = getattr(item, f"get_gsi{index}_keys", None)
+            if getter:
+                gsi_keys = getter()
+                if gsi_keys:
+                    keys.update(gsi_keys)
+        return keys
+
     def get(self, pk: str, sk: str) -> T | None:
         """Get an item by its primary key.
 
@@ -279,50 +372,21 @@ class BaseRepository(Generic[T]):
         Returns:
             Tuple of (items, last_evaluated_key).
         """
-        try:
-            # Build key condition
-            sk_condition = sk_prefix or sk_begins_with
-            if sk_condition:
-                key_condition = "PK = :pk AND begins_with(SK, :sk_prefix)"
-                expr_values = {":pk": pk, ":sk_prefix": sk_condition}
-            else:
-                key_condition = "PK = :pk"
-                expr_values = {":pk": pk}
-
-            # Use GSI key names if querying index
-            if index_name and index_name.startswith("GSI"):
-                prefix = index_name.lower()  # e.g., "gsi1", "gsi4"
-                key_condition = key_condition.replace("PK", f"{index_name}PK").replace("SK", f"{index_name}SK")
-                expr_values = {
-                    k.replace(":pk", f":{prefix}pk").replace(":sk_prefix", f":{prefix}sk_prefix"): v
-                    for k, v in expr_values.items()
-                }
-                key_condition = key_condition.replace(":pk", f":{prefix}pk").replace(
-                    ":sk_prefix", f":{prefix}sk_prefix"
-                )
-
-            # Merge with additional expression values
-            if expression_values:
-                expr_values.update(expression_values)
-
-            # Build query kwargs
-            kwargs: dict[str, Any] = {
-                "KeyConditionExpression": key_condition,
-                "ExpressionAttributeValues": expr_values,
-                "ScanIndexForward": scan_forward,
-            }
-
-            if index_name:
-                kwargs["IndexName"] = index_name
-            if limit:
-                kwargs["Limit"] = limit
-            if filter_expression:
-                kwargs["FilterExpression"] = filter_expression
-            if expression_names:
-                kwargs["ExpressionAttributeNames"] = expression_names
-            if last_key:
-                kwargs["ExclusiveStartKey"] = last_key
+        kwargs = self._build_query_kwargs(
+            pk=pk,
+            sk_prefix=sk_prefix or sk_begins_with,
+            index_name=index_name,
+            scan_forward=scan_forward,
+            filter_expression=filter_expression,
+            expression_values=expression_values,
+            expression_names=expression_names,
+        )
+        if limit:
+            kwargs["Limit"] = limit
+        if last_key:
+            kwargs["ExclusiveStartKey"] = last_key
 
+        try:
             response = self.table.query(**kwargs)
 
             items = [self.model_class.from_dynamodb(item) for item in response.get("Items", [])]
@@ -334,64 +398,368 @@ class BaseRepository(Generic[T]):
             logger.error("DynamoDB query failed", error=str(e), pk=pk)
             raise
 
-    def batch_get(self, keys: list[tuple[str, str]]) -> list[T]:
+    def iter_query(
+        self,
+        pk: str,
+        sk_prefix: str | None = None,
+        sk_begins_with: str | None = None,
+        index_name: str | None = None,
+        scan_forward: bool = True,
+        filter_expression: str | None = None,
+        expression_values: dict | None = None,
+        expression_names: dict | None = None,
+        projection_expression: str | None = None,
+        page_size: int | None = None,
+        max_items: int | None = None,
+        prefetch: bool = True,
+        consistent_read: bool = False,
+    ) -> Iterator[T]:
+        """Lazily iterate over every item matching a query, across pages.
+
+        Unlike query(), this never stops at the first 1 MB page. Items are
+        deserialized as they are consumed, and with prefetch the next page
+        is fetched on a background thread while the current one is used.
+
+        Args:
+            pk: Partition key value.
+            sk_prefix: Sort key prefix for begins_with condition.
+            sk_begins_with: Alias for sk_prefix.
+            index_name: Optional GSI name.
+            scan_forward: Sort direction (True = ascending).
+            filter_expression: Optional filter expression.
+            expression_values: Expression attribute values.
+            expression_names: Expression attribute names (for reserved words).
+            projection_expression: Optional projection (must include every
+                required model field).
+            page_size: Items evaluated per DynamoDB request.
+            max_items: Stop after yielding this many items.
+            prefetch: Fetch the next page while the current one is consumed.
+            consistent_read: Strongly consistent read (base table only).
+
+        Yields:
+            Model instances.
+        """
+        kwargs = self._build_query_kwargs(
+            pk=pk,
+            sk_prefix=sk_prefix or sk_begins_with,
+            index_name=index_name,
+            scan_forward=scan_forward,
+            filter_expression=filter_expression,
+            expression_values=expression_values,
+            expression_names=expression_names,
+        )
+        if projection_expression:
+            kwargs["ProjectionExpression"] = projection_expression
+        if page_size:
+            kwargs["Limit"] = page_size
+        if consistent_read:
+            kwargs["ConsistentRead"] = True
+
+        yielded = 0
+        for page in self._iter_query_pages(kwargs, prefetch=prefetch):
+            for item in page:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield self.model_class.from_dynamodb(item)
+                yielded += 1
+
+    def _iter_query_pages(self, kwargs: dict[str, Any], prefetch: bool = True) -> Iterator[list[dict]]:
+        """Iterate over raw result pages of a query.
+
+        Args:
+            kwargs: table.query keyword arguments.
+            prefetch: Fetch page N+1 on a background thread while page N is
+                being consumed.
+
+        Yields:
+            Lists of raw DynamoDB items.
+        """
+
+        def fetch(last_key: dict | None) -> dict:
+            page_kwargs = {**kwargs, "ExclusiveStartKey": last_key} if last_key else kwargs
+            try:
+                return self.client.query(TableName=self.table_name, **page_kwargs)
+            except ClientError as e:
+                logger.error("DynamoDB query failed", error=str(e), index=kwargs.get("IndexName"))
+                raise
+
+        if not prefetch:
+            last_key = None
+            while True:
+                response = fetch(last_key)
+                yield response.get("Items", [])
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return
+
+        # One request in flight: the next page loads while this one is consumed
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(fetch, None)
+            while future is not None:
+                response = future.result()
+                last_key = response.get("LastEvaluatedKey")
+                future = pool.submit(fetch, last_key) if last_key else None
+                yield response.get("Items", [])
+
+    def _build_query_kwargs(
+        self,
+        pk: str,
+        sk_prefix: str | None = None,
+        index_name: str | None = None,
+        scan_forward: bool = True,
+        filter_expression: str | None = None,
+        expression_values: dict | None = None,
+        expression_names: dict | None = None,
+    ) -> dict[str, Any]:
+        """Build table.query keyword arguments.
+
+        Args:
+            pk: Partition key value.
+            sk_prefix: Sort key prefix for begins_with condition.
+            index_name: Optional GSI name.
+            scan_forward: Sort direction (True = ascending).
+            filter_expression: Optional filter expression.
+            expression_values: Expression attribute values.
+            expression_names: Expression attribute names.
+
+        Returns:
+            Query kwargs (without Limit or ExclusiveStartKey).
+        """
+        # Build key condition
+        if sk_prefix:
+            key_condition = "PK = :pk AND begins_with(SK, :sk_prefix)"
+            expr_values = {":pk": pk, ":sk_prefix": sk_prefix}
+        else:
+            key_condition = "PK = :pk"
+            expr_values = {":pk": pk}
+
+        # Use GSI key names if querying index
+        if index_name and index_name.startswith("GSI"):
+            prefix = index_name.lower()  # e.g., "gsi1", "gsi4"
+            key_condition = key_condition.replace("PK", f"{index_name}PK").replace("SK", f"{index_name}SK")
+            expr_values = {
+                k.replace(":pk", f":{prefix}pk").replace(":sk_prefix", f":{prefix}sk_prefix"): v
+                for k, v in expr_values.items()
+            }
+            key_condition = key_condition.replace(":pk", f":{prefix}pk").replace(
+                ":sk_prefix", f":{prefix}sk_prefix"
+            )
+
+        # Merge with additional expression values
+        if expression_values:
+            expr_values.update(expression_values)
+
+        kwargs: dict[str, Any] = {
+            "KeyConditionExpression": key_condition,
+            "ExpressionAttributeValues": expr_values,
+            "ScanIndexForward": scan_forward,
+        }
+
+        if index_name:
+            kwargs["IndexName"] = index_name
+        if filter_expression:
+            kwargs["FilterExpression"] = filter_expression
+        if expression_names:
+            kwargs["ExpressionAttributeNames"] = expression_names
+
+        return kwargs
+
+    def batch_get(
+        self,
+        keys: list[tuple[str, str]],
+        projection_expression: str | None = None,
+        expression_names: dict | None = None,
+        consistent_read: bool = False,
+        max_workers: int = 1,
+    ) -> list[T]:
         """Batch get multiple items.
 
         Args:
             keys: List of (pk, sk) tuples.
+            projection_expression: Optional projection (must include every
+                required model field).
+            expression_names: Expression attribute names for the projection.
+            consistent_read: Use strongly consistent reads.
+            max_workers: Number of 100-key chunks fetched in parallel.
 
         Returns:
-            List of model instances.
+            List of model instances (order not guaranteed).
         """
-        if not keys:
-            return []
+        return list(
+            self.iter_batch_get(
+                keys,
+                projection_expression=projection_expression,
+                expression_names=expression_names,
+                consistent_read=consistent_read,
+                max_workers=max_workers,
+            )
+        )
 
-        try:
-            # DynamoDB batch_get_item has a limit of 100 items
-            all_items = []
+    def iter_batch_get(
+        self,
+        keys: Iterable[tuple[str, str]],
+        projection_expression: str | None = None,
+        expression_names: dict | None = None,
+        consistent_read: bool = False,
+        max_workers: int = 1,
+    ) -> Iterator[T]:
+        """Stream items for many keys, one 100-key chunk at a time.
+
+        Duplicate keys are fetched once. Unprocessed keys are retried with
+        exponential backoff.
+
+        Args:
+            keys: (pk, sk) tuples.
+            projection_expression: Optional projection (must include every
+                required model field).
+            expression_names: Expression attribute names for the projection.
+            consistent_read: Use strongly consistent reads.
+            max_workers: Number of chunks fetched in parallel.
+
+        Yields:
+            Model instances (order not guaranteed).
+
+        Raises:
+            ExternalServiceError: If keys remain unprocessed after retries.
+        """
+        unique_keys = [self._build_key(pk, sk) for pk, sk in dict.fromkeys(keys)]
+        if not unique_keys:
+            return
+
+        request: dict[str, Any] = {"ConsistentRead": consistent_read}
+        if projection_expression:
+            request["ProjectionExpression"] = projection_expression
+        if expression_names:
+            request["ExpressionAttributeNames"] = expression_names
+
+        def fetch(chunk: list[dict]) -> list[dict]:
+            return self._batch_get_chunk({**request, "Keys": chunk})
+
+        for items in _map_chunks(fetch, _chunks(unique_keys, BATCH_GET_MAX_KEYS), max_workers):
+            for item in items:
+                yield self.model_class.from_dynamodb(item)
 
-            for i in range(0, len(keys), 100):
-                batch_keys = keys[i : i + 100]
-                request_keys = [self._build_key(pk, sk) for pk, sk in batch_keys]
+    def _batch_get_chunk(self, request: dict[str, Any]) -> list[dict]:
+        """Fetch one batch_get_item request, retrying unprocessed keys.
 
-                response = self.dynamodb.batch_get_item(
-                    RequestItems={self.table_name: {"Keys": request_keys}}
-                )
+        Args:
+            request: KeysAndAttributes for the table (at most 100 keys).
 
-                items = response.get("Responses", {}).get(self.table_name, [])
-                all_items.extend([self.model_class.from_dynamodb(item) for item in items])
+        Returns:
+            Raw DynamoDB items.
+        """
+        items: list[dict] = []
+        attempt = 0
+
+        try:
+            while True:
+                response = self.client.batch_get_item(RequestItems={self.table_name: request})
+                items.extend(response.get("Responses", {}).get(self.table_name, []))
 
-            return all_items
+                unprocessed = response.get("UnprocessedKeys", {}).get(self.table_name)
+                if not unprocessed or not unprocessed.get("Keys"):
+                    return items
+
+                if attempt >= BATCH_MAX_RETRIES:
+                    raise ExternalServiceError(
+                        "dynamodb",
+                        message=f"{len(unprocessed['Keys'])} keys unprocessed after retries",
+                    )
+
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
+                request = unprocessed
 
         except ClientError as e:
             logger.error("DynamoDB batch_get_item failed", error=str(e))
             raise
 
-    def batch_write(self, items: list[T]) -> None:
+    def batch_write(self, items: list[T], max_workers: int = 1) -> None:
         """Batch write multiple items.
 
+        All GSI keys the model defines are written. Unprocessed items are
+        retried with exponential backoff.
+
         Args:
             items: List of model instances to save.
+            max_workers: Number of 25-item chunks written in parallel.
+
+        Raises:
+            ExternalServiceError: If items remain unprocessed after retries.
         """
         if not items:
             return
 
-        try:
-            with self.table.batch_writer() as batch:
-                for item in items:
-                    item.update_timestamp()
-                    db_item = item.to_dynamodb()
-                    db_item.update(item.get_keys())
+        # Keyed by (PK, SK): duplicates in one request are rejected, last wins
+        requests: dict[tuple[str, str], dict] = {}
+        for item in items:
+            item.update_timestamp()
+            db_item = item.to_dynamodb()
+            db_item.update(item.get_keys())
+            db_item.update(self._get_all_gsi_keys(item))
+            requests[(db_item["PK"], db_item["SK"])] = {"PutRequest": {"Item": db_item}}
+
+        self._batch_write_requests(list(requests.values()), max_workers)
 
-                    # Try to get GSI keys
-                    if hasattr(item, "get_gsi1_keys"):
-                        gsi_keys = item.get_gsi1_keys()
-                        if gsi_keys:
-                            db_item.update(gsi_keys)
+        logger.debug("Batch write completed", count=len(requests))
 
-                    batch.put_item(Item=db_item)
+    def batch_delete(self, keys: Iterable[tuple[str, str]], max_workers: int = 1) -> int:
+        """Batch delete items by key.
+
+        Args:
+            keys: (pk, sk) tuples.
+            max_workers: Number of 25-item chunks deleted in parallel.
 
-            logger.debug("Batch write completed", count=len(items))
+        Returns:
+            Number of distinct keys deleted.
+
+        Raises:
+            ExternalServiceError: If deletes remain unprocessed after retries.
+        """
+        requests = [
+            {"DeleteRequest": {"Key": self._build_key(pk, sk)}}
+            for pk, sk in dict.fromkeys(keys)
+        ]
+        self._batch_write_requests(requests, max_workers)
+
+        logger.debug("Batch delete completed", count=len(requests))
+
+        return len(requests)
+
+    def _batch_write_requests(self, requests: list[dict], max_workers: int = 1) -> None:
+        """Send write requests in 25-item chunks.
+
+        Args:
+            requests: PutRequest/DeleteRequest entries.
+            max_workers: Number of chunks sent in parallel.
+        """
+        chunks = _chunks(requests, BATCH_WRITE_MAX_ITEMS)
+        for _ in _map_chunks(self._batch_write_chunk, chunks, max_workers):
+            pass
+
+    def _batch_write_chunk(self, requests: list[dict]) -> None:
+        """Send one batch_write_item request, retrying unprocessed items.
+
+        Args:
+            requests: At most 25 PutRequest/DeleteRequest entries.
+        """
+        attempt = 0
+
+        try:
+            while requests:
+                response = self.client.batch_write_item(RequestItems={self.table_name: requests})
+                requests = response.get("UnprocessedItems", {}).get(self.table_name, [])
+                if not requests:
+                    return
+
+                if attempt >= BATCH_MAX_RETRIES:
+                    raise ExternalServiceError(
+                        "dynamodb",
+                        message=f"{len(requests)} writes unprocessed after retries",
+                    )
+
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
 
         except ClientError as e:
             logger.error("DynamoDB batch_write failed", error=str(e))
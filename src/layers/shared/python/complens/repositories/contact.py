@@ -1,5 +1,8 @@
 """Contact repository for DynamoDB operations."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
 from complens.models.contact import Contact
 from complens.repositories.base import BaseRepository
 
@@ -41,6 +44,112 @@ class ContactRepository(BaseRepository[Contact]):
         )
         return items[0] if items else None
 
+    def iter_emails(self, workspace_id: str) -> Iterator[str]:
+        """Stream every contact email in a workspace from GSI1.
+
+        Only the GSI1 sort key is projected, so this reads a small fraction
+        of what loading the contacts themselves would.
+
+        Args:
+            workspace_id: The workspace ID.
+
+        Yields:
+            Lowercased email addresses.
+        """
+        kwargs = {
+            "IndexName": "GSI1",
+            "KeyConditionExpression": "GSI1PK = :pk",
+            "ExpressionAttributeValues": {":pk": f"WS#{workspace_id}#EMAIL"},
+            "ProjectionExpression": "GSI1SK",
+        }
+        for items in self._iter_query_pages(kwargs):
+            for item in items:
+                yield item["GSI1SK"]
+
+    def find_existing_emails(
+        self,
+        workspace_id: str,
+        emails: Iterable[str],
+        max_workers: int = 8,
+    ) -> set[str]:
+        """Return which of the given emails already belong to a contact.
+
+        GSI1 does not support BatchGetItem, so lookups are exact-match
+        queries issued concurrently.
+
+        Args:
+            workspace_id: The workspace ID.
+            emails: Email addresses to check.
+            max_workers: Maximum concurrent queries.
+
+        Returns:
+            Set of lowercased emails that already exist.
+        """
+        emails = list({email.lower() for email in emails})
+        if not emails:
+            return set()
+
+        def exists(email: str) -> bool:
+            response = self.client.query(
+                TableName=self.table_name,
+                IndexName="GSI1",
+                KeyConditionExpression="GSI1PK = :pk AND GSI1SK = :email",
+                ExpressionAttributeValues={":pk": f"WS#{workspace_id}#EMAIL", ":email": email},
+                Select="COUNT",
+                Limit=1,
+            )
+            return response.get("Count", 0) > 0
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(emails)))) as pool:
+            return {email for email, found in zip(emails, pool.map(exists, emails), strict=True) if found}
+
+    def find_contact_ids_by_email(
+        self,
+        workspace_id: str,
+        emails: Iterable[str],
+        max_workers: int = 8,
+    ) -> dict[str, list[str]]:
+        """Return the IDs of every contact holding each of the given emails.
+
+        Used to spot duplicates created by concurrent writers that both
+        passed an existence check. Lookups are concurrent exact-match
+        GSI1 queries that project only the contact ID.
+
+        Args:
+            workspace_id: The workspace ID.
+            emails: Email addresses to look up.
+            max_workers: Maximum concurrent queries.
+
+        Returns:
+            Dict of lowercased email -> sorted contact IDs, for emails
+            with at least one contact.
+        """
+        emails = list({email.lower() for email in emails})
+        if not emails:
+            return {}
+
+        def ids_for(email: str) -> list[str]:
+            kwargs = {
+                "IndexName": "GSI1",
+                "KeyConditionExpression": "GSI1PK = :pk AND GSI1SK = :email",
+                "ExpressionAttributeValues": {
+                    ":pk": f"WS#{workspace_id}#EMAIL",
+                    ":email": email,
+                },
+                "ProjectionExpression": "#id",
+                "ExpressionAttributeNames": {"#id": "id"},
+            }
+            return sorted(
+                item["id"] for items in self._iter_query_pages(kwargs) for item in items
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(emails)))) as pool:
+            return {
+                email: ids
+                for email, ids in zip(emails, pool.map(ids_for, emails), strict=True)
+                if ids
+            }
+
     def get_by_phone(self, workspace_id: str, phone: str) -> Contact | None:
         """Get contact by phone number using GSI4.
 
@@ -0,0 +1,49 @@
+"""Repository for contact export jobs."""
+
+from complens.models.contact_export import ContactExport
+from complens.repositories.base import BaseRepository
+
+
+class ContactExportRepository(BaseRepository[ContactExport]):
+    """Repository for ContactExport entities."""
+
+    def __init__(self, table_name: str | None = None):
+        """Initialize contact export repository."""
+        super().__init__(ContactExport, table_name)
+
+    def get_by_id(self, workspace_id: str, export_id: str) -> ContactExport | None:
+        """Get an export job by ID.
+
+        Args:
+            workspace_id: The workspace ID.
+            export_id: The export job ID.
+
+        Returns:
+            ContactExport or None if not found.
+        """
+        return self.get(pk=f"WS#{workspace_id}", sk=f"EXPORT#{export_id}")
+
+    def create_export(self, job: ContactExport) -> ContactExport:
+        """Create a new export job.
+
+        Args:
+            job: The export job to create.
+
+        Returns:
+            The created export job.
+        """
+        return self.create(job)
+
+    def update_export(self, job: ContactExport) -> ContactExport:
+        """Update an export job's status and progress.
+
+        The export worker is the only writer once processing starts, so
+        no version check is performed.
+
+        Args:
+            job: The export job to update.
+
+        Returns:
+            The updated export job.
+        """
+        return self.update(job, check_version=False)
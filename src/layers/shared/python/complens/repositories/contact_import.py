@@ -0,0 +1,49 @@
+"""Repository for contact import jobs."""
+
+from complens.models.contact_import import ContactImport
+from complens.repositories.base import BaseRepository
+
+
+class ContactImportRepository(BaseRepository[ContactImport]):
+    """Repository for ContactImport entities."""
+
+    def __init__(self, table_name: str | None = None):
+        """Initialize contact import repository."""
+        super().__init__(ContactImport, table_name)
+
+    def get_by_id(self, workspace_id: str, import_id: str) -> ContactImport | None:
+        """Get an import job by ID.
+
+        Args:
+            workspace_id: The workspace ID.
+            import_id: The import job ID.
+
+        Returns:
+            ContactImport or None if not found.
+        """
+        return self.get(pk=f"WS#{workspace_id}", sk=f"IMPORT#{import_id}")
+
+    def create_import(self, job: ContactImport) -> ContactImport:
+        """Create a new import job.
+
+        Args:
+            job: The import job to create.
+
+        Returns:
+            The created import job.
+        """
+        return self.create(job)
+
+    def update_import(self, job: ContactImport) -> ContactImport:
+        """Update an import job's status and progress.
+
+        The import worker is the only writer once processing starts, so
+        no version check is performed.
+
+        Args:
+            job: The import job to update.
+
+        Returns:
+            The updated import job.
+        """
+        return self.update(job, check_version=False)
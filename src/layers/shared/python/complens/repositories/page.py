@@ -320,21 +320,35 @@ class PageRepository(BaseRepository[Page]):
 
         return self.delete(pk=f"WS#{workspace_id}", sk=f"PAGE#{page_id}")
 
-    def increment_view_count(self, workspace_id: str, page_id: str) -> None:
+    def increment_view_count(self, workspace_id: str, page_id: str, count: int = 1) -> bool:
         """Increment the view count for a page.
 
+        The page must exist, so IDs reported by the public tracking beacon
+        cannot create stray items.
+
         Args:
             workspace_id: The workspace ID.
             page_id: The page ID.
+            count: Number of views to add.
+
+        Returns:
+            True if the page exists and was counted.
         """
-        self.table.update_item(
-            Key={
-                "PK": f"WS#{workspace_id}",
-                "SK": f"PAGE#{page_id}",
-            },
-            UpdateExpression="SET view_count = if_not_exists(view_count, :zero) + :inc",
-            ExpressionAttributeValues={":inc": 1, ":zero": 0},
-        )
+        try:
+            self.table.update_item(
+                Key={
+                    "PK": f"WS#{workspace_id}",
+                    "SK": f"PAGE#{page_id}",
+                },
+                UpdateExpression="SET view_count = if_not_exists(view_count, :zero) + :inc",
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={":inc": count, ":zero": 0},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
 
     def increment_form_submission_count(self, workspace_id: str, page_id: str) -> None:
         """Increment the form submission count for a page.
@@ -0,0 +1,108 @@
+"""Repository for maintained resource counters."""
+
+from botocore.exceptions import ClientError
+
+from complens.models.base import utc_now
+from complens.models.resource_counts import ResourceCounts
+from complens.repositories.base import BaseRepository
+from complens.utils.exceptions import ConflictError
+
+
+class ResourceCountsRepository(BaseRepository[ResourceCounts]):
+    """Repository for ResourceCounts items."""
+
+    def __init__(self, table_name: str | None = None):
+        """Initialize resource counts repository."""
+        super().__init__(ResourceCounts, table_name)
+
+    def get_counts(self, workspace_id: str) -> ResourceCounts | None:
+        """Get a workspace's counters (strongly consistent).
+
+        Args:
+            workspace_id: The workspace ID.
+
+        Returns:
+            The counters, or None if they have not been initialized.
+        """
+        item = self.table.get_item(
+            Key={"PK": f"WS#{workspace_id}", "SK": "COUNTERS"},
+            ConsistentRead=True,
+        ).get("Item")
+        return ResourceCounts.from_dynamodb(item) if item else None
+
+    def add_counts(
+        self,
+        workspace_id: str,
+        deltas: dict[str, int],
+        changed_after: int | None = None,
+    ) -> bool:
+        """Atomically add to initialized counters.
+
+        Uninitialized counters are left alone: the first read counts the
+        items, and that count already includes these changes. With
+        changed_after, the update is also refused when the counters were
+        counted at or after that second, since the count may already
+        include some of the changes.
+
+        Args:
+            workspace_id: The workspace ID.
+            deltas: Resource name -> amount to add (may be negative).
+            changed_after: Epoch second of the oldest change in deltas.
+
+        Returns:
+            True if the counters exist and were updated.
+        """
+        deltas = {resource: n for resource, n in deltas.items() if n}
+        if not deltas:
+            return True
+
+        condition = "attribute_exists(PK)"
+        values = {
+            **{f":{resource}": n for resource, n in deltas.items()},
+            ":now": utc_now().isoformat(),
+        }
+        if changed_after is not None:
+            condition += " AND (attribute_not_exists(counted_at) OR counted_at < :changed_after)"
+            values[":changed_after"] = changed_after
+
+        try:
+            self.table.update_item(
+                Key={"PK": f"WS#{workspace_id}", "SK": "COUNTERS"},
+                UpdateExpression=(
+                    "SET updated_at = :now ADD "
+                    + ", ".join(f"#{resource} :{resource}" for resource in deltas)
+                ),
+                ConditionExpression=condition,
+                ExpressionAttributeNames={f"#{resource}": resource for resource in deltas},
+                ExpressionAttributeValues=values,
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
+    def initialize(self, counts: ResourceCounts) -> ResourceCounts:
+        """Store freshly counted counters unless another caller got there first.
+
+        Args:
+            counts: Counted values.
+
+        Returns:
+            The stored counters.
+        """
+        try:
+            return self.create(counts)
+        except ConflictError:
+            return self.get_counts(counts.workspace_id) or counts
+
+    def save(self, counts: ResourceCounts) -> ResourceCounts:
+        """Overwrite a workspace's counters (reconciliation).
+
+        Args:
+            counts: Recounted values.
+
+        Returns:
+            The stored counters.
+        """
+        return self.put(counts)
@@ -0,0 +1,49 @@
+"""Repository for synthesis jobs."""
+
+from complens.models.synthesis_job import SynthesisJob
+from complens.repositories.base import BaseRepository
+
+
+class SynthesisJobRepository(BaseRepository[SynthesisJob]):
+    """Repository for SynthesisJob entities."""
+
+    def __init__(self, table_name: str | None = None):
+        """Initialize synthesis job repository."""
+        super().__init__(SynthesisJob, table_name)
+
+    def get_by_id(self, workspace_id: str, job_id: str) -> SynthesisJob | None:
+        """Get a synthesis job by ID.
+
+        Args:
+            workspace_id: The workspace ID.
+            job_id: The synthesis job ID.
+
+        Returns:
+            SynthesisJob or None if not found.
+        """
+        return self.get(pk=f"WS#{workspace_id}", sk=f"SYNTHJOB#{job_id}")
+
+    def create_job(self, job: SynthesisJob) -> SynthesisJob:
+        """Create a new synthesis job.
+
+        Args:
+            job: The synthesis job to create.
+
+        Returns:
+            The created synthesis job.
+        """
+        return self.create(job)
+
+    def update_job(self, job: SynthesisJob) -> SynthesisJob:
+        """Update a synthesis job's status and progress.
+
+        The AI processor is the only writer once the job is queued, so
+        no version check is performed.
+
+        Args:
+            job: The synthesis job to update.
+
+        Returns:
+            The updated synthesis job.
+        """
+        return self.update(job, check_version=False)
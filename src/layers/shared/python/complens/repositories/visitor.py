@@ -4,14 +4,13 @@ Uses DynamoDB UpdateItem with if_not_exists for atomic upserts,
 ensuring first-touch attribution fields are never overwritten.
 """
 
-import os
 from datetime import datetime, timezone
 
-import boto3
 import structlog
-from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
 
 from complens.models.visitor import Visitor
+from complens.repositories.base import BaseRepository
 
 logger = structlog.get_logger()
 
@@ -19,25 +18,11 @@ logger = structlog.get_logger()
 MAX_PAGES_VISITED = 50
 
 
-class VisitorRepository:
+class VisitorRepository(BaseRepository[Visitor]):
     """Repository for Visitor records in DynamoDB."""
 
     def __init__(self, table_name: str | None = None):
-        self.table_name = table_name or os.environ.get("TABLE_NAME", "complens-dev")
-        self._dynamodb = None
-        self._table = None
-
-    @property
-    def dynamodb(self):
-        if self._dynamodb is None:
-            self._dynamodb = boto3.resource("dynamodb")
-        return self._dynamodb
-
-    @property
-    def table(self):
-        if self._table is None:
-            self._table = self.dynamodb.Table(self.table_name)
-        return self._table
+        super().__init__(Visitor, table_name)
 
     def get_by_visitor_id(self, workspace_id: str, visitor_id: str) -> Visitor | None:
         """Get a visitor by workspace and visitor ID.
@@ -89,13 +74,68 @@ class VisitorRepository:
             ip: Client IP address.
             user_agent: Client user agent string.
         """
+        self.record_page_views(
+            workspace_id=workspace_id,
+            visitor_id=visitor_id,
+            page_ids=[page_id],
+            referrer=referrer,
+            utm_source=utm_source,
+            utm_medium=utm_medium,
+            utm_campaign=utm_campaign,
+            utm_content=utm_content,
+            utm_term=utm_term,
+            ip=ip,
+            user_agent=user_agent,
+        )
+
+    def record_page_views(
+        self,
+        workspace_id: str,
+        visitor_id: str,
+        page_ids: list[str],
+        views: int | None = None,
+        referrer: str | None = None,
+        last_referrer: str | None = None,
+        utm_source: str | None = None,
+        utm_medium: str | None = None,
+        utm_campaign: str | None = None,
+        utm_content: str | None = None,
+        utm_term: str | None = None,
+        ip: str | None = None,
+        user_agent: str | None = None,
+        seen_at: str | None = None,
+    ) -> None:
+        """Create or update a visitor for one or more coalesced page views.
+
+        First-touch fields come from the earliest view and use
+        if_not_exists, so they are only set on the initial visit. Last-touch
+        fields come from the latest view and are only written when it is
+        newer than the stored last_seen, so a batch processed out of order
+        cannot move them backward.
+
+        Args:
+            workspace_id: Workspace ID.
+            visitor_id: Visitor ID (from cookie).
+            page_ids: Pages viewed, in order (the last one is the latest view).
+            views: Number of page views (defaults to len(page_ids)).
+            referrer: HTTP referrer of the earliest view.
+            last_referrer: HTTP referrer of the latest view (defaults to referrer).
+            utm_source: UTM source parameter.
+            utm_medium: UTM medium parameter.
+            utm_campaign: UTM campaign parameter.
+            utm_content: UTM content parameter.
+            utm_term: UTM term parameter.
+            ip: Client IP address.
+            user_agent: Client user agent string.
+            seen_at: ISO timestamp of the latest view (defaults to now).
+        """
         now = datetime.now(timezone.utc).isoformat()
 
         # Build update expression parts
         set_parts = [
             "workspace_id = if_not_exists(workspace_id, :ws_id)",
             "visitor_id = if_not_exists(visitor_id, :vid)",
-            "first_page_id = if_not_exists(first_page_id, :page_id)",
+            "first_page_id = if_not_exists(first_page_id, :first_page_id)",
             "first_referrer = if_not_exists(first_referrer, :referrer)",
             "first_utm_source = if_not_exists(first_utm_source, :utm_source)",
             "first_utm_medium = if_not_exists(first_utm_medium, :utm_medium)",
@@ -105,18 +145,21 @@ class VisitorRepository:
             "user_agent = if_not_exists(user_agent, :ua)",
             "ip = if_not_exists(ip, :ip)",
             "created_at = if_not_exists(created_at, :now)",
-            # Always update last-touch fields
-            "last_page_id = :page_id",
-            "last_referrer = :referrer",
-            "last_seen = :now",
             "updated_at = :now",
         ]
+        last_touch_parts = [
+            "last_page_id = :last_page_id",
+            "last_referrer = :last_referrer",
+            "last_seen = :seen_at",
+        ]
 
         expr_values = {
             ":ws_id": workspace_id,
             ":vid": visitor_id,
-            ":page_id": page_id,
+            ":first_page_id": page_ids[0],
+            ":last_page_id": page_ids[-1],
             ":referrer": referrer,
+            ":last_referrer": last_referrer if last_referrer is not None else referrer,
             ":utm_source": utm_source,
             ":utm_medium": utm_medium,
             ":utm_campaign": utm_campaign,
@@ -125,26 +168,41 @@ class VisitorRepository:
             ":ua": user_agent[:500] if user_agent else None,
             ":ip": ip,
             ":now": now,
-            ":one": 1,
-            ":page_list": [page_id],
-            ":max_pages": MAX_PAGES_VISITED,
-            ":empty_list": [],
+            ":seen_at": seen_at or now,
+            ":views": views if views is not None else len(page_ids),
         }
 
         # Atomic increment page view counter
-        add_parts = ["total_page_views :one"]
+        add_parts = ["total_page_views :views"]
 
-        update_expr = f"SET {', '.join(set_parts)} ADD {', '.join(add_parts)}"
+        key = {"PK": f"WS#{workspace_id}", "SK": f"VISITOR#{visitor_id}"}
 
         try:
-            self.table.update_item(
-                Key={"PK": f"WS#{workspace_id}", "SK": f"VISITOR#{visitor_id}"},
-                UpdateExpression=update_expr,
-                ExpressionAttributeValues=expr_values,
-            )
-
-            # Append page_id to pages_visited (separate call to handle list size cap)
-            self._append_page_visited(workspace_id, visitor_id, page_id)
+            try:
+                self.table.update_item(
+                    Key=key,
+                    UpdateExpression=(
+                        f"SET {', '.join(set_parts + last_touch_parts)} ADD {', '.join(add_parts)}"
+                    ),
+                    ConditionExpression="attribute_not_exists(last_seen) OR last_seen < :seen_at",
+                    ExpressionAttributeValues=expr_values,
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                # A newer view is already recorded: count these, keep last-touch
+                self.table.update_item(
+                    Key=key,
+                    UpdateExpression=f"SET {', '.join(set_parts)} ADD {', '.join(add_parts)}",
+                    ExpressionAttributeValues={
+                        k: v
+                        for k, v in expr_values.items()
+                        if k not in (":last_page_id", ":last_referrer", ":seen_at")
+                    },
+                )
+
+            # Append pages to pages_visited (separate call to handle list size cap)
+            self._append_pages_visited(workspace_id, visitor_id, list(dict.fromkeys(page_ids)))
 
         except Exception as e:
             logger.exception(
@@ -155,26 +213,27 @@ class VisitorRepository:
             )
             raise
 
-    def _append_page_visited(
-        self, workspace_id: str, visitor_id: str, page_id: str
+    def _append_pages_visited(
+        self, workspace_id: str, visitor_id: str, page_ids: list[str]
     ) -> None:
-        """Append page_id to pages_visited list, capped at MAX_PAGES_VISITED.
+        """Append page IDs to pages_visited, capped at MAX_PAGES_VISITED.
 
         Args:
             workspace_id: Workspace ID.
             visitor_id: Visitor ID.
-            page_id: Page ID to append.
+            page_ids: Page IDs to append.
         """
+        page_ids = page_ids[:MAX_PAGES_VISITED]
         try:
-            # First, try to append to existing list
+            # Only append while the whole batch still fits under the cap
             self.table.update_item(
                 Key={"PK": f"WS#{workspace_id}", "SK": f"VISITOR#{visitor_id}"},
-                UpdateExpression="SET pages_visited = list_append(if_not_exists(pages_visited, :empty), :page)",
-                ConditionExpression="attribute_not_exists(pages_visited) OR size(pages_visited) < :max_size",
+                UpdateExpression="SET pages_visited = list_append(if_not_exists(pages_visited, :empty), :pages)",
+                ConditionExpression="attribute_not_exists(pages_visited) OR size(pages_visited) <= :max_size",
                 ExpressionAttributeValues={
-                    ":page": [page_id],
+                    ":pages": page_ids,
                     ":empty": [],
-                    ":max_size": MAX_PAGES_VISITED,
+                    ":max_size": MAX_PAGES_VISITED - len(page_ids),
                 },
             )
         except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
@@ -215,6 +274,24 @@ class VisitorRepository:
                 error=str(e),
             )
 
+    def count_chat_visitors(self, workspace_id: str) -> int:
+        """Count visitors that have sent at least one chat message.
+
+        Args:
+            workspace_id: Workspace ID.
+
+        Returns:
+            Number of visitors who started a chat.
+        """
+        visitors = self.iter_query(
+            pk=f"WS#{workspace_id}",
+            sk_prefix="VISITOR#",
+            filter_expression="total_chat_messages > :zero",
+            expression_values={":zero": 0},
+            projection_expression="PK, SK, workspace_id, visitor_id",
+        )
+        return sum(1 for _ in visitors)
+
     def increment_chat_messages(self, workspace_id: str, visitor_id: str) -> None:
         """Atomically increment the chat message counter.
 
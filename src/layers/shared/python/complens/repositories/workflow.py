@@ -1,9 +1,17 @@
 """Workflow repository for DynamoDB operations."""
 
+import time
+
+import structlog
+from botocore.exceptions import ClientError
+
 from complens.models.workflow import Workflow, WorkflowStatus
 from complens.models.workflow_run import RunStatus, WorkflowRun, WorkflowStep
+from complens.queue.trigger_index import TRIGGER_INDEX_SK, TriggerIndex
 from complens.repositories.base import BaseRepository
 
+logger = structlog.get_logger()
+
 
 class WorkflowRepository(BaseRepository[Workflow]):
     """Repository for Workflow entities."""
@@ -202,7 +210,9 @@ class WorkflowRepository(BaseRepository[Workflow]):
         gsi2_keys = workflow.get_gsi2_keys()
         if gsi2_keys:
             gsi_keys.update(gsi2_keys)
-        return self.create(workflow, gsi_keys=gsi_keys)
+        workflow = self.create(workflow, gsi_keys=gsi_keys)
+        self._refresh_trigger_index(workflow.workspace_id, changed=workflow)
+        return workflow
 
     def update_workflow(self, workflow: Workflow) -> Workflow:
         """Update an existing workflow.
@@ -217,7 +227,9 @@ class WorkflowRepository(BaseRepository[Workflow]):
         gsi2_keys = workflow.get_gsi2_keys()
         if gsi2_keys:
             gsi_keys.update(gsi2_keys)
-        return self.update(workflow, gsi_keys=gsi_keys)
+        workflow = self.update(workflow, gsi_keys=gsi_keys)
+        self._refresh_trigger_index(workflow.workspace_id, changed=workflow)
+        return workflow
 
     def delete_workflow(self, workspace_id: str, workflow_id: str) -> bool:
         """Delete a workflow.
@@ -229,7 +241,145 @@ class WorkflowRepository(BaseRepository[Workflow]):
         Returns:
             True if deleted, False if not found.
         """
-        return self.delete(pk=f"WS#{workspace_id}", sk=f"WF#{workflow_id}")
+        deleted = self.delete(pk=f"WS#{workspace_id}", sk=f"WF#{workflow_id}")
+        if deleted:
+            self._refresh_trigger_index(workspace_id, removed_id=workflow_id)
+        return deleted
+
+    def get_trigger_index(self, workspace_id: str) -> TriggerIndex | None:
+        """Get the compiled trigger index for a workspace.
+
+        Args:
+            workspace_id: The workspace ID.
+
+        Returns:
+            TriggerIndex or None if it has not been built yet.
+        """
+        response = self.table.get_item(
+            Key=self._build_key(f"WS#{workspace_id}", TRIGGER_INDEX_SK),
+        )
+        item = response.get("Item")
+        return TriggerIndex.from_item(item) if item else None
+
+    def get_trigger_index_version(self, workspace_id: str) -> str | None:
+        """Get only the version stamp of the workspace trigger index.
+
+        Args:
+            workspace_id: The workspace ID.
+
+        Returns:
+            Version string or None if the index does not exist.
+        """
+        response = self.table.get_item(
+            Key=self._build_key(f"WS#{workspace_id}", TRIGGER_INDEX_SK),
+            ProjectionExpression="index_version",
+        )
+        return response.get("Item", {}).get("index_version")
+
+    def drop_trigger_index(self, workspace_id: str) -> None:
+        """Delete the stored trigger index for a workspace.
+
+        Readers rebuild a missing index on next use, so this is the safe
+        fallback whenever workflows change outside the normal write path.
+
+        Args:
+            workspace_id: The workspace ID.
+        """
+        self.table.delete_item(
+            Key=self._build_key(f"WS#{workspace_id}", TRIGGER_INDEX_SK),
+        )
+
+    def rebuild_trigger_index(
+        self,
+        workspace_id: str,
+        changed: Workflow | None = None,
+        removed_id: str | None = None,
+    ) -> TriggerIndex:
+        """Recompile and store the trigger index from active workflows.
+
+        Active workflows are read from the base table with a consistent
+        read, so the workflow that was just written (or deleted) is always
+        reflected. Concurrent rebuilds are ordered by when they started:
+        the write is conditioned on no later-started rebuild having stored
+        its index, so a rebuild that read older state cannot overwrite a
+        newer one.
+
+        Args:
+            workspace_id: The workspace ID.
+            changed: Workflow that was just created or updated (for logging).
+            removed_id: ID of a workflow that was just deleted (for logging).
+
+        Returns:
+            The stored TriggerIndex (a newer concurrent one if this lost).
+        """
+        started_ns = time.time_ns()
+        workflows = list(self.iter_query(
+            pk=f"WS#{workspace_id}",
+            sk_prefix="WF#",
+            filter_expression="#status = :active",
+            expression_names={"#status": "status"},
+            expression_values={":active": WorkflowStatus.ACTIVE.value},
+            consistent_read=True,
+            prefetch=False,
+        ))
+
+        index = TriggerIndex.build(workspace_id, workflows)
+        try:
+            self.table.put_item(
+                Item={**index.to_item(), "built_at_ns": started_ns},
+                ConditionExpression="attribute_not_exists(built_at_ns) OR built_at_ns < :started",
+                ExpressionAttributeValues={":started": started_ns},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+            logger.info(
+                "Trigger index rebuild superseded by a newer one",
+                workspace_id=workspace_id,
+            )
+            return self.get_trigger_index(workspace_id) or index
+
+        logger.info(
+            "Trigger index rebuilt",
+            workspace_id=workspace_id,
+            version=index.version,
+            workflow_count=len(index.entries),
+            changed_id=changed.id if changed else None,
+            removed_id=removed_id,
+        )
+
+        return index
+
+    def _refresh_trigger_index(
+        self,
+        workspace_id: str,
+        changed: Workflow | None = None,
+        removed_id: str | None = None,
+    ) -> None:
+        """Rebuild the trigger index after a workflow write.
+
+        Any workflow write can change what triggers (status, trigger node,
+        config), so the index is always rebuilt. If the rebuild fails the
+        index is dropped so the next reader rebuilds it instead of matching
+        against stale data.
+
+        Args:
+            workspace_id: The workspace ID.
+            changed: Workflow that was just created or updated.
+            removed_id: ID of a workflow that was just deleted.
+        """
+        try:
+            self.rebuild_trigger_index(workspace_id, changed=changed, removed_id=removed_id)
+        except ClientError as e:
+            logger.warning(
+                "Trigger index rebuild failed, dropping index",
+                workspace_id=workspace_id,
+                error=str(e),
+            )
+            try:
+                self.drop_trigger_index(workspace_id)
+            except ClientError:
+                pass
 
     def activate(self, workspace_id: str, workflow_id: str) -> Workflow | None:
         """Activate a workflow.
@@ -363,43 +363,43 @@ class AdminService:
 
         for key, prefix in entity_prefixes.items():
             try:
-                response = self.dynamodb.query(
-                    TableName=self._table_name,
-                    KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
-                    ExpressionAttributeValues={
-                        ":pk": {"S": f"WS#{workspace_id}"},
-                        ":sk_prefix": {"S": prefix},
-                    },
-                    Select="COUNT",
+                stats[key] = sum(
+                    page.get("Count", 0)
+                    for page in self._paginate_query(
+                        KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
+                        ExpressionAttributeValues={
+                            ":pk": {"S": f"WS#{workspace_id}"},
+                            ":sk_prefix": {"S": prefix},
+                        },
+                        Select="COUNT",
+                    )
                 )
-                stats[key] = response.get("Count", 0)
             except ClientError as e:
                 logger.warning(f"Failed to count {key}", workspace_id=workspace_id, error=str(e))
 
         # Count workflow runs (stored under WF#{wf_id} as partition key)
         try:
+            total_runs = 0
+            succeeded_runs = 0
+            failed_runs = 0
+
             # First get all workflow IDs for this workspace
-            wf_response = self.dynamodb.query(
-                TableName=self._table_name,
+            for wf_page in self._paginate_query(
                 KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                 ExpressionAttributeValues={
                     ":pk": {"S": f"WS#{workspace_id}"},
                     ":sk_prefix": {"S": "WF#"},
                 },
                 ProjectionExpression="SK",
-            )
-
-            total_runs = 0
-            succeeded_runs = 0
-            failed_runs = 0
+            ):
+                for item in wf_page.get("Items", []):
+                    wf_sk = item.get("SK", {}).get("S", "")
+                    wf_id = wf_sk.replace("WF#", "") if wf_sk.startswith("WF#") else None
+                    if not wf_id:
+                        continue
 
-            for item in wf_response.get("Items", []):
-                wf_sk = item.get("SK", {}).get("S", "")
-                wf_id = wf_sk.replace("WF#", "") if wf_sk.startswith("WF#") else None
-                if wf_id:
                     # Count runs for this workflow
-                    run_response = self.dynamodb.query(
-                        TableName=self._table_name,
+                    for run_page in self._paginate_query(
                         KeyConditionExpression="PK = :pk AND begins_with(SK, :sk_prefix)",
                         ExpressionAttributeValues={
                             ":pk": {"S": f"WF#{wf_id}"},
@@ -407,14 +407,14 @@ class AdminService:
                         },
                         ProjectionExpression="SK, #status",
                         ExpressionAttributeNames={"#status": "status"},
-                    )
-                    for run in run_response.get("Items", []):
-                        total_runs += 1
-                        status = run.get("status", {}).get("S", "")
-                        if status == "succeeded":
-                            succeeded_runs += 1
-                        elif status == "failed":
-                            failed_runs += 1
+                    ):
+                        for run in run_page.get("Items", []):
+                            total_runs += 1
+                            status = run.get("status", {}).get("S", "")
+                            if status == "succeeded":
+                                succeeded_runs += 1
+                            elif status == "failed":
+                                failed_runs += 1
 
             stats["workflow_runs"] = {
                 "total": total_runs,
@@ -426,6 +426,23 @@ class AdminService:
 
         return stats
 
+    def _paginate_query(self, **kwargs):
+        """Run a low-level query across every result page.
+
+        Args:
+            **kwargs: dynamodb client query arguments (TableName is added).
+
+        Yields:
+            Raw query responses, one per page.
+        """
+        while True:
+            response = self.dynamodb.query(TableName=self._table_name, **kwargs)
+            yield response
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            kwargs["ExclusiveStartKey"] = last_key
+
     def get_user_stats(self, user_id: str) -> dict:
         """Get aggregate stats across all user's workspaces.
 
@@ -983,18 +1000,30 @@ class AdminService:
         except ClientError as e:
             logger.warning("Failed to query warmup domains", workspace_id=workspace_id, error=str(e))
 
-        # 6. Batch delete everything
+        # 6. Batch delete everything (deduplicated, chunks deleted in parallel)
+        from complens.repositories.workspace import WorkspaceRepository
+
         all_items = ws_items + child_items + warmup_items
-        with table.batch_writer() as batch:
-            seen_keys = set()
-            for item in all_items:
-                pk = item.get("PK", "")
-                sk = item.get("SK", "")
-                key = (pk, sk)
-                if key not in seen_keys and pk and sk:
-                    seen_keys.add(key)
-                    batch.delete_item(Key={"PK": pk, "SK": sk})
-                    deleted_count += 1
+        keys = [
+            (item["PK"], item["SK"])
+            for item in all_items
+            if item.get("PK") and item.get("SK")
+        ]
+        deleted_count += WorkspaceRepository(table_name=self._table_name).batch_delete(
+            keys, max_workers=4
+        )
+
+        # 6b. The batch delete bypasses WorkflowRepository.delete_workflow, so
+        # drop the trigger index explicitly (after the workflows are gone) and
+        # evict this container's cached copy.
+        from complens.queue.trigger_index import get_trigger_index_cache
+        from complens.repositories.workflow import WorkflowRepository
+
+        try:
+            WorkflowRepository(table_name=self._table_name).drop_trigger_index(workspace_id)
+        except ClientError as e:
+            logger.warning("Failed to drop trigger index", workspace_id=workspace_id, error=str(e))
+        get_trigger_index_cache().invalidate(workspace_id)
 
         # 7. Delete the workspace record itself
         try:
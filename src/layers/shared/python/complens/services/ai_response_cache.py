@@ -0,0 +1,223 @@
+"""Content-addressed cache for Bedrock text responses.
+
+Many AI features send identical requests repeatedly (node autofill,
+workflow step suggestions, block improvement retries, onboarding
+questions). A response is cached under a SHA-256 of everything that
+determines it: model, full system prompt, user prompt, temperature and
+max_tokens. The business profile and knowledge base context are part of
+the system prompt, so editing a profile changes the key and old entries
+are simply never read again.
+
+Lookups go to a warm-container LRU first, then to the main table
+(``AICACHE#{key}`` items that expire after AI_CACHE_TTL_SECONDS). Hits,
+misses and the Bedrock tokens saved are counted per container and
+logged every AI_CACHE_STATS_INTERVAL lookups.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import boto3
+import structlog
+from botocore.exceptions import ClientError
+
+from complens.utils.cache import get_cache
+
+logger = structlog.get_logger()
+
+# Seconds a cached response stays valid in DynamoDB
+AI_CACHE_TTL_SECONDS = int(os.environ.get("AI_CACHE_TTL_SECONDS", "86400"))
+
+# Seconds a response stays in the container LRU (CACHE_TTL_AI_RESPONSES overrides)
+AI_CACHE_MEMORY_TTL_SECONDS = 3600
+
+# Responses kept in the container LRU
+AI_CACHE_MAX_ENTRIES = 128
+
+# Lookups between statistics log lines
+AI_CACHE_STATS_INTERVAL = 50
+
+_table = None
+
+
+def _get_table():
+    """Get the main DynamoDB table (lazy initialization)."""
+    global _table
+    if _table is None:
+        _table = boto3.resource("dynamodb").Table(os.environ.get("TABLE_NAME", "complens-dev"))
+    return _table
+
+
+def response_cache_key(
+    model: str,
+    system: str | None,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Hash the inputs that determine a response.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    material = json.dumps(
+        [model, system or "", prompt, temperature, max_tokens],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    """A cached response text and the tokens it cost to generate."""
+
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class AIResponseCache:
+    """Two-level (container LRU, then DynamoDB) response cache."""
+
+    def __init__(self, table=None, ttl_seconds: int = AI_CACHE_TTL_SECONDS):
+        """Initialize the cache.
+
+        Args:
+            table: DynamoDB table (defaults to the main table).
+            ttl_seconds: Lifetime of persisted entries.
+        """
+        self._table = table
+        self.ttl_seconds = ttl_seconds
+        self._memory = get_cache(
+            "ai_responses", AI_CACHE_MEMORY_TTL_SECONDS, max_entries=AI_CACHE_MAX_ENTRIES
+        )
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.table_hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+
+    @property
+    def table(self):
+        """DynamoDB table holding persisted entries."""
+        return self._table or _get_table()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Look up a response.
+
+        Args:
+            key: Key from response_cache_key().
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        found, entry = self._memory.get(key)
+        if found:
+            self._record_hit(entry, "memory")
+            return entry
+
+        entry = None
+        try:
+            item = self.table.get_item(Key={"PK": f"AICACHE#{key}", "SK": "RESPONSE"}).get("Item")
+            if item and int(item.get("ttl", 0)) > time.time():
+                entry = CachedResponse(
+                    text=item["text"],
+                    input_tokens=int(item.get("input_tokens", 0)),
+                    output_tokens=int(item.get("output_tokens", 0)),
+                )
+        except ClientError as e:
+            logger.warning("AI response cache read failed", error=str(e))
+
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            self._maybe_log_statistics()
+            return None
+
+        self._memory.set(key, entry)
+        self._record_hit(entry, "table")
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store a response in both levels.
+
+        Args:
+            key: Key from response_cache_key().
+            entry: Response to cache.
+        """
+        self._memory.set(key, entry)
+        try:
+            self.table.put_item(Item={
+                "PK": f"AICACHE#{key}",
+                "SK": "RESPONSE",
+                "text": entry.text,
+                "input_tokens": entry.input_tokens,
+                "output_tokens": entry.output_tokens,
+                "ttl": int(time.time()) + self.ttl_seconds,
+            })
+        except ClientError as e:
+            logger.warning("AI response cache write failed", error=str(e))
+
+    def invalidate(self, key: str) -> None:
+        """Drop a response, e.g. one the caller could not use."""
+        self._memory.invalidate(key)
+        try:
+            self.table.delete_item(Key={"PK": f"AICACHE#{key}", "SK": "RESPONSE"})
+        except ClientError as e:
+            logger.warning("AI response cache delete failed", error=str(e))
+
+    def _record_hit(self, entry: CachedResponse, level: str) -> None:
+        tokens = entry.input_tokens + entry.output_tokens
+        with self._lock:
+            if level == "memory":
+                self.memory_hits += 1
+            else:
+                self.table_hits += 1
+            self.tokens_saved += tokens
+        logger.info("AI response cache hit", level=level, tokens_saved=tokens)
+        self._maybe_log_statistics()
+
+    def _maybe_log_statistics(self) -> None:
+        lookups = self.memory_hits + self.table_hits + self.misses
+        if lookups % AI_CACHE_STATS_INTERVAL == 0:
+            self.log_statistics()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get hit/miss counts and tokens saved in this container.
+
+        Returns:
+            Dict of statistics.
+        """
+        hits = self.memory_hits + self.table_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "table_hits": self.table_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "tokens_saved": self.tokens_saved,
+        }
+
+    def log_statistics(self) -> None:
+        """Log statistics if the cache has been used."""
+        stats = self.get_statistics()
+        if stats["memory_hits"] or stats["table_hits"] or stats["misses"]:
+            logger.info("AI response cache statistics", **stats)
+
+
+_response_cache: AIResponseCache | None = None
+
+
+def get_ai_response_cache() -> AIResponseCache:
+    """Get the container's AI response cache."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = AIResponseCache()
+    return _response_cache
@@ -7,6 +7,7 @@ for context-aware generation of pages, blocks, workflows, and more.
 import json
 import os
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 import boto3
@@ -15,6 +16,11 @@ from botocore.config import Config
 
 from complens.models.business_profile import BusinessProfile
 from complens.repositories.business_profile import BusinessProfileRepository
+from complens.services.ai_response_cache import (
+    CachedResponse,
+    get_ai_response_cache,
+    response_cache_key,
+)
 
 logger = structlog.get_logger()
 
@@ -103,6 +109,7 @@ def invoke_claude(
     max_tokens: int = 4096,
     temperature: float = 0.7,
     site_id: str | None = None,
+    cache: bool | None = None,
 ) -> str:
     """Invoke Claude with optional business context.
 
@@ -115,10 +122,70 @@ def invoke_claude(
         max_tokens: Maximum tokens to generate.
         temperature: Sampling temperature.
         site_id: Optional site ID for site-specific profile.
+        cache: Reuse cached responses for identical requests. Defaults to
+            caching only deterministic (temperature 0) calls.
 
     Returns:
         The generated text response.
     """
+    return _invoke_claude(
+        prompt, system, workspace_id, page_id, model, max_tokens, temperature, site_id,
+        cache=cache,
+        parse=lambda text: text,
+    )
+
+
+def invoke_claude_json(
+    prompt: str,
+    system: str | None = None,
+    workspace_id: str | None = None,
+    page_id: str | None = None,
+    model: str = DEFAULT_MODEL,
+    site_id: str | None = None,
+    cache: bool | None = None,
+) -> dict:
+    """Invoke Claude and parse JSON response.
+
+    Args:
+        prompt: The user prompt (should request JSON output).
+        system: Optional system prompt.
+        workspace_id: Optional workspace ID for business context.
+        page_id: Optional page ID for page-specific profile.
+        model: The model to use.
+        site_id: Optional site ID for site-specific profile.
+        cache: Reuse cached responses for identical requests (off by
+            default, since structured output is sampled at temperature 0.5).
+
+    Returns:
+        Parsed JSON response as dict.
+    """
+    return _invoke_claude(
+        prompt, system, workspace_id, page_id, model,
+        max_tokens=4096,
+        temperature=0.5,  # Lower temperature for structured output
+        site_id=site_id,
+        cache=cache,
+        parse=_parse_json_response,
+    )
+
+
+def _invoke_claude(
+    prompt: str,
+    system: str | None,
+    workspace_id: str | None,
+    page_id: str | None,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    site_id: str | None,
+    cache: bool | None,
+    parse: Callable[[str], Any],
+) -> Any:
+    """Build the request, answer it from the response cache or Bedrock, and parse it.
+
+    Only responses that parse are cached, and a cached response that no
+    longer parses is dropped and regenerated.
+    """
     # Build system prompt with business context
     system_parts = []
 
@@ -139,6 +206,20 @@ def invoke_claude(
 
     full_system = "\n".join(system_parts) if system_parts else None
 
+    use_cache = cache if cache is not None else temperature == 0
+    response_cache = key = None
+    if use_cache:
+        # The key covers the business and knowledge base context, so a
+        # profile edit never serves a response generated from the old one
+        response_cache = get_ai_response_cache()
+        key = response_cache_key(model, full_system, prompt, temperature, max_tokens)
+        cached = response_cache.get(key)
+        if cached is not None:
+            try:
+                return parse(cached.text)
+            except ValueError:
+                response_cache.invalidate(key)
+
     # Build request
     messages = [{"role": "user", "content": prompt}]
 
@@ -161,45 +242,31 @@ def invoke_claude(
         )
 
         response_body = json.loads(response["body"].read())
-        return response_body["content"][0]["text"]
+        text = response_body["content"][0]["text"]
 
     except Exception as e:
         logger.error("Claude invocation failed", error=str(e))
         raise
 
+    result = parse(text)
 
-def invoke_claude_json(
-    prompt: str,
-    system: str | None = None,
-    workspace_id: str | None = None,
-    page_id: str | None = None,
-    model: str = DEFAULT_MODEL,
-    site_id: str | None = None,
-) -> dict:
-    """Invoke Claude and parse JSON response.
+    if response_cache is not None:
+        usage = response_body.get("usage", {})
+        response_cache.put(key, CachedResponse(
+            text=text,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+        ))
 
-    Args:
-        prompt: The user prompt (should request JSON output).
-        system: Optional system prompt.
-        workspace_id: Optional workspace ID for business context.
-        page_id: Optional page ID for page-specific profile.
-        model: The model to use.
-        site_id: Optional site ID for site-specific profile.
+    return result
 
-    Returns:
-        Parsed JSON response as dict.
-    """
-    response = invoke_claude(
-        prompt=prompt,
-        system=system,
-        workspace_id=workspace_id,
-        page_id=page_id,
-        model=model,
-        temperature=0.5,  # Lower temperature for structured output
-        site_id=site_id,
-    )
 
-    # Try to parse JSON from response
+def _parse_json_response(response: str) -> dict:
+    """Parse a JSON response, unwrapping markdown code fences.
+
+    Raises:
+        ValueError: If the response is not valid JSON.
+    """
     try:
         # Handle markdown code blocks
         if "```json" in response:
@@ -274,7 +341,9 @@ Improve this content following the instruction: {instruction}
 
 Return the improved configuration as a JSON object with the same structure."""
 
-    return invoke_claude_json(prompt, system, workspace_id, page_id, site_id=site_id)
+    return invoke_claude_json(
+        prompt, system, workspace_id, page_id, site_id=site_id, cache=True
+    )
 
 
 def generate_page_blocks(
@@ -472,7 +541,9 @@ Return a JSON array where each element has:
 - "description": one-line explanation of why this step is useful
 - "config": complete config object ready to use"""
 
-    result = invoke_claude_json(prompt, system, workspace_id, page_id, model=FAST_MODEL, site_id=site_id)
+    result = invoke_claude_json(
+        prompt, system, workspace_id, page_id, model=FAST_MODEL, site_id=site_id, cache=True
+    )
 
     # Normalize: accept both array and {"suggestions": [...]}
     if isinstance(result, dict) and "suggestions" in result:
@@ -990,7 +1061,9 @@ Preceding nodes (in order, earliest first):
 Suggest values for the empty fields in this node's configuration.
 Return a JSON object with only the field names and suggested values."""
 
-    result = invoke_claude_json(prompt, system, workspace_id, model=FAST_MODEL, site_id=site_id)
+    result = invoke_claude_json(
+        prompt, system, workspace_id, model=FAST_MODEL, site_id=site_id, cache=True
+    )
 
     # Only return suggestions for fields that were actually empty
     if current_config and not all_empty:
@@ -1298,7 +1371,9 @@ Return JSON with:
 What's the most important question to ask next?
 If we have enough information, set is_complete to true."""
 
-    return invoke_claude_json(prompt, system, workspace_id, model=FAST_MODEL, site_id=site_id)
+    return invoke_claude_json(
+        prompt, system, workspace_id, model=FAST_MODEL, site_id=site_id, cache=True
+    )
 
 
 def analyze_content_for_profile(
@@ -0,0 +1,268 @@
+"""Stream-fed analytics rollups.
+
+The analytics rollup worker reads the main table's stream and turns
+entity changes into per-workspace, per-day counter deltas:
+
+- contact INSERT / REMOVE -> contacts_created / contacts_deleted
+- workflow run INSERT -> runs_started; status -> completed / failed
+- form submission INSERT -> form_submissions
+- page view_count increases -> page_views
+- a visitor's first chat message -> chat_sessions
+
+Deltas are coalesced per workspace and day within a batch and written
+with one ADD per rollup item (plus one for the workspace's all-time
+TOTAL item), so the analytics API reads O(days) items.
+
+rebuild_workspace_rollups() recomputes a workspace's rollups from its
+entities, for backfilling workspaces that predate the stream consumer.
+"""
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import structlog
+from boto3.dynamodb.types import TypeDeserializer
+
+from complens.models.analytics_rollup import TOTAL_PERIOD, AnalyticsRollup
+from complens.models.workflow_run import RunStatus
+from complens.repositories.analytics_rollup import AnalyticsRollupRepository
+from complens.repositories.contact import ContactRepository
+from complens.repositories.form import FormRepository, FormSubmissionRepository
+from complens.repositories.page import PageRepository
+from complens.repositories.visitor import VisitorRepository
+from complens.repositories.workflow import WorkflowRepository, WorkflowRunRepository
+
+logger = structlog.get_logger()
+
+# Terminal run statuses and the counter each one increments
+RUN_OUTCOMES = {
+    RunStatus.COMPLETED.value: "runs_completed",
+    RunStatus.FAILED.value: "runs_failed",
+}
+
+_deserializer = TypeDeserializer()
+
+
+def _deserialize_image(image: dict) -> dict:
+    """Deserialize a DynamoDB stream image to a regular dict."""
+    return {k: _deserializer.deserialize(v) for k, v in image.items()}
+
+
+def _day(value) -> str | None:
+    """UTC day (YYYY-MM-DD) of an ISO timestamp or datetime."""
+    if isinstance(value, datetime):
+        return value.astimezone(timezone.utc).date().isoformat()
+    if isinstance(value, str) and len(value) >= 10:
+        try:
+            return datetime.fromisoformat(value).astimezone(timezone.utc).date().isoformat()
+        except ValueError:
+            return None
+    return None
+
+
+def _record_day(record: dict) -> str:
+    """UTC day on which a stream record was written."""
+    created = record.get("dynamodb", {}).get("ApproximateCreationDateTime")
+    when = (
+        datetime.fromtimestamp(float(created), timezone.utc)
+        if created is not None
+        else datetime.now(timezone.utc)
+    )
+    return when.date().isoformat()
+
+
+def record_deltas(record: dict) -> list[tuple[str, str, str, int]]:
+    """Counter deltas implied by one stream record.
+
+    Args:
+        record: DynamoDB stream record.
+
+    Returns:
+        List of (workspace_id, day, metric, amount).
+    """
+    event_name = record.get("eventName")
+    stream = record.get("dynamodb", {})
+    sk = stream.get("Keys", {}).get("SK", {}).get("S", "")
+    new = _deserialize_image(stream.get("NewImage", {}))
+    old = _deserialize_image(stream.get("OldImage", {}))
+
+    workspace_id = new.get("workspace_id") or old.get("workspace_id")
+    if not workspace_id:
+        return []
+
+    event_day = _record_day(record)
+    deltas = []
+
+    if sk.startswith("CONTACT#"):
+        if event_name == "INSERT":
+            deltas.append(("contacts_created", _day(new.get("created_at")) or event_day, 1))
+        elif event_name == "REMOVE":
+            deltas.append(("contacts_deleted", event_day, 1))
+
+    elif sk.startswith("RUN#"):
+        status = new.get("status")
+        if event_name == "INSERT":
+            deltas.append(("runs_started", _day(new.get("created_at")) or event_day, 1))
+        if status in RUN_OUTCOMES and old.get("status") != status:
+            deltas.append((RUN_OUTCOMES[status], event_day, 1))
+
+    elif sk.startswith("SUB#"):
+        if event_name == "INSERT":
+            deltas.append(("form_submissions", _day(new.get("created_at")) or event_day, 1))
+
+    elif sk.startswith("PAGE#"):
+        views = int(new.get("view_count") or 0) - int(old.get("view_count") or 0)
+        if event_name == "MODIFY" and views > 0:
+            deltas.append(("page_views", event_day, views))
+
+    elif sk.startswith("VISITOR#"):
+        chatted = int(new.get("total_chat_messages") or 0) > 0
+        if chatted and not int(old.get("total_chat_messages") or 0):
+            deltas.append(("chat_sessions", event_day, 1))
+
+    return [(workspace_id, day, metric, amount) for metric, day, amount in deltas]
+
+
+class RollupAggregator:
+    """Coalesces rollup deltas and writes one ADD per rollup item."""
+
+    def __init__(self, repo: AnalyticsRollupRepository | None = None, max_workers: int = 8):
+        """Initialize the aggregator.
+
+        Args:
+            repo: Analytics rollup repository.
+            max_workers: Concurrent DynamoDB writes during flush.
+        """
+        self.repo = repo or AnalyticsRollupRepository()
+        self.max_workers = max_workers
+        self.counts: dict[tuple[str, str], Counter[str]] = defaultdict(Counter)
+
+    def add_record(self, record: dict) -> int:
+        """Fold a stream record into the batch.
+
+        Returns:
+            Number of deltas the record produced.
+        """
+        deltas = record_deltas(record)
+        for workspace_id, day, metric, amount in deltas:
+            self.counts[(workspace_id, day)][metric] += amount
+            self.counts[(workspace_id, TOTAL_PERIOD)][metric] += amount
+        return len(deltas)
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """Fold several stream records into the batch.
+
+        Returns:
+            Number of deltas the records produced.
+        """
+        return sum(self.add_record(record) for record in records)
+
+    def flush(self) -> dict:
+        """Write the coalesced counters and reset the batch.
+
+        Failed writes are logged but not retried: re-delivering the
+        batch would double count every write that succeeded.
+
+        Returns:
+            Dict with the number of items written and failed writes.
+        """
+        writes = list(self.counts.items())
+        self.counts = defaultdict(Counter)
+        if not writes:
+            return {"written": 0, "errors": 0}
+
+        def write(entry: tuple[tuple[str, str], Counter[str]]) -> bool:
+            (workspace_id, period), counts = entry
+            try:
+                self.repo.add_counts(workspace_id, period, dict(counts))
+            except Exception as e:
+                logger.warning(
+                    "Rollup write failed",
+                    workspace_id=workspace_id,
+                    period=period,
+                    counts=dict(counts),
+                    error=str(e),
+                )
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(writes))) as executor:
+            results = list(executor.map(write, writes))
+
+        stats = {"written": results.count(True), "errors": results.count(False)}
+        logger.info("Analytics rollups flushed", **stats)
+        return stats
+
+
+def rebuild_workspace_rollups(workspace_id: str, max_workers: int = 8) -> AnalyticsRollup:
+    """Recompute a workspace's rollups from its entities.
+
+    Page views and chat sessions have no per-day history outside the
+    rollups, so only their all-time totals are rebuilt; deleted contacts
+    are gone and cannot be recounted.
+
+    Args:
+        workspace_id: Workspace to rebuild.
+        max_workers: Workflows and forms read in parallel.
+
+    Returns:
+        The rebuilt TOTAL rollup.
+    """
+    days: dict[str, Counter[str]] = defaultdict(Counter)
+
+    for contact in ContactRepository().iter_query(
+        pk=f"WS#{workspace_id}", sk_begins_with="CONTACT#"
+    ):
+        days[_day(contact.created_at)]["contacts_created"] += 1
+
+    run_repo = WorkflowRunRepository()
+    submission_repo = FormSubmissionRepository()
+
+    def count_runs(workflow_id: str) -> list[tuple[str, str]]:
+        counted = []
+        for run in run_repo.iter_query(pk=f"WF#{workflow_id}", sk_begins_with="RUN#"):
+            counted.append((_day(run.created_at), "runs_started"))
+            status = RunStatus(run.status).value
+            if status in RUN_OUTCOMES:
+                finished = run.completed_at or run.updated_at
+                counted.append((_day(finished), RUN_OUTCOMES[status]))
+        return counted
+
+    def count_submissions(form_id: str) -> list[tuple[str, str]]:
+        return [
+            (_day(submission.created_at), "form_submissions")
+            for submission in submission_repo.iter_query(
+                pk=f"FORM#{form_id}", sk_begins_with="SUB#"
+            )
+        ]
+
+    workflows = WorkflowRepository().iter_query(pk=f"WS#{workspace_id}", sk_begins_with="WF#")
+    forms = FormRepository().iter_query(pk=f"WS#{workspace_id}", sk_begins_with="FORM#")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(count_runs, workflow.id) for workflow in workflows]
+        futures += [executor.submit(count_submissions, form.id) for form in forms]
+        for future in futures:
+            for day, metric in future.result():
+                days[day][metric] += 1
+
+    total = Counter()
+    for counts in days.values():
+        total.update(counts)
+    total["page_views"] = sum(
+        page.view_count or 0
+        for page in PageRepository().iter_query(pk=f"WS#{workspace_id}", sk_begins_with="PAGE#")
+    )
+    total["chat_sessions"] = VisitorRepository().count_chat_visitors(workspace_id)
+
+    rollups = [
+        AnalyticsRollup(workspace_id=workspace_id, period=day, **counts)
+        for day, counts in days.items()
+    ]
+    totals = AnalyticsRollup(workspace_id=workspace_id, period=TOTAL_PERIOD, **total)
+    AnalyticsRollupRepository().replace_all(workspace_id, [*rollups, totals])
+
+    logger.info("Analytics rollups rebuilt", workspace_id=workspace_id, days=len(rollups))
+    return totals
+
@@ -1,11 +1,12 @@
 """Billing service for Stripe platform subscriptions."""
 
 import os
-import time
 from typing import Any
 
 import structlog
 
+from complens.utils.cache import get_cache
+
 logger = structlog.get_logger()
 
 # Default pricing tier limits — used as seed/fallback when DynamoDB is empty
@@ -51,10 +52,14 @@ DEFAULT_PLAN_LIMITS = {
     },
 }
 
-# Module-level cache for plan configs
-_plan_cache: dict[str, Any] | None = None
-_plan_cache_ts: float = 0
-_CACHE_TTL = 300  # 5 minutes
+# Plan configs are cached per container for 5 minutes (CACHE_TTL_PLAN_CONFIGS)
+PLAN_CACHE_TTL_SECONDS = 300
+_PLAN_CACHE_KEY = "all"
+
+
+def _plan_cache():
+    """Get the shared plan config cache."""
+    return get_cache("plan_configs", ttl_seconds=PLAN_CACHE_TTL_SECONDS, max_entries=1)
 
 
 def get_plan_configs() -> dict[str, Any]:
@@ -63,11 +68,10 @@ def get_plan_configs() -> dict[str, Any]:
     Returns a dict keyed by plan_key, each value being a PlanConfig instance.
     Seeds defaults on first access if DynamoDB is empty.
     """
-    global _plan_cache, _plan_cache_ts
-
-    now = time.time()
-    if _plan_cache is not None and (now - _plan_cache_ts) < _CACHE_TTL:
-        return _plan_cache
+    cache = _plan_cache()
+    found, configs = cache.get(_PLAN_CACHE_KEY)
+    if found:
+        return configs
 
     try:
         from complens.repositories.plan_config import PlanConfigRepository
@@ -77,9 +81,9 @@ def get_plan_configs() -> dict[str, Any]:
         if not plans:
             plans = repo.seed_defaults(DEFAULT_PLAN_LIMITS)
 
-        _plan_cache = {p.plan_key: p for p in plans}
-        _plan_cache_ts = now
-        return _plan_cache
+        configs = {p.plan_key: p for p in plans}
+        cache.set(_PLAN_CACHE_KEY, configs)
+        return configs
 
     except Exception:
         logger.debug("Failed to load plan configs from DynamoDB, using defaults")
@@ -129,9 +133,7 @@ def get_plan_config(plan: str):
 
 def invalidate_plan_cache() -> None:
     """Invalidate the plan config cache (e.g., after admin update)."""
-    global _plan_cache, _plan_cache_ts
-    _plan_cache = None
-    _plan_cache_ts = 0
+    _plan_cache().invalidate(_PLAN_CACHE_KEY)
 
 
 class BillingService:
@@ -68,18 +68,20 @@ def _get_distribution_ids() -> tuple[str, str]:
 
 
 def invalidate_page_cache(
-    subdomain: Optional[str] = None,
-    custom_domain: Optional[str] = None,
+    subdomain: Optional[str | list[str]] = None,
+    custom_domain: Optional[str | list[str]] = None,
     page_id: Optional[str] = None,
 ) -> dict:
     """Invalidate CloudFront cache for a page.
 
     Invalidates the appropriate CloudFront distributions based on
-    how the page is accessed (subdomain or custom domain).
+    how the page is accessed (subdomain or custom domain). The router
+    functions rewrite every request for a host to a single path, so only
+    that path is invalidated and other pages stay cached.
 
     Args:
-        subdomain: The subdomain (e.g., 'mypage' for mypage.dev.complens.ai)
-        custom_domain: The custom domain (e.g., 'example.com')
+        subdomain: The subdomain(s) (e.g., 'mypage' for mypage.dev.complens.ai)
+        custom_domain: The custom domain(s) (e.g., 'example.com')
         page_id: The page ID (for logging)
 
     Returns:
@@ -87,18 +89,21 @@ def invalidate_page_cache(
     """
     results = {"subdomain": None, "custom_domain": None}
 
+    subdomains = [subdomain] if isinstance(subdomain, str) else list(subdomain or [])
+    custom_domains = (
+        [custom_domain] if isinstance(custom_domain, str) else list(custom_domain or [])
+    )
+
     subdomain_dist_id, pages_dist_id = _get_distribution_ids()
 
     cloudfront = boto3.client("cloudfront")
-    caller_ref = f"page-{page_id or 'unknown'}-{int(time.time())}"
+    caller_ref = f"page-{page_id or 'unknown'}-{time.time_ns()}"
 
     # Invalidate subdomain distribution
-    if subdomain and subdomain_dist_id:
+    if subdomains and subdomain_dist_id:
         try:
-            # The subdomain router rewrites to /public/subdomain/{subdomain}
-            # But since we use a CloudFront Function, we invalidate the root
-            # and let it pass through
-            paths = [f"/{subdomain}", f"/{subdomain}/*"]
+            # The subdomain router rewrites every path to /{subdomain}
+            paths = [f"/{name}" for name in subdomains]
 
             response = cloudfront.create_invalidation(
                 DistributionId=subdomain_dist_id,
@@ -119,7 +124,7 @@ def invalidate_page_cache(
 
             logger.info(
                 "Subdomain cache invalidation created",
-                subdomain=subdomain,
+                subdomain=subdomains,
                 distribution_id=subdomain_dist_id,
                 invalidation_id=response["Invalidation"]["Id"],
             )
@@ -127,16 +132,16 @@ def invalidate_page_cache(
         except Exception as e:
             logger.error(
                 "Failed to invalidate subdomain cache",
-                subdomain=subdomain,
+                subdomain=subdomains,
                 error=str(e),
             )
             results["subdomain"] = {"error": str(e)}
 
     # Invalidate custom domain distribution
-    if custom_domain and pages_dist_id:
+    if custom_domains and pages_dist_id:
         try:
-            # The pages router rewrites to /public/domain/{domain}
-            paths = [f"/{custom_domain}", f"/{custom_domain}/*", "/*"]
+            # The pages router rewrites every path to /{domain}
+            paths = [f"/{domain}" for domain in custom_domains]
 
             response = cloudfront.create_invalidation(
                 DistributionId=pages_dist_id,
@@ -157,7 +162,7 @@ def invalidate_page_cache(
 
             logger.info(
                 "Custom domain cache invalidation created",
-                custom_domain=custom_domain,
+                custom_domain=custom_domains,
                 distribution_id=pages_dist_id,
                 invalidation_id=response["Invalidation"]["Id"],
             )
@@ -165,7 +170,7 @@ def invalidate_page_cache(
         except Exception as e:
             logger.error(
                 "Failed to invalidate custom domain cache",
-                custom_domain=custom_domain,
+                custom_domain=custom_domains,
                 error=str(e),
             )
             results["custom_domain"] = {"error": str(e)}
@@ -0,0 +1,153 @@
+"""Streaming contact export.
+
+Reads a workspace's contacts page by page and writes them straight into
+an S3 multipart upload as CSV or NDJSON, optionally gzip-compressed, so
+memory stays flat regardless of how many contacts are exported.
+"""
+
+import csv
+import gzip
+import io
+import json
+from collections.abc import Callable
+
+import structlog
+
+from complens.models.contact import Contact
+from complens.models.contact_export import ContactExportFormat
+from complens.repositories.contact import ContactRepository
+from complens.utils.s3_multipart import S3MultipartWriter
+
+logger = structlog.get_logger()
+
+# Columns written to CSV exports
+EXPORT_FIELDNAMES = [
+    "id", "email", "phone", "first_name", "last_name",
+    "status", "source", "tags", "sms_opt_in", "email_opt_in",
+    "total_messages_sent", "total_messages_received",
+    "last_contacted_at", "last_response_at",
+    "created_at", "updated_at",
+]
+
+# Contacts written between progress callbacks
+PROGRESS_INTERVAL = 5000
+
+CONTENT_TYPES = {
+    ContactExportFormat.CSV: "text/csv",
+    ContactExportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def contact_to_csv_row(contact: Contact) -> dict:
+    """Flatten a contact into a CSV export row."""
+    return {
+        "id": contact.id,
+        "email": contact.email or "",
+        "phone": contact.phone or "",
+        "first_name": contact.first_name or "",
+        "last_name": contact.last_name or "",
+        "status": contact.status,
+        "source": contact.source or "",
+        "tags": ",".join(contact.tags),
+        "sms_opt_in": str(contact.sms_opt_in),
+        "email_opt_in": str(contact.email_opt_in),
+        "total_messages_sent": contact.total_messages_sent,
+        "total_messages_received": contact.total_messages_received,
+        "last_contacted_at": contact.last_contacted_at or "",
+        "last_response_at": contact.last_response_at or "",
+        "created_at": contact.created_at.isoformat(),
+        "updated_at": contact.updated_at.isoformat(),
+    }
+
+
+class ContactExporter:
+    """Streams a workspace's contacts into an S3 object."""
+
+    def __init__(
+        self,
+        workspace_id: str,
+        export_format: ContactExportFormat | str = ContactExportFormat.CSV,
+        compress: bool = False,
+        repo: ContactRepository | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            workspace_id: Workspace to export.
+            export_format: CSV or NDJSON.
+            compress: Gzip the output.
+            repo: Contact repository.
+            on_progress: Called with the number of contacts written every
+                PROGRESS_INTERVAL contacts.
+        """
+        self.workspace_id = workspace_id
+        self.export_format = ContactExportFormat(export_format)
+        self.compress = compress
+        self.repo = repo or ContactRepository()
+        self.on_progress = on_progress
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type of the exported object."""
+        return "application/gzip" if self.compress else CONTENT_TYPES[self.export_format]
+
+    def run(self, s3_client, bucket: str, key: str) -> tuple[int, int]:
+        """Export every contact to s3://bucket/key.
+
+        Args:
+            s3_client: boto3 S3 client.
+            bucket: Destination bucket.
+            key: Destination object key.
+
+        Returns:
+            Tuple of (contacts exported, object size in bytes).
+        """
+        with S3MultipartWriter(s3_client, bucket, key, content_type=self.content_type) as sink:
+            if self.compress:
+                with gzip.GzipFile(fileobj=sink, mode="wb") as compressed:
+                    count = self._write(compressed)
+            else:
+                count = self._write(sink)
+
+        logger.info(
+            "Contacts exported",
+            workspace_id=self.workspace_id,
+            format=self.export_format.value,
+            gzip=self.compress,
+            count=count,
+            size_bytes=sink.bytes_written,
+        )
+        return count, sink.bytes_written
+
+    def _write(self, binary) -> int:
+        """Encode contacts into a binary stream."""
+        text = io.TextIOWrapper(binary, encoding="utf-8", newline="")
+        try:
+            if self.export_format == ContactExportFormat.CSV:
+                writer = csv.DictWriter(text, fieldnames=EXPORT_FIELDNAMES)
+                writer.writeheader()
+
+                def write(contact: Contact) -> None:
+                    writer.writerow(contact_to_csv_row(contact))
+
+            else:
+
+                def write(contact: Contact) -> None:
+                    text.write(json.dumps(contact.model_dump(mode="json")))
+                    text.write("\n")
+
+            count = 0
+            for contact in self.repo.iter_query(
+                pk=f"WS#{self.workspace_id}", sk_begins_with="CONTACT#"
+            ):
+                write(contact)
+                count += 1
+                if self.on_progress and count % PROGRESS_INTERVAL == 0:
+                    self.on_progress(count)
+
+            text.flush()
+            return count
+        finally:
+            # Leave the underlying stream open for the caller to finish
+            text.detach()
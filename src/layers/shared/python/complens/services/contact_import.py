@@ -0,0 +1,340 @@
+"""Bulk contact import engine.
+
+Streams CSV rows, dedups emails within the file and against existing
+contacts, and writes new contacts with batched writes. Used directly by
+the contacts API for small inline imports and by the contact import
+worker for large files uploaded to S3.
+
+BatchWriteItem has no conditions, so the existence check is the only
+guard against duplicate emails, as it was for the single-contact API.
+Two concurrent writers can both pass it. After each batch is written,
+its emails are looked up again and any contact this import created for
+an email that another contact already holds is deleted. The contact
+with the lowest (earliest) ID is kept, so concurrent imports converge on
+one contact per email.
+"""
+
+import csv
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from pydantic import ValidationError as PydanticValidationError
+
+from complens.models.contact import Contact
+from complens.repositories.base import BATCH_WRITE_MAX_ITEMS
+from complens.repositories.contact import ContactRepository
+
+logger = structlog.get_logger()
+
+# Rows resolved and written per batch
+IMPORT_BATCH_SIZE = 1000
+
+# Row errors kept for reporting (the total is always counted)
+MAX_REPORTED_ERRORS = 100
+
+# An exact-match GSI1 query costs roughly as much as reading this many
+# contact entries while streaming the workspace's email index
+EMAIL_INDEX_COST_RATIO = 4
+
+# Contact fields a CSV column can map to directly
+DIRECT_FIELDS = ("email", "phone", "first_name", "last_name", "source", "status")
+
+
+def sanitize_csv_value(value: str) -> str:
+    """Prefix CSV fields that start with formula characters to prevent injection."""
+    if value and value[0] in ("=", "+", "-", "@"):
+        return f"'{value}"
+    return value
+
+
+def map_row(row: dict[str, str | None], mapping: dict[str, str]) -> dict[str, Any]:
+    """Map a CSV row to contact fields.
+
+    Args:
+        row: CSV row keyed by column name.
+        mapping: CSV column -> contact field mapping.
+
+    Returns:
+        Contact field values (empty cells omitted).
+    """
+    contact_data: dict[str, Any] = {}
+    custom_fields: dict[str, Any] = {}
+
+    for csv_col, contact_field in mapping.items():
+        value = sanitize_csv_value((row.get(csv_col) or "").strip())
+        if not value:
+            continue
+
+        if contact_field in DIRECT_FIELDS:
+            contact_data[contact_field] = value
+        elif contact_field == "tags":
+            contact_data["tags"] = [t.strip() for t in value.split(",") if t.strip()]
+        elif contact_field.startswith("custom_fields."):
+            custom_fields[contact_field.replace("custom_fields.", "")] = value
+        else:
+            custom_fields[contact_field] = value
+
+    if custom_fields:
+        contact_data["custom_fields"] = custom_fields
+
+    return contact_data
+
+
+@dataclass
+class ImportProgress:
+    """Running totals for a contact import."""
+
+    rows_processed: int = 0
+    imported: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def record_error(self, row: int, error: str) -> None:
+        """Record a failed row, keeping only the first few for reporting."""
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "rows_processed": self.rows_processed,
+            "imported": self.imported,
+            "skipped": self.skipped,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
+
+
+class ContactImporter:
+    """Imports contacts from CSV in batches.
+
+    Each batch of rows is deduplicated in memory, checked against existing
+    contacts and written with BatchWriteItem, so the number of DynamoDB
+    requests grows with batches rather than rows. A write request that
+    fails is reported as errors on its rows instead of aborting the
+    import, so partial progress is kept.
+
+    Existing emails are resolved with concurrent exact-match queries. Once
+    the rows checked so far outnumber what a single pass over the
+    workspace's email index would cost, the index is streamed once and
+    later batches are resolved in memory.
+    """
+
+    def __init__(
+        self,
+        workspace_id: str,
+        mapping: dict[str, str],
+        repo: ContactRepository | None = None,
+        existing_count: int | None = None,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        max_workers: int = 4,
+        on_progress: Callable[[ImportProgress], None] | None = None,
+    ):
+        """Initialize the importer.
+
+        Args:
+            workspace_id: Workspace to import into.
+            mapping: CSV column -> contact field mapping.
+            repo: Contact repository.
+            existing_count: Contacts already in the workspace, if known.
+                Without it the email index is never streamed.
+            batch_size: Rows resolved and written per batch.
+            max_workers: Concurrency for lookups and batch writes.
+            on_progress: Called with the running totals after each batch.
+        """
+        self.workspace_id = workspace_id
+        self.mapping = mapping
+        self.repo = repo or ContactRepository()
+        self.existing_count = existing_count
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.on_progress = on_progress
+
+        self.progress = ImportProgress()
+        self._seen_emails: set[str] = set()
+        self._seen_phones: set[str] = set()
+        self._email_index: set[str] | None = None
+        self._emails_checked = 0
+
+    def run(self, lines: Iterable[str]) -> ImportProgress:
+        """Import every row of a CSV.
+
+        Args:
+            lines: CSV text lines, header first (e.g. a file object or a
+                decoded S3 stream).
+
+        Returns:
+            Final import totals.
+        """
+        batch: list[tuple[int, Contact]] = []
+
+        for row_num, row in enumerate(csv.DictReader(lines), start=2):
+            self.progress.rows_processed += 1
+            contact = self._parse_row(row_num, row)
+            if contact is None:
+                continue
+
+            batch.append((row_num, contact))
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+        if batch:
+            self._flush(batch)
+
+        logger.info(
+            "Contacts imported",
+            workspace_id=self.workspace_id,
+            rows=self.progress.rows_processed,
+            imported=self.progress.imported,
+            skipped=self.progress.skipped,
+            errors=self.progress.error_count,
+        )
+        return self.progress
+
+    def _parse_row(self, row_num: int, row: dict[str, str | None]) -> Contact | None:
+        """Validate a row and drop it if it repeats an earlier row.
+
+        Returns:
+            Contact to import, or None if the row was skipped or invalid.
+        """
+        try:
+            contact_data = map_row(row, self.mapping)
+
+            # Must have email or phone
+            if not contact_data.get("email") and not contact_data.get("phone"):
+                self.progress.skipped += 1
+                return None
+
+            contact = Contact(workspace_id=self.workspace_id, **contact_data)
+        except (PydanticValidationError, TypeError, ValueError) as e:
+            self.progress.record_error(row_num, str(e))
+            return None
+
+        # In-file dedup: by email, or by phone for rows without an email
+        if contact.email:
+            seen, key = self._seen_emails, contact.email
+        else:
+            seen, key = self._seen_phones, contact.phone
+        if key in seen:
+            self.progress.skipped += 1
+            return None
+        seen.add(key)
+
+        return contact
+
+    def _flush(self, batch: list[tuple[int, Contact]]) -> None:
+        """Drop contacts whose email already exists and write the rest."""
+        existing = self._existing_emails([c.email for _, c in batch if c.email])
+        new_rows = [(row, c) for row, c in batch if not c.email or c.email not in existing]
+        self.progress.skipped += len(batch) - len(new_rows)
+
+        written = self._write(new_rows)
+        duplicates = self._remove_duplicates(written)
+
+        self.progress.imported += len(written) - duplicates
+        self.progress.skipped += duplicates
+
+        if self.on_progress:
+            self.on_progress(self.progress)
+
+    def _write(self, rows: list[tuple[int, Contact]]) -> list[Contact]:
+        """Batch write contacts, recording the rows of failed requests as errors.
+
+        Returns:
+            Contacts whose write request succeeded.
+        """
+        chunks = [
+            rows[i : i + BATCH_WRITE_MAX_ITEMS] for i in range(0, len(rows), BATCH_WRITE_MAX_ITEMS)
+        ]
+
+        def write(chunk: list[tuple[int, Contact]]) -> Exception | None:
+            try:
+                self.repo.batch_write([contact for _, contact in chunk])
+            except Exception as e:
+                return e
+            return None
+
+        written: list[Contact] = []
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(chunks)))) as pool:
+            for chunk, failure in zip(chunks, pool.map(write, chunks), strict=True):
+                if failure is None:
+                    written.extend(contact for _, contact in chunk)
+                    continue
+                logger.warning(
+                    "Contact batch write failed",
+                    workspace_id=self.workspace_id,
+                    rows=len(chunk),
+                    error=str(failure),
+                )
+                for row, _ in chunk:
+                    self.progress.record_error(row, f"Failed to save contact: {failure}")
+        return written
+
+    def _remove_duplicates(self, written: list[Contact]) -> int:
+        """Delete written contacts whose email another contact already holds.
+
+        Best effort: if the lookup or delete fails the duplicates stay and
+        are counted as imported.
+
+        Returns:
+            Number of written contacts deleted.
+        """
+        by_email = {c.email: c for c in written if c.email}
+        if not by_email:
+            return 0
+
+        try:
+            holders = self.repo.find_contact_ids_by_email(
+                self.workspace_id, by_email, max_workers=self.max_workers * 2
+            )
+            duplicates = [
+                contact
+                for email, contact in by_email.items()
+                if len(holders.get(email, ())) > 1 and contact.id != holders[email][0]
+            ]
+            if not duplicates:
+                return 0
+            self.repo.batch_delete(
+                [(f"WS#{self.workspace_id}", f"CONTACT#{c.id}") for c in duplicates],
+                max_workers=self.max_workers,
+            )
+        except Exception as e:
+            logger.warning(
+                "Duplicate contact check failed",
+                workspace_id=self.workspace_id,
+                error=str(e),
+            )
+            return 0
+
+        logger.info(
+            "Removed contacts duplicated by a concurrent writer",
+            workspace_id=self.workspace_id,
+            count=len(duplicates),
+        )
+        return len(duplicates)
+
+    def _existing_emails(self, emails: list[str]) -> set[str]:
+        """Return which emails already belong to contacts in the workspace."""
+        if not emails:
+            return set()
+
+        self._emails_checked += len(emails)
+        if (
+            self._email_index is None
+            and self.existing_count is not None
+            and self._emails_checked * EMAIL_INDEX_COST_RATIO >= self.existing_count
+        ):
+            self._email_index = set(self.repo.iter_emails(self.workspace_id))
+
+        if self._email_index is not None:
+            return {email for email in emails if email in self._email_index}
+
+        return self.repo.find_existing_emails(
+            self.workspace_id, emails, max_workers=self.max_workers * 2
+        )
@@ -3,9 +3,13 @@
 import structlog
 
 from complens.services.billing_service import DEFAULT_PLAN_LIMITS, get_dynamic_plan_limits
+from complens.utils.cache import get_cache
 
 logger = structlog.get_logger()
 
+# Workspaces (plan, subscription) are cached per container for a minute
+WORKSPACE_CACHE_TTL_SECONDS = 60
+
 
 class FeatureGateError(Exception):
     """Raised when a feature is not available on the current plan."""
@@ -95,6 +99,35 @@ def require_feature(plan: str, feature: str) -> None:
         raise FeatureGateError(feature, plan, required)
 
 
+def get_cached_workspace(workspace_id: str):
+    """Get a workspace from the warm-container workspace cache.
+
+    The workspace lookup is a GSI query, so gated requests share a cached
+    copy for WORKSPACE_CACHE_TTL_SECONDS (CACHE_TTL_WORKSPACES overrides).
+    The returned model is shared: read it, don't modify and save it.
+
+    Args:
+        workspace_id: Workspace ID.
+
+    Returns:
+        Workspace or None if not found.
+    """
+    from complens.repositories.workspace import WorkspaceRepository
+
+    return _workspace_cache().get_or_load(
+        workspace_id, lambda: WorkspaceRepository().get_by_id(workspace_id)
+    )
+
+
+def invalidate_workspace_cache(workspace_id: str) -> None:
+    """Drop a workspace from this container's cache (e.g., after a plan change).
+
+    Args:
+        workspace_id: Workspace ID.
+    """
+    _workspace_cache().invalidate(workspace_id)
+
+
 def get_workspace_plan(workspace_id: str) -> str:
     """Get the plan for a workspace.
 
@@ -104,12 +137,15 @@ def get_workspace_plan(workspace_id: str) -> str:
     Returns:
         Plan name (free, pro, business).
     """
-    from complens.repositories.workspace import WorkspaceRepository
-
-    ws = WorkspaceRepository().get_by_id(workspace_id)
+    ws = get_cached_workspace(workspace_id)
     return ws.plan if ws else "free"
 
 
+def _workspace_cache():
+    """Get the shared workspace cache."""
+    return get_cache("workspaces", ttl_seconds=WORKSPACE_CACHE_TTL_SECONDS)
+
+
 def count_resources(table, workspace_id: str, sk_prefix: str) -> int:
     """Count resources in a workspace using efficient DynamoDB Select='COUNT'.
 
@@ -121,15 +157,24 @@ def count_resources(table, workspace_id: str, sk_prefix: str) -> int:
     Returns:
         Count of matching items.
     """
-    response = table.query(
-        KeyConditionExpression="PK = :pk AND begins_with(SK, :sk)",
-        ExpressionAttributeValues={
+    kwargs: dict = {
+        "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk)",
+        "ExpressionAttributeValues": {
             ":pk": f"WS#{workspace_id}",
             ":sk": sk_prefix,
         },
-        Select="COUNT",
-    )
-    return response["Count"]
+        "Select": "COUNT",
+    }
+
+    # COUNT queries are still paged at 1 MB of evaluated data
+    count = 0
+    while True:
+        response = table.query(**kwargs)
+        count += response["Count"]
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            return count
+        kwargs["ExclusiveStartKey"] = last_key
 
 
 def get_usage_summary(plan: str, counts: dict[str, int]) -> dict:
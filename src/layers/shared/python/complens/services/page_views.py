@@ -0,0 +1,308 @@
+"""Buffered page-view ingestion.
+
+The public tracking beacon only validates a view and drops a compact
+message onto the page view queue. The page view aggregator consumes the
+queue in large batches and coalesces them before writing:
+
+- one view_count increment per page,
+- one visitor upsert per visitor (first/last touch from the earliest and
+  latest views),
+- one trigger_page_visit per visitor and page.
+
+So DynamoDB writes scale with the number of distinct pages and visitors
+in a batch window rather than with raw traffic.
+"""
+
+import json
+import os
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+import boto3
+import structlog
+
+from complens.repositories.page import PageRepository
+from complens.repositories.visitor import VisitorRepository
+
+logger = structlog.get_logger()
+
+# Views accepted per client IP per aggregated batch. A backstop only: the
+# beacon rate limits each IP before enqueueing.
+MAX_VIEWS_PER_IP = 10
+
+# SendMessageBatch accepts at most 10 entries
+SQS_BATCH_SIZE = 10
+
+_sqs_client = None
+
+
+def _get_sqs_client():
+    """Get SQS client (lazy initialization)."""
+    global _sqs_client
+    if _sqs_client is None:
+        _sqs_client = boto3.client("sqs")
+    return _sqs_client
+
+
+@dataclass
+class PageView:
+    """A single page view reported by the tracking beacon."""
+
+    workspace_id: str
+    page_id: str
+    visitor_id: str | None = None
+    referrer: str | None = None
+    utm_source: str | None = None
+    utm_medium: str | None = None
+    utm_campaign: str | None = None
+    utm_content: str | None = None
+    utm_term: str | None = None
+    ip: str | None = None
+    user_agent: str | None = None
+    viewed_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_message(self) -> str:
+        """Serialize to a compact queue message (empty fields omitted)."""
+        return json.dumps({k: v for k, v in asdict(self).items() if v})
+
+    @classmethod
+    def from_message(cls, body: str) -> "PageView":
+        """Parse a queue message.
+
+        Raises:
+            ValueError: If the message is not a valid page view.
+        """
+        data = json.loads(body)
+        if not isinstance(data, dict) or not data.get("workspace_id") or not data.get("page_id"):
+            raise ValueError("Page view requires workspace_id and page_id")
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+def record_page_view(view: PageView) -> None:
+    """Record a page view.
+
+    Enqueues the view for the aggregator. Without a configured queue
+    (local development) the view is written immediately.
+
+    Args:
+        view: The page view.
+    """
+    queue_url = os.environ.get("PAGE_VIEW_QUEUE_URL")
+    if queue_url:
+        _get_sqs_client().send_message(QueueUrl=queue_url, MessageBody=view.to_message())
+        return
+
+    aggregator = PageViewAggregator()
+    aggregator.add(view)
+    aggregator.flush()
+
+
+@dataclass
+class VisitorActivity:
+    """A visitor's coalesced views within a batch."""
+
+    views: list[PageView] = field(default_factory=list)
+
+    def add(self, view: PageView) -> None:
+        """Fold another view into the activity."""
+        self.views.append(view)
+
+    def in_order(self) -> list[PageView]:
+        """Views sorted by the time they happened (arrival order is not)."""
+        return sorted(self.views, key=lambda view: view.viewed_at)
+
+
+@dataclass
+class FlushStats:
+    """Outcome of writing an aggregated batch."""
+
+    views: int = 0
+    dropped: int = 0
+    page_writes: int = 0
+    visitor_writes: int = 0
+    triggers: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class PageViewAggregator:
+    """Coalesces page views and writes them with one update per key."""
+
+    def __init__(
+        self,
+        page_repo: PageRepository | None = None,
+        visitor_repo: VisitorRepository | None = None,
+        max_views_per_ip: int = MAX_VIEWS_PER_IP,
+        max_workers: int = 8,
+    ):
+        """Initialize the aggregator.
+
+        Args:
+            page_repo: Page repository.
+            visitor_repo: Visitor repository.
+            max_views_per_ip: Views accepted per client IP; the rest are dropped.
+            max_workers: Concurrent DynamoDB writes during flush.
+        """
+        self.page_repo = page_repo or PageRepository()
+        self.visitor_repo = visitor_repo or VisitorRepository()
+        self.max_views_per_ip = max_views_per_ip
+        self.max_workers = max_workers
+
+        self.page_counts: Counter[tuple[str, str]] = Counter()
+        self.visitors: dict[tuple[str, str], VisitorActivity] = {}
+        self.visits: dict[tuple[str, str, str], PageView] = {}
+        self._ip_counts: Counter[str] = Counter()
+        self._stats = FlushStats()
+
+    def add(self, view: PageView) -> bool:
+        """Add a view to the batch.
+
+        Returns:
+            False if the view was dropped by the per-IP limit.
+        """
+        if view.ip:
+            self._ip_counts[view.ip] += 1
+            if self._ip_counts[view.ip] > self.max_views_per_ip:
+                self._stats.dropped += 1
+                return False
+
+        self._stats.views += 1
+        self.page_counts[(view.workspace_id, view.page_id)] += 1
+
+        if view.visitor_id:
+            key = (view.workspace_id, view.visitor_id)
+            self.visitors.setdefault(key, VisitorActivity()).add(view)
+
+            # First view of each page per visitor triggers page-visit workflows
+            self.visits.setdefault((view.workspace_id, view.visitor_id, view.page_id), view)
+
+        return True
+
+    def add_all(self, views: Iterable[PageView]) -> None:
+        """Add several views to the batch."""
+        for view in views:
+            self.add(view)
+
+    def flush(self) -> FlushStats:
+        """Write the coalesced counters and reset the batch.
+
+        Failed writes are logged and counted but not retried: re-queueing
+        the batch would double count every write that succeeded.
+
+        Returns:
+            Stats for the flushed batch.
+        """
+        writes = [
+            (self._write_page_count, key, count) for key, count in self.page_counts.items()
+        ] + [
+            (self._write_visitor, key, activity) for key, activity in self.visitors.items()
+        ]
+
+        stats = self._stats
+        if writes:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(writes))) as executor:
+                for kind, ok in executor.map(lambda w: w[0](w[1], w[2]), writes):
+                    if not ok:
+                        stats.errors += 1
+                    elif kind == "page":
+                        stats.page_writes += 1
+                    else:
+                        stats.visitor_writes += 1
+
+        stats.triggers = self._send_triggers(list(self.visits.values()))
+
+        logger.info("Page views flushed", **stats.to_dict())
+
+        self.page_counts.clear()
+        self.visitors.clear()
+        self.visits.clear()
+        self._ip_counts.clear()
+        self._stats = FlushStats()
+        return stats
+
+    def _write_page_count(self, key: tuple[str, str], count: int) -> tuple[str, bool]:
+        """Add a page's coalesced views to its view_count."""
+        workspace_id, page_id = key
+        try:
+            self.page_repo.increment_view_count(workspace_id, page_id, count)
+        except Exception as e:
+            logger.warning("Failed to increment view count", page_id=page_id, error=str(e))
+            return "page", False
+        return "page", True
+
+    def _write_visitor(
+        self, key: tuple[str, str], activity: VisitorActivity
+    ) -> tuple[str, bool]:
+        """Upsert a visitor with its coalesced views."""
+        workspace_id, visitor_id = key
+        views = activity.in_order()
+        first, last = views[0], views[-1]
+        try:
+            self.visitor_repo.record_page_views(
+                workspace_id=workspace_id,
+                visitor_id=visitor_id,
+                page_ids=[view.page_id for view in views],
+                referrer=first.referrer,
+                last_referrer=last.referrer,
+                utm_source=first.utm_source,
+                utm_medium=first.utm_medium,
+                utm_campaign=first.utm_campaign,
+                utm_content=first.utm_content,
+                utm_term=first.utm_term,
+                ip=first.ip,
+                user_agent=first.user_agent,
+                seen_at=last.viewed_at,
+            )
+        except Exception as e:
+            logger.warning("Visitor upsert failed", visitor_id=visitor_id, error=str(e))
+            return "visitor", False
+        return "visitor", True
+
+    def _send_triggers(self, visits: list[PageView]) -> int:
+        """Fire trigger_page_visit for each visitor/page pair in the batch.
+
+        Returns:
+            Number of trigger messages sent.
+        """
+        queue_url = os.environ.get("WORKFLOW_QUEUE_URL")
+        if not queue_url or not visits:
+            return 0
+
+        sent = 0
+        for start in range(0, len(visits), SQS_BATCH_SIZE):
+            chunk = visits[start:start + SQS_BATCH_SIZE]
+            entries = [
+                {
+                    "Id": str(i),
+                    "MessageBody": json.dumps({
+                        "detail": {
+                            "trigger_type": "trigger_page_visit",
+                            "workspace_id": view.workspace_id,
+                            "visitor_id": view.visitor_id,
+                            "page_id": view.page_id,
+                            "referrer": view.referrer or "",
+                            "utm_source": view.utm_source or "",
+                            "utm_medium": view.utm_medium or "",
+                            "utm_campaign": view.utm_campaign or "",
+                        }
+                    }),
+                    "MessageGroupId": view.workspace_id,
+                }
+                for i, view in enumerate(chunk)
+            ]
+            try:
+                response = _get_sqs_client().send_message_batch(
+                    QueueUrl=queue_url, Entries=entries
+                )
+                sent += len(response.get("Successful", []))
+                for failure in response.get("Failed", []):
+                    logger.warning("Page visit trigger failed", error=failure.get("Message"))
+            except Exception as e:
+                logger.warning("Page visit trigger failed", error=str(e))
+        return sent
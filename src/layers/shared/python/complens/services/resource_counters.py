@@ -0,0 +1,306 @@
+"""Maintained resource counters for plan-limit enforcement.
+
+Every workspace has a WS#{id} / COUNTERS item holding its number of
+contacts, pages, workflows, forms and sites. The analytics rollup
+worker applies INSERT / REMOVE deltas from the table's stream, so every
+write path (API, bulk import, webhooks) is counted, and enforcement is a
+single consistent GetItem.
+
+Counters are initialized lazily by counting the workspace's items the
+first time they are read. reconcile_all() recounts every workspace with
+a parallel segmented scan and corrects any drift (for example from
+stream batches delivered twice).
+
+A count can include items whose stream records have not been processed
+yet (the stream batching window is up to 30 seconds). Every count stores
+the epoch second it started as counted_at, and stream changes written at
+or before it are skipped so they are not added twice. Changes within
+that same second are ambiguous; the daily reconcile settles them.
+"""
+
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import structlog
+from boto3.dynamodb.types import TypeDeserializer
+
+from complens.models.base import utc_now
+from complens.models.resource_counts import RESOURCE_PREFIXES, ResourceCounts
+from complens.repositories.resource_counts import ResourceCountsRepository
+from complens.services.feature_gate import count_resources
+
+logger = structlog.get_logger()
+
+# Parallel scan segments used by reconcile_all
+RECONCILE_SEGMENTS = 8
+
+_deserializer = TypeDeserializer()
+
+
+def _resource_for(sk: str) -> str | None:
+    """Resource counted by an item's sort key, if any."""
+    for resource, prefix in RESOURCE_PREFIXES.items():
+        if sk.startswith(prefix):
+            return resource
+    return None
+
+
+def get_resource_counts(workspace_id: str) -> ResourceCounts:
+    """Get a workspace's resource counters, counting items on first use.
+
+    Args:
+        workspace_id: Workspace ID.
+
+    Returns:
+        The workspace's counters.
+    """
+    repo = ResourceCountsRepository()
+    counts = repo.get_counts(workspace_id)
+    if counts is None:
+        counts = repo.initialize(count_workspace_resources(workspace_id, repo))
+    return counts
+
+
+def get_resource_count(workspace_id: str, resource: str) -> int:
+    """Get the current count of one resource.
+
+    Args:
+        workspace_id: Workspace ID.
+        resource: contacts, pages, workflows, forms or sites.
+
+    Returns:
+        Number of items of that resource in the workspace.
+    """
+    return getattr(get_resource_counts(workspace_id), resource)
+
+
+def count_workspace_resources(
+    workspace_id: str, repo: ResourceCountsRepository | None = None
+) -> ResourceCounts:
+    """Count a workspace's resources from its items.
+
+    Each resource is a paginated COUNT query; the five run in parallel.
+
+    Args:
+        workspace_id: Workspace ID.
+        repo: Repository whose table is queried.
+
+    Returns:
+        Freshly counted (unsaved) counters.
+    """
+    table = (repo or ResourceCountsRepository()).table
+    counted_at = int(time.time())
+    with ThreadPoolExecutor(max_workers=len(RESOURCE_PREFIXES)) as executor:
+        counted = dict(zip(
+            RESOURCE_PREFIXES,
+            executor.map(
+                lambda prefix: count_resources(table, workspace_id, prefix),
+                RESOURCE_PREFIXES.values(),
+            ),
+            strict=True,
+        ))
+    return ResourceCounts(
+        workspace_id=workspace_id, reconciled_at=utc_now(), counted_at=counted_at, **counted
+    )
+
+
+def reconcile_workspace(workspace_id: str) -> ResourceCounts:
+    """Recount a workspace's resources and overwrite its counters.
+
+    Args:
+        workspace_id: Workspace ID.
+
+    Returns:
+        The corrected counters.
+    """
+    repo = ResourceCountsRepository()
+    return repo.save(count_workspace_resources(workspace_id, repo))
+
+
+class ResourceCounterAggregator:
+    """Coalesces stream deltas into one counter update per workspace."""
+
+    def __init__(self, repo: ResourceCountsRepository | None = None, max_workers: int = 8):
+        """Initialize the aggregator.
+
+        Args:
+            repo: Resource counts repository.
+            max_workers: Concurrent DynamoDB writes during flush.
+        """
+        self.repo = repo or ResourceCountsRepository()
+        self.max_workers = max_workers
+        # Workspace -> (write second or None, resource, +1/-1) per record
+        self.changes: dict[str, list[tuple[int | None, str, int]]] = defaultdict(list)
+
+    def add_record(self, record: dict) -> bool:
+        """Fold a stream record into the batch.
+
+        Returns:
+            True if the record changed a counter.
+        """
+        event_name = record.get("eventName")
+        if event_name not in ("INSERT", "REMOVE"):
+            return False
+
+        keys = _deserialize(record.get("dynamodb", {}).get("Keys", {}))
+        pk, sk = keys.get("PK", ""), keys.get("SK", "")
+        resource = _resource_for(sk)
+        if not pk.startswith("WS#") or "#" in pk[3:] or not resource:
+            return False
+
+        created = record.get("dynamodb", {}).get("ApproximateCreationDateTime")
+        self.changes[pk[3:]].append((
+            int(float(created)) if created is not None else None,
+            resource,
+            1 if event_name == "INSERT" else -1,
+        ))
+        return True
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """Fold several stream records into the batch.
+
+        Returns:
+            Number of records that changed a counter.
+        """
+        return sum(self.add_record(record) for record in records)
+
+    def flush(self) -> dict:
+        """Apply the coalesced deltas and reset the batch.
+
+        Returns:
+            Dict with the number of workspaces updated, skipped because
+            their counters are not initialized yet, and failed.
+        """
+        writes = list(self.changes.items())
+        self.changes = defaultdict(list)
+        stats = {"updated": 0, "uninitialized": 0, "errors": 0}
+        if not writes:
+            return stats
+
+        def write(entry: tuple[str, list[tuple[int | None, str, int]]]) -> str:
+            workspace_id, changes = entry
+            deltas = _sum_changes(changes)
+            try:
+                # Common case: every change is newer than the last count
+                times = [created for created, _, _ in changes if created is not None]
+                if self.repo.add_counts(
+                    workspace_id, deltas, changed_after=min(times) if times else None
+                ):
+                    return "updated"
+
+                counts = self.repo.get_counts(workspace_id)
+                if counts is None:
+                    return "uninitialized"
+                # Recently counted: drop the changes the count already saw
+                watermark = counts.counted_at or 0
+                deltas = _sum_changes(
+                    change for change in changes if change[0] is None or change[0] > watermark
+                )
+                if self.repo.add_counts(workspace_id, deltas):
+                    return "updated"
+                return "uninitialized"
+            except Exception as e:
+                logger.warning(
+                    "Resource counter update failed",
+                    workspace_id=workspace_id,
+                    deltas=deltas,
+                    error=str(e),
+                )
+                return "errors"
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(writes))) as executor:
+            for outcome in executor.map(write, writes):
+                stats[outcome] += 1
+
+        logger.info("Resource counters flushed", **stats)
+        return stats
+
+
+def reconcile_all(total_segments: int = RECONCILE_SEGMENTS) -> dict:
+    """Recount every workspace's resources with a parallel scan.
+
+    Each segment pages through its share of the table reading only keys.
+    Counters that disagree with the scan are overwritten; writes racing
+    the scan may leave a small error that the next run corrects.
+
+    Args:
+        total_segments: Parallel scan segments.
+
+    Returns:
+        Dict with the number of workspaces checked and corrected.
+    """
+    repo = ResourceCountsRepository()
+    client = repo.client
+    counted_at = int(time.time())
+
+    def scan_segment(segment: int) -> tuple[dict[str, Counter[str]], dict[str, dict]]:
+        counted: dict[str, Counter[str]] = defaultdict(Counter)
+        stored: dict[str, dict] = {}
+        kwargs = {
+            "TableName": repo.table_name,
+            "Segment": segment,
+            "TotalSegments": total_segments,
+            "FilterExpression": "begins_with(PK, :ws)",
+            "ProjectionExpression": "PK, SK, " + ", ".join(f"#{r}" for r in RESOURCE_PREFIXES),
+            "ExpressionAttributeNames": {f"#{r}": r for r in RESOURCE_PREFIXES},
+            "ExpressionAttributeValues": {":ws": "WS#"},
+        }
+        while True:
+            response = client.scan(**kwargs)
+            for item in response.get("Items", []):
+                pk, sk = item["PK"], item["SK"]
+                workspace_id = pk[3:]
+                if "#" in workspace_id:
+                    continue
+                if sk == "COUNTERS":
+                    stored[workspace_id] = item
+                elif resource := _resource_for(sk):
+                    counted[workspace_id][resource] += 1
+            if "LastEvaluatedKey" not in response:
+                return counted, stored
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    counted: dict[str, Counter[str]] = defaultdict(Counter)
+    stored: dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        for segment_counts, segment_stored in executor.map(scan_segment, range(total_segments)):
+            for workspace_id, counts in segment_counts.items():
+                counted[workspace_id].update(counts)
+            stored.update(segment_stored)
+
+    corrected = 0
+    for workspace_id in set(counted) | set(stored):
+        counts = {resource: counted[workspace_id][resource] for resource in RESOURCE_PREFIXES}
+        current = stored.get(workspace_id)
+        if current and all(int(current.get(r, 0)) == n for r, n in counts.items()):
+            continue
+        if current:
+            logger.info(
+                "Resource counter drift corrected",
+                workspace_id=workspace_id,
+                stored={r: int(current.get(r, 0)) for r in RESOURCE_PREFIXES},
+                counted=counts,
+            )
+        repo.save(ResourceCounts(
+            workspace_id=workspace_id, reconciled_at=utc_now(), counted_at=counted_at, **counts
+        ))
+        corrected += 1
+
+    stats = {"workspaces": len(set(counted) | set(stored)), "corrected": corrected}
+    logger.info("Resource counters reconciled", **stats)
+    return stats
+
+
+def _sum_changes(changes: Iterable[tuple[int | None, str, int]]) -> dict[str, int]:
+    """Net delta per resource for a set of stream changes."""
+    deltas: Counter[str] = Counter()
+    for _, resource, delta in changes:
+        deltas[resource] += delta
+    return dict(deltas)
+
+
+def _deserialize(image: dict) -> dict:
+    """Deserialize DynamoDB attribute values to a regular dict."""
+    return {k: _deserializer.deserialize(v) for k, v in image.items()}
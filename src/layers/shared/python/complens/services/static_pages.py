@@ -0,0 +1,500 @@
+"""Pre-rendered static HTML for published landing pages.
+
+Published pages are rendered when they, their forms or their business
+profile change and stored in S3, where CloudFront serves them directly.
+The public pages API only renders on a miss and writes the result back.
+
+Layout of the static pages bucket:
+    pages/{page_id}/{content_hash}.html   immutable rendered versions
+    static/subdomain/{subdomain}          live HTML for {subdomain}.{domain}
+    static/domain/{host}                  live HTML for a site domain
+
+Live objects are copies of a rendered version and carry the owning page
+ID and content hash as metadata, so republishing a page whose HTML did
+not change writes nothing and invalidates nothing.
+"""
+
+import hashlib
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import boto3
+import structlog
+from botocore.exceptions import ClientError
+
+from complens.models.business_profile import BusinessProfile
+from complens.models.form import Form
+from complens.models.page import Page, PageStatus
+from complens.models.site import Site
+from complens.repositories.business_profile import BusinessProfileRepository
+from complens.repositories.form import FormRepository
+from complens.repositories.page import PageRepository
+from complens.repositories.site import SiteRepository
+from complens.services.cdn_service import invalidate_page_cache
+from complens.services.page_templates import render_full_page
+
+logger = structlog.get_logger()
+
+# Browsers revalidate after 5 minutes; CloudFront keeps the page until
+# a republish invalidates it
+HTML_CACHE_CONTROL = "public, max-age=300, s-maxage=31536000"
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """Get S3 client (lazy initialization)."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def _get_bucket() -> str:
+    """Get the static pages bucket name (empty when not configured)."""
+    return os.environ.get("STATIC_PAGES_BUCKET", "")
+
+
+@dataclass(frozen=True)
+class StaticRoute:
+    """A public host that serves a page.
+
+    Attributes:
+        kind: "subdomain" for {subdomain}.{domain}, "domain" for site domains.
+        host: Subdomain label or full domain, as rewritten into the URI by
+            the CloudFront router functions.
+        canonical_url: Canonical URL rendered into the page.
+        claim: Whether the page owns the route outright. Unclaimed routes
+            (a site's root domain without a default page) are only kept up
+            to date once the public API has stored the page there.
+    """
+
+    kind: str
+    host: str
+    canonical_url: str
+    claim: bool = True
+
+    @property
+    def key(self) -> str:
+        """S3 key of the live object for this route."""
+        return f"static/{self.kind}/{self.host}"
+
+
+def subdomain_route(subdomain: str) -> StaticRoute:
+    """Route for a page subdomain (e.g., mypage.dev.complens.ai)."""
+    stage = os.environ.get("STAGE", "dev")
+    suffix = "complens.ai" if stage == "prod" else f"{stage}.complens.ai"
+    return StaticRoute("subdomain", subdomain, f"https://{subdomain}.{suffix}")
+
+
+def domain_route(host: str, claim: bool = True) -> StaticRoute:
+    """Route for a site domain or subdomain.rootdomain host."""
+    return StaticRoute("domain", host, f"https://{host}", claim)
+
+
+def is_published(page: Page) -> bool:
+    """Check whether a page is publicly served."""
+    return PageStatus(page.status) == PageStatus.PUBLISHED
+
+
+def page_routes(page: Page, site: Site | None = None) -> list[StaticRoute]:
+    """List the public routes that serve a page.
+
+    Mirrors the lookups in the public pages API: the page subdomain, the
+    subdomain under its site's domain, and the site's root domain when
+    the page is (or may be) the site's default page.
+
+    Args:
+        page: The page.
+        site: The page's site, looked up if not given.
+
+    Returns:
+        Routes for the page.
+    """
+    routes = []
+    if page.subdomain:
+        routes.append(subdomain_route(page.subdomain.lower()))
+
+    if site is None and page.site_id:
+        site = SiteRepository().get_by_id(page.workspace_id, page.site_id)
+
+    if site and site.id == page.site_id and site.domain_name:
+        root = site.domain_name.lower()
+        if page.subdomain:
+            routes.append(domain_route(f"{page.subdomain.lower()}.{root}"))
+
+        default_page_id = site.settings.get("default_page_id")
+        if default_page_id == page.id:
+            routes.append(domain_route(root))
+        elif not default_page_id:
+            # Without a default the API serves the first published page
+            routes.append(domain_route(root, claim=False))
+
+    return routes
+
+
+def render_page(page: Page, routes: Iterable[StaticRoute]) -> dict[str, str]:
+    """Render a page once per route.
+
+    Forms and the effective business profile are loaded once and shared;
+    only the canonical URL differs between routes.
+
+    Args:
+        page: The page to render.
+        routes: Routes to render for.
+
+    Returns:
+        Dict of route key -> HTML.
+    """
+    form_repo = FormRepository()
+
+    # New way: forms with page_id set
+    page_forms, _ = form_repo.list_by_page(page.id)
+    forms = [form.model_dump(mode="json") for form in page_forms]
+
+    # Legacy way: forms referenced by form_ids (for backwards compatibility)
+    form_ids_set = {f.get("id") for f in forms}
+    for form_id in page.form_ids or []:
+        if form_id not in form_ids_set:
+            form = form_repo.get_by_id(page.workspace_id, form_id)
+            if form:
+                forms.append(form.model_dump(mode="json"))
+
+    profile = BusinessProfileRepository().get_effective_profile(
+        page.workspace_id, page.id, page.site_id
+    )
+    profile_data = profile.model_dump(mode="json") if profile else None
+
+    # Derive API/WS URLs from domain name to avoid circular CloudFormation dependencies
+    domain_name = os.environ.get("DOMAIN_NAME", "dev.complens.ai")
+    api_url = f"https://api.{domain_name}"
+    ws_url = f"wss://ws.{domain_name}"
+
+    page_data = page.model_dump(mode="json")
+    return {
+        route.key: render_full_page(
+            page_data, ws_url, api_url,
+            forms=forms, canonical_url=route.canonical_url,
+            business_profile=profile_data,
+        )
+        for route in routes
+    }
+
+
+def get_static_html(route: StaticRoute) -> str | None:
+    """Read the live HTML for a route.
+
+    Returns:
+        The stored HTML, or None if nothing is stored or S3 is unavailable.
+    """
+    bucket = _get_bucket()
+    if not bucket:
+        return None
+
+    try:
+        response = _get_s3_client().get_object(Bucket=bucket, Key=route.key)
+        return response["Body"].read().decode("utf-8")
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("NoSuchKey", "404"):
+            logger.warning("Failed to read static page", key=route.key, error=str(e))
+        return None
+
+
+def store_route(page: Page, route: StaticRoute, html: str) -> bool:
+    """Store rendered HTML as the live object for a route.
+
+    Args:
+        page: The page the HTML belongs to.
+        route: Route to publish.
+        html: Rendered HTML.
+
+    Returns:
+        True if the live object changed.
+    """
+    bucket = _get_bucket()
+    if not bucket:
+        return False
+
+    s3 = _get_s3_client()
+    content_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+
+    current = _head_route(route)
+    if current and current.get("page-id") == page.id and current.get("content-hash") == content_hash:
+        return False
+
+    version_key = f"pages/{page.id}/{content_hash}.html"
+    metadata = {"page-id": page.id, "content-hash": content_hash}
+    s3.put_object(
+        Bucket=bucket,
+        Key=version_key,
+        Body=html.encode("utf-8"),
+        ContentType="text/html; charset=utf-8",
+        CacheControl=HTML_CACHE_CONTROL,
+        Metadata=metadata,
+    )
+    s3.copy_object(
+        Bucket=bucket,
+        Key=route.key,
+        CopySource={"Bucket": bucket, "Key": version_key},
+        MetadataDirective="REPLACE",
+        ContentType="text/html; charset=utf-8",
+        CacheControl=HTML_CACHE_CONTROL,
+        Metadata=metadata,
+    )
+
+    logger.info(
+        "Static page published",
+        page_id=page.id,
+        route=route.key,
+        content_hash=content_hash,
+    )
+    return True
+
+
+def sync_page(
+    page: Page,
+    stale_routes: Iterable[StaticRoute] = (),
+    site: Site | None = None,
+) -> list[StaticRoute]:
+    """Bring a page's static HTML in line with its current state.
+
+    Published pages are rendered and stored for each of their routes.
+    Routes the page no longer serves (from stale_routes, or all routes
+    once unpublished) are removed if the page still owns them. Only the
+    routes whose content changed are invalidated in CloudFront.
+
+    Args:
+        page: The page, as saved.
+        stale_routes: Routes the page served before the change.
+        site: The page's site, looked up if not given.
+
+    Returns:
+        Routes whose live content changed.
+    """
+    try:
+        routes = page_routes(page, site) if is_published(page) else []
+    except Exception as e:
+        logger.exception("Failed to resolve page routes", page_id=page.id, error=str(e))
+        return []
+    current_keys = {route.key for route in routes}
+    removed = [route for route in stale_routes if route.key not in current_keys]
+
+    if not _get_bucket():
+        # No static bucket (local/dev): pages are rendered on request
+        changed = routes + removed
+        _invalidate(page.id, changed)
+        return changed
+
+    changed = []
+    try:
+        if routes:
+            claimed = [route for route in routes if route.claim or _owns(page, route)]
+            html_by_key = render_page(page, claimed)
+            changed.extend(
+                route for route in claimed if store_route(page, route, html_by_key[route.key])
+            )
+        changed.extend(route for route in removed if _remove_route(page, route))
+    except Exception as e:
+        logger.exception("Failed to sync static page", page_id=page.id, error=str(e))
+        # Fall back to serving from the API until the next successful sync
+        for route in routes:
+            _remove_route(page, route)
+        changed = routes + removed
+
+    _invalidate(page.id, changed)
+    return changed
+
+
+def remove_page(page: Page, site: Site | None = None) -> list[StaticRoute]:
+    """Take down a page's static HTML (e.g., when the page is deleted).
+
+    Args:
+        page: The page.
+        site: The page's site, looked up if not given.
+
+    Returns:
+        Routes that were removed.
+    """
+    routes = page_routes(page, site)
+    if _get_bucket():
+        routes = [route for route in routes if _remove_route(page, route)]
+    _invalidate(page.id, routes)
+    return routes
+
+
+def republish_pages(
+    workspace_id: str,
+    predicate: Callable[[Page], bool] | None = None,
+    max_workers: int = 8,
+) -> int:
+    """Re-render a workspace's published pages after a shared input changed.
+
+    Pages are synced concurrently; pages whose HTML is unchanged cost a
+    render and a HEAD request but no writes or invalidations.
+
+    Args:
+        workspace_id: Workspace ID.
+        predicate: Selects the pages to republish (all published pages if None).
+        max_workers: Pages rendered concurrently.
+
+    Returns:
+        Number of pages whose static HTML changed.
+    """
+    try:
+        pages = [
+            page
+            for page in PageRepository().iter_query(
+                pk=f"WS#{workspace_id}", sk_begins_with="PAGE#"
+            )
+            if is_published(page) and (predicate is None or predicate(page))
+        ]
+    except Exception as e:
+        # Log but don't fail the caller - pages pick it up on their next publish
+        logger.warning("Failed to list pages to republish", workspace_id=workspace_id, error=str(e))
+        return 0
+    if not pages:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+        results = list(executor.map(sync_page, pages))
+
+    changed = sum(1 for routes in results if routes)
+    logger.info(
+        "Republished workspace pages",
+        workspace_id=workspace_id,
+        pages=len(pages),
+        changed=changed,
+    )
+    return changed
+
+
+def republish_form_pages(form: Form) -> int:
+    """Re-render the pages that embed a form after it changed.
+
+    Args:
+        form: The created, updated or deleted form.
+
+    Returns:
+        Number of pages whose static HTML changed.
+    """
+    return republish_pages(
+        form.workspace_id,
+        lambda page: page.id == form.page_id or form.id in (page.form_ids or []),
+    )
+
+
+def republish_profile_pages(profile: BusinessProfile) -> int:
+    """Re-render the pages a business profile applies to after it changed.
+
+    Args:
+        profile: The updated page, site or workspace profile.
+
+    Returns:
+        Number of pages whose static HTML changed.
+    """
+    if profile.page_id:
+        predicate = lambda page: page.id == profile.page_id  # noqa: E731
+    elif profile.site_id:
+        predicate = lambda page: page.site_id == profile.site_id  # noqa: E731
+    else:
+        predicate = None
+    return republish_pages(profile.workspace_id, predicate)
+
+
+def sync_site(
+    workspace_id: str,
+    site_id: str,
+    previous: Site | None,
+    current: Site | None,
+) -> int:
+    """Resync a site's pages after its domain or default page changed.
+
+    Args:
+        workspace_id: Workspace ID.
+        site_id: Site ID.
+        previous: The site before the change.
+        current: The site after the change (None if deleted).
+
+    Returns:
+        Number of pages whose static HTML changed.
+    """
+    changed = 0
+    try:
+        for page in PageRepository().iter_query(pk=f"WS#{workspace_id}", sk_begins_with="PAGE#"):
+            if page.site_id != site_id:
+                continue
+            stale = page_routes(page, previous) if previous else []
+            if current is None:
+                # Site domain routes go with the site; the page subdomain stays live
+                removed = [route for route in stale if route.kind == "domain"]
+                if _get_bucket():
+                    removed = [route for route in removed if _remove_route(page, route)]
+                _invalidate(page.id, removed)
+                changed += bool(removed)
+            elif sync_page(page, stale, site=current):
+                changed += 1
+    except Exception as e:
+        # Log but don't fail the caller - pages pick it up on their next publish
+        logger.warning("Failed to sync site pages", site_id=site_id, error=str(e))
+    return changed
+
+
+def _head_route(route: StaticRoute) -> dict | None:
+    """Get the metadata of a route's live object, or None if absent."""
+    try:
+        response = _get_s3_client().head_object(Bucket=_get_bucket(), Key=route.key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return None
+        raise
+    return response.get("Metadata", {})
+
+
+def _owns(page: Page, route: StaticRoute) -> bool:
+    """Check whether a route's live object was rendered from this page."""
+    current = _head_route(route)
+    return bool(current) and current.get("page-id") == page.id
+
+
+def _remove_route(page: Page, route: StaticRoute) -> bool:
+    """Delete a route's live object if the page owns it.
+
+    Returns:
+        True if an object was deleted.
+    """
+    try:
+        if not _owns(page, route):
+            return False
+        _get_s3_client().delete_object(Bucket=_get_bucket(), Key=route.key)
+    except ClientError as e:
+        logger.warning("Failed to remove static page", key=route.key, error=str(e))
+        return False
+
+    logger.info("Static page removed", page_id=page.id, route=route.key)
+    return True
+
+
+def _invalidate(page_id: str, routes: list[StaticRoute]) -> None:
+    """Invalidate the CloudFront paths of changed routes."""
+    if not routes:
+        return
+
+    subdomains = [route.host for route in routes if route.kind == "subdomain"]
+    domains = [route.host for route in routes if route.kind == "domain"]
+    try:
+        result = invalidate_page_cache(
+            subdomain=subdomains or None,
+            custom_domain=domains or None,
+            page_id=page_id,
+        )
+        logger.info(
+            "CDN cache invalidated",
+            page_id=page_id,
+            routes=[route.key for route in routes],
+            result=result,
+        )
+    except Exception as e:
+        # Log but don't fail the request - the route stays stale until the next publish
+        logger.warning("Failed to invalidate CDN cache", page_id=page_id, error=str(e))
@@ -7,13 +7,31 @@ cohesive, high-conversion landing pages through a multi-stage pipeline:
 2. Content Assessment - Score available content quality
 3. Block Planning - Decide which blocks to include/exclude with layouts
 4. Design System - Generate industry-aware colors and styling
-5. Content Synthesis - Single AI call for cross-block narrative coherence
+5. Content Synthesis - Brand foundation, then block batches generated concurrently
 6. Block Configuration - Build validated PageBlock list
+
+Block batches share a container-wide thread pool. A single synthesis has
+at most BLOCK_BATCH_CONCURRENCY batches in flight, and the whole batch
+stage shares one BLOCK_BATCH_TIMEOUT_SECONDS deadline: batches that have
+not finished by then get default content so the request stays within the
+API Gateway timeout. Stage durations are reported in
+SynthesisMetadata.stage_timings_ms.
+
+Synthesis jobs (see the AI processor worker) run the same pipeline
+without the API Gateway timeout: they pass larger batch sizes and
+stage timeouts, and an on_progress callback that receives each stage's
+output and each block batch as it completes.
 """
 
 import json
+import os
 import random
 import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any
 from uuid import uuid4
 
@@ -46,6 +64,40 @@ from complens.services.ai_service import FAST_MODEL, get_kb_context, invoke_clau
 
 logger = structlog.get_logger()
 
+# Block batches generated at once per synthesis request
+BLOCK_BATCH_CONCURRENCY = int(os.environ.get("SYNTHESIS_BATCH_CONCURRENCY", "3"))
+
+# Seconds the block batch stage may take before unfinished blocks fall back to defaults
+BLOCK_BATCH_TIMEOUT_SECONDS = float(os.environ.get("SYNTHESIS_BATCH_TIMEOUT_SECONDS", "20"))
+
+# Threads generating block batches per container
+BLOCK_BATCH_MAX_WORKERS = 8
+
+# Blocks per Bedrock call for synchronous requests
+MAX_BLOCK_BATCH_SIZE = 3
+
+# Called with a stage name and its output as synthesis progresses
+ProgressCallback = Callable[[str, dict[str, Any]], None]
+
+_batch_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    """Get the container's block batch thread pool."""
+    global _batch_executor
+    with _lock:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(
+                max_workers=BLOCK_BATCH_MAX_WORKERS, thread_name_prefix="synthesis"
+            )
+        return _batch_executor
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return round((time.perf_counter() - started) * 1000, 1)
+
 
 # Intent to block mapping: which blocks are required/conditional/excluded per goal
 INTENT_BLOCK_MAPPING: dict[str, dict[str, list[str]]] = {
@@ -124,9 +176,21 @@ INDUSTRY_COLORS: dict[str, ColorScheme] = {
 class SynthesisEngine:
     """Unified page synthesis engine."""
 
-    def __init__(self) -> None:
-        """Initialize the synthesis engine."""
+    def __init__(
+        self,
+        max_batch_size: int = MAX_BLOCK_BATCH_SIZE,
+        batch_timeout_seconds: float | None = None,
+    ) -> None:
+        """Initialize the synthesis engine.
+
+        Args:
+            max_batch_size: Blocks generated per Bedrock call.
+            batch_timeout_seconds: Seconds the whole block batch stage
+                may take (default BLOCK_BATCH_TIMEOUT_SECONDS).
+        """
         self.profile_repo = BusinessProfileRepository()
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_timeout_seconds = batch_timeout_seconds
 
     def synthesize(
         self,
@@ -139,6 +203,7 @@ class SynthesisEngine:
         include_chat: bool = True,
         block_types: list[str] | None = None,
         site_id: str | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> SynthesisResult:
         """Main entry point for page synthesis.
 
@@ -154,6 +219,9 @@ class SynthesisEngine:
             include_chat: Whether to include a chat block.
             block_types: Optional list of specific block types to generate.
                          If provided, only these blocks will be generated.
+            on_progress: Optional callback receiving each stage's output
+                (intent_analysis, content_assessment, block_planning,
+                design_system, brand_foundation, one block_batch per batch).
 
         Returns:
             Complete SynthesisResult with all blocks and metadata.
@@ -166,41 +234,64 @@ class SynthesisEngine:
         )
 
         stages_executed: list[str] = []
+        stage_timings: dict[str, float] = {}
+        synthesis_started = time.perf_counter()
 
         # Get business profile for context
+        stage_started = time.perf_counter()
         profile = self._get_profile(workspace_id, page_id, site_id)
+        stage_timings["profile"] = _elapsed_ms(stage_started)
 
         # Stage 1: Intent Analysis
         logger.debug("Stage 1: Analyzing intent")
+        stage_started = time.perf_counter()
         intent = self._analyze_intent(description, intent_hints, profile)
         stages_executed.append("intent_analysis")
+        stage_timings["intent_analysis"] = _elapsed_ms(stage_started)
+        self._report(on_progress, "intent_analysis", {"intent": intent.model_dump(mode="json")})
 
         # Stage 2: Content Assessment
         logger.debug("Stage 2: Assessing content")
+        stage_started = time.perf_counter()
         assessment = self._assess_content(profile, description, intent)
         stages_executed.append("content_assessment")
+        stage_timings["content_assessment"] = _elapsed_ms(stage_started)
+        self._report(
+            on_progress, "content_assessment", {"assessment": assessment.model_dump(mode="json")}
+        )
 
         # Stage 3: Block Planning
         logger.debug("Stage 3: Planning blocks")
+        stage_started = time.perf_counter()
         plan = self._plan_blocks(intent, assessment, include_form, include_chat, block_types)
         stages_executed.append("block_planning")
+        stage_timings["block_planning"] = _elapsed_ms(stage_started)
+        self._report(on_progress, "block_planning", {"plan": plan.model_dump(mode="json")})
 
         # Stage 4: Design System
         logger.debug("Stage 4: Generating design system")
+        stage_started = time.perf_counter()
         design = self._generate_design_system(profile, intent, style_preference)
         stages_executed.append("design_system")
+        stage_timings["design_system"] = _elapsed_ms(stage_started)
+        self._report(on_progress, "design_system", {"design": design.model_dump(mode="json")})
 
-        # Stage 5: Content Synthesis
+        # Stage 5: Content Synthesis (records brand_foundation and block_batches)
         logger.debug("Stage 5: Synthesizing content")
+        stage_started = time.perf_counter()
         synthesized = self._synthesize_content(
-            workspace_id, profile, description, intent, plan, design
+            workspace_id, profile, description, intent, plan, design,
+            timings=stage_timings, on_progress=on_progress,
         )
         stages_executed.append("content_synthesis")
+        stage_timings["content_synthesis"] = _elapsed_ms(stage_started)
 
         # Stage 6: Block Configuration
         logger.debug("Stage 6: Configuring blocks")
+        stage_started = time.perf_counter()
         blocks = self._configure_blocks(plan, synthesized, design, description)
         stages_executed.append("block_configuration")
+        stage_timings["block_configuration"] = _elapsed_ms(stage_started)
 
         # Build form config if needed
         form_config = None
@@ -212,6 +303,8 @@ class SynthesisEngine:
             intent, synthesized, block_types=[b.type for b in blocks]
         )
 
+        stage_timings["total"] = _elapsed_ms(synthesis_started)
+
         # Build metadata
         metadata = SynthesisMetadata(
             blocks_included=[b.type for b in blocks],
@@ -224,6 +317,7 @@ class SynthesisEngine:
                 pb.type: pb.content_source for pb in plan.blocks
             },
             generation_stages=stages_executed,
+            stage_timings_ms=stage_timings,
         )
 
         # Build SEO config from synthesized content
@@ -261,6 +355,7 @@ class SynthesisEngine:
             synthesis_id=result.synthesis_id,
             blocks_count=len(blocks),
             excluded_count=len(plan.excluded),
+            stage_timings_ms=stage_timings,
         )
 
         return result
@@ -1237,13 +1332,22 @@ class SynthesisEngine:
         intent: PageIntent,
         plan: BlockPlan,
         design: DesignSystem,
+        timings: dict[str, float] | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> SynthesizedContent:
         """Stage 5: Generate block content using chunked AI calls.
 
         Uses an agentic approach - first establishes brand context, then
         generates each block type in focused batches to prevent content
-        truncation and ensure complete data.
+        truncation and ensure complete data. The batches run concurrently.
+
+        Args:
+            timings: Optional dict to record brand_foundation and
+                block_batches durations (ms) in.
+            on_progress: Optional callback for the brand foundation and
+                each block batch.
         """
+        timings = timings if timings is not None else {}
         # Build profile context
         profile_context = profile.get_ai_context() if profile.business_name else ""
 
@@ -1253,22 +1357,30 @@ class SynthesisEngine:
             profile_context = (profile_context + "\n\n" + kb_context) if profile_context else kb_context
 
         # Step 1: Generate brand foundation (small, focused call)
+        stage_started = time.perf_counter()
         brand = self._synthesize_brand_foundation(
             profile, description, intent, design, extra_context=kb_context
         )
+        timings["brand_foundation"] = _elapsed_ms(stage_started)
+        self._report(on_progress, "brand_foundation", {"brand": brand})
 
-        # Step 2: Generate blocks in focused batches
+        # Step 2: Generate blocks in focused batches, concurrently
         block_types = [pb.type for pb in plan.blocks]
-        all_blocks: list[SynthesizedBlockContent] = []
-
-        # Group blocks into larger batches (max 4-5 per call) to reduce AI calls
         batches = self._create_block_batches(block_types)
 
-        for batch in batches:
-            batch_blocks = self._synthesize_block_batch(
-                batch, brand, profile_context, description, intent, design
-            )
-            all_blocks.extend(batch_blocks)
+        stage_started = time.perf_counter()
+        def on_batch(index: int, blocks: list[SynthesizedBlockContent]) -> None:
+            self._report(on_progress, "block_batch", {
+                "batch": index,
+                "batches": len(batches),
+                "blocks": [block.model_dump(mode="json") for block in blocks],
+            })
+
+        all_blocks = self._synthesize_block_batches(
+            batches, brand, profile_context, description, intent, design,
+            on_batch=on_batch if on_progress else None,
+        )
+        timings["block_batches"] = _elapsed_ms(stage_started)
 
         # Extract SEO from brand foundation (merged to save an AI call)
         business_name = brand.get("business_name", profile.business_name or "Business")
@@ -1348,14 +1460,14 @@ Return JSON:
     def _create_block_batches(self, block_types: list[str]) -> list[list[str]]:
         """Group blocks into batches for generation.
 
-        Max 3 blocks per batch to stay within the 29-second API Gateway
-        limit. Groups related blocks together for coherent generation.
+        Max 3 blocks per batch (by default) keeps each Bedrock call short,
+        so the batches (generated concurrently) finish within the 29-second
+        API Gateway limit; synthesis jobs use larger batches. Groups related
+        blocks together for coherent generation.
         """
         if not block_types:
             return []
 
-        MAX_BATCH_SIZE = 3
-
         # Ordered by generation priority — hero first, then conversion, then content
         priority_order = [
             "hero", "cta", "form", "chat",
@@ -1370,13 +1482,103 @@ Return JSON:
             key=lambda bt: priority_order.index(bt) if bt in priority_order else 99,
         )
 
-        # Split into batches of MAX_BATCH_SIZE
+        # Split into batches of max_batch_size
         batches = []
-        for i in range(0, len(ordered), MAX_BATCH_SIZE):
-            batches.append(ordered[i:i + MAX_BATCH_SIZE])
+        for i in range(0, len(ordered), self.max_batch_size):
+            batches.append(ordered[i:i + self.max_batch_size])
 
         return batches
 
+    def _synthesize_block_batches(
+        self,
+        batches: list[list[str]],
+        brand: dict[str, Any],
+        profile_context: str,
+        description: str,
+        intent: PageIntent,
+        design: DesignSystem,
+        on_batch: Callable[[int, list[SynthesizedBlockContent]], None] | None = None,
+    ) -> list[SynthesizedBlockContent]:
+        """Generate block batches concurrently, in batch order.
+
+        At most BLOCK_BATCH_CONCURRENCY batches of this request run at
+        once; the rest wait for a slot. Slot waits and results share one
+        deadline, the batch timeout from the start of the stage, so the
+        stage never runs longer than that however many batches there
+        are. A batch that gets no slot, or has not finished by the
+        deadline, gets default content. Its Bedrock call is not
+        cancelled, only its result discarded.
+
+        Args:
+            batches: Block types per batch.
+            brand: Brand foundation.
+            profile_context: Business profile and knowledge base context.
+            description: User's description.
+            intent: Page intent.
+            design: Design system.
+            on_batch: Optional callback with each batch's index and blocks,
+                called in batch order from the calling thread.
+
+        Returns:
+            Synthesized blocks of all batches.
+        """
+        slots = threading.BoundedSemaphore(max(1, BLOCK_BATCH_CONCURRENCY))
+        executor = _get_batch_executor()
+        timeout = self.batch_timeout_seconds or BLOCK_BATCH_TIMEOUT_SECONDS
+
+        deadline = time.monotonic() + timeout
+        started: list[Future | None] = []
+        for batch in batches:
+            if not slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                started.append(None)
+                continue
+            try:
+                future = executor.submit(
+                    self._synthesize_block_batch,
+                    batch, brand, profile_context, description, intent, design,
+                )
+            except Exception:
+                slots.release()
+                raise
+            future.add_done_callback(lambda _: slots.release())
+            started.append(future)
+
+        all_blocks: list[SynthesizedBlockContent] = []
+        for index, (batch, future) in enumerate(zip(batches, started, strict=True)):
+            if future is None:
+                logger.warning("No slot for block batch, using defaults", blocks=batch)
+                batch_blocks = self._default_blocks(batch, brand)
+            else:
+                try:
+                    batch_blocks = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    logger.warning(
+                        "Block batch timed out, using defaults",
+                        blocks=batch,
+                        timeout_seconds=timeout,
+                    )
+                    batch_blocks = self._default_blocks(batch, brand)
+            all_blocks.extend(batch_blocks)
+            if on_batch:
+                on_batch(index, batch_blocks)
+
+        return all_blocks
+
+    def _report(
+        self, on_progress: ProgressCallback | None, stage: str, output: dict[str, Any]
+    ) -> None:
+        """Pass a stage's output to the progress callback, if any.
+
+        Progress is best effort: callback errors are logged and synthesis
+        carries on.
+        """
+        if on_progress is None:
+            return
+        try:
+            on_progress(stage, output)
+        except Exception as e:
+            logger.warning("Synthesis progress callback failed", stage=stage, error=str(e))
+
     def _synthesize_block_batch(
         self,
         block_types: list[str],
@@ -1469,13 +1671,19 @@ Return only valid JSON."""
         except Exception as e:
             logger.error("Block batch synthesis failed", blocks=block_types, error=str(e))
             # Return defaults for all blocks instead of empty list
-            return [
-                SynthesizedBlockContent(
-                    block_type=bt,
-                    content=self._get_default_block_content(bt, brand),
-                )
-                for bt in block_types
-            ]
+            return self._default_blocks(block_types, brand)
+
+    def _default_blocks(
+        self, block_types: list[str], brand: dict[str, Any]
+    ) -> list[SynthesizedBlockContent]:
+        """Default content for every block in a batch."""
+        return [
+            SynthesizedBlockContent(
+                block_type=bt,
+                content=self._get_default_block_content(bt, brand),
+            )
+            for bt in block_types
+        ]
 
     def _get_default_block_content(
         self, block_type: str, brand: dict[str, Any]
@@ -27,6 +27,9 @@ from complens.repositories.workflow import WorkflowRepository, WorkflowRunReposi
 
 logger = structlog.get_logger()
 
+# Upper bound on steps executed in one traversal ("Go to" loop guard)
+MAX_EXECUTION_STEPS = 1000
+
 # Combined legacy node registry (built-in node types)
 NODE_REGISTRY: dict[str, type[BaseNode]] = {
     **TRIGGER_NODES,
@@ -192,7 +195,8 @@ class WorkflowEngine:
     ) -> None:
         """Execute workflow starting from a specific node.
 
-        This is a recursive function that traverses the workflow graph.
+        Traverses the workflow graph iteratively until the path ends, a
+        node waits, or a node fails.
 
         Args:
             workflow: The workflow definition.
@@ -204,58 +208,77 @@ class WorkflowEngine:
             trigger_data: Original trigger data.
             step_sequence: Current step number.
         """
-        # Get the node definition
-        node_def = workflow.get_node_by_id(current_node_id)
-        if not node_def:
-            self.logger.error("Node not found", node_id=current_node_id)
-            return
-
-        # Get node implementation (supports both legacy and provider-based nodes)
-        node = _get_node_for_type(
-            node_id=current_node_id,
-            node_type=node_def.node_type,
-            config=node_def.get_config(),
-        )
-        if not node:
-            self.logger.error("Unknown node type", node_type=node_def.node_type)
-            return
-
-        # Create step record
-        step = WorkflowStep(
-            run_id=run.id,
-            node_id=current_node_id,
-            node_type=node_def.node_type,
-            sequence=step_sequence,
-            input_data={"variables": variables},
-        )
-        step.start()
+        steps_executed = 0
 
-        try:
-            # Node instance already created by _get_node_for_type
+        while current_node_id:
+            # Guard against "Go to" loops that never reach an exit
+            if steps_executed >= MAX_EXECUTION_STEPS:
+                run.error_node_id = current_node_id
+                raise Exception(
+                    f"Workflow exceeded {MAX_EXECUTION_STEPS} steps (possible infinite loop)"
+                )
 
-            # Build execution context
-            context = NodeContext(
-                contact=contact,
-                workflow_run=run,
-                conversation=conversation,
-                workspace_id=workflow.workspace_id,
-                variables=variables.copy(),
-                trigger_data=trigger_data,
-                node_config=node_def.get_config(),
+            # Get the node definition
+            node_def = workflow.get_node_by_id(current_node_id)
+            if not node_def:
+                self.logger.error("Node not found", node_id=current_node_id)
+                return
+
+            # Get node implementation (supports both legacy and provider-based nodes)
+            node = _get_node_for_type(
+                node_id=current_node_id,
+                node_type=node_def.node_type,
+                config=node_def.get_config(),
             )
+            if not node:
+                self.logger.error("Unknown node type", node_type=node_def.node_type)
+                return
 
-            # Execute the node
-            self.logger.info(
-                "Executing node",
+            # Create step record
+            step = WorkflowStep(
+                run_id=run.id,
                 node_id=current_node_id,
                 node_type=node_def.node_type,
-                step=step_sequence,
+                sequence=step_sequence,
+                input_data={"variables": variables},
             )
+            step.start()
+
+            try:
+                # Build execution context. Each step gets a fresh merged
+                # variables dict, so the node can share this one.
+                context = NodeContext(
+                    contact=contact,
+                    workflow_run=run,
+                    conversation=conversation,
+                    workspace_id=workflow.workspace_id,
+                    variables=variables,
+                    trigger_data=trigger_data,
+                    node_config=node_def.get_config(),
+                )
 
-            result = await node.execute(context)
+                # Execute the node
+                self.logger.info(
+                    "Executing node",
+                    node_id=current_node_id,
+                    node_type=node_def.node_type,
+                    step=step_sequence,
+                )
+
+                result = await node.execute(context)
+
+                if not result.success:
+                    # Node failed
+                    step.complete(
+                        success=False,
+                        error_message=result.error,
+                    )
+                    self.step_repo.create_step(step)
+
+                    run.error_message = result.error
+                    run.error_node_id = current_node_id
+                    raise Exception(result.error)
 
-            # Handle result
-            if result.success:
                 # Merge output variables
                 merged_vars = {**variables, **result.variables, **result.output}
 
@@ -266,55 +289,35 @@ class WorkflowEngine:
                 )
                 self.step_repo.create_step(step)
 
-                # Handle waiting state
-                if result.status == "waiting":
-                    run.wait(result.wait_until or datetime.now(timezone.utc))
-                    run.current_node_id = result.next_node_id
-                    run.variables = merged_vars
-                    self.run_repo.update_run(run)
-                    # Execution will resume via Step Functions
-                    return
-
-                # Determine next node
-                next_node_id = result.next_node_id
-                if not next_node_id:
-                    # No explicit next, try to find from edges
-                    edges = workflow.get_outgoing_edges(current_node_id)
-                    if edges:
-                        # For non-branching nodes, take the first edge
-                        next_node_id = edges[0].target
-
-                if next_node_id:
-                    # Continue to next node
-                    await self._execute_from_node(
-                        workflow=workflow,
-                        run=run,
-                        contact=contact,
-                        conversation=conversation,
-                        current_node_id=next_node_id,
-                        variables=merged_vars,
-                        trigger_data=trigger_data,
-                        step_sequence=step_sequence + 1,
-                    )
-                # else: end of workflow path
-
-            else:
-                # Node failed
-                step.complete(
-                    success=False,
-                    error_message=result.error,
-                )
-                self.step_repo.create_step(step)
-
-                run.error_message = result.error
-                run.error_node_id = current_node_id
-                raise Exception(result.error)
-
-        except Exception as e:
-            if not step.completed_at:
-                step.complete(success=False, error_message=str(e))
-                self.step_repo.create_step(step)
-            raise
+            except Exception as e:
+                if not step.completed_at:
+                    step.complete(success=False, error_message=str(e))
+                    self.step_repo.create_step(step)
+                raise
+
+            # Handle waiting state
+            if result.status == "waiting":
+                run.wait(result.wait_until or datetime.now(timezone.utc))
+                run.current_node_id = result.next_node_id
+                run.variables = merged_vars
+                self.run_repo.update_run(run)
+                # Execution will resume via Step Functions
+                return
+
+            # Determine next node
+            next_node_id = result.next_node_id
+            if not next_node_id:
+                # No explicit next, try to find from edges
+                edges = workflow.get_outgoing_edges(current_node_id)
+                if edges:
+                    # For non-branching nodes, take the first edge
+                    next_node_id = edges[0].target
+
+            # Continue to next node (None ends the workflow path)
+            current_node_id = next_node_id
+            variables = merged_vars
+            step_sequence += 1
+            steps_executed += 1
 
     async def resume_after_wait(
         self,
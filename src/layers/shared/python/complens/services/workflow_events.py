@@ -1,19 +1,67 @@
 """Workflow event broadcasting service.
 
 Broadcasts real-time workflow events to connected WebSocket clients.
+
+Fan-out is kept off the workflow executor's critical path as far as
+possible: a workspace's connection IDs are cached for a few seconds,
+boto3 clients are reused across warm invocations, posts run on a
+bounded thread pool, and gone connections are deleted in one batch.
+Setting BROADCAST_QUEUE_URL hands every broadcast to a queue consumed by
+the workflow event broadcaster worker instead.
+
+The worker also throttles workflow events, since a bulk trigger (a tag
+applied to 10k contacts) starts thousands of runs that each emit two
+events per node. Per workspace, only the first few events of every
+window go out in full; the rest are counted into one
+``workflow_summary`` frame per window (counts per workflow, node and
+status). Connections subscribed to a run (``handle_subscribe`` with
+channel ``run`` and the run ID) still get every event of that run.
+Direct broadcasts, without the queue, are never coalesced.
 """
 
 import json
 import os
+import threading
 import time
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
 import boto3
 import structlog
+from botocore.config import Config
+
+from complens.utils.cache import get_cache
 
 logger = structlog.get_logger()
 
+# Seconds a workspace's connection list is reused (CACHE_TTL_WS_CONNECTIONS overrides)
+CONNECTION_CACHE_TTL_SECONDS = 10
+
+# Concurrent post_to_connection calls per container
+BROADCAST_MAX_WORKERS = 16
+
+# Length of a coalescing window
+COALESCE_WINDOW_SECONDS = float(os.environ.get("EVENT_COALESCE_WINDOW_SECONDS", "1"))
+
+# Workflow events per workspace and window sent in full before coalescing
+FULL_EVENTS_PER_WINDOW = int(os.environ.get("EVENT_FULL_EVENTS_PER_WINDOW", "20"))
+
+# Subscription channel for full-fidelity events of one run ("run:<run_id>")
+RUN_CHANNEL = "run"
+
+# Keys accepted by one BatchGetItem call
+BATCH_GET_SIZE = 100
+
+_dynamodb = None
+_sqs_client = None
+_apigw_clients: dict[str, Any] = {}
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
 
 class WorkflowEventType(str, Enum):
     """Workflow event types."""
@@ -115,6 +163,38 @@ def emit_workflow_event(
     )
 
 
+def emit_workspace_event(workspace_id: str, action: str, data: dict) -> int:
+    """Broadcast a non-workflow event to a workspace's WebSocket clients.
+
+    Args:
+        workspace_id: Workspace ID.
+        action: Message action the frontend dispatches on.
+        data: Event payload fields.
+
+    Returns:
+        Number of connections that received the event.
+    """
+    ws_endpoint = os.environ.get("WEBSOCKET_ENDPOINT")
+    if not ws_endpoint:
+        logger.debug("No WebSocket endpoint configured, skipping event broadcast")
+        return 0
+
+    return _broadcast_to_workspace(
+        workspace_id=workspace_id,
+        message={
+            "action": action,
+            "workspace_id": workspace_id,
+            "timestamp": int(time.time() * 1000),
+            **data,
+        },
+        connections_table=os.environ.get(
+            "CONNECTIONS_TABLE",
+            f"complens-{os.environ.get('STAGE', 'dev')}-connections",
+        ),
+        ws_endpoint=ws_endpoint,
+    )
+
+
 def emit_workflow_started(
     workspace_id: str,
     workflow_id: str,
@@ -325,13 +405,98 @@ def _sanitize_result(result: dict) -> dict:
         return {"_note": "Result contains non-serializable data"}
 
 
+def _get_connections_table(table_name: str):
+    """Get a container-cached connections Table."""
+    global _dynamodb
+    if _dynamodb is None:
+        _dynamodb = boto3.resource("dynamodb")
+    return _dynamodb.Table(table_name)
+
+
+def _get_apigw_client(ws_endpoint: str):
+    """Get a container-cached API Gateway Management API client.
+
+    The connection pool matches the broadcast thread pool so parallel
+    posts reuse HTTPS connections.
+    """
+    client = _apigw_clients.get(ws_endpoint)
+    if client is None:
+        client = boto3.client(
+            "apigatewaymanagementapi",
+            endpoint_url=ws_endpoint,
+            config=Config(max_pool_connections=BROADCAST_MAX_WORKERS),
+        )
+        _apigw_clients[ws_endpoint] = client
+    return client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the container's broadcast thread pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=BROADCAST_MAX_WORKERS, thread_name_prefix="broadcast"
+            )
+        return _executor
+
+
+def _get_sqs_client():
+    """Get a container-cached SQS client."""
+    global _sqs_client
+    if _sqs_client is None:
+        _sqs_client = boto3.client("sqs")
+    return _sqs_client
+
+
+def get_workspace_connections(workspace_id: str, connections_table: str) -> list[str]:
+    """Get a workspace's WebSocket connection IDs.
+
+    Cached per container for CONNECTION_CACHE_TTL_SECONDS, so a workflow
+    run queries WorkspaceIdIndex once rather than once per event. New
+    dashboards start receiving events once the entry expires.
+
+    Args:
+        workspace_id: Workspace ID.
+        connections_table: DynamoDB connections table name.
+
+    Returns:
+        Connection IDs.
+    """
+    def load() -> list[str]:
+        table = _get_connections_table(connections_table)
+        kwargs = {
+            "IndexName": "WorkspaceIdIndex",
+            "KeyConditionExpression": "workspaceId = :ws",
+            "ExpressionAttributeValues": {":ws": workspace_id},
+            "ProjectionExpression": "connectionId",
+        }
+        connection_ids = []
+        while True:
+            response = table.query(**kwargs)
+            connection_ids.extend(
+                item["connectionId"] for item in response.get("Items", [])
+                if item.get("connectionId")
+            )
+            if "LastEvaluatedKey" not in response:
+                return connection_ids
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    cache = get_cache("ws_connections", CONNECTION_CACHE_TTL_SECONDS)
+    return cache.get_or_load((connections_table, workspace_id), load)
+
+
 def _broadcast_to_workspace(
     workspace_id: str,
     message: dict,
     connections_table: str,
     ws_endpoint: str,
 ) -> int:
-    """Broadcast message to all workspace connections.
+    """Broadcast a message, or hand it to the broadcast queue if configured.
+
+    With BROADCAST_QUEUE_URL set, the message is enqueued for the
+    workflow event broadcaster worker and the caller never waits on
+    WebSocket fan-out.
 
     Args:
         workspace_id: Workspace ID.
@@ -340,82 +505,372 @@ def _broadcast_to_workspace(
         ws_endpoint: WebSocket endpoint URL.
 
     Returns:
-        Number of connections that received the message.
+        Number of connections that received the message (0 when queued).
     """
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(connections_table)
+    queue_url = os.environ.get("BROADCAST_QUEUE_URL")
+    if not queue_url:
+        return broadcast_to_workspace(workspace_id, message, connections_table, ws_endpoint)
 
-    # Use WorkspaceIdIndex GSI for O(n) query instead of full table scan
     try:
-        response = table.query(
-            IndexName="WorkspaceIdIndex",
-            KeyConditionExpression="workspaceId = :ws",
-            ExpressionAttributeValues={":ws": workspace_id},
+        _get_sqs_client().send_message(
+            QueueUrl=queue_url,
+            MessageBody=json.dumps({
+                "workspace_id": workspace_id,
+                "message": message,
+                "connections_table": connections_table,
+                "ws_endpoint": ws_endpoint,
+            }),
         )
-        items = response.get("Items", [])
-
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            response = table.query(
-                IndexName="WorkspaceIdIndex",
-                KeyConditionExpression="workspaceId = :ws",
-                ExpressionAttributeValues={":ws": workspace_id},
-                ExclusiveStartKey=response["LastEvaluatedKey"],
-            )
-            items.extend(response.get("Items", []))
+    except Exception as e:
+        logger.warning("Failed to queue broadcast", workspace_id=workspace_id, error=str(e))
+    return 0
+
+
+def broadcast_to_workspace(
+    workspace_id: str,
+    message: dict,
+    connections_table: str,
+    ws_endpoint: str,
+) -> int:
+    """Broadcast message to all workspace connections.
+
+    Posts run in parallel on the container's broadcast pool. Connections
+    that are gone are dropped from the cached list and deleted in one
+    batched write.
 
+    Args:
+        workspace_id: Workspace ID.
+        message: Message to broadcast.
+        connections_table: DynamoDB connections table name.
+        ws_endpoint: WebSocket endpoint URL.
+
+    Returns:
+        Number of connections that received the message.
+    """
+    try:
+        connection_ids = get_workspace_connections(workspace_id, connections_table)
     except Exception as e:
         logger.error("WorkspaceIdIndex GSI query failed", error=str(e), workspace_id=workspace_id)
         return 0
 
-    if not items:
+    if not connection_ids:
         logger.debug("No connections for workspace", workspace_id=workspace_id)
         return 0
 
-    # Create API Gateway Management API client
-    apigw = boto3.client(
-        "apigatewaymanagementapi",
-        endpoint_url=ws_endpoint,
+    return _post_to_connections(
+        workspace_id, connection_ids, message, connections_table, ws_endpoint
     )
 
-    sent_count = 0
-    stale_connections = []
-    message_bytes = json.dumps(message).encode("utf-8")
 
-    for item in items:
-        connection_id = item.get("connectionId")
-        if not connection_id:
-            continue
+def _post_to_connections(
+    workspace_id: str,
+    connection_ids: list[str],
+    message: dict,
+    connections_table: str,
+    ws_endpoint: str,
+) -> int:
+    """Post a message to connections in parallel and clean up gone ones.
+
+    Args:
+        workspace_id: Workspace the connections belong to.
+        connection_ids: Connection IDs to post to.
+        message: Message to send.
+        connections_table: DynamoDB connections table name.
+        ws_endpoint: WebSocket endpoint URL.
+
+    Returns:
+        Number of connections that received the message.
+    """
+    apigw = _get_apigw_client(ws_endpoint)
+    message_bytes = json.dumps(message).encode("utf-8")
 
+    def post(connection_id: str) -> str:
         try:
-            apigw.post_to_connection(
-                ConnectionId=connection_id,
-                Data=message_bytes,
-            )
-            sent_count += 1
+            apigw.post_to_connection(ConnectionId=connection_id, Data=message_bytes)
+            return "sent"
         except apigw.exceptions.GoneException:
-            stale_connections.append(connection_id)
+            return "gone"
         except Exception as e:
             logger.debug(
                 "Failed to send to connection",
                 connection_id=connection_id,
                 error=str(e),
             )
+            return "failed"
 
-    # Clean up stale connections
-    for stale_id in stale_connections:
-        try:
-            table.delete_item(Key={"connectionId": stale_id})
-        except Exception:
-            pass
+    if len(connection_ids) == 1:
+        outcomes = [post(connection_ids[0])]
+    else:
+        outcomes = list(_get_executor().map(post, connection_ids))
+
+    sent_count = outcomes.count("sent")
+    stale_connections = [
+        connection_id
+        for connection_id, outcome in zip(connection_ids, outcomes, strict=True)
+        if outcome == "gone"
+    ]
+
+    if stale_connections:
+        _remove_stale_connections(workspace_id, stale_connections, connections_table)
 
     if sent_count > 0 or stale_connections:
         logger.info(
             "Workflow event broadcast",
             workspace_id=workspace_id,
-            event=message.get("event"),
+            event_type=message.get("event") or message.get("action"),
             sent=sent_count,
             stale_removed=len(stale_connections),
         )
 
     return sent_count
+
+
+def _remove_stale_connections(
+    workspace_id: str,
+    stale_connections: list[str],
+    connections_table: str,
+) -> None:
+    """Forget gone connections in the cache and delete them in batches.
+
+    Args:
+        workspace_id: Workspace ID.
+        stale_connections: Connection IDs API Gateway reported as gone.
+        connections_table: DynamoDB connections table name.
+    """
+    cache = get_cache("ws_connections", CONNECTION_CACHE_TTL_SECONDS)
+    found, cached = cache.get((connections_table, workspace_id))
+    if found and cached:
+        stale = set(stale_connections)
+        cache.set(
+            (connections_table, workspace_id),
+            [connection_id for connection_id in cached if connection_id not in stale],
+        )
+    get_cache("ws_subscriptions", CONNECTION_CACHE_TTL_SECONDS).invalidate(
+        (connections_table, workspace_id)
+    )
+
+    try:
+        with _get_connections_table(connections_table).batch_writer() as batch:
+            for connection_id in stale_connections:
+                batch.delete_item(Key={"connectionId": connection_id})
+    except Exception as e:
+        logger.debug("Failed to delete stale connections", error=str(e))
+
+
+def get_channel_subscribers(
+    workspace_id: str,
+    channel: str,
+    connections_table: str,
+) -> list[str]:
+    """Get the workspace connections subscribed to a channel.
+
+    WorkspaceIdIndex only projects keys, so subscriptions are read from
+    the table with BatchGetItem. Both lookups are cached per container
+    for CONNECTION_CACHE_TTL_SECONDS.
+
+    Args:
+        workspace_id: Workspace ID.
+        channel: Subscription, as stored by handle_subscribe (e.g. "run:<run_id>").
+        connections_table: DynamoDB connections table name.
+
+    Returns:
+        Connection IDs subscribed to the channel.
+    """
+    def load() -> dict[str, frozenset[str]]:
+        connection_ids = get_workspace_connections(workspace_id, connections_table)
+        subscriptions: dict[str, frozenset[str]] = {}
+        for start in range(0, len(connection_ids), BATCH_GET_SIZE):
+            request = {
+                connections_table: {
+                    "Keys": [
+                        {"connectionId": connection_id}
+                        for connection_id in connection_ids[start:start + BATCH_GET_SIZE]
+                    ],
+                    "ProjectionExpression": "connectionId, subscriptions",
+                }
+            }
+            while request:
+                response = _get_connections_table(connections_table).meta.client.batch_get_item(
+                    RequestItems=request
+                )
+                for item in response.get("Responses", {}).get(connections_table, []):
+                    subscriptions[item["connectionId"]] = frozenset(
+                        item.get("subscriptions") or ()
+                    )
+                request = response.get("UnprocessedKeys") or None
+        return subscriptions
+
+    cache = get_cache("ws_subscriptions", CONNECTION_CACHE_TTL_SECONDS)
+    subscriptions = cache.get_or_load((connections_table, workspace_id), load)
+    return [
+        connection_id
+        for connection_id, channels in subscriptions.items()
+        if channel in channels
+    ]
+
+
+@dataclass
+class _Window:
+    """Events of one workspace in one coalescing window."""
+
+    full_sent: int = 0
+    counts: Counter = field(default_factory=Counter)
+
+
+class EventCoalescer:
+    """Samples a workspace's workflow events and counts the rest per window.
+
+    Windows are aligned on event timestamps, so a frame reports what
+    happened in that second however late the broadcaster handles it.
+    The first ``full_events`` events of a workspace's window are sent in
+    full; later ones are only counted until drain() turns the counts
+    into summary frames.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = COALESCE_WINDOW_SECONDS,
+        full_events: int = FULL_EVENTS_PER_WINDOW,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the coalescer.
+
+        Args:
+            window_seconds: Length of a window.
+            full_events: Events per workspace and window sent in full.
+            clock: Time source (epoch seconds).
+        """
+        self.window_ms = max(1, int(window_seconds * 1000))
+        self.full_events = full_events
+        self.clock = clock
+        self._windows: dict[tuple[str, int], _Window] = {}
+
+    def admit(self, workspace_id: str, message: dict) -> bool:
+        """Decide whether a workflow event goes out in full.
+
+        Args:
+            workspace_id: Workspace ID.
+            message: Workflow event payload.
+
+        Returns:
+            True to broadcast the event, False if it was counted instead.
+        """
+        timestamp = message.get("timestamp") or int(self.clock() * 1000)
+        window = self._windows.setdefault(
+            (workspace_id, timestamp // self.window_ms), _Window()
+        )
+        if window.full_sent < self.full_events:
+            window.full_sent += 1
+            return True
+
+        key = (message.get("workflow_id"), message.get("node_id"),
+               message.get("status") or message.get("event"))
+        window.counts[key] += 1
+        return False
+
+    def drain(self) -> list[tuple[str, dict]]:
+        """Take summary frames for all counted events.
+
+        Windows are remembered for a while after draining so that events
+        of the same window arriving in a later batch still count against
+        its full-event allowance.
+
+        Returns:
+            (workspace ID, workflow_summary message) pairs.
+        """
+        now_ms = int(self.clock() * 1000)
+        frames = []
+        for (workspace_id, index), window in sorted(self._windows.items()):
+            if not window.counts:
+                continue
+            frames.append((workspace_id, {
+                "action": "workflow_summary",
+                "workspace_id": workspace_id,
+                "window_start": index * self.window_ms,
+                "window_seconds": self.window_ms / 1000,
+                "events": sum(window.counts.values()),
+                "counts": [
+                    {"workflow_id": workflow_id, "node_id": node_id, "status": status,
+                     "count": count}
+                    for (workflow_id, node_id, status), count in window.counts.items()
+                ],
+                "timestamp": now_ms,
+            }))
+            window.counts.clear()
+
+        horizon = now_ms // self.window_ms - 60
+        self._windows = {
+            key: window for key, window in self._windows.items() if key[1] >= horizon
+        }
+        return frames
+
+
+# Per-container coalescer shared by warm broadcaster invocations
+_coalescer = EventCoalescer()
+
+
+def broadcast_workflow_events(
+    broadcasts: list[dict],
+    coalescer: EventCoalescer | None = None,
+) -> int:
+    """Broadcast a batch of queued events, coalescing workflow events.
+
+    Workflow events beyond a workspace's full-event allowance are sent
+    only to connections subscribed to their run, and counted into one
+    summary frame per workspace and window, broadcast after the batch.
+    Other actions are broadcast unchanged.
+
+    Args:
+        broadcasts: Queued broadcasts with workspace_id, message,
+            connections_table and ws_endpoint.
+        coalescer: Event coalescer (defaults to the container's).
+
+    Returns:
+        Number of messages posted to connections.
+    """
+    coalescer = coalescer or _coalescer
+    targets: dict[str, tuple[str, str]] = {}
+    sent = 0
+    coalesced = 0
+
+    for broadcast in broadcasts:
+        workspace_id = broadcast["workspace_id"]
+        message = broadcast["message"]
+        connections_table = broadcast["connections_table"]
+        ws_endpoint = broadcast["ws_endpoint"]
+
+        if message.get("action") != "workflow_event" or coalescer.admit(workspace_id, message):
+            sent += broadcast_to_workspace(workspace_id, message, connections_table, ws_endpoint)
+            continue
+
+        coalesced += 1
+        targets[workspace_id] = (connections_table, ws_endpoint)
+        run_id = message.get("run_id")
+        if not run_id:
+            continue
+        try:
+            subscribers = get_channel_subscribers(
+                workspace_id, f"{RUN_CHANNEL}:{run_id}", connections_table
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to load run subscribers", workspace_id=workspace_id, error=str(e)
+            )
+            continue
+        if subscribers:
+            sent += _post_to_connections(
+                workspace_id, subscribers, message, connections_table, ws_endpoint
+            )
+
+    for workspace_id, frame in coalescer.drain():
+        connections_table, ws_endpoint = targets[workspace_id]
+        sent += broadcast_to_workspace(workspace_id, frame, connections_table, ws_endpoint)
+
+    if coalesced:
+        logger.info(
+            "Workflow events coalesced",
+            events=len(broadcasts),
+            coalesced=coalesced,
+            workspaces=len(targets),
+        )
+    return sent
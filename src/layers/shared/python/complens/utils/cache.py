@@ -0,0 +1,245 @@
+"""Warm-container TTL/LRU caches.
+
+Lambda containers serve many invocations, so values that change rarely
+compared to how often they are read (workspace metadata, plan configs,
+workflow definitions) are kept in process memory for a short TTL.
+
+Caches are bounded: the least recently used entry is evicted once a cache
+holds ``max_entries``. Each cache counts hits, misses and evictions, and
+lookups sample the counts into the logs (at most once per
+CACHE_STATS_INTERVAL_SECONDS per container) so TTLs can be tuned from
+them without handlers having to do anything. Named caches created with get_cache()
+are shared across the process, and their TTL can be overridden with a
+``CACHE_TTL_<NAME>`` environment variable:
+
+    workspaces = get_cache("workspaces", ttl_seconds=60)
+    workspace = workspaces.get_or_load(workspace_id, lambda: repo.get_by_id(workspace_id))
+
+Invalidation only reaches the current container; other warm containers
+see a change once their entry expires.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Default bound on entries per cache to keep container memory flat
+DEFAULT_MAX_ENTRIES = 256
+
+# Minimum seconds between statistics logs from maybe_log_cache_statistics()
+CACHE_STATS_INTERVAL_SECONDS = float(os.environ.get("CACHE_STATS_INTERVAL_SECONDS", "60"))
+
+
+@dataclass
+class _CacheEntry:
+    """A cached value and its expiry time (clock seconds)."""
+
+    value: Any
+    expires_at: float
+
+
+class TTLCache:
+    """Bounded TTL cache with least-recently-used eviction.
+
+    get_or_load() does not cache a loader's None result, so an item that
+    is created right after a failed lookup is seen on the next read
+    instead of reading as missing for the whole TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        name: str = "cache",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds each entry stays valid.
+            max_entries: Maximum entries before LRU eviction.
+            name: Name used in statistics.
+            clock: Time source (monotonic seconds).
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.name = name
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Get a value, returning (found, value)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        maybe_log_cache_statistics()
+        if entry is None:
+            return False, None
+        return True, entry.value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value with the cache TTL."""
+        with self._lock:
+            expires_at = self._clock() + self.ttl_seconds
+            self._entries[key] = _CacheEntry(value=value, expires_at=expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Get a value, loading and caching it on a miss.
+
+        Args:
+            key: Cache key.
+            loader: Called with no arguments to produce the value on a miss.
+                Exceptions propagate and nothing is cached; neither is None.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop one entry.
+
+        Returns:
+            True if the key was cached.
+        """
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def pop_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove all entries whose key matches the predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hit/miss/eviction counts, hit rate and size.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Named caches shared across the process
+_caches: dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+_last_stats_log: float | None = None
+
+
+def get_cache(
+    name: str,
+    ttl_seconds: float,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> TTLCache:
+    """Get (or create) a named process-wide cache.
+
+    Args:
+        name: Cache name; ``CACHE_TTL_<NAME>`` overrides the TTL.
+        ttl_seconds: Default TTL for the cache.
+        max_entries: Maximum entries before LRU eviction.
+
+    Returns:
+        The shared TTLCache for that name.
+    """
+    cache = _caches.get(name)
+    if cache is not None:
+        return cache
+
+    with _caches_lock:
+        if name not in _caches:
+            ttl = float(os.environ.get(f"CACHE_TTL_{name.upper()}", ttl_seconds))
+            _caches[name] = TTLCache(ttl, max_entries, name=name)
+        return _caches[name]
+
+
+def get_cache_statistics() -> dict[str, dict[str, Any]]:
+    """Get statistics for every named cache.
+
+    Returns:
+        Dict of cache name -> statistics.
+    """
+    return {name: cache.get_statistics() for name, cache in _caches.items()}
+
+
+def log_cache_statistics() -> None:
+    """Log statistics for every named cache that has been used."""
+    for name, stats in get_cache_statistics().items():
+        if stats["hits"] or stats["misses"]:
+            logger.info("Cache statistics", cache=name, **stats)
+
+
+def maybe_log_cache_statistics(clock: Callable[[], float] = time.monotonic) -> bool:
+    """Log cache statistics if the sampling interval has passed.
+
+    Called on every cache lookup, so it returns without locking while
+    the interval is running. Statistics are logged at most once per
+    CACHE_STATS_INTERVAL_SECONDS per container, and on its first call.
+
+    Args:
+        clock: Time source (monotonic seconds).
+
+    Returns:
+        True if statistics were logged.
+    """
+    global _last_stats_log
+    now = clock()
+    if _last_stats_log is not None and now - _last_stats_log < CACHE_STATS_INTERVAL_SECONDS:
+        return False
+    with _caches_lock:
+        if _last_stats_log is not None and now - _last_stats_log < CACHE_STATS_INTERVAL_SECONDS:
+            return False
+        _last_stats_log = now
+    log_cache_statistics()
+    return True
+
+
+def clear_caches() -> None:
+    """Clear every named cache (entries only)."""
+    for cache in _caches.values():
+        cache.clear()
@@ -1,7 +1,28 @@
-"""Rate limiting utilities for public endpoints."""
-
+"""Rate limiting utilities for public endpoints.
+
+Three modes share the same fixed-window DynamoDB counters
+(``RATELIMIT#{action}#MIN#{minute}`` / ``#HOUR#{hour}``):
+
+- ``fixed_window``: increments both counters on every request (two
+  round trips per request).
+- ``token_bucket`` (default): an in-container token bucket rejects
+  bursts locally, allowed requests are counted locally and synced to the
+  window counters in coalesced increments, and DynamoDB is only consulted
+  synchronously once a window gets close to its limit. Other containers'
+  traffic is seen at the next sync, so the limit can be overshot by
+  roughly the unsynced share of each warm container. Local state is
+  bounded to the MAX_TRACKED_ENTRIES most recently seen buckets and
+  counters so public traffic from many distinct IPs keeps memory flat.
+- ``sliding_log``: precise enforcement from a per-identifier log of
+  request timestamps, updated with an optimistic version check.
+"""
+
+import math
 import os
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
 from typing import NamedTuple
 
 import boto3
@@ -17,6 +38,18 @@ TABLE_NAME = os.environ.get("TABLE_NAME", "complens-dev")
 DEFAULT_REQUESTS_PER_MINUTE = 10
 DEFAULT_REQUESTS_PER_HOUR = 100
 
+# Token bucket sync tuning
+SYNC_BATCH_SIZE = 10  # Unsynced requests per counter before forcing a sync
+SYNC_INTERVAL_SECONDS = 5.0  # Max age of unsynced counts
+NEAR_LIMIT_RATIO = 0.8  # Fraction of a limit after which every request goes remote
+SYNC_MIN_RATIO = 0.5  # Counts below this fraction of a limit are never worth a write
+MAX_TRACKED_ENTRIES = 10_000  # Local buckets / counters kept before LRU eviction
+
+# Optimistic write attempts for the sliding log
+SLIDING_LOG_ATTEMPTS = 3
+
+WINDOWS = (("MIN", 60), ("HOUR", 3600))
+
 
 class RateLimitResult(NamedTuple):
     """Result of a rate limit check."""
@@ -26,11 +59,397 @@ class RateLimitResult(NamedTuple):
     retry_after: int | None  # Seconds until limit resets
 
 
+class RateLimitMode(str, Enum):
+    """Rate limiting algorithm."""
+
+    FIXED_WINDOW = "fixed_window"
+    TOKEN_BUCKET = "token_bucket"
+    SLIDING_LOG = "sliding_log"
+
+
 def _get_dynamodb():
     """Get DynamoDB resource."""
     return boto3.resource("dynamodb")
 
 
+@dataclass
+class TokenBucket:
+    """In-container token bucket refilled continuously up to its capacity."""
+
+    capacity: float
+    refill_per_second: float
+    tokens: float
+    updated_at: float
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+
+    def take(self, now: float) -> bool:
+        """Take one token if available."""
+        self.refill(now)
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def seconds_until_token(self) -> int:
+        """Seconds until the next token is available."""
+        if self.refill_per_second <= 0:
+            return 60
+        return max(1, math.ceil((1 - self.tokens) / self.refill_per_second))
+
+
+@dataclass
+class WindowCounter:
+    """Local view of one fixed-window DynamoDB counter."""
+
+    key: str
+    identifier: str
+    limit: int
+    expires_at: int
+    remote_count: int = 0  # Last count returned by DynamoDB
+    pending: int = 0  # Allowed locally, not yet written
+
+    @property
+    def estimate(self) -> int:
+        """Best local estimate of the window's count."""
+        return self.remote_count + self.pending
+
+
+class RateLimiter:
+    """Rate limit engine.
+
+    Instances keep per-container state, so use one per process via
+    get_rate_limiter().
+    """
+
+    def __init__(
+        self,
+        mode: RateLimitMode | str = RateLimitMode.TOKEN_BUCKET,
+        table=None,
+        sync_batch_size: int = SYNC_BATCH_SIZE,
+        sync_interval: float = SYNC_INTERVAL_SECONDS,
+        near_limit_ratio: float = NEAR_LIMIT_RATIO,
+        sync_min_ratio: float = SYNC_MIN_RATIO,
+        max_entries: int = MAX_TRACKED_ENTRIES,
+        clock=time.time,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            mode: Rate limiting algorithm.
+            table: DynamoDB Table (defaults to TABLE_NAME).
+            sync_batch_size: Unsynced requests per counter before syncing.
+            sync_interval: Seconds between syncs of unsynced counts.
+            near_limit_ratio: Fraction of a limit above which checks go remote.
+            sync_min_ratio: Fraction of a limit below which counts stay local
+                until their window expires.
+            max_entries: Token buckets and window counters each kept in
+                memory before the least recently used one is evicted.
+            clock: Time source (seconds since the epoch).
+        """
+        self.mode = RateLimitMode(mode)
+        self._table = table
+        self.sync_batch_size = sync_batch_size
+        self.sync_interval = sync_interval
+        self.near_limit_ratio = near_limit_ratio
+        self.sync_min_ratio = sync_min_ratio
+        self.max_entries = max(1, max_entries)
+        self.clock = clock
+
+        self.remote_calls = 0
+        self.evictions = 0
+        self._buckets: OrderedDict[tuple[str, str], TokenBucket] = OrderedDict()
+        self._counters: OrderedDict[tuple[str, str], WindowCounter] = OrderedDict()
+        self._next_sync_at = 0.0
+
+    @property
+    def table(self):
+        """DynamoDB table holding the counters."""
+        if self._table is None:
+            self._table = _get_dynamodb().Table(TABLE_NAME)
+        return self._table
+
+    def check(
+        self,
+        identifier: str,
+        action: str,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        requests_per_hour: int = DEFAULT_REQUESTS_PER_HOUR,
+    ) -> RateLimitResult:
+        """Check if a request should be rate limited.
+
+        Args:
+            identifier: Unique identifier (usually IP address or hashed IP).
+            action: Action being rate limited (e.g., "form_submit", "page_view").
+            requests_per_minute: Max requests allowed per minute.
+            requests_per_hour: Max requests allowed per hour.
+
+        Returns:
+            RateLimitResult with allowed status and remaining requests.
+        """
+        limits = (requests_per_minute, requests_per_hour)
+        try:
+            if self.mode == RateLimitMode.SLIDING_LOG:
+                result = self._check_sliding_log(identifier, action, limits)
+            elif self.mode == RateLimitMode.TOKEN_BUCKET:
+                result = self._check_token_bucket(identifier, action, limits)
+            else:
+                result = self._check_fixed_window(identifier, action, limits)
+        except ClientError as e:
+            # If DynamoDB fails, allow the request but log the error
+            logger.error(
+                "Rate limiter DynamoDB error",
+                error=str(e),
+                identifier=identifier[:20],
+                action=action,
+            )
+            return RateLimitResult(allowed=True, requests_remaining=-1, retry_after=None)
+
+        if not result.allowed:
+            logger.warning(
+                "Rate limit exceeded",
+                identifier=identifier[:20],  # Truncate for privacy
+                action=action,
+                mode=self.mode.value,
+                retry_after=result.retry_after,
+            )
+        return result
+
+    def flush(self, force: bool = False) -> int:
+        """Write unsynced counts to DynamoDB.
+
+        One-off clients (the bulk of public traffic) never get near a limit,
+        so counts below sync_min_ratio of their limit are dropped when the
+        window expires instead of being written.
+
+        Args:
+            force: Write every unsynced count.
+
+        Returns:
+            Number of counters written.
+        """
+        now = self.clock()
+        self._next_sync_at = now + self.sync_interval
+        written = 0
+
+        for key, counter in list(self._counters.items()):
+            if counter.pending and (
+                force or counter.estimate >= counter.limit * self.sync_min_ratio
+            ):
+                try:
+                    self._sync(counter, 0)
+                    written += 1
+                except ClientError as e:
+                    logger.warning("Rate limit sync failed", key=counter.key, error=str(e))
+            if counter.expires_at <= now:
+                del self._counters[key]
+
+        # Full buckets carry no state worth keeping
+        for key, bucket in list(self._buckets.items()):
+            bucket.refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del self._buckets[key]
+
+        return written
+
+    def _window_keys(self, action: str, now: float) -> list[tuple[str, int]]:
+        """Counter keys and window lengths for the current minute and hour."""
+        return [
+            (f"RATELIMIT#{action}#{name}#{int(now) // seconds}", seconds)
+            for name, seconds in WINDOWS
+        ]
+
+    def _increment(self, key: str, identifier: str, amount: int, ttl: int) -> int:
+        """Add to a window counter and return its new value."""
+        self.remote_calls += 1
+        response = self.table.update_item(
+            Key={"PK": key, "SK": identifier},
+            UpdateExpression="SET #count = if_not_exists(#count, :zero) + :inc, #ttl = :ttl",
+            ExpressionAttributeNames={"#count": "count", "#ttl": "ttl"},
+            ExpressionAttributeValues={":zero": 0, ":inc": amount, ":ttl": ttl},
+            ReturnValues="ALL_NEW",
+        )
+        return int(response["Attributes"]["count"])
+
+    def _check_fixed_window(
+        self, identifier: str, action: str, limits: tuple[int, int]
+    ) -> RateLimitResult:
+        """Increment the minute then hour counter on every request."""
+        now = int(self.clock())
+        counts = []
+
+        for (key, seconds), limit in zip(self._window_keys(action, now), limits, strict=True):
+            count = self._increment(key, identifier, 1, now + seconds * 2)
+            if count > limit:
+                return RateLimitResult(False, 0, seconds - now % seconds)
+            counts.append(limit - count)
+
+        return RateLimitResult(True, min(counts), None)
+
+    def _check_token_bucket(
+        self, identifier: str, action: str, limits: tuple[int, int]
+    ) -> RateLimitResult:
+        """Check locally and go remote only when near a limit."""
+        now = self.clock()
+        if now >= self._next_sync_at:
+            self.flush()
+
+        requests_per_minute = limits[0]
+        bucket = self._buckets.get((action, identifier))
+        if bucket is None or bucket.capacity != requests_per_minute:
+            bucket = TokenBucket(
+                capacity=requests_per_minute,
+                refill_per_second=requests_per_minute / 60,
+                tokens=requests_per_minute,
+                updated_at=now,
+            )
+            self._buckets[(action, identifier)] = bucket
+            self._evict_buckets()
+        else:
+            self._buckets.move_to_end((action, identifier))
+        if not bucket.take(now):
+            return RateLimitResult(False, 0, bucket.seconds_until_token())
+
+        counters = []
+        for (key, seconds), limit in zip(self._window_keys(action, now), limits, strict=True):
+            counter = self._counters.get((key, identifier))
+            if counter is None:
+                window_end = (int(now) // seconds + 1) * seconds
+                counter = WindowCounter(key, identifier, limit, expires_at=window_end)
+                self._counters[(key, identifier)] = counter
+                self._evict_counters()
+            else:
+                self._counters.move_to_end((key, identifier))
+            counter.limit = limit
+            counters.append(counter)
+
+        # Windows only ever fill up, so a known-exhausted window needs no round trip
+        for counter, limit in zip(counters, limits, strict=True):
+            if counter.estimate >= limit:
+                return RateLimitResult(False, 0, max(1, counter.expires_at - int(now)))
+
+        remaining = []
+        for counter, limit in zip(counters, limits, strict=True):
+            if counter.estimate + 1 > limit * self.near_limit_ratio:
+                count = self._sync(counter, 1)
+                if count > limit:
+                    return RateLimitResult(False, 0, max(1, counter.expires_at - int(now)))
+            else:
+                counter.pending += 1
+                if counter.pending >= self.sync_batch_size:
+                    self._sync(counter, 0)
+            remaining.append(limit - counter.estimate)
+
+        return RateLimitResult(True, max(0, min(remaining)), None)
+
+    def _evict_buckets(self) -> None:
+        """Drop least recently used buckets beyond max_entries.
+
+        An evicted bucket is recreated full, so a client idle long enough
+        to be evicted may burst once more; the window counters still apply.
+        """
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+
+    def _evict_counters(self) -> None:
+        """Drop least recently used counters beyond max_entries.
+
+        Pending counts worth a write (see flush) are synced first; the rest
+        are dropped, as they would be when their window expires.
+        """
+        while len(self._counters) > self.max_entries:
+            _, counter = self._counters.popitem(last=False)
+            self.evictions += 1
+            if counter.pending and counter.estimate >= counter.limit * self.sync_min_ratio:
+                try:
+                    self._sync(counter, 0)
+                except ClientError as e:
+                    logger.warning("Rate limit sync failed", key=counter.key, error=str(e))
+
+    def _sync(self, counter: WindowCounter, extra: int) -> int:
+        """Write a counter's pending count (plus extra) and refresh it."""
+        amount = counter.pending + extra
+        counter.pending = 0
+        try:
+            counter.remote_count = self._increment(
+                counter.key, counter.identifier, amount, counter.expires_at + 60
+            )
+        except ClientError:
+            # Keep the counts for the next sync
+            counter.pending = amount
+            raise
+        return counter.remote_count
+
+    def _check_sliding_log(
+        self, identifier: str, action: str, limits: tuple[int, int]
+    ) -> RateLimitResult:
+        """Enforce exact limits from a log of request timestamps."""
+        key = {"PK": f"RATELIMIT#{action}#LOG", "SK": identifier}
+        longest = WINDOWS[-1][1] * 1000
+
+        for _ in range(SLIDING_LOG_ATTEMPTS):
+            now_ms = int(self.clock() * 1000)
+            self.remote_calls += 1
+            item = self.table.get_item(Key=key, ConsistentRead=True).get("Item")
+            version = int(item["version"]) if item else 0
+            log = sorted(int(t) for t in (item or {}).get("log", []) if int(t) > now_ms - longest)
+
+            remaining = []
+            for (_, seconds), limit in zip(WINDOWS, limits, strict=True):
+                in_window = [t for t in log if t > now_ms - seconds * 1000]
+                if len(in_window) >= limit:
+                    oldest = in_window[len(in_window) - limit]
+                    retry_after = math.ceil((oldest + seconds * 1000 - now_ms) / 1000)
+                    return RateLimitResult(False, 0, max(1, retry_after))
+                remaining.append(limit - len(in_window) - 1)
+
+            log.append(now_ms)
+            condition = {"ConditionExpression": "attribute_not_exists(PK)"}
+            if item:
+                condition = {
+                    "ConditionExpression": "#version = :version",
+                    "ExpressionAttributeNames": {"#version": "version"},
+                    "ExpressionAttributeValues": {":version": version},
+                }
+            self.remote_calls += 1
+            try:
+                self.table.put_item(
+                    Item={
+                        **key,
+                        "log": log,
+                        "version": version + 1,
+                        "ttl": now_ms // 1000 + longest // 1000 + 60,
+                    },
+                    **condition,
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+                continue
+            return RateLimitResult(True, min(remaining), None)
+
+        # Heavy contention on one identifier is itself a sign of abuse
+        return RateLimitResult(False, 0, 1)
+
+
+_rate_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter (mode from RATE_LIMIT_MODE)."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(
+            mode=os.environ.get("RATE_LIMIT_MODE", RateLimitMode.TOKEN_BUCKET.value)
+        )
+    return _rate_limiter
+
+
 def check_rate_limit(
     identifier: str,
     action: str,
@@ -39,8 +458,8 @@ def check_rate_limit(
 ) -> RateLimitResult:
     """Check if a request should be rate limited.
 
-    Uses DynamoDB to track request counts with automatic TTL cleanup.
-    Implements a sliding window algorithm with minute and hour buckets.
+    Uses the process-wide RateLimiter, which tracks minute and hour
+    windows in DynamoDB with automatic TTL cleanup.
 
     Args:
         identifier: Unique identifier (usually IP address or hashed IP).
@@ -51,95 +470,7 @@ def check_rate_limit(
     Returns:
         RateLimitResult with allowed status and remaining requests.
     """
-    table = _get_dynamodb().Table(TABLE_NAME)
-    current_time = int(time.time())
-    current_minute = current_time // 60
-    current_hour = current_time // 3600
-
-    # Keys for minute and hour tracking
-    minute_key = f"RATELIMIT#{action}#MIN#{current_minute}"
-    hour_key = f"RATELIMIT#{action}#HOUR#{current_hour}"
-
-    try:
-        # Increment minute counter with TTL (expires after 2 minutes)
-        minute_response = table.update_item(
-            Key={"PK": minute_key, "SK": identifier},
-            UpdateExpression="SET #count = if_not_exists(#count, :zero) + :inc, #ttl = :ttl",
-            ExpressionAttributeNames={"#count": "count", "#ttl": "ttl"},
-            ExpressionAttributeValues={
-                ":zero": 0,
-                ":inc": 1,
-                ":ttl": current_time + 120,  # 2 minute TTL
-            },
-            ReturnValues="ALL_NEW",
-        )
-        minute_count = minute_response["Attributes"]["count"]
-
-        # Check minute limit first (stricter)
-        if minute_count > requests_per_minute:
-            seconds_until_next_minute = 60 - (current_time % 60)
-            logger.warning(
-                "Rate limit exceeded (minute)",
-                identifier=identifier[:20],  # Truncate for privacy
-                action=action,
-                count=minute_count,
-                limit=requests_per_minute,
-            )
-            return RateLimitResult(
-                allowed=False,
-                requests_remaining=0,
-                retry_after=seconds_until_next_minute,
-            )
-
-        # Increment hour counter with TTL (expires after 2 hours)
-        hour_response = table.update_item(
-            Key={"PK": hour_key, "SK": identifier},
-            UpdateExpression="SET #count = if_not_exists(#count, :zero) + :inc, #ttl = :ttl",
-            ExpressionAttributeNames={"#count": "count", "#ttl": "ttl"},
-            ExpressionAttributeValues={
-                ":zero": 0,
-                ":inc": 1,
-                ":ttl": current_time + 7200,  # 2 hour TTL
-            },
-            ReturnValues="ALL_NEW",
-        )
-        hour_count = hour_response["Attributes"]["count"]
-
-        # Check hour limit
-        if hour_count > requests_per_hour:
-            seconds_until_next_hour = 3600 - (current_time % 3600)
-            logger.warning(
-                "Rate limit exceeded (hour)",
-                identifier=identifier[:20],
-                action=action,
-                count=hour_count,
-                limit=requests_per_hour,
-            )
-            return RateLimitResult(
-                allowed=False,
-                requests_remaining=0,
-                retry_after=seconds_until_next_hour,
-            )
-
-        # Request allowed
-        return RateLimitResult(
-            allowed=True,
-            requests_remaining=min(
-                requests_per_minute - minute_count,
-                requests_per_hour - hour_count,
-            ),
-            retry_after=None,
-        )
-
-    except ClientError as e:
-        # If DynamoDB fails, allow the request but log the error
-        logger.error(
-            "Rate limiter DynamoDB error",
-            error=str(e),
-            identifier=identifier[:20],
-            action=action,
-        )
-        return RateLimitResult(allowed=True, requests_remaining=-1, retry_after=None)
+    return get_rate_limiter().check(identifier, action, requests_per_minute, requests_per_hour)
 
 
 def get_client_ip(event: dict) -> str:
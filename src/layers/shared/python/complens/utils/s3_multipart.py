@@ -0,0 +1,136 @@
+"""Streaming writer for S3 multipart uploads."""
+
+import io
+
+import structlog
+
+logger = structlog.get_logger()
+
+# S3 requires every part except the last to be at least 5 MiB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+
+class S3MultipartWriter(io.RawIOBase):
+    """Binary file-like object that streams writes into an S3 multipart upload.
+
+    At most one part is buffered in memory, so arbitrarily large objects
+    can be written with flat memory. Use as a context manager: the upload
+    is completed on a clean exit and aborted if an exception escapes. A
+    failed part upload or completion also aborts the upload before the
+    error is raised, so no parts are left orphaned.
+
+    Example:
+        with S3MultipartWriter(s3, bucket, key, content_type="text/csv") as out:
+            out.write(b"id,email\\n")
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        content_type: str = "application/octet-stream",
+        part_size: int = DEFAULT_PART_SIZE,
+    ):
+        """Start a multipart upload.
+
+        Args:
+            s3_client: boto3 S3 client.
+            bucket: Destination bucket.
+            key: Destination object key.
+            content_type: Content-Type stored on the object.
+            part_size: Bytes buffered before each part is uploaded.
+        """
+        super().__init__()
+        self.s3 = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.bytes_written = 0
+
+        self._buffer = bytearray()
+        self._parts: list[dict] = []
+        self._upload_id = self.s3.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType=content_type
+        )["UploadId"]
+
+    def writable(self) -> bool:
+        """The writer only supports writing."""
+        return True
+
+    def write(self, data) -> int:
+        """Buffer data, uploading a part each time the buffer fills.
+
+        Args:
+            data: Bytes-like object.
+
+        Returns:
+            Number of bytes accepted.
+        """
+        self._buffer.extend(data)
+        self.bytes_written += len(data)
+        try:
+            while len(self._buffer) >= self.part_size:
+                self._upload_part(bytes(self._buffer[: self.part_size]))
+                del self._buffer[: self.part_size]
+        except Exception:
+            self.abort()
+            raise
+        return len(data)
+
+    def close(self) -> None:
+        """Upload the final part and complete the upload.
+
+        Raises:
+            Exception: Whatever the final part upload or completion raised,
+                after the upload has been aborted.
+        """
+        if self.closed:
+            return
+        try:
+            if self._buffer or not self._parts:
+                self._upload_part(bytes(self._buffer))
+                self._buffer.clear()
+            self.s3.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        except Exception:
+            self.abort()
+            raise
+        super().close()
+
+    def abort(self) -> None:
+        """Abort the upload, discarding any uploaded parts."""
+        if self.closed:
+            return
+        try:
+            self.s3.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except Exception as e:
+            logger.warning("Failed to abort multipart upload", key=self.key, error=str(e))
+        self._buffer.clear()
+        super().close()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Complete the upload, or abort it if the block raised."""
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def _upload_part(self, body: bytes) -> None:
+        """Upload one part and record its ETag."""
+        part_number = len(self._parts) + 1
+        response = self.s3.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
@@ -19,6 +19,16 @@ os.environ["AWS_ACCESS_KEY_ID"] = "testing"
 os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
 
 
+@pytest.fixture(autouse=True)
+def clear_warm_caches():
+    """Start every test with empty warm-container caches."""
+    from complens.utils.cache import clear_caches
+
+    clear_caches()
+    yield
+    clear_caches()
+
+
 @pytest.fixture
 def aws_credentials():
     """Mock AWS credentials for moto."""
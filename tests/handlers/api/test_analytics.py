@@ -0,0 +1,57 @@
+"""Tests for the analytics API handler."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+class TestAnalytics:
+    """Tests for the rollup-backed analytics dashboard."""
+
+    def test_reads_daily_rollups(self, dynamodb_table, api_gateway_event):
+        from api.analytics import handler
+        from complens.repositories.analytics_rollup import AnalyticsRollupRepository
+
+        repo = AnalyticsRollupRepository()
+        today = datetime.now(timezone.utc).date()
+        repo.add_counts(WORKSPACE_ID, today.isoformat(), {
+            "contacts_created": 4, "runs_completed": 2, "runs_failed": 1, "page_views": 30,
+        })
+        repo.add_counts(WORKSPACE_ID, (today - timedelta(days=6)).isoformat(), {
+            "contacts_created": 1,
+        })
+        # Outside the 7 day window
+        repo.add_counts(WORKSPACE_ID, (today - timedelta(days=20)).isoformat(), {
+            "contacts_created": 50,
+        })
+        repo.add_counts(WORKSPACE_ID, "TOTAL", {"contacts_created": 120_000, "contacts_deleted": 5})
+
+        event = api_gateway_event(
+            path=f"/workspaces/{WORKSPACE_ID}/analytics",
+            path_params={"workspace_id": WORKSPACE_ID},
+            query_params={"period": "7d"},
+        )
+        response = handler(event, None)
+
+        assert response["statusCode"] == 200
+        data = json.loads(response["body"])
+        assert data["summary"]["total_contacts"] == 119_995
+        assert data["summary"]["contacts_in_period"] == 5
+        assert data["summary"]["page_views_in_period"] == 30
+        assert len(data["contact_growth"]) == 7
+        assert data["contact_growth"][-1] == {"date": today.isoformat(), "count": 4}
+        assert data["workflow_runs"][-1] == {
+            "date": today.isoformat(), "success": 2, "failed": 1,
+        }
+
+    def test_invalid_period(self, dynamodb_table, api_gateway_event):
+        from api.analytics import handler
+
+        event = api_gateway_event(
+            path=f"/workspaces/{WORKSPACE_ID}/analytics",
+            path_params={"workspace_id": WORKSPACE_ID},
+            query_params={"period": "1y"},
+        )
+
+        assert handler(event, None)["statusCode"] == 400
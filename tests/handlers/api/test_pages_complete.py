@@ -677,3 +677,28 @@ class TestBuildAutomationWorkflow:
         for edge in workflow.edges:
             assert edge.source in node_ids
             assert edge.target in node_ids
+
+
+class TestGeneratePageContent:
+    """Tests for the synchronous POST /pages/generate endpoint."""
+
+    def test_bedrock_call_is_capped_below_gateway_timeout(self, dynamodb_table, api_gateway_event):
+        """A slow model call fails cleanly before API Gateway's 29s limit."""
+        from api.pages import handler
+
+        event = api_gateway_event(
+            method="POST",
+            path="/workspaces/test-workspace-456/pages/generate",
+            path_params={"workspace_id": "test-workspace-456"},
+            body={"source_content": "We sell handmade ceramic mugs online."},
+        )
+
+        mock_bedrock = MagicMock()
+        mock_bedrock.invoke_model.side_effect = TimeoutError("read timed out")
+        with patch("api.pages.boto3.client", return_value=mock_bedrock) as mock_client:
+            response = handler(event, None)
+
+        assert response["statusCode"] == 500
+        config = mock_client.call_args.kwargs["config"]
+        assert config.read_timeout + config.connect_timeout < 29
+        assert config.retries["max_attempts"] == 1
@@ -460,3 +460,147 @@ class TestPublicPages:
         assert "Access-Control-Allow-Origin" in response["headers"]
         assert "Access-Control-Allow-Methods" in response["headers"]
         assert "POST" in response["headers"]["Access-Control-Allow-Methods"]
+
+    # -----------------------------------------------------------------
+    # 13. Get page by subdomain -- served from pre-rendered S3 object
+    # -----------------------------------------------------------------
+    def test_get_page_by_subdomain_serves_static_html(self, dynamodb_table):
+        """A stored static page is returned without looking up the page."""
+        import boto3
+
+        from api.public_pages import handler
+        from complens.services import static_pages
+
+        static_pages._s3_client = None
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="static-pages")
+        s3.put_object(
+            Bucket="static-pages", Key="static/subdomain/cached", Body=b"<html>cached</html>"
+        )
+
+        event = public_event(
+            method="GET",
+            path="/public/subdomain/cached",
+            path_params={"subdomain": "cached"},
+        )
+        with patch.dict(os.environ, {"STATIC_PAGES_BUCKET": "static-pages"}), \
+                patch.object(PageRepository, "get_by_subdomain") as lookup:
+            response = handler(event, None)
+        static_pages._s3_client = None
+
+        assert response["statusCode"] == 200
+        assert response["body"] == "<html>cached</html>"
+        assert "s-maxage" in response["headers"]["Cache-Control"]
+        lookup.assert_not_called()
+
+    # -----------------------------------------------------------------
+    # 14. Get page by subdomain -- rendered page is stored on a miss
+    # -----------------------------------------------------------------
+    def test_get_page_by_subdomain_stores_rendered_page(self, dynamodb_table):
+        """A page rendered on a miss is written to S3 for later requests."""
+        import boto3
+
+        from api.public_pages import handler
+        from complens.services import static_pages
+
+        static_pages._s3_client = None
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="static-pages")
+        page = _seed_published_page(slug="miss-test", subdomain="fresh")
+
+        event = public_event(
+            method="GET",
+            path="/public/subdomain/fresh",
+            path_params={"subdomain": "fresh"},
+        )
+        with patch.dict(os.environ, {"STATIC_PAGES_BUCKET": "static-pages"}):
+            response = handler(event, None)
+        static_pages._s3_client = None
+
+        assert response["statusCode"] == 200
+        stored = s3.get_object(Bucket="static-pages", Key="static/subdomain/fresh")
+        assert stored["Body"].read().decode() == response["body"]
+        assert stored["Metadata"]["page-id"] == page.id
+        # Rendering no longer counts views
+        assert PageRepository().get_by_id(WORKSPACE_ID, page.id).view_count == 0
+
+    # -----------------------------------------------------------------
+    # 15. Track beacon counts page views
+    # -----------------------------------------------------------------
+    def test_track_page_view_counts_view(self, dynamodb_table):
+        """POST /public/track counts the view (written inline without a queue)."""
+        from api.public_pages import handler
+
+        page = _seed_published_page(slug="tracked")
+
+        for page_id in (page.id, "unknown-page"):
+            event = public_event(
+                method="POST",
+                path="/public/track",
+                body={"visitor_id": "v_abc123", "page_id": page_id, "workspace_id": WORKSPACE_ID},
+            )
+            assert handler(event, None)["statusCode"] == 204
+
+        assert PageRepository().get_by_id(WORKSPACE_ID, page.id).view_count == 1
+        # Unknown page IDs don't create stray items
+        assert PageRepository().get_by_id(WORKSPACE_ID, "unknown-page") is None
+
+    # -----------------------------------------------------------------
+    # 15b. Rate-limited beacons are dropped before enqueueing
+    # -----------------------------------------------------------------
+    @patch("api.public_pages.record_page_view")
+    @patch("api.public_pages.check_rate_limit")
+    def test_track_page_view_rate_limited(self, mock_rate_limit, mock_record, dynamodb_table):
+        """POST /public/track over the per-IP limit records nothing."""
+        from api.public_pages import handler
+
+        mock_rate_limit.return_value = RateLimitResult(allowed=False, requests_remaining=0, retry_after=30)
+        event = public_event(
+            method="POST",
+            path="/public/track",
+            body={"visitor_id": "v_abc123", "page_id": "p1", "workspace_id": WORKSPACE_ID},
+        )
+
+        assert handler(event, None)["statusCode"] == 204
+        assert mock_rate_limit.call_args.kwargs["action"] == "page_track"
+        mock_record.assert_not_called()
+
+    # -----------------------------------------------------------------
+    # 16. Track beacon only enqueues when a page view queue is configured
+    # -----------------------------------------------------------------
+    def test_track_page_view_enqueues(self, dynamodb_table):
+        """POST /public/track sends one compact message and writes nothing."""
+        import boto3
+
+        from api.public_pages import handler
+        from complens.services import page_views
+
+        page_views._sqs_client = None
+        queue_url = boto3.client("sqs", region_name="us-east-1").create_queue(
+            QueueName="page-views"
+        )["QueueUrl"]
+        page = _seed_published_page(slug="queued")
+
+        event = public_event(
+            method="POST",
+            path="/public/track",
+            body={
+                "visitor_id": "v_abc123",
+                "page_id": page.id,
+                "workspace_id": WORKSPACE_ID,
+                "utm_source": "newsletter",
+            },
+        )
+        with patch.dict(os.environ, {"PAGE_VIEW_QUEUE_URL": queue_url}):
+            assert handler(event, None)["statusCode"] == 204
+        page_views._sqs_client = None
+
+        messages = boto3.client("sqs", region_name="us-east-1").receive_message(
+            QueueUrl=queue_url, MaxNumberOfMessages=10
+        )["Messages"]
+        assert len(messages) == 1
+        body = json.loads(messages[0]["Body"])
+        assert body["page_id"] == page.id
+        assert body["utm_source"] == "newsletter"
+        assert "utm_medium" not in body
+        assert PageRepository().get_by_id(WORKSPACE_ID, page.id).view_count == 0
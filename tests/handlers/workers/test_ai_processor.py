@@ -0,0 +1,158 @@
+"""Tests for page synthesis jobs on the AI processor worker."""
+
+import json
+import os
+import re
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+from complens.models.synthesis_job import SynthesisJobStatus
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+def fake_bedrock(prompt, system, workspace_id=None, model=None):
+    """Answer block batch prompts; other stages fall back to their defaults."""
+    match = re.search(r"content for these blocks: (.+)", prompt)
+    if not match:
+        raise RuntimeError("Only block batches are answered")
+    return {
+        "blocks": [
+            {"block_type": bt, "content": {"headline": f"Generated {bt}"}}
+            for bt in match.group(1).split(", ")
+        ]
+    }
+
+
+@pytest.fixture
+def synthesis_env(dynamodb_table):
+    """AI queue, fake Bedrock and captured WebSocket progress events."""
+    queue_url = boto3.client("sqs", region_name="us-east-1").create_queue(
+        QueueName="complens-test-ai"
+    )["QueueUrl"]
+    events = []
+
+    with patch.dict(os.environ, {"AI_QUEUE_URL": queue_url}), \
+            patch("complens.services.synthesis_engine.invoke_claude_json", fake_bedrock), \
+            patch("complens.services.synthesis_engine.get_kb_context", return_value=""), \
+            patch(
+                "complens.services.workflow_events.emit_workspace_event",
+                side_effect=lambda ws, action, data: events.append((action, data)),
+            ):
+        yield queue_url, events
+
+
+def _create_job(api_gateway_event, body):
+    from api.ai import handler
+
+    response = handler(api_gateway_event(
+        method="POST",
+        path=f"/workspaces/{WORKSPACE_ID}/ai/synthesize-page/jobs",
+        path_params={"workspace_id": WORKSPACE_ID},
+        body=body,
+    ), None)
+    assert response["statusCode"] == 202
+    return json.loads(response["body"])["id"]
+
+
+def _run_queue(queue_url):
+    from ai_processor import handler
+
+    messages = boto3.client("sqs").receive_message(
+        QueueUrl=queue_url, MaxNumberOfMessages=10
+    ).get("Messages", [])
+    records = [{"messageId": m["MessageId"], "body": m["Body"]} for m in messages]
+    return handler({"Records": records}, None)
+
+
+class TestSynthesisJobs:
+    """Tests for queued page synthesis."""
+
+    def test_job_runs_on_queue_and_streams_progress(self, synthesis_env, api_gateway_event):
+        """Stage outputs and blocks are saved and broadcast as they complete."""
+        from api.ai import handler
+        from complens.repositories.synthesis_job import SynthesisJobRepository
+
+        queue_url, events = synthesis_env
+        job_id = _create_job(api_gateway_event, {
+            "description": "A landing page for Acme plumbing services",
+            "block_types": ["hero", "cta", "features", "testimonials", "stats", "faq"],
+            "include_chat": False,
+        })
+
+        assert _run_queue(queue_url) == {"batchItemFailures": []}
+
+        job = SynthesisJobRepository().get_by_id(WORKSPACE_ID, job_id)
+        assert job.status == SynthesisJobStatus.COMPLETED
+        assert {"intent_analysis", "block_planning", "brand_foundation"} <= set(job.stage_outputs)
+        assert {b["block_type"] for b in job.blocks} >= {"hero", "faq"}
+        assert job.result["metadata"]["stage_timings_ms"]["total"] >= 0
+
+        # Jobs use larger batches: 6 blocks in 2 calls
+        batches = [data for _, data in events if data["output"] and data["stage"] == "block_batch"]
+        assert all(action == "synthesis_progress" for action, _ in events)
+        assert len(batches) == 2
+        assert batches[0]["output"]["blocks"][0]["content"]["headline"].startswith("Generated")
+        assert events[0][1]["status"] == SynthesisJobStatus.PROCESSING
+        assert events[-1][1]["status"] == SynthesisJobStatus.COMPLETED
+
+        response = handler(api_gateway_event(
+            method="GET",
+            path=f"/workspaces/{WORKSPACE_ID}/ai/synthesize-page/jobs/{job_id}",
+            path_params={"workspace_id": WORKSPACE_ID, "job_id": job_id},
+        ), None)
+        assert response["statusCode"] == 200
+        assert json.loads(response["body"])["result"]["blocks"]
+
+    def test_finished_job_is_not_rerun(self, synthesis_env, api_gateway_event):
+        """A redelivered message for a finished job is skipped."""
+        from ai_processor import process_synthesis_job
+
+        queue_url, events = synthesis_env
+        job_id = _create_job(api_gateway_event, {"description": "A page for a bakery in town"})
+        _run_queue(queue_url)
+        events.clear()
+
+        result = process_synthesis_job({"workspace_id": WORKSPACE_ID, "job_id": job_id})
+
+        assert result == {"success": True, "skipped": True}
+        assert events == []
+
+    def test_failed_job_is_recorded_not_retried(self, synthesis_env, api_gateway_event):
+        """Pipeline errors fail the job instead of the queue message."""
+        from complens.repositories.synthesis_job import SynthesisJobRepository
+
+        queue_url, events = synthesis_env
+        job_id = _create_job(api_gateway_event, {"description": "A page for a bakery in town"})
+
+        with patch(
+            "complens.services.synthesis_engine.SynthesisEngine._plan_blocks",
+            side_effect=RuntimeError("planner down"),
+        ):
+            assert _run_queue(queue_url) == {"batchItemFailures": []}
+
+        job = SynthesisJobRepository().get_by_id(WORKSPACE_ID, job_id)
+        assert job.status == SynthesisJobStatus.FAILED
+        assert job.error_message == "planner down"
+        assert events[-1][1]["status"] == SynthesisJobStatus.FAILED
+
+    def test_job_failed_when_queueing_fails(self, synthesis_env, api_gateway_event):
+        """A job that never reaches the queue is failed instead of left pending."""
+        from api.ai import handler
+        from complens.repositories.synthesis_job import SynthesisJobRepository
+
+        with patch("api.ai.boto3.client") as mock_client:
+            mock_client.return_value.send_message.side_effect = RuntimeError("queue down")
+            response = handler(api_gateway_event(
+                method="POST",
+                path=f"/workspaces/{WORKSPACE_ID}/ai/synthesize-page/jobs",
+                path_params={"workspace_id": WORKSPACE_ID},
+                body={"description": "A page for a bakery in town"},
+            ), None)
+
+        assert response["statusCode"] == 503
+        jobs = list(SynthesisJobRepository().iter_query(pk=f"WS#{WORKSPACE_ID}", sk_prefix="SYNTHJOB#"))
+        assert [job.status for job in jobs] == [SynthesisJobStatus.FAILED]
+        assert jobs[0].error_message == "Failed to queue job: queue down"
@@ -0,0 +1,74 @@
+"""Tests for the analytics rollup stream worker."""
+
+from boto3.dynamodb.types import TypeSerializer
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+def _insert(sk: str, image: dict) -> dict:
+    serializer = TypeSerializer()
+    return {
+        "eventName": "INSERT",
+        "dynamodb": {
+            "Keys": {"SK": {"S": sk}},
+            "NewImage": {k: serializer.serialize(v) for k, v in image.items()},
+        },
+    }
+
+
+class TestAnalyticsRollupHandler:
+    """Tests for the analytics rollup handler."""
+
+    def test_folds_batch(self, dynamodb_table):
+        import analytics_rollup
+        from complens.repositories.analytics_rollup import AnalyticsRollupRepository
+
+        image = {"workspace_id": WORKSPACE_ID, "created_at": "2026-03-02T10:00:00+00:00"}
+        event = {
+            "Records": [_insert(f"CONTACT#c{i}", image) for i in range(3)]
+            + [{"eventName": "INSERT", "dynamodb": {"NewImage": "garbage"}}]
+        }
+
+        result = analytics_rollup.handler(event, None)
+
+        assert result == {
+            "records": 4,
+            "deltas": 3,
+            "written": 2,
+            "errors": 0,
+            "counters": {"changes": 0, "updated": 0, "uninitialized": 0, "errors": 0},
+        }
+        totals = AnalyticsRollupRepository().get_totals(WORKSPACE_ID)
+        assert totals.contacts_created == 3
+
+    def test_applies_resource_counter_deltas(self, dynamodb_table):
+        import analytics_rollup
+        from complens.services.resource_counters import get_resource_counts
+
+        serializer = TypeSerializer()
+
+        def keyed(event_name: str, sk: str) -> dict:
+            return {
+                "eventName": event_name,
+                "dynamodb": {
+                    "Keys": {
+                        "PK": serializer.serialize(f"WS#{WORKSPACE_ID}"),
+                        "SK": serializer.serialize(sk),
+                    },
+                },
+            }
+
+        get_resource_counts(WORKSPACE_ID)
+        event = {
+            "Records": [keyed("INSERT", f"PAGE#p{i}") for i in range(3)]
+            + [keyed("REMOVE", "PAGE#p0"), keyed("INSERT", "WF#w1")]
+        }
+
+        result = analytics_rollup.handler(event, None)
+
+        assert result["counters"] == {
+            "changes": 5, "updated": 1, "uninitialized": 0, "errors": 0,
+        }
+        counts = get_resource_counts(WORKSPACE_ID)
+        assert counts.pages == 2
+        assert counts.workflows == 1
@@ -0,0 +1,70 @@
+"""Tests for the contact export worker Lambda."""
+
+import json
+import os
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+from complens.models.contact import Contact
+from complens.models.contact_export import ContactExport, ContactExportStatus
+
+WORKSPACE_ID = "test-workspace-456"
+BUCKET = "complens-test-contact-files"
+
+
+@pytest.fixture
+def export_job(dynamodb_table):
+    """Create a pending export job for a workspace with contacts."""
+    from complens.repositories.contact import ContactRepository
+    from complens.repositories.contact_export import ContactExportRepository
+
+    import contact_export
+
+    contact_export._s3_client = None
+    boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+
+    ContactRepository().batch_write([
+        Contact(workspace_id=WORKSPACE_ID, email=f"u{i}@example.com") for i in range(5)
+    ])
+    job = ContactExport(workspace_id=WORKSPACE_ID)
+    job.file_key = f"exports/{WORKSPACE_ID}/{job.file_name}"
+    ContactExportRepository().create_export(job)
+
+    with patch.dict(os.environ, {"CONTACT_FILES_BUCKET": BUCKET}):
+        yield job
+    contact_export._s3_client = None
+
+
+def _sqs_event(job):
+    """Build an SQS event for an export job."""
+    body = json.dumps({"workspace_id": job.workspace_id, "export_id": job.id})
+    return {"Records": [{"messageId": "m1", "body": body}]}
+
+
+class TestContactExportWorker:
+    """Tests for processing export jobs."""
+
+    def test_export_completes_job(self, export_job):
+        """The export file is written and the job records its totals."""
+        from complens.repositories.contact_export import ContactExportRepository
+        from contact_export import handler
+
+        assert handler(_sqs_event(export_job), None) == {"processed": 1}
+
+        job = ContactExportRepository().get_by_id(WORKSPACE_ID, export_job.id)
+        assert job.status == ContactExportStatus.COMPLETED
+        assert job.rows_exported == 5
+        assert job.size_bytes > 0
+
+        body = boto3.client("s3").get_object(Bucket=BUCKET, Key=job.file_key)["Body"].read()
+        assert body.decode().count("\n") == 6
+
+    def test_redelivered_message_is_ignored(self, export_job):
+        """A job is only exported once."""
+        from contact_export import handler
+
+        handler(_sqs_event(export_job), None)
+
+        assert handler(_sqs_event(export_job), None) == {"processed": 0}
@@ -0,0 +1,70 @@
+"""Tests for the contact import worker Lambda."""
+
+import boto3
+import pytest
+
+from complens.models.contact_import import ContactImport, ContactImportStatus
+
+WORKSPACE_ID = "test-workspace-456"
+BUCKET = "complens-test-contact-files"
+
+
+@pytest.fixture
+def import_job(dynamodb_table):
+    """Create a pending import job and upload its CSV."""
+    from complens.repositories.contact_import import ContactImportRepository
+
+    import contact_import
+
+    contact_import._s3_client = None
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket=BUCKET)
+
+    job = ContactImport(
+        workspace_id=WORKSPACE_ID, mapping={"email": "email", "name": "first_name"}
+    )
+    job.file_key = f"imports/{WORKSPACE_ID}/{job.id}.csv"
+    ContactImportRepository().create_import(job)
+
+    body = (
+        "\ufeffemail,name\r\n"
+        "a@example.com,Ann\r\n"
+        "b@example.com,\"Bob\r\nJr\"\r\n"
+        "a@example.com,Dupe\r\n"
+    )
+    s3.put_object(Bucket=BUCKET, Key=job.file_key, Body=body.encode("utf-8"))
+
+    yield job
+    contact_import._s3_client = None
+
+
+def _s3_event(key):
+    """Build an S3 ObjectCreated notification."""
+    return {"Records": [{"s3": {"bucket": {"name": BUCKET}, "object": {"key": key}}}]}
+
+
+class TestContactImportWorker:
+    """Tests for processing uploaded import files."""
+
+    def test_imports_upload_and_completes_job(self, import_job):
+        """Rows are imported and the job records the final totals."""
+        from complens.repositories.contact import ContactRepository
+        from complens.repositories.contact_import import ContactImportRepository
+        from contact_import import handler
+
+        assert handler(_s3_event(import_job.file_key), None) == {"processed": 1}
+
+        job = ContactImportRepository().get_by_id(WORKSPACE_ID, import_job.id)
+        assert job.status == ContactImportStatus.COMPLETED
+        assert (job.rows_processed, job.imported, job.skipped) == (3, 2, 1)
+
+        bob = ContactRepository().get_by_email(WORKSPACE_ID, "b@example.com")
+        assert bob.first_name == "Bob\r\nJr"
+
+    def test_duplicate_notification_is_ignored(self, import_job):
+        """A redelivered S3 notification does not import the file twice."""
+        from contact_import import handler
+
+        handler(_s3_event(import_job.file_key), None)
+
+        assert handler(_s3_event(import_job.file_key), None) == {"processed": 0}
@@ -0,0 +1,37 @@
+"""Tests for the page view aggregator worker Lambda."""
+
+import json
+
+from complens.models.page import Page, PageStatus
+from complens.repositories.page import PageRepository
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+def _sqs_event(bodies: list[str]) -> dict:
+    return {
+        "Records": [
+            {"messageId": f"m{i}", "body": body} for i, body in enumerate(bodies)
+        ]
+    }
+
+
+class TestPageViewAggregatorHandler:
+    """Tests for the page view aggregator handler."""
+
+    def test_aggregates_batch(self, dynamodb_table):
+        import page_view_aggregator
+
+        page = PageRepository().create_page(
+            Page(workspace_id=WORKSPACE_ID, name="P", slug="p", status=PageStatus.PUBLISHED)
+        )
+        view = {"workspace_id": WORKSPACE_ID, "page_id": page.id, "visitor_id": "v_abc"}
+
+        result = page_view_aggregator.handler(
+            _sqs_event([json.dumps(view)] * 3 + ["not json", "{}"]), None
+        )
+
+        assert result["views"] == 3
+        assert result["page_writes"] == 1
+        assert result["visitor_writes"] == 1
+        assert PageRepository().get_by_id(WORKSPACE_ID, page.id).view_count == 3
@@ -0,0 +1,107 @@
+"""Tests for deficit round-robin dispatch in the sharded queue processor Lambda."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from complens.models.workflow import Workflow, WorkflowStatus
+from complens.models.workflow_node import WorkflowNode
+from complens.queue.dispatch import DeferralSchedule
+from complens.queue.fair_scheduler import FairScheduler, TenantTier
+from complens.queue.trigger_index import TriggerIndex
+
+SHARD_ARN = "arn:aws:sqs:us-east-1:123456789012:complens-test-shard-0"
+TIERS = {"ws-noisy": TenantTier.FREE, "ws-pro": TenantTier.PROFESSIONAL}
+
+
+def _index(workspace_id):
+    """Build a trigger index with one workflow on the "vip" tag."""
+    workflow = Workflow(
+        id=f"wf-{workspace_id}",
+        workspace_id=workspace_id,
+        name="On vip",
+        status=WorkflowStatus.ACTIVE,
+        nodes=[
+            WorkflowNode(
+                id="t1",
+                node_type="trigger_tag_added",
+                data={"config": {"tag_name": "vip"}},
+            ),
+        ],
+    )
+    return TriggerIndex.build(workspace_id, [workflow])
+
+
+def _record(message_id, workspace_id):
+    """Build a sharded-queue SQS record for a tag event."""
+    return {
+        "messageId": message_id,
+        "receiptHandle": f"rh-{message_id}",
+        "eventSourceARN": SHARD_ARN,
+        "messageAttributes": {
+            "workspace_id": {"stringValue": workspace_id, "dataType": "String"},
+        },
+        "body": json.dumps({
+            "workspace_id": workspace_id,
+            "contact_id": f"contact-{message_id}",
+            "trigger_type": "trigger_tag_added",
+            "tag": "vip",
+            "operation": "added",
+        }),
+    }
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """Patch the processor's collaborators around an in-memory scheduler."""
+    import sharded_queue_processor
+
+    monkeypatch.setenv("QUEUE_MAX_CONCURRENCY", "1")
+    monkeypatch.setattr("complens.queue.dispatch._deferral_schedule", DeferralSchedule())
+    scheduler = FairScheduler(refresh_interval=60, use_dynamodb=False)
+    cache = MagicMock()
+    cache.get.side_effect = _index
+
+    with patch.object(sharded_queue_processor, "get_fair_scheduler", return_value=scheduler), \
+            patch.object(sharded_queue_processor, "is_flag_enabled", return_value=True), \
+            patch.object(sharded_queue_processor, "_get_workspace_tier", side_effect=TIERS.get), \
+            patch.object(sharded_queue_processor, "get_trigger_index_cache", return_value=cache), \
+            patch.object(sharded_queue_processor, "start_workflow_execution") as start, \
+            patch.object(sharded_queue_processor, "defer_messages") as defer:
+        yield sharded_queue_processor.handler, start, defer
+
+
+class TestShardedDispatch:
+    """Tests for ordering and deferral of shard batches."""
+
+    def test_quiet_tenant_not_stuck_behind_noisy_one(self, processor):
+        handler, start, _ = processor
+        records = [_record(f"n{i}", "ws-noisy") for i in range(5)]
+        records += [_record("p1", "ws-pro"), _record("p2", "ws-pro")]
+
+        result = handler({"Records": records}, None)
+
+        assert result == {"batchItemFailures": []}
+        started = [call.kwargs["contact_id"] for call in start.call_args_list]
+        assert started[:3] == ["contact-n0", "contact-p1", "contact-p2"]
+        assert len(started) == 7
+
+    def test_over_quota_records_deferred_not_failed_immediately(self, processor):
+        handler, start, defer = processor
+        records = [_record(f"n{i}", "ws-noisy") for i in range(12)]
+
+        result = handler({"Records": records}, None)
+
+        assert start.call_count == 10
+        assert result == {"batchItemFailures": [
+            {"itemIdentifier": "n10"},
+            {"itemIdentifier": "n11"},
+        ]}
+        deferrals = defer.call_args.args[0]
+        assert [(d.receipt_handle, d.source_arn) for d in deferrals] == [
+            ("rh-n10", SHARD_ARN),
+            ("rh-n11", SHARD_ARN),
+        ]
+        # Second deferral waits one extra free-tier refill (6 seconds)
+        assert deferrals[1].delay_seconds - deferrals[0].delay_seconds == 6
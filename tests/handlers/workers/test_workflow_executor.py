@@ -0,0 +1,178 @@
+"""Tests for node fusion in the workflow executor Lambda."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from complens.models.workflow import Workflow, WorkflowEdge
+from complens.models.workflow_node import WorkflowNode
+from complens.models.workflow_run import WorkflowRun
+from complens.nodes.base import NodeResult
+from complens.queue.feature_flags import FeatureFlag
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+class _PassNode:
+    """Node stub that completes immediately, recording its execution."""
+
+    executed: list[str] = []
+
+    def __init__(self, node_id, config):
+        self.node_id = node_id
+
+    async def execute(self, context):
+        _PassNode.executed.append(self.node_id)
+        return NodeResult.completed(variables={self.node_id: True})
+
+
+def _workflow():
+    """Build trigger -> a1 -> a2 -> wait -> a3."""
+    node_types = [
+        ("t1", "trigger_tag_added"),
+        ("a1", "action_update_contact"),
+        ("a2", "action_update_contact"),
+        ("w1", "action_wait"),
+        ("a3", "action_update_contact"),
+    ]
+    return Workflow(
+        id="wf-1",
+        workspace_id=WORKSPACE_ID,
+        name="Fusion",
+        nodes=[WorkflowNode(id=node_id, node_type=node_type) for node_id, node_type in node_types],
+        edges=[
+            WorkflowEdge(id=f"e{i}", source=source[0], target=target[0])
+            for i, (source, target) in enumerate(zip(node_types, node_types[1:], strict=False))
+        ],
+    )
+
+
+@pytest.fixture
+def executor_env():
+    """Patch the executor's collaborators and return its cache mock."""
+    _PassNode.executed = []
+    cache = MagicMock()
+    cache.get_workflow.return_value = _workflow()
+    cache.get_run.return_value = WorkflowRun(
+        id="run-1", workflow_id="wf-1", workspace_id=WORKSPACE_ID, trigger_type="trigger_tag_added"
+    )
+    cache.get_workspace_settings.return_value = {}
+    cache.get_site_settings.return_value = {}
+
+    with (
+        patch("workflow_executor.get_execution_context_cache", return_value=cache),
+        patch(
+            "workflow_executor.is_flag_enabled",
+            side_effect=lambda flag, workspace_id: flag == FeatureFlag.ENABLE_NODE_FUSION,
+        ),
+        patch("workflow_executor.WorkflowEngine") as mock_engine_cls,
+        patch("workflow_executor.emit_node_executing"),
+        patch("workflow_executor.emit_node_completed"),
+        patch("workflow_executor.emit_node_failed"),
+    ):
+        mock_engine_cls.return_value.get_node_class.return_value = _PassNode
+        yield cache
+
+
+def _event(**overrides):
+    """Build an execute_node event with carried context."""
+    event = {
+        "action": "execute_node",
+        "workflow_run_id": "run-1",
+        "workflow_id": "wf-1",
+        "workspace_id": WORKSPACE_ID,
+        "current_node_id": "a1",
+        "variables": {},
+        "cached_context": {"workflow_version": 1},
+        "execution_type": "express",
+    }
+    event.update(overrides)
+    return event
+
+
+class TestNodeFusion:
+    """Tests for running several Express nodes per invocation."""
+
+    def test_fuses_until_wait_node(self, executor_env):
+        """Non-waiting nodes run in-process and stop before the wait."""
+        from workflow_executor import handler
+
+        result = handler(_event(), None)
+
+        assert _PassNode.executed == ["a1", "a2"]
+        assert result["next_node_id"] == "w1"
+        assert result["nodes_executed"] == 2
+        assert result["variables"] == {"a1": True, "a2": True}
+
+    def test_standard_executions_not_fused(self, executor_env):
+        """Standard executions keep one node per task."""
+        from workflow_executor import handler
+
+        result = handler(_event(execution_type=None), None)
+
+        assert _PassNode.executed == ["a1"]
+        assert result["next_node_id"] == "a2"
+
+    def test_exhausted_budget_returns_to_state_machine(self, executor_env):
+        """Nothing is fused when the Lambda is close to its timeout."""
+        from workflow_executor import handler
+
+        lambda_context = MagicMock()
+        lambda_context.get_remaining_time_in_millis.return_value = 5_000
+
+        result = handler(_event(), lambda_context)
+
+        assert _PassNode.executed == ["a1"]
+        assert result["nodes_executed"] == 1
+
+
+class TestCircuitBreakerFlush:
+    """Tests for flushing write-behind circuit breaker counts."""
+
+    def test_flushes_after_node_execution(self, executor_env):
+        """Recorded outcomes are flushed before the invocation returns."""
+        from workflow_executor import handler
+
+        with patch("workflow_executor.get_circuit_breaker_registry") as mock_registry:
+            handler(_event(), None)
+
+        mock_registry.return_value.flush.assert_called_once()
+
+    def test_flushes_when_step_fails(self):
+        """A failing step still flushes, and a failed flush is not raised."""
+        from workflow_executor import handler
+
+        with patch("workflow_executor.get_circuit_breaker_registry") as mock_registry:
+            mock_registry.return_value.flush.side_effect = RuntimeError("no table")
+            result = handler({"action": "bogus"}, None)
+
+        assert result["status"] == "error"
+        mock_registry.return_value.flush.assert_called_once()
+
+
+class TestCachedContext:
+    """Tests for what initialize carries in Step Functions state."""
+
+    def test_state_carries_only_the_workflow_version(self):
+        """Settings (which hold secrets) and trigger data stay out of state."""
+        from workflow_executor import initialize_workflow
+
+        cache = MagicMock()
+        cache.get_workflow.return_value = _workflow()
+        with (
+            patch("workflow_executor.get_execution_context_cache", return_value=cache),
+            patch("workflow_executor.ContactRepository"),
+            patch("workflow_executor.WorkflowRunRepository") as mock_run_repo,
+            patch("workflow_executor.emit_workflow_started"),
+        ):
+            mock_run_repo.return_value.create_run.side_effect = lambda run: run
+            result = initialize_workflow({
+                "workflow_id": "wf-1",
+                "workspace_id": WORKSPACE_ID,
+                "contact_id": "c-1",
+                "trigger_data": {"trigger_type": "trigger_tag_added"},
+            })
+
+        assert result["cached_context"] == {"workflow_version": 1}
+        cache.remember_run.assert_called_once()
+        cache.get_workspace_settings.assert_not_called()
@@ -0,0 +1,150 @@
+"""Tests for batch processing in the workflow queue processor Lambda."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from complens.models.workflow import Workflow, WorkflowStatus
+from complens.models.workflow_node import WorkflowNode
+from complens.queue.trigger_index import TriggerIndex
+
+
+def _index(workspace_id, *tags):
+    """Build a trigger index with one tag workflow per tag."""
+    workflows = [
+        Workflow(
+            id=f"wf-{tag}",
+            workspace_id=workspace_id,
+            name=f"On {tag}",
+            status=WorkflowStatus.ACTIVE,
+            nodes=[
+                WorkflowNode(
+                    id="t1",
+                    node_type="trigger_tag_added",
+                    data={"config": {"tag_name": tag}},
+                ),
+            ],
+        )
+        for tag in tags
+    ]
+    return TriggerIndex.build(workspace_id, workflows)
+
+
+def _record(message_id, workspace_id, tag):
+    """Build an SQS record wrapping an EventBridge tag event."""
+    return {
+        "messageId": message_id,
+        "body": json.dumps({
+            "detail": {
+                "workspace_id": workspace_id,
+                "contact_id": f"contact-{message_id}",
+                "trigger_type": "trigger_tag_added",
+                "tag": tag,
+                "operation": "added",
+            },
+        }),
+    }
+
+
+class TestWorkflowQueueBatch:
+    """Tests for grouped, concurrent batch processing."""
+
+    @patch("workflow_queue_processor.start_workflow_execution")
+    @patch("workflow_queue_processor.get_trigger_index_cache")
+    def test_index_loaded_once_per_workspace(self, mock_cache_fn, mock_start):
+        """Records for the same workspace share a single index lookup."""
+        from workflow_queue_processor import handler
+
+        indexes = {"ws-a": _index("ws-a", "vip"), "ws-b": _index("ws-b", "vip")}
+        mock_cache = MagicMock()
+        mock_cache.get.side_effect = lambda ws: indexes[ws]
+        mock_cache_fn.return_value = mock_cache
+
+        event = {"Records": [
+            _record("m1", "ws-a", "vip"),
+            _record("m2", "ws-b", "vip"),
+            _record("m3", "ws-a", "vip"),
+            _record("m4", "ws-a", "other"),
+        ]}
+
+        result = handler(event, None)
+
+        assert result == {"batchItemFailures": []}
+        assert mock_cache.get.call_count == 2
+        started = sorted(call.kwargs["contact_id"] for call in mock_start.call_args_list)
+        assert started == ["contact-m1", "contact-m2", "contact-m3"]
+
+    @patch("workflow_queue_processor.start_workflow_execution")
+    @patch("workflow_queue_processor.get_trigger_index_cache")
+    def test_only_failed_records_reported(self, mock_cache_fn, mock_start):
+        """A failed start only retries the record that requested it."""
+        from workflow_queue_processor import handler
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = _index("ws-a", "vip")
+        mock_cache_fn.return_value = mock_cache
+
+        def _start(**kwargs):
+            if kwargs["contact_id"] == "contact-m2":
+                raise RuntimeError("throttled")
+            return "arn"
+
+        mock_start.side_effect = _start
+
+        event = {"Records": [
+            _record("m1", "ws-a", "vip"),
+            _record("m2", "ws-a", "vip"),
+            {"messageId": "m3", "body": "not json"},
+        ]}
+
+        result = handler(event, None)
+
+        assert result == {"batchItemFailures": [{"itemIdentifier": "m2"}]}
+
+    @patch("workflow_queue_processor.start_workflow_execution")
+    @patch("workflow_queue_processor.get_trigger_index_cache")
+    def test_failure_blocks_rest_of_message_group(self, mock_cache_fn, mock_start):
+        """A failed message also fails the later messages in its FIFO group."""
+        from workflow_queue_processor import handler
+
+        mock_cache = MagicMock()
+        mock_cache.get.side_effect = lambda ws: _index(ws, "vip")
+        mock_cache_fn.return_value = mock_cache
+
+        def _start(**kwargs):
+            if kwargs["contact_id"] == "contact-m2":
+                raise RuntimeError("throttled")
+            return "arn"
+
+        mock_start.side_effect = _start
+
+        def _grouped(message_id, workspace_id):
+            record = _record(message_id, workspace_id, "vip")
+            record["attributes"] = {"MessageGroupId": workspace_id}
+            return record
+
+        event = {"Records": [
+            _grouped("m1", "ws-a"),
+            _grouped("m2", "ws-a"),
+            _grouped("m3", "ws-a"),
+            _grouped("m4", "ws-b"),
+        ]}
+
+        result = handler(event, None)
+
+        assert result == {"batchItemFailures": [
+            {"itemIdentifier": "m2"},
+            {"itemIdentifier": "m3"},
+        ]}
+        started = sorted(call.kwargs["contact_id"] for call in mock_start.call_args_list)
+        assert started == ["contact-m1", "contact-m2", "contact-m4"]
+
+    @patch("workflow_queue_processor.process_queue_record")
+    def test_batch_mode_can_be_disabled(self, mock_process, monkeypatch):
+        """QUEUE_BATCH_MODE=false falls back to record-at-a-time processing."""
+        from workflow_queue_processor import handler
+
+        monkeypatch.setenv("QUEUE_BATCH_MODE", "false")
+
+        handler({"Records": [_record("m1", "ws-a", "vip")]}, None)
+
+        mock_process.assert_called_once()
@@ -0,0 +1,83 @@
+"""Tests for the Bedrock response cache."""
+
+import io
+import json
+
+import pytest
+
+from complens.services import ai_response_cache, ai_service
+from complens.services.ai_response_cache import AIResponseCache
+
+
+class FakeBedrock:
+    """Stands in for the bedrock-runtime client, counting invocations."""
+
+    def __init__(self, text: str = '{"answer": 42}'):
+        self.text = text
+        self.calls = 0
+
+    def invoke_model(self, modelId, body, contentType, accept):
+        self.calls += 1
+        payload = {
+            "content": [{"text": self.text}],
+            "usage": {"input_tokens": 120, "output_tokens": 30},
+        }
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+@pytest.fixture
+def bedrock(dynamodb_table, monkeypatch):
+    """Fake Bedrock client and a fresh response cache on the test table."""
+    fake = FakeBedrock()
+    monkeypatch.setattr(ai_service, "bedrock", fake)
+    monkeypatch.setattr(ai_response_cache, "_response_cache", AIResponseCache(dynamodb_table))
+    return fake
+
+
+class TestAIResponseCache:
+    """Tests for cached Bedrock invocations."""
+
+    def test_deterministic_calls_are_cached(self, bedrock):
+        first = ai_service.invoke_claude("Summarize", system="Be brief", temperature=0)
+        second = ai_service.invoke_claude("Summarize", system="Be brief", temperature=0)
+
+        assert first == second
+        assert bedrock.calls == 1
+        stats = ai_response_cache.get_ai_response_cache().get_statistics()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["tokens_saved"] == 150
+
+    def test_sampled_calls_bypass_cache_unless_opted_in(self, bedrock):
+        ai_service.invoke_claude_json("Suggest a step")
+        ai_service.invoke_claude_json("Suggest a step")
+        assert bedrock.calls == 2
+
+        ai_service.invoke_claude_json("Suggest a step", cache=True)
+        assert ai_service.invoke_claude_json("Suggest a step", cache=True) == {"answer": 42}
+        assert bedrock.calls == 3
+
+    def test_persisted_entries_survive_a_cold_container(self, bedrock):
+        ai_service.invoke_claude("Summarize", temperature=0)
+
+        ai_response_cache.get_ai_response_cache()._memory.clear()
+        ai_service.invoke_claude("Summarize", temperature=0)
+
+        assert bedrock.calls == 1
+        assert ai_response_cache.get_ai_response_cache().get_statistics()["table_hits"] == 1
+
+    def test_key_changes_with_request_inputs(self, bedrock):
+        ai_service.invoke_claude("Summarize", system="Profile v1", temperature=0)
+        ai_service.invoke_claude("Summarize", system="Profile v2", temperature=0)
+        ai_service.invoke_claude("Summarize", system="Profile v2", temperature=0, max_tokens=100)
+
+        assert bedrock.calls == 3
+
+    def test_unparseable_responses_are_not_cached(self, bedrock):
+        bedrock.text = "Sorry, I cannot help with that."
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                ai_service.invoke_claude_json("Suggest a step", cache=True)
+
+        assert bedrock.calls == 2
@@ -0,0 +1,145 @@
+"""Tests for stream-fed analytics rollups."""
+
+from datetime import date, datetime, timezone
+
+from boto3.dynamodb.types import TypeSerializer
+
+from complens.models.contact import Contact
+from complens.models.workflow import Workflow
+from complens.models.workflow_run import RunStatus, WorkflowRun
+from complens.services.analytics_rollups import (
+    RollupAggregator,
+    rebuild_workspace_rollups,
+    record_deltas,
+)
+
+WORKSPACE_ID = "ws-rollup-123"
+RECORDED_AT = datetime(2026, 3, 2, 12, tzinfo=timezone.utc).timestamp()
+
+_serializer = TypeSerializer()
+
+
+def _record(event_name: str, sk: str, new: dict | None = None, old: dict | None = None) -> dict:
+    stream = {
+        "Keys": {"PK": {"S": f"WS#{WORKSPACE_ID}"}, "SK": {"S": sk}},
+        "ApproximateCreationDateTime": RECORDED_AT,
+    }
+    for name, image in (("NewImage", new), ("OldImage", old)):
+        if image is not None:
+            image = {"workspace_id": WORKSPACE_ID, **image}
+            stream[name] = {k: _serializer.serialize(v) for k, v in image.items()}
+    return {"eventName": event_name, "dynamodb": stream}
+
+
+class TestRecordDeltas:
+    """Tests for mapping stream records to counter deltas."""
+
+    def test_contact_created_on_its_created_day(self):
+        record = _record("INSERT", "CONTACT#c1", new={"created_at": "2026-03-01T23:30:00+00:00"})
+
+        assert record_deltas(record) == [(WORKSPACE_ID, "2026-03-01", "contacts_created", 1)]
+
+    def test_contact_deleted(self):
+        record = _record("REMOVE", "CONTACT#c1", old={"created_at": "2026-01-01T00:00:00+00:00"})
+
+        assert record_deltas(record) == [(WORKSPACE_ID, "2026-03-02", "contacts_deleted", 1)]
+
+    def test_run_outcome_only_on_status_change(self):
+        completed = _record(
+            "MODIFY", "RUN#r1", new={"status": "completed"}, old={"status": "running"}
+        )
+        touched = _record(
+            "MODIFY", "RUN#r1", new={"status": "completed"}, old={"status": "completed"}
+        )
+
+        assert record_deltas(completed) == [(WORKSPACE_ID, "2026-03-02", "runs_completed", 1)]
+        assert record_deltas(touched) == []
+
+    def test_page_view_delta(self):
+        record = _record("MODIFY", "PAGE#p1", new={"view_count": 57}, old={"view_count": 50})
+
+        assert record_deltas(record) == [(WORKSPACE_ID, "2026-03-02", "page_views", 7)]
+
+    def test_first_chat_message_starts_session(self):
+        first = _record(
+            "MODIFY", "VISITOR#v_1", new={"total_chat_messages": 1}, old={"total_page_views": 3}
+        )
+        later = _record(
+            "MODIFY", "VISITOR#v_1", new={"total_chat_messages": 2}, old={"total_chat_messages": 1}
+        )
+
+        assert record_deltas(first) == [(WORKSPACE_ID, "2026-03-02", "chat_sessions", 1)]
+        assert record_deltas(later) == []
+
+    def test_unrelated_items_are_ignored(self):
+        assert record_deltas(_record("INSERT", "DEAL#d1", new={"title": "Deal"})) == []
+
+
+class TestRollupAggregator:
+    """Tests for coalesced rollup writes."""
+
+    def test_one_write_per_day_and_total(self, dynamodb_table):
+        from complens.repositories.analytics_rollup import AnalyticsRollupRepository
+
+        aggregator = RollupAggregator()
+        aggregator.add_records(
+            [_record("INSERT", f"CONTACT#c{i}", new={"created_at": "2026-03-02T08:00:00+00:00"})
+             for i in range(5)]
+            + [_record("INSERT", "SUB#s1", new={"created_at": "2026-03-01T08:00:00+00:00"})]
+        )
+
+        assert aggregator.flush() == {"written": 3, "errors": 0}
+        aggregator.add_record(_record("REMOVE", "CONTACT#c0", old={}))
+        aggregator.flush()
+
+        repo = AnalyticsRollupRepository()
+        days = repo.list_days(WORKSPACE_ID, date(2026, 3, 1), date(2026, 3, 2))
+        assert [(r.period, r.contacts_created, r.form_submissions) for r in days] == [
+            ("2026-03-01", 0, 1),
+            ("2026-03-02", 5, 0),
+        ]
+        totals = repo.get_totals(WORKSPACE_ID)
+        assert totals.contacts_created == 5
+        assert totals.contacts_deleted == 1
+
+
+class TestRebuild:
+    """Tests for backfilling rollups from entities."""
+
+    def test_rebuild_counts_entities(self, dynamodb_table):
+        from complens.repositories.analytics_rollup import AnalyticsRollupRepository
+        from complens.repositories.contact import ContactRepository
+        from complens.repositories.workflow import WorkflowRepository, WorkflowRunRepository
+
+        created = datetime(2026, 2, 10, 9, tzinfo=timezone.utc)
+        for i in range(3):
+            ContactRepository().create_contact(
+                Contact(workspace_id=WORKSPACE_ID, email=f"c{i}@example.com", created_at=created)
+            )
+        workflow = WorkflowRepository().create_workflow(
+            Workflow(workspace_id=WORKSPACE_ID, name="Nurture")
+        )
+        for status in (RunStatus.COMPLETED, RunStatus.FAILED, RunStatus.RUNNING):
+            WorkflowRunRepository().create_run(
+                WorkflowRun(
+                    workflow_id=workflow.id,
+                    workspace_id=WORKSPACE_ID,
+                    trigger_type="trigger_manual",
+                    status=status,
+                    created_at=created,
+                    completed_at=created,
+                )
+            )
+        # Stale rollup from before the rebuild
+        AnalyticsRollupRepository().add_counts(WORKSPACE_ID, "2020-01-01", {"page_views": 9})
+
+        totals = rebuild_workspace_rollups(WORKSPACE_ID)
+
+        assert totals.contacts_created == 3
+        assert totals.runs_started == 3
+        assert totals.runs_completed == 1
+        assert totals.runs_failed == 1
+        days = AnalyticsRollupRepository().list_days(
+            WORKSPACE_ID, date(2020, 1, 1), date(2026, 12, 31)
+        )
+        assert [r.period for r in days] == ["2026-02-10"]
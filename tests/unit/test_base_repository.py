@@ -0,0 +1,128 @@
+"""Tests for BaseRepository bulk operations."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from complens.models.contact import Contact
+from complens.utils.exceptions import ExternalServiceError
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+def _contacts(count):
+    """Build contacts with email and phone (GSI1 and GSI4 keys)."""
+    return [
+        Contact(
+            id=f"c{i:04d}",
+            workspace_id=WORKSPACE_ID,
+            email=f"user{i}@example.com",
+            phone=f"+1555000{i:04d}",
+        )
+        for i in range(count)
+    ]
+
+
+class TestBatchOperations:
+    """Tests for batch_get, batch_write and batch_delete."""
+
+    def test_batch_write_includes_all_gsi_keys(self, dynamodb_table):
+        """Every GSI the model defines is written, not just GSI1."""
+        from complens.repositories.contact import ContactRepository
+
+        ContactRepository().batch_write(_contacts(1))
+
+        item = dynamodb_table.get_item(Key={"PK": f"WS#{WORKSPACE_ID}", "SK": "CONTACT#c0000"})["Item"]
+        assert item["GSI1SK"] == "user0@example.com"
+        assert item["GSI4SK"] == "+15550000000"
+
+    def test_round_trip_across_chunks_in_parallel(self, dynamodb_table):
+        """Writes and reads spanning several chunks return every item once."""
+        from complens.repositories.contact import ContactRepository
+
+        repo = ContactRepository()
+        contacts = _contacts(230)
+        repo.batch_write(contacts, max_workers=4)
+
+        keys = [(c.get_pk(), c.get_sk()) for c in contacts]
+        fetched = repo.batch_get(keys + keys[:10], max_workers=3)
+
+        assert sorted(c.id for c in fetched) == [c.id for c in contacts]
+
+        assert repo.batch_delete(keys, max_workers=4) == 230
+        assert repo.batch_get(keys) == []
+
+    @patch("complens.repositories.base.time.sleep")
+    def test_unprocessed_keys_are_retried(self, mock_sleep):
+        """Throttled keys are requested again instead of being dropped."""
+        from complens.repositories.contact import ContactRepository
+
+        item = Contact(id="c1", workspace_id=WORKSPACE_ID).to_dynamodb()
+        unprocessed = {"Keys": [{"PK": f"WS#{WORKSPACE_ID}", "SK": "CONTACT#c1"}]}
+
+        repo = ContactRepository(table_name="complens-test")
+        repo._dynamodb = MagicMock()
+        client = repo._dynamodb.meta.client
+        client.batch_get_item.side_effect = [
+            {"Responses": {"complens-test": []}, "UnprocessedKeys": {"complens-test": unprocessed}},
+            {"Responses": {"complens-test": [item]}, "UnprocessedKeys": {}},
+        ]
+
+        fetched = repo.batch_get([(f"WS#{WORKSPACE_ID}", "CONTACT#c1")])
+
+        assert [c.id for c in fetched] == ["c1"]
+        assert client.batch_get_item.call_args_list[1].kwargs["RequestItems"] == {
+            "complens-test": unprocessed
+        }
+        mock_sleep.assert_called_once()
+
+    @patch("complens.repositories.base.time.sleep")
+    def test_persistent_unprocessed_writes_raise(self, mock_sleep):
+        """Writes still unprocessed after every retry surface an error."""
+        from complens.repositories.contact import ContactRepository
+
+        repo = ContactRepository(table_name="complens-test")
+        repo._dynamodb = MagicMock()
+        repo._dynamodb.meta.client.batch_write_item.side_effect = lambda RequestItems: {
+            "UnprocessedItems": RequestItems
+        }
+
+        with pytest.raises(ExternalServiceError):
+            repo.batch_write(_contacts(2))
+
+
+class TestIterQuery:
+    """Tests for the streaming, auto-paginating query iterator."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iterates_across_pages(self, dynamodb_table, prefetch):
+        """Every matching item is yielded, not just the first page."""
+        from complens.repositories.contact import ContactRepository
+
+        repo = ContactRepository()
+        repo.batch_write(_contacts(23))
+
+        contacts = list(repo.iter_query(
+            pk=f"WS#{WORKSPACE_ID}",
+            sk_begins_with="CONTACT#",
+            page_size=5,
+            prefetch=prefetch,
+        ))
+
+        assert [c.id for c in contacts] == [f"c{i:04d}" for i in range(23)]
+
+    def test_max_items_stops_early(self, dynamodb_table):
+        """Iteration stops after max_items without fetching further pages."""
+        from complens.repositories.contact import ContactRepository
+
+        repo = ContactRepository()
+        repo.batch_write(_contacts(12))
+
+        contacts = list(repo.iter_query(
+            pk=f"WS#{WORKSPACE_ID}",
+            sk_begins_with="CONTACT#",
+            page_size=5,
+            max_items=7,
+        ))
+
+        assert len(contacts) == 7
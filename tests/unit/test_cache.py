@@ -0,0 +1,134 @@
+"""Tests for warm-container TTL/LRU caches."""
+
+from unittest.mock import MagicMock, patch
+
+from complens.models.workspace import Workspace
+from complens.utils.cache import (
+    TTLCache,
+    get_cache,
+    get_cache_statistics,
+    maybe_log_cache_statistics,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl_seconds=10, clock=clock)
+        cache.set("a", 1)
+
+        assert cache.get("a") == (True, 1)
+        clock.now += 10
+        assert cache.get("a") == (False, None)
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.evictions == 1
+
+    def test_get_or_load_does_not_cache_missing_values(self):
+        cache = TTLCache(ttl_seconds=60)
+        loader = MagicMock(return_value=None)
+
+        assert cache.get_or_load("missing", loader) is None
+        loader.return_value = 1
+        assert cache.get_or_load("missing", loader) == 1
+        assert cache.get_or_load("missing", loader) == 1
+        assert loader.call_count == 2
+
+    def test_statistics(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.get_or_load("a", lambda: 1)
+        cache.get_or_load("a", lambda: 1)
+        cache.invalidate("a")
+        cache.get_or_load("a", lambda: 1)
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_rate"] == 0.333
+        assert stats["entries"] == 1
+
+
+class TestNamedCaches:
+    """Tests for process-wide named caches."""
+
+    def test_shared_by_name_with_env_ttl(self):
+        with patch.dict("os.environ", {"CACHE_TTL_TEST_ENV": "5"}):
+            cache = get_cache("test_env", ttl_seconds=60)
+
+        assert get_cache("test_env", ttl_seconds=1) is cache
+        assert cache.ttl_seconds == 5
+        assert "test_env" in get_cache_statistics()
+
+    def test_statistics_logged_once_per_interval(self, monkeypatch):
+        from complens.utils import cache as cache_module
+
+        clock = FakeClock()
+        monkeypatch.setattr(cache_module, "_last_stats_log", None)
+        monkeypatch.setattr(cache_module, "CACHE_STATS_INTERVAL_SECONDS", 60)
+        get_cache("test_stats", ttl_seconds=60).get_or_load("a", lambda: 1)
+        monkeypatch.setattr(cache_module, "_last_stats_log", None)
+
+        with patch.object(cache_module, "logger") as mock_logger:
+            assert maybe_log_cache_statistics(clock) is True
+            clock.now += 30
+            assert maybe_log_cache_statistics(clock) is False
+            clock.now += 30
+            assert maybe_log_cache_statistics(clock) is True
+
+        logged = [c.kwargs["cache"] for c in mock_logger.info.call_args_list]
+        assert logged.count("test_stats") == 2
+
+
+    def test_lookups_sample_statistics(self, monkeypatch):
+        from complens.utils import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "_last_stats_log", None)
+        monkeypatch.setattr(cache_module, "CACHE_STATS_INTERVAL_SECONDS", 60)
+        cache = get_cache("test_sampled", ttl_seconds=60)
+
+        with patch.object(cache_module, "logger") as mock_logger:
+            cache.get_or_load("a", lambda: 1)
+            cache.get("a")
+
+        logged = [c.kwargs["cache"] for c in mock_logger.info.call_args_list]
+        assert logged.count("test_sampled") == 1
+
+class TestWorkspacePlanCache:
+    """Tests for cached workspace lookups in the feature gate."""
+
+    def test_plan_lookup_cached_until_invalidated(self):
+        from complens.services.feature_gate import get_workspace_plan, invalidate_workspace_cache
+
+        workspace = Workspace(id="ws-1", agency_id="agency-1", name="Acme", slug="acme", plan="pro")
+        with patch("complens.repositories.workspace.WorkspaceRepository") as repo_cls:
+            repo_cls.return_value.get_by_id.return_value = workspace
+
+            assert get_workspace_plan("ws-1") == "pro"
+            assert get_workspace_plan("ws-1") == "pro"
+            assert repo_cls.return_value.get_by_id.call_count == 1
+
+            workspace.plan = "business"
+            invalidate_workspace_cache("ws-1")
+            assert get_workspace_plan("ws-1") == "business"
+            assert repo_cls.return_value.get_by_id.call_count == 2
@@ -0,0 +1,108 @@
+"""Tests for the circuit breaker registry persistence modes."""
+
+from complens.execution.circuit_breaker import (
+    CircuitBreakerConfig,
+    CircuitBreakerMode,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+
+CIRCUIT_ID = "twilio.send_sms"
+KEY = {"PK": f"CIRCUIT#{CIRCUIT_ID}", "SK": "STATE"}
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _registry(clock=None, **kwargs) -> CircuitBreakerRegistry:
+    return CircuitBreakerRegistry(
+        default_config=CircuitBreakerConfig(failure_threshold=3, recovery_timeout=60),
+        table_name="complens-test",
+        mode=CircuitBreakerMode.WRITE_BEHIND,
+        clock=clock or FakeClock(),
+        **kwargs,
+    )
+
+
+class TestModeSelection:
+    """Tests for choosing the persistence mode."""
+
+    def test_use_dynamodb_defaults_to_write_behind(self):
+        assert CircuitBreakerRegistry(use_dynamodb=True).mode == CircuitBreakerMode.WRITE_BEHIND
+        assert CircuitBreakerRegistry(use_dynamodb=False).mode == CircuitBreakerMode.LOCAL
+
+
+class TestWriteBehind:
+    """Tests for write-behind circuit state."""
+
+    def test_outcomes_are_flushed_as_batched_deltas(self, dynamodb_table):
+        registry = _registry(sync_batch_size=10)
+        registry.get_circuit(CIRCUIT_ID)
+
+        for _ in range(9):
+            registry.record_success(CIRCUIT_ID)
+        assert "Item" not in dynamodb_table.get_item(Key=KEY)
+
+        registry.record_success(CIRCUIT_ID)
+        item = dynamodb_table.get_item(Key=KEY)["Item"]
+        assert item["total_calls"] == 10
+        assert item["successful_calls"] == 10
+        assert registry.remote_calls == 2  # initial load + one flush
+
+    def test_interval_sync_and_explicit_flush(self, dynamodb_table):
+        clock = FakeClock()
+        registry = _registry(clock=clock)
+        registry.get_circuit(CIRCUIT_ID)
+        registry.record_failure(CIRCUIT_ID)
+
+        clock.now += 5
+        registry.record_success(CIRCUIT_ID)
+        assert dynamodb_table.get_item(Key=KEY)["Item"]["total_calls"] == 2
+
+        registry.record_success(CIRCUIT_ID)
+        assert registry.flush() == 1
+        assert registry.flush() == 0
+        item = dynamodb_table.get_item(Key=KEY)["Item"]
+        assert (item["total_calls"], item["failed_calls"]) == (3, 1)
+
+    def test_transition_is_persisted_and_adopted_by_other_containers(self, dynamodb_table):
+        clock = FakeClock()
+        first, second = _registry(clock=clock), _registry(clock=clock)
+        first.get_circuit(CIRCUIT_ID)
+        other = second.get_circuit(CIRCUIT_ID)
+
+        for _ in range(3):
+            first.record_failure(CIRCUIT_ID)
+
+        item = dynamodb_table.get_item(Key=KEY)["Item"]
+        assert item["state"] == CircuitState.OPEN.value
+        assert item["version"] == 1
+        assert other.state == CircuitState.CLOSED
+
+        clock.now += 5
+        assert second.get_circuit(CIRCUIT_ID).state == CircuitState.OPEN
+        assert other.version == 1
+
+    def test_losing_transition_adopts_stored_state(self, dynamodb_table):
+        first, second = _registry(), _registry()
+        first.get_circuit(CIRCUIT_ID)
+        loser = second.get_circuit(CIRCUIT_ID)
+
+        for _ in range(3):
+            first.record_failure(CIRCUIT_ID)
+        first.reset_circuit(CIRCUIT_ID)
+
+        # Second container still thinks version 0 and trips the circuit itself
+        for _ in range(3):
+            second.record_failure(CIRCUIT_ID)
+
+        assert loser.state == CircuitState.CLOSED
+        assert loser.version == 2
+        assert dynamodb_table.get_item(Key=KEY)["Item"]["state"] == CircuitState.CLOSED.value
@@ -0,0 +1,105 @@
+"""Tests for streaming contact exports and the S3 multipart writer."""
+
+import csv
+import gzip
+import io
+import json
+
+import boto3
+import pytest
+
+from complens.models.contact import Contact
+from complens.services.contact_export import ContactExporter
+from complens.utils.s3_multipart import MIN_PART_SIZE, S3MultipartWriter
+
+WORKSPACE_ID = "test-workspace-456"
+BUCKET = "complens-test-contact-files"
+
+
+@pytest.fixture
+def s3(dynamodb_table):
+    """Mocked S3 client with the contact files bucket."""
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket=BUCKET)
+    return client
+
+
+def _read(s3, key):
+    """Read an object's bytes."""
+    return s3.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+
+
+class TestS3MultipartWriter:
+    """Tests for S3MultipartWriter."""
+
+    def test_uploads_parts_as_buffer_fills(self, s3):
+        """Large writes are split into parts and reassembled in order."""
+        data = b"a" * MIN_PART_SIZE + b"b" * 100
+
+        with S3MultipartWriter(s3, BUCKET, "big.bin", part_size=MIN_PART_SIZE) as out:
+            out.write(data[:10])
+            out.write(data[10:])
+            assert len(out._buffer) == 100
+
+        assert _read(s3, "big.bin") == data
+
+    def test_aborts_on_error(self, s3):
+        """An exception inside the block leaves no object behind."""
+        with pytest.raises(RuntimeError):
+            with S3MultipartWriter(s3, BUCKET, "broken.bin") as out:
+                out.write(b"partial")
+                raise RuntimeError("boom")
+
+        assert s3.list_objects_v2(Bucket=BUCKET).get("KeyCount") == 0
+        assert not s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads")
+
+    def test_aborts_when_completion_fails(self, s3, monkeypatch):
+        """A failed complete_multipart_upload aborts the upload and re-raises."""
+        out = S3MultipartWriter(s3, BUCKET, "incomplete.bin")
+        out.write(b"data")
+
+        def fail(**kwargs):
+            raise RuntimeError("complete failed")
+
+        monkeypatch.setattr(s3, "complete_multipart_upload", fail)
+        with pytest.raises(RuntimeError, match="complete failed"):
+            out.close()
+
+        assert out.closed
+        assert not s3.list_multipart_uploads(Bucket=BUCKET).get("Uploads")
+
+
+class TestContactExporter:
+    """Tests for ContactExporter."""
+
+    @pytest.fixture(autouse=True)
+    def contacts(self, s3):
+        """Seed a few contacts."""
+        from complens.repositories.contact import ContactRepository
+
+        ContactRepository().batch_write([
+            Contact(
+                id=f"c{i}", workspace_id=WORKSPACE_ID, email=f"u{i}@example.com", tags=["a", "b"]
+            )
+            for i in range(3)
+        ])
+
+    def test_csv_export(self, s3):
+        """CSV exports include a header and one row per contact."""
+        count, size = ContactExporter(WORKSPACE_ID).run(s3, BUCKET, "out.csv")
+
+        rows = list(csv.DictReader(io.StringIO(_read(s3, "out.csv").decode())))
+        assert count == 3
+        assert size == s3.head_object(Bucket=BUCKET, Key="out.csv")["ContentLength"]
+        assert [r["email"] for r in rows] == ["u0@example.com", "u1@example.com", "u2@example.com"]
+        assert rows[0]["tags"] == "a,b"
+
+    def test_gzip_ndjson_export(self, s3):
+        """NDJSON exports can be gzip-compressed."""
+        exporter = ContactExporter(WORKSPACE_ID, "ndjson", compress=True)
+        exporter.run(s3, BUCKET, "out.ndjson.gz")
+
+        lines = gzip.decompress(_read(s3, "out.ndjson.gz")).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["c0", "c1", "c2"]
+        head = s3.head_object(Bucket=BUCKET, Key="out.ndjson.gz")
+        assert head["ContentType"] == "application/gzip"
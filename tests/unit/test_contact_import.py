@@ -0,0 +1,124 @@
+"""Tests for the bulk contact import engine."""
+
+import io
+from unittest.mock import MagicMock
+
+from complens.models.contact import Contact
+from complens.services.contact_import import ContactImporter
+
+WORKSPACE_ID = "test-workspace-456"
+MAPPING = {"Email": "email", "Phone": "phone", "First": "first_name", "Plan": "custom_fields.plan"}
+
+
+def _csv(*rows):
+    """Build CSV text with the standard header."""
+    return io.StringIO("\n".join(["Email,Phone,First,Plan", *rows]) + "\n")
+
+
+class TestContactImporter:
+    """Tests for ContactImporter."""
+
+    def test_dedups_within_file_and_against_existing(self, dynamodb_table):
+        """Repeated and existing emails are skipped; new rows are batch written."""
+        from complens.repositories.contact import ContactRepository
+
+        repo = ContactRepository()
+        repo.create_contact(Contact(workspace_id=WORKSPACE_ID, email="old@example.com"))
+
+        progress = ContactImporter(WORKSPACE_ID, MAPPING, repo=repo, batch_size=2).run(_csv(
+            "new@example.com,,Ann,pro",
+            "NEW@example.com,,Dupe,",
+            "old@example.com,,Existing,",
+            ",+15550000001,Phone,",
+            ",+15550000001,Phone again,",
+            ",,Nobody,",
+            f"long@example.com,,{'x' * 101},",
+        ))
+
+        assert progress.rows_processed == 7
+        assert progress.imported == 2
+        assert progress.skipped == 4
+        assert progress.error_count == 1
+        assert progress.errors[0]["row"] == 8
+
+        contacts = repo.iter_query(pk=f"WS#{WORKSPACE_ID}", sk_begins_with="CONTACT#")
+        stored = {c.first_name: c for c in contacts}
+        assert set(stored) == {None, "Ann", "Phone"}
+        assert stored["Ann"].custom_fields == {"plan": "pro"}
+
+    def test_streams_email_index_once_lookups_outgrow_it(self):
+        """Small workspaces resolve duplicates from one pass over the email index."""
+        repo = MagicMock()
+        repo.iter_emails.return_value = iter(["user3@example.com"])
+        reports = []
+
+        progress = ContactImporter(
+            WORKSPACE_ID,
+            MAPPING,
+            repo=repo,
+            existing_count=1,
+            batch_size=2,
+            on_progress=lambda p: reports.append(p.imported),
+        ).run(_csv(*(f"user{i}@example.com,,," for i in range(5))))
+
+        repo.iter_emails.assert_called_once_with(WORKSPACE_ID)
+        repo.find_existing_emails.assert_not_called()
+        assert repo.batch_write.call_count == 3
+        assert progress.imported == 4
+        assert reports == [2, 3, 4]
+
+    def test_large_workspace_uses_exact_lookups(self):
+        """Workspaces much larger than the import never stream the index."""
+        repo = MagicMock()
+        repo.find_existing_emails.return_value = {"user0@example.com"}
+
+        progress = ContactImporter(
+            WORKSPACE_ID, MAPPING, repo=repo, existing_count=100_000
+        ).run(_csv("user0@example.com,,,", "user1@example.com,,,"))
+
+        repo.iter_emails.assert_not_called()
+        assert progress.imported == 1
+        assert progress.skipped == 1
+
+    def test_failed_write_reports_rows_and_keeps_progress(self):
+        """A failed batch write becomes row errors; other chunks still import."""
+        repo = MagicMock()
+        repo.find_existing_emails.return_value = set()
+        repo.find_contact_ids_by_email.return_value = {}
+
+        def batch_write(contacts):
+            if any(c.email == "user30@example.com" for c in contacts):
+                raise RuntimeError("throttled")
+
+        repo.batch_write.side_effect = batch_write
+
+        progress = ContactImporter(WORKSPACE_ID, MAPPING, repo=repo).run(
+            _csv(*(f"user{i}@example.com,,," for i in range(40)))
+        )
+
+        # Rows 27-41 (the second 25-item chunk's 15 rows) failed
+        assert progress.imported == 25
+        assert progress.error_count == 15
+        assert progress.errors[0] == {"row": 27, "error": "Failed to save contact: throttled"}
+
+    def test_removes_duplicates_created_by_a_concurrent_writer(self, dynamodb_table):
+        """A contact that slipped past the existence check is deleted after the write."""
+        from complens.repositories.contact import ContactRepository
+
+        repo = ContactRepository()
+        original = repo.create_contact(Contact(workspace_id=WORKSPACE_ID, email="race@example.com"))
+        # Simulate the other writer landing between the check and the write
+        repo.find_existing_emails = MagicMock(return_value=set())
+
+        progress = ContactImporter(WORKSPACE_ID, MAPPING, repo=repo).run(_csv(
+            "race@example.com,,Late,",
+            "fresh@example.com,,Fresh,",
+        ))
+
+        assert progress.imported == 1
+        assert progress.skipped == 1
+        holders = repo.find_contact_ids_by_email(
+            WORKSPACE_ID, ["race@example.com", "fresh@example.com"]
+        )
+        assert holders["race@example.com"] == [original.id]
+        assert len(holders["fresh@example.com"]) == 1
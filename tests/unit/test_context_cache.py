@@ -0,0 +1,120 @@
+"""Tests for the warm-container execution context cache."""
+
+from unittest.mock import MagicMock
+
+from complens.execution.context_cache import ExecutionContextCache
+from complens.models.workflow import Workflow
+from complens.models.workflow_run import WorkflowRun
+from complens.models.workspace import Workspace
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+def _cache(workflow_ttl=300, settings_ttl=60):
+    """Build a cache backed by mock repositories."""
+    workflow_repo = MagicMock()
+    workflow_repo.get_by_id.return_value = Workflow(
+        id="wf-1", workspace_id=WORKSPACE_ID, name="Welcome", version=3
+    )
+    workspace_repo = MagicMock()
+    workspace_repo.get_by_id.return_value = Workspace(
+        id=WORKSPACE_ID,
+        agency_id="agency-1",
+        name="Acme",
+        slug="acme",
+        settings={"brand_color": "#000"},
+        notification_email="ops@acme.test",
+    )
+    site_repo = MagicMock()
+    cache = ExecutionContextCache(
+        workflow_ttl_seconds=workflow_ttl,
+        settings_ttl_seconds=settings_ttl,
+        workflow_repo=workflow_repo,
+        workspace_repo=workspace_repo,
+        site_repo=site_repo,
+    )
+    return cache, workflow_repo, workspace_repo, site_repo
+
+
+class TestExecutionContextCache:
+    """Tests for ExecutionContextCache."""
+
+    def test_workflow_cached_by_version(self):
+        """Repeated node executions for a run version hit the cache."""
+        cache, workflow_repo, _, _ = _cache()
+
+        first = cache.get_workflow(WORKSPACE_ID, "wf-1", version=3)
+        second = cache.get_workflow(WORKSPACE_ID, "wf-1", version=3)
+
+        assert first is second
+        assert workflow_repo.get_by_id.call_count == 1
+        assert cache.hits == 1
+
+    def test_latest_lookup_seeds_versioned_entry(self):
+        """Initializing a run warms the cache for its node executions."""
+        cache, workflow_repo, _, _ = _cache()
+
+        workflow = cache.get_workflow(WORKSPACE_ID, "wf-1")
+
+        assert cache.get_workflow(WORKSPACE_ID, "wf-1", version=workflow.version) is workflow
+        assert workflow_repo.get_by_id.call_count == 1
+
+    def test_new_version_is_a_miss(self):
+        """A run started on a newer version reloads the definition."""
+        cache, workflow_repo, _, _ = _cache()
+
+        cache.get_workflow(WORKSPACE_ID, "wf-1", version=3)
+        cache.get_workflow(WORKSPACE_ID, "wf-1", version=4)
+
+        assert workflow_repo.get_by_id.call_count == 2
+
+    def test_settings_expire_after_ttl(self):
+        """Workspace settings are re-read once the TTL has passed."""
+        cache, _, workspace_repo, _ = _cache(settings_ttl=0)
+
+        settings = cache.get_workspace_settings(WORKSPACE_ID)
+        cache.get_workspace_settings(WORKSPACE_ID)
+
+        assert settings["notification_email"] == "ops@acme.test"
+        assert settings["brand_color"] == "#000"
+        assert workspace_repo.get_by_id.call_count == 2
+
+    def test_unscoped_workflow_skips_site_lookup(self):
+        """Workflows without a site never read site settings."""
+        cache, _, _, site_repo = _cache()
+
+        assert cache.get_site_settings(WORKSPACE_ID, None) == {}
+        site_repo.get_by_id.assert_not_called()
+
+    def test_invalidate_workspace(self):
+        """Invalidating a workspace drops its workflows and settings."""
+        cache, workflow_repo, workspace_repo, _ = _cache()
+        cache.get_workflow(WORKSPACE_ID, "wf-1", version=3)
+        cache.get_workspace_settings(WORKSPACE_ID)
+
+        cache.invalidate_workspace(WORKSPACE_ID)
+        cache.get_workflow(WORKSPACE_ID, "wf-1", version=3)
+        cache.get_workspace_settings(WORKSPACE_ID)
+
+        assert workflow_repo.get_by_id.call_count == 2
+        assert workspace_repo.get_by_id.call_count == 2
+
+    def test_run_fields_cached_after_first_load(self):
+        """A run is read once per container and rebuilt from its fields."""
+        run_repo = MagicMock()
+        run_repo.get_by_id.return_value = WorkflowRun(
+            id="run-1",
+            workflow_id="wf-1",
+            workspace_id=WORKSPACE_ID,
+            contact_id="c-1",
+            trigger_type="trigger_form_submitted",
+            trigger_data={"form_id": "f-1"},
+        )
+        cache = ExecutionContextCache(run_repo=run_repo)
+
+        cache.get_run(WORKSPACE_ID, "wf-1", "run-1")
+        run = cache.get_run(WORKSPACE_ID, "wf-1", "run-1")
+
+        assert run_repo.get_by_id.call_count == 1
+        assert run.contact_id == "c-1"
+        assert run.trigger_data == {"form_id": "f-1"}
@@ -0,0 +1,150 @@
+"""Tests for deficit round-robin dispatch of queue batches."""
+
+import boto3
+from moto import mock_aws
+
+from complens.queue.dispatch import (
+    Deferral,
+    DeferralSchedule,
+    deficit_round_robin,
+    defer_messages,
+    plan_dispatch,
+    queue_url_from_arn,
+)
+from complens.queue.fair_scheduler import FairScheduler, TenantTier
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeficitRoundRobin:
+    """Tests for the ordering stage."""
+
+    def test_equal_weights_interleave(self):
+        flows = {"noisy": ["n1", "n2", "n3", "n4"], "quiet": ["q1", "q2"]}
+
+        order = deficit_round_robin(flows, {"noisy": 1, "quiet": 1})
+
+        assert [item for _, item in order] == ["n1", "q1", "n2", "q2", "n3", "n4"]
+
+    def test_weights_set_share_per_round(self):
+        flows = {"free": ["f1", "f2", "f3"], "pro": ["p1", "p2", "p3", "p4", "p5"]}
+
+        order = deficit_round_robin(flows, {"free": 1, "pro": 2})
+
+        assert [item for _, item in order] == ["f1", "p1", "p2", "f2", "p3", "p4", "f3", "p5"]
+
+    def test_costly_items_accumulate_deficit(self):
+        flows = {"low": ["l1", "l2"], "normal": ["n1", "n2", "n3"]}
+        cost = {"l1": 2, "l2": 2}
+
+        order = deficit_round_robin(
+            flows, {"low": 1, "normal": 1}, cost=lambda item: cost.get(item, 1)
+        )
+
+        assert [item for _, item in order] == ["n1", "l1", "n2", "n3", "l2"]
+
+
+class TestPlanDispatch:
+    """Tests for admission and deferral."""
+
+    def test_over_quota_messages_deferred_with_spread_delays(self):
+        scheduler = FairScheduler(refresh_interval=60, use_dynamodb=False, clock=FakeClock())
+        flows = {
+            "ws-noisy": [f"n{i}" for i in range(14)],
+            "ws-pro": ["p1", "p2"],
+        }
+        tiers = {"ws-noisy": TenantTier.FREE, "ws-pro": TenantTier.PROFESSIONAL}
+
+        plan = plan_dispatch(
+            flows, scheduler, tiers, priority=lambda _: "normal", deferrals=DeferralSchedule()
+        )
+
+        # The professional tenant is dispatched first despite arriving second
+        assert plan.admitted[:3] == [("ws-noisy", "n0"), ("ws-pro", "p1"), ("ws-pro", "p2")]
+        assert len(plan.admitted) == 12
+        # Free tier: 10 credits per minute, one every 6 seconds
+        assert plan.deferred == [
+            ("ws-noisy", "n10", 60),
+            ("ws-noisy", "n11", 66),
+            ("ws-noisy", "n12", 72),
+            ("ws-noisy", "n13", 78),
+        ]
+
+    def test_deferrals_continue_across_batches(self):
+        clock = FakeClock()
+        scheduler = FairScheduler(refresh_interval=60, use_dynamodb=False, clock=clock)
+        deferrals = DeferralSchedule()
+        tiers = {"ws-noisy": TenantTier.FREE}
+
+        def dispatch(prefix):
+            flows = {"ws-noisy": [f"{prefix}{i}" for i in range(12)]}
+            return plan_dispatch(
+                flows, scheduler, tiers, priority=lambda _: "normal", deferrals=deferrals
+            )
+
+        first = dispatch("a")
+        clock.now += 10
+        second = dispatch("b")
+
+        assert [delay for _, _, delay in first.deferred] == [60, 66]
+        # Slots continue after the first batch's deferrals (72s and 78s from its start)
+        assert [delay for _, _, delay in second.deferred[:2]] == [62, 68]
+        assert len(second.deferred) == 12
+
+    def test_unscheduled_workspaces_always_admitted(self):
+        scheduler = FairScheduler(refresh_interval=60, use_dynamodb=False, clock=FakeClock())
+        flows = {"ws-a": [f"a{i}" for i in range(15)]}
+
+        plan = plan_dispatch(
+            flows, scheduler, {"ws-a": TenantTier.FREE}, priority=lambda _: "normal", scheduled=()
+        )
+
+        assert len(plan.admitted) == 15
+        assert plan.deferred == []
+
+
+class TestDeferMessages:
+    """Tests for visibility changes."""
+
+    def test_queue_url_from_arn(self):
+        assert queue_url_from_arn("arn:aws:sqs:us-east-1:123456789012:shard-0") == (
+            "https://sqs.us-east-1.amazonaws.com/123456789012/shard-0"
+        )
+        assert queue_url_from_arn("not-an-arn") is None
+
+    def test_defer_messages_changes_visibility(self, aws_credentials, monkeypatch):
+        with mock_aws():
+            sqs = boto3.client("sqs", region_name="us-east-1")
+            monkeypatch.setattr("complens.queue.dispatch._sqs_client", sqs)
+            queue_url = sqs.create_queue(QueueName="complens-shard-0")["QueueUrl"]
+            arn = sqs.get_queue_attributes(
+                QueueUrl=queue_url, AttributeNames=["QueueArn"]
+            )["Attributes"]["QueueArn"]
+            for i in range(12):
+                sqs.send_message(QueueUrl=queue_url, MessageBody=str(i))
+
+            received = []
+            while len(received) < 12:
+                received += sqs.receive_message(
+                    QueueUrl=queue_url, MaxNumberOfMessages=10, VisibilityTimeout=300
+                ).get("Messages", [])
+
+            # Shorten the first five messages' visibility so they come straight back
+            deferred = defer_messages([
+                Deferral(m["MessageId"], m["ReceiptHandle"], arn, delay_seconds=0 if i < 5 else 120)
+                for i, m in enumerate(received)
+            ])
+
+            assert deferred == 12
+            visible = sqs.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10)
+            assert sorted(m["MessageId"] for m in visible["Messages"]) == sorted(
+                m["MessageId"] for m in received[:5]
+            )
@@ -2,10 +2,11 @@
 
 import pytest
 from datetime import datetime, timezone
+from decimal import Decimal
 
 from complens.models.base import BaseModel, generate_ulid
 from complens.models.contact import Contact, CreateContactRequest
-from complens.models.workflow import Workflow, WorkflowStatus
+from complens.models.workflow import Workflow, WorkflowEdge, WorkflowStatus
 from complens.models.workflow_node import NodeType, WorkflowNode
 
 
@@ -68,6 +69,36 @@ class TestBaseModel:
         assert contact.email == "test@example.com"
         assert isinstance(contact.created_at, datetime)
 
+    def test_deserialization_converts_nested_decimals(self):
+        """Test Decimals are converted in nested models and free-form dicts."""
+        db_item = {
+            "PK": "WS#ws-456",
+            "SK": "WF#wf-1",
+            "id": "wf-1",
+            "workspace_id": "ws-456",
+            "name": "Flow",
+            "version": Decimal("3"),
+            "nodes": [{
+                "id": "n1",
+                "type": "action_wait",
+                "position": {"x": Decimal("10.5"), "y": Decimal("2")},
+                "data": {"config": {"wait_seconds": Decimal("60"), "note": "2024-01-01"}},
+            }],
+            "created_at": "2024-01-01T12:00:00Z",
+            "updated_at": "2024-01-01T12:00:00Z",
+        }
+
+        workflow = Workflow.from_dynamodb(db_item)
+
+        assert workflow.version == 3
+        node = workflow.nodes[0]
+        assert node.position.x == 10.5
+        assert node.data["config"]["wait_seconds"] == 60
+        assert isinstance(node.data["config"]["wait_seconds"], int)
+        # Free-form strings are not parsed as datetimes
+        assert node.data["config"]["note"] == "2024-01-01"
+        assert workflow.created_at.tzinfo is not None
+
 
 class TestContact:
     """Tests for Contact model."""
@@ -183,6 +214,39 @@ class TestWorkflow:
         assert sample_workflow.get_pk() == "WS#test-workspace-456"
         assert sample_workflow.get_sk() == "WF#test-workflow-789"
 
+    def test_workflow_graph_cached(self, sample_workflow):
+        """Test adjacency is compiled once and reused."""
+        graph = sample_workflow.graph
+
+        assert sample_workflow.graph is graph
+        assert sample_workflow.get_trigger_node().id == "trigger-1"
+        assert [e.target for e in sample_workflow.get_outgoing_edges("trigger-1")] == ["action-1"]
+
+    def test_workflow_graph_rebuilt_on_change(self, sample_workflow):
+        """Test adjacency picks up added nodes and edges."""
+        sample_workflow.get_node_by_id("trigger-1")
+
+        sample_workflow.nodes.append(
+            WorkflowNode(id="action-2", node_type="action_send_email", data={})
+        )
+        sample_workflow.edges.append(
+            WorkflowEdge(id="edge-2", source="action-1", target="action-2")
+        )
+
+        assert sample_workflow.get_node_by_id("action-2") is not None
+        assert [n.id for n in sample_workflow.get_next_nodes("action-1")] == ["action-2"]
+
+    def test_workflow_graph_rebuilt_on_in_place_replacement(self, sample_workflow):
+        """Test adjacency picks up same-size replacements once the revision changes."""
+        sample_workflow.get_node_by_id("trigger-1")
+
+        sample_workflow.nodes[1] = WorkflowNode(id="action-9", node_type="action_send_email", data={})
+        sample_workflow.edges[0] = WorkflowEdge(id="edge-9", source="trigger-1", target="action-9")
+        sample_workflow.increment_version()
+
+        assert sample_workflow.get_node_by_id("action-1") is None
+        assert [n.id for n in sample_workflow.get_next_nodes("trigger-1")] == ["action-9"]
+
 
 class TestWorkflowNode:
     """Tests for WorkflowNode model."""
@@ -0,0 +1,142 @@
+"""Tests for buffered page-view aggregation."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from complens.models.page import Page, PageStatus
+from complens.services.page_views import PageView, PageViewAggregator
+
+WORKSPACE_ID = "ws-views-123"
+
+
+def _view(page_id="p1", visitor_id="v_one", at="2026-01-01T00:00:00", **kwargs) -> PageView:
+    return PageView(
+        workspace_id=WORKSPACE_ID,
+        page_id=page_id,
+        visitor_id=visitor_id,
+        viewed_at=at,
+        **kwargs,
+    )
+
+
+class TestPageViewMessage:
+    """Tests for the queue message format."""
+
+    def test_round_trip_omits_empty_fields(self):
+        view = _view(utm_source="ads", ip="1.2.3.4")
+
+        message = view.to_message()
+
+        assert "utm_medium" not in message
+        assert PageView.from_message(message) == view
+
+    def test_rejects_missing_ids(self):
+        with pytest.raises(ValueError):
+            PageView.from_message('{"page_id": "p1"}')
+
+
+class TestPageViewAggregator:
+    """Tests for coalescing and writing page views."""
+
+    def test_coalesces_writes_per_page_and_visitor(self):
+        page_repo, visitor_repo = MagicMock(), MagicMock()
+        aggregator = PageViewAggregator(page_repo=page_repo, visitor_repo=visitor_repo)
+
+        aggregator.add_all([
+            _view("p1", "v_one", "2026-01-01T00:00:02", referrer="https://b.example"),
+            _view("p1", "v_one", "2026-01-01T00:00:01", referrer="https://a.example"),
+            _view("p2", "v_one", "2026-01-01T00:00:03"),
+            _view("p1", "v_two", "2026-01-01T00:00:04"),
+        ])
+        stats = aggregator.flush()
+
+        assert stats.views == 4
+        assert stats.page_writes == 2
+        assert stats.visitor_writes == 2
+        page_repo.increment_view_count.assert_any_call(WORKSPACE_ID, "p1", 3)
+        page_repo.increment_view_count.assert_any_call(WORKSPACE_ID, "p2", 1)
+
+        calls = {c.kwargs["visitor_id"]: c.kwargs for c in visitor_repo.record_page_views.call_args_list}
+        one = calls["v_one"]
+        # Ordered by view time, not arrival
+        assert one["page_ids"] == ["p1", "p1", "p2"]
+        assert one["referrer"] == "https://a.example"
+        assert one["seen_at"] == "2026-01-01T00:00:03"
+
+    def test_drops_views_over_ip_limit(self):
+        page_repo = MagicMock()
+        aggregator = PageViewAggregator(
+            page_repo=page_repo, visitor_repo=MagicMock(), max_views_per_ip=2
+        )
+
+        accepted = [aggregator.add(_view(ip="9.9.9.9")) for _ in range(5)]
+        stats = aggregator.flush()
+
+        assert accepted == [True, True, False, False, False]
+        assert stats.dropped == 3
+        page_repo.increment_view_count.assert_called_once_with(WORKSPACE_ID, "p1", 2)
+
+    def test_failed_write_is_counted_not_raised(self):
+        page_repo = MagicMock()
+        page_repo.increment_view_count.side_effect = Exception("throttled")
+        aggregator = PageViewAggregator(page_repo=page_repo, visitor_repo=MagicMock())
+
+        aggregator.add(_view())
+        stats = aggregator.flush()
+
+        assert stats.errors == 1
+        assert stats.visitor_writes == 1
+
+    def test_flush_resets_batch(self):
+        aggregator = PageViewAggregator(page_repo=MagicMock(), visitor_repo=MagicMock())
+        aggregator.add(_view())
+        aggregator.flush()
+
+        assert aggregator.flush().views == 0
+
+    def test_writes_dynamodb(self, dynamodb_table):
+        from complens.repositories.page import PageRepository
+        from complens.repositories.visitor import VisitorRepository
+
+        page = PageRepository().create_page(
+            Page(workspace_id=WORKSPACE_ID, name="P", slug="p", status=PageStatus.PUBLISHED)
+        )
+        aggregator = PageViewAggregator()
+        aggregator.add_all([
+            _view(page.id, "v_one", "2026-01-01T00:00:01", utm_source="ads"),
+            _view(page.id, "v_one", "2026-01-01T00:00:02"),
+            _view("missing-page", "v_one", "2026-01-01T00:00:03"),
+        ])
+        aggregator.flush()
+
+        assert PageRepository().get_by_id(WORKSPACE_ID, page.id).view_count == 2
+        visitor = VisitorRepository().get_by_visitor_id(WORKSPACE_ID, "v_one")
+        assert visitor.total_page_views == 3
+        assert visitor.first_page_id == page.id
+        assert visitor.last_page_id == "missing-page"
+        assert visitor.first_utm_source == "ads"
+        assert visitor.pages_visited == [page.id, "missing-page"]
+
+    def test_out_of_order_batch_keeps_last_touch(self, dynamodb_table):
+        from complens.repositories.visitor import VisitorRepository
+
+        repo = VisitorRepository()
+        repo.record_page_views(WORKSPACE_ID, "v_two", ["p-new"], seen_at="2026-01-01T00:05:00")
+        repo.record_page_views(WORKSPACE_ID, "v_two", ["p-old"], seen_at="2026-01-01T00:01:00")
+
+        visitor = repo.get_by_visitor_id(WORKSPACE_ID, "v_two")
+        assert visitor.total_page_views == 2
+        assert visitor.last_page_id == "p-new"
+        assert visitor.last_seen == "2026-01-01T00:05:00"
+
+    def test_count_chat_visitors(self, dynamodb_table):
+        from complens.repositories.visitor import VisitorRepository
+
+        repo = VisitorRepository()
+        repo.record_page_views(WORKSPACE_ID, "v_quiet", ["p1"])
+        repo.record_page_views(WORKSPACE_ID, "v_chatty", ["p1"])
+        repo.increment_chat_messages(WORKSPACE_ID, "v_chatty")
+        repo.increment_chat_messages(WORKSPACE_ID, "v_chatty")
+
+        assert repo.count_chat_visitors(WORKSPACE_ID) == 1
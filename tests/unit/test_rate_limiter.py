@@ -2,9 +2,13 @@
 
 import json
 
+import boto3
 import pytest
 
+from complens.utils import rate_limiter
 from complens.utils.rate_limiter import (
+    RateLimiter,
+    RateLimitMode,
     RateLimitResult,
     check_rate_limit,
     get_client_ip,
@@ -12,6 +16,29 @@ from complens.utils.rate_limiter import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Drop the process-wide limiter's local state between tests."""
+    rate_limiter._rate_limiter = None
+    yield
+    rate_limiter._rate_limiter = None
+
+
+class FakeClock:
+    """Controllable time source."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(mode: RateLimitMode, clock: FakeClock, **kwargs) -> RateLimiter:
+    table = boto3.resource("dynamodb", region_name="us-east-1").Table("complens-test")
+    return RateLimiter(mode=mode, table=table, clock=clock, **kwargs)
+
+
 class TestRateLimiter:
     """Tests for check_rate_limit and rate_limit_response."""
 
@@ -108,6 +135,150 @@ class TestRateLimiter:
         assert body["error_code"] == "RATE_LIMITED"
 
 
+class TestTokenBucketMode:
+    """Tests for the locally pre-checked token bucket mode."""
+
+    def test_far_from_limit_stays_local(self, dynamodb_table):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitMode.TOKEN_BUCKET, clock, sync_batch_size=100)
+
+        for _ in range(50):
+            assert limiter.check("ip", "test", 100, 1000).allowed
+
+        assert limiter.remote_calls == 0
+
+    def test_syncs_coalesced_counts(self, dynamodb_table):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitMode.TOKEN_BUCKET, clock, sync_interval=5)
+
+        for _ in range(3):
+            limiter.check("ip", "test", 5, 1000)
+        limiter.check("one-off", "test", 5, 1000)
+        clock.now += 6
+        limiter.check("other-ip", "test", 5, 1000)
+
+        # One ADD of 3 for the minute window; counts far below a limit stay local
+        assert limiter.remote_calls == 1
+        minute = int(clock.now - 6) // 60
+        item = dynamodb_table.get_item(
+            Key={"PK": f"RATELIMIT#test#MIN#{minute}", "SK": "ip"}
+        )["Item"]
+        assert item["count"] == 3
+
+    def test_near_limit_goes_remote_and_sees_other_containers(self, dynamodb_table):
+        clock = FakeClock(1_700_000_010.0)
+        first = _limiter(RateLimitMode.TOKEN_BUCKET, clock)
+        second = _limiter(RateLimitMode.TOKEN_BUCKET, clock)
+
+        for _ in range(5):
+            assert first.check("ip", "test", 10, 100).allowed
+        first.flush(force=True)
+
+        results = [second.check("ip", "test", 10, 100).allowed for _ in range(10)]
+
+        # The second container learns about the first one's requests once its own
+        # estimate nears the limit, so the overshoot is bounded by that threshold
+        assert results == [True] * 8 + [False] * 2
+        assert second.remote_calls == 1
+
+    def test_local_bucket_rejects_bursts_without_remote_call(self, dynamodb_table):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitMode.TOKEN_BUCKET, clock, near_limit_ratio=2)
+
+        for _ in range(5):
+            assert limiter.check("ip", "test", 5, 100).allowed
+        calls = limiter.remote_calls
+        result = limiter.check("ip", "test", 5, 100)
+
+        assert result.allowed is False
+        assert result.retry_after >= 1
+        assert limiter.remote_calls == calls
+
+    def test_local_state_is_bounded(self, dynamodb_table):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitMode.TOKEN_BUCKET, clock, max_entries=4)
+
+        for i in range(10):
+            assert limiter.check(f"ip-{i}", "test", 100, 1000).allowed
+
+        assert len(limiter._buckets) == 4
+        assert len(limiter._counters) == 4
+        assert ("test", "ip-9") in limiter._buckets
+        assert limiter.remote_calls == 0
+
+    def test_evicted_counts_worth_keeping_are_synced(self, dynamodb_table):
+        clock = FakeClock()
+        limiter = _limiter(
+            RateLimitMode.TOKEN_BUCKET, clock, max_entries=2, sync_min_ratio=0
+        )
+
+        for _ in range(3):
+            limiter.check("ip", "test", 100, 1000)
+        limiter.check("other-ip", "test", 100, 1000)
+
+        # Both of "ip"'s window counters were evicted and written on the way out
+        assert limiter.remote_calls == 2
+        minute = int(clock.now) // 60
+        item = dynamodb_table.get_item(
+            Key={"PK": f"RATELIMIT#test#MIN#{minute}", "SK": "ip"}
+        )["Item"]
+        assert item["count"] == 3
+
+    def test_fails_open_on_dynamodb_error(self, dynamodb_table):
+        clock = FakeClock()
+        table = boto3.resource("dynamodb", region_name="us-east-1").Table("missing")
+        limiter = RateLimiter(
+            mode=RateLimitMode.TOKEN_BUCKET, table=table, clock=clock, near_limit_ratio=0
+        )
+
+        result = limiter.check("ip", "test", 5, 100)
+
+        assert result.allowed is True
+        assert result.requests_remaining == -1
+
+
+class TestSlidingLogMode:
+    """Tests for precise sliding-window-log enforcement."""
+
+    def test_enforces_exact_rolling_window(self, dynamodb_table):
+        clock = FakeClock(1_700_000_050.0)
+        limiter = _limiter(RateLimitMode.SLIDING_LOG, clock)
+
+        for _ in range(3):
+            assert limiter.check("ip", "test", 3, 100).allowed
+            clock.now += 5
+
+        # A fixed window would have reset at the minute boundary
+        blocked = limiter.check("ip", "test", 3, 100)
+        assert blocked.allowed is False
+        assert blocked.retry_after == 45
+
+        clock.now += 45
+        assert limiter.check("ip", "test", 3, 100).allowed
+
+    def test_hour_limit(self, dynamodb_table):
+        clock = FakeClock()
+        limiter = _limiter(RateLimitMode.SLIDING_LOG, clock)
+
+        for _ in range(2):
+            assert limiter.check("ip", "test", 10, 2).allowed
+            clock.now += 120
+
+        assert limiter.check("ip", "test", 10, 2).allowed is False
+
+
+class TestFixedWindowMode:
+    """Tests for the per-request fixed window mode."""
+
+    def test_two_remote_calls_per_request(self, dynamodb_table):
+        limiter = _limiter(RateLimitMode.FIXED_WINDOW, FakeClock())
+
+        for _ in range(4):
+            limiter.check("ip", "test", 10, 100)
+
+        assert limiter.remote_calls == 8
+
+
 class TestGetClientIp:
     """Tests for get_client_ip."""
 
@@ -0,0 +1,125 @@
+"""Tests for maintained resource counters."""
+
+from boto3.dynamodb.types import TypeSerializer
+
+WORKSPACE_ID = "ws-counters-123"
+
+
+def _put(table, sk: str, workspace_id: str = WORKSPACE_ID) -> None:
+    table.put_item(Item={"PK": f"WS#{workspace_id}", "SK": sk})
+
+
+def _record(event_name: str, pk: str, sk: str, created: int | None = None) -> dict:
+    serializer = TypeSerializer()
+    record = {
+        "eventName": event_name,
+        "dynamodb": {"Keys": {"PK": serializer.serialize(pk), "SK": serializer.serialize(sk)}},
+    }
+    if created is not None:
+        record["dynamodb"]["ApproximateCreationDateTime"] = created
+    return record
+
+
+class TestGetResourceCounts:
+    """Tests for reading counters."""
+
+    def test_initializes_from_items_on_first_read(self, dynamodb_table):
+        from complens.services.resource_counters import get_resource_count, get_resource_counts
+
+        for i in range(3):
+            _put(dynamodb_table, f"CONTACT#c{i}")
+        _put(dynamodb_table, "PAGE#p1")
+        _put(dynamodb_table, "MEMBER#u1")
+
+        counts = get_resource_counts(WORKSPACE_ID)
+
+        assert counts.counts() == {
+            "contacts": 3, "pages": 1, "workflows": 0, "forms": 0, "sites": 0,
+        }
+        assert counts.reconciled_at is not None
+        stored = dynamodb_table.get_item(Key={"PK": f"WS#{WORKSPACE_ID}", "SK": "COUNTERS"})
+        assert int(stored["Item"]["contacts"]) == 3
+
+        # Later reads use the stored counters rather than recounting
+        _put(dynamodb_table, "CONTACT#c3")
+        assert get_resource_count(WORKSPACE_ID, "contacts") == 3
+
+
+class TestResourceCounterAggregator:
+    """Tests for applying stream deltas."""
+
+    def test_coalesces_deltas_per_workspace(self, dynamodb_table):
+        from complens.services.resource_counters import (
+            ResourceCounterAggregator,
+            get_resource_counts,
+        )
+
+        get_resource_counts(WORKSPACE_ID)
+        aggregator = ResourceCounterAggregator()
+        records = [_record("INSERT", f"WS#{WORKSPACE_ID}", f"CONTACT#c{i}") for i in range(4)]
+        records += [
+            _record("REMOVE", f"WS#{WORKSPACE_ID}", "CONTACT#c0"),
+            _record("INSERT", f"WS#{WORKSPACE_ID}", "SITE#s1"),
+            _record("MODIFY", f"WS#{WORKSPACE_ID}", "CONTACT#c1"),
+            _record("INSERT", f"WS#{WORKSPACE_ID}", "MEMBER#u1"),
+            _record("INSERT", f"WS#{WORKSPACE_ID}#ROLLUP", "PAGE#p1"),
+        ]
+
+        assert aggregator.add_records(records) == 6
+        assert aggregator.flush() == {"updated": 1, "uninitialized": 0, "errors": 0}
+
+        counts = get_resource_counts(WORKSPACE_ID)
+        assert counts.contacts == 3
+        assert counts.sites == 1
+
+    def test_skips_changes_already_in_the_initial_count(self, dynamodb_table):
+        from complens.services.resource_counters import (
+            ResourceCounterAggregator,
+            get_resource_counts,
+        )
+
+        _put(dynamodb_table, "CONTACT#c0")
+        counted_at = get_resource_counts(WORKSPACE_ID).counted_at
+        aggregator = ResourceCounterAggregator()
+        aggregator.add_records([
+            # Written before the count, so already counted
+            _record("INSERT", f"WS#{WORKSPACE_ID}", "CONTACT#c0", created=counted_at - 5),
+            _record("INSERT", f"WS#{WORKSPACE_ID}", "CONTACT#c1", created=counted_at + 1),
+        ])
+
+        assert aggregator.flush() == {"updated": 1, "uninitialized": 0, "errors": 0}
+        assert get_resource_counts(WORKSPACE_ID).contacts == 2
+
+    def test_skips_uninitialized_workspaces(self, dynamodb_table):
+        from complens.services.resource_counters import ResourceCounterAggregator
+
+        aggregator = ResourceCounterAggregator()
+        aggregator.add_record(_record("INSERT", f"WS#{WORKSPACE_ID}", "CONTACT#c1"))
+
+        assert aggregator.flush() == {"updated": 0, "uninitialized": 1, "errors": 0}
+        stored = dynamodb_table.get_item(Key={"PK": f"WS#{WORKSPACE_ID}", "SK": "COUNTERS"})
+        assert "Item" not in stored
+
+
+class TestReconcileAll:
+    """Tests for parallel-scan reconciliation."""
+
+    def test_corrects_drift(self, dynamodb_table):
+        from complens.models.resource_counts import ResourceCounts
+        from complens.repositories.resource_counts import ResourceCountsRepository
+        from complens.services.resource_counters import get_resource_counts, reconcile_all
+
+        for i in range(2):
+            _put(dynamodb_table, f"WF#w{i}")
+        _put(dynamodb_table, "FORM#f1", workspace_id="ws-other")
+        repo = ResourceCountsRepository()
+        repo.save(ResourceCounts(workspace_id=WORKSPACE_ID, workflows=5, contacts=1))
+
+        assert reconcile_all(total_segments=4) == {"workspaces": 2, "corrected": 2}
+
+        assert get_resource_counts(WORKSPACE_ID).counts()["workflows"] == 2
+        assert get_resource_counts(WORKSPACE_ID).contacts == 0
+        assert repo.get_counts("ws-other").forms == 1
+
+        # A second run finds nothing to fix
+        assert reconcile_all(total_segments=4) == {"workspaces": 2, "corrected": 0}
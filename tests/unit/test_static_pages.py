@@ -0,0 +1,236 @@
+"""Tests for pre-rendered static landing pages."""
+
+import os
+from unittest.mock import patch
+
+import boto3
+import pytest
+
+from complens.models.page import Page, PageStatus
+from complens.models.site import Site
+
+WORKSPACE_ID = "ws-static-123"
+BUCKET = "complens-test-static-pages"
+
+
+@pytest.fixture
+def static_bucket(dynamodb_table):
+    """Create the static pages bucket and stub out CDN invalidation."""
+    from complens.services import static_pages
+
+    static_pages._s3_client = None
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket=BUCKET)
+
+    with patch.dict(os.environ, {"STATIC_PAGES_BUCKET": BUCKET}), \
+            patch("complens.services.static_pages.invalidate_page_cache") as invalidate:
+        yield s3, invalidate
+    static_pages._s3_client = None
+
+
+def _create_page(**kwargs) -> Page:
+    from complens.repositories.page import PageRepository
+
+    page = Page(
+        workspace_id=WORKSPACE_ID,
+        name="Landing",
+        slug=kwargs.pop("slug", "landing"),
+        meta_title="Hello world",
+        status=kwargs.pop("status", PageStatus.PUBLISHED),
+        **kwargs,
+    )
+    return PageRepository().create_page(page)
+
+
+def _keys(s3) -> list[str]:
+    response = s3.list_objects_v2(Bucket=BUCKET)
+    return sorted(obj["Key"] for obj in response.get("Contents", []))
+
+
+class TestPageRoutes:
+    """Tests for route resolution."""
+
+    def test_subdomain_only(self):
+        from complens.services.static_pages import page_routes
+
+        page = Page(workspace_id=WORKSPACE_ID, name="P", slug="p", subdomain="acme")
+
+        routes = page_routes(page)
+
+        assert [r.key for r in routes] == ["static/subdomain/acme"]
+        assert routes[0].canonical_url == "https://acme.test.complens.ai"
+
+    def test_site_domain_routes(self):
+        from complens.services.static_pages import page_routes
+
+        site = Site(workspace_id=WORKSPACE_ID, name="S", domain_name="acme.com")
+        page = Page(
+            workspace_id=WORKSPACE_ID, name="P", slug="p", subdomain="promo", site_id=site.id
+        )
+
+        routes = page_routes(page, site)
+
+        assert [r.key for r in routes] == [
+            "static/subdomain/promo",
+            "static/domain/promo.acme.com",
+            "static/domain/acme.com",
+        ]
+        # The root domain belongs to the first published page unless a default is set
+        assert routes[2].claim is False
+
+        site.settings["default_page_id"] = page.id
+        assert page_routes(page, site)[2].claim is True
+
+        site.settings["default_page_id"] = "other-page"
+        assert len(page_routes(page, site)) == 2
+
+
+class TestSyncPage:
+    """Tests for publishing pages to S3."""
+
+    def test_publishes_versioned_and_live_objects(self, static_bucket):
+        from complens.services.static_pages import HTML_CACHE_CONTROL, sync_page
+
+        s3, invalidate = static_bucket
+        page = _create_page(subdomain="acme")
+
+        changed = sync_page(page)
+
+        assert [r.key for r in changed] == ["static/subdomain/acme"]
+        keys = _keys(s3)
+        assert "static/subdomain/acme" in keys
+        assert any(k.startswith(f"pages/{page.id}/") and k.endswith(".html") for k in keys)
+
+        live = s3.get_object(Bucket=BUCKET, Key="static/subdomain/acme")
+        assert live["Metadata"]["page-id"] == page.id
+        assert live["CacheControl"] == HTML_CACHE_CONTROL
+        assert "Hello world" in live["Body"].read().decode()
+        invalidate.assert_called_once_with(subdomain=["acme"], custom_domain=None, page_id=page.id)
+
+    def test_unchanged_page_is_not_rewritten(self, static_bucket):
+        from complens.services.static_pages import sync_page
+
+        s3, invalidate = static_bucket
+        page = _create_page(subdomain="acme")
+        sync_page(page)
+        invalidate.reset_mock()
+
+        assert sync_page(page) == []
+        invalidate.assert_not_called()
+        assert len(_keys(s3)) == 2
+
+    def test_content_change_invalidates_route(self, static_bucket):
+        from complens.services.static_pages import sync_page
+
+        s3, invalidate = static_bucket
+        page = _create_page(subdomain="acme")
+        sync_page(page)
+        invalidate.reset_mock()
+
+        page.meta_title = "Brand new headline"
+        assert len(sync_page(page)) == 1
+        invalidate.assert_called_once()
+        body = s3.get_object(Bucket=BUCKET, Key="static/subdomain/acme")["Body"].read()
+        assert b"Brand new headline" in body
+
+    def test_subdomain_change_removes_old_route(self, static_bucket):
+        from complens.services.static_pages import page_routes, sync_page
+
+        s3, invalidate = static_bucket
+        page = _create_page(subdomain="old")
+        sync_page(page)
+        previous = page_routes(page)
+
+        page.subdomain = "new"
+        changed = sync_page(page, previous)
+
+        assert {r.key for r in changed} == {"static/subdomain/new", "static/subdomain/old"}
+        assert "static/subdomain/old" not in _keys(s3)
+
+    def test_unpublish_removes_route(self, static_bucket):
+        from complens.services.static_pages import page_routes, sync_page
+
+        s3, _ = static_bucket
+        page = _create_page(subdomain="acme")
+        sync_page(page)
+        previous = page_routes(page)
+
+        page.status = PageStatus.DRAFT
+        sync_page(page, previous)
+
+        assert "static/subdomain/acme" not in _keys(s3)
+
+    def test_does_not_remove_route_owned_by_another_page(self, static_bucket):
+        from complens.services.static_pages import remove_page, sync_page
+
+        s3, _ = static_bucket
+        first = _create_page(subdomain="acme", slug="first")
+        sync_page(first)
+        second = _create_page(subdomain="acme", slug="second")
+        sync_page(second)
+
+        assert remove_page(first) == []
+        live = s3.head_object(Bucket=BUCKET, Key="static/subdomain/acme")
+        assert live["Metadata"]["page-id"] == second.id
+
+    def test_without_bucket_only_invalidates(self, dynamodb_table):
+        from complens.services.static_pages import sync_page
+
+        page = _create_page(subdomain="acme")
+        with patch("complens.services.static_pages.invalidate_page_cache") as invalidate:
+            changed = sync_page(page)
+
+        assert [r.key for r in changed] == ["static/subdomain/acme"]
+        invalidate.assert_called_once()
+
+
+class TestRepublish:
+    """Tests for republishing after shared inputs change."""
+
+    def test_form_change_republishes_linked_pages(self, static_bucket):
+        from complens.models.form import Form
+        from complens.repositories.form import FormRepository
+        from complens.services.static_pages import republish_form_pages, sync_page
+
+        s3, _ = static_bucket
+        linked = _create_page(subdomain="linked", slug="linked")
+        other = _create_page(subdomain="other", slug="other")
+        sync_page(linked)
+        sync_page(other)
+
+        form = Form(workspace_id=WORKSPACE_ID, page_id=linked.id, name="Signup Form")
+        FormRepository().create_form(form)
+
+        assert republish_form_pages(form) == 1
+        body = s3.get_object(Bucket=BUCKET, Key="static/subdomain/linked")["Body"].read()
+        assert b"Signup Form" in body or form.id.encode() in body
+
+    def test_skips_unpublished_pages(self, static_bucket):
+        from complens.services.static_pages import republish_pages
+
+        s3, _ = static_bucket
+        _create_page(subdomain="draft", status=PageStatus.DRAFT)
+
+        assert republish_pages(WORKSPACE_ID) == 0
+        assert _keys(s3) == []
+
+
+class TestInvalidatePageCache:
+    """Tests for targeted CloudFront invalidation."""
+
+    def test_invalidates_only_page_paths(self):
+        from complens.services import cdn_service
+
+        with patch.object(cdn_service, "_get_distribution_ids", return_value=("SUB", "PAGES")), \
+                patch.object(cdn_service.boto3, "client") as client:
+            client.return_value.create_invalidation.return_value = {
+                "Invalidation": {"Id": "I1", "Status": "InProgress"}
+            }
+            cdn_service.invalidate_page_cache(
+                subdomain="acme", custom_domain=["acme.com", "promo.acme.com"], page_id="p1"
+            )
+
+        calls = client.return_value.create_invalidation.call_args_list
+        paths = {c.kwargs["DistributionId"]: c.kwargs["InvalidationBatch"]["Paths"] for c in calls}
+        assert paths["SUB"]["Items"] == ["/acme"]
+        assert paths["PAGES"]["Items"] == ["/acme.com", "/promo.acme.com"]
@@ -0,0 +1,119 @@
+"""Tests for concurrent block batch synthesis."""
+
+import re
+import threading
+import time
+
+import pytest
+
+from complens.models.business_profile import BusinessProfile
+from complens.services import synthesis_engine
+from complens.services.synthesis_engine import SynthesisEngine
+
+BLOCK_TYPES = ["hero", "cta", "form", "features", "testimonials", "stats", "faq"]
+
+
+class FakeBedrock:
+    """Stands in for invoke_claude_json, tracking concurrent block batch calls."""
+
+    def __init__(self, delay: float = 0.1, hang: str | None = None):
+        self.delay = delay
+        self.hang = hang
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt, system, workspace_id=None, model=None):
+        match = re.search(r"content for these blocks: (.+)", prompt)
+        if not match:
+            raise RuntimeError("Only block batches are answered")
+
+        block_types = match.group(1).split(", ")
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(2 if self.hang in block_types else self.delay)
+        finally:
+            with self._lock:
+                self.running -= 1
+        return {
+            "blocks": [
+                {"block_type": bt, "content": {"headline": f"Generated {bt}"}}
+                for bt in block_types
+            ]
+        }
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """Synthesis engine with a fixed profile and no knowledge base."""
+    engine = SynthesisEngine()
+    monkeypatch.setattr(
+        engine, "_get_profile",
+        lambda *args: BusinessProfile(workspace_id="ws-1", business_name="Acme"),
+    )
+    monkeypatch.setattr(synthesis_engine, "get_kb_context", lambda *args: "")
+    return engine
+
+
+def _synthesize(engine):
+    return engine.synthesize(
+        workspace_id="ws-1",
+        description="A landing page for Acme plumbing",
+        block_types=BLOCK_TYPES,
+        include_chat=False,
+    )
+
+
+class TestConcurrentBatches:
+    """Tests for the content synthesis stage."""
+
+    def test_batches_run_concurrently_up_to_the_request_cap(self, engine, monkeypatch):
+        bedrock = FakeBedrock(delay=0.2)
+        monkeypatch.setattr(synthesis_engine, "invoke_claude_json", bedrock)
+        monkeypatch.setattr(synthesis_engine, "BLOCK_BATCH_CONCURRENCY", 2)
+
+        result = _synthesize(engine)
+
+        # 7 blocks -> 3 batches, at most 2 in flight
+        assert bedrock.max_running == 2
+        assert {b.type for b in result.blocks} >= set(BLOCK_TYPES)
+        hero = next(b for b in result.blocks if b.type == "hero")
+        assert hero.config["headline"] == "Generated hero"
+
+    def test_timed_out_batch_falls_back_to_defaults(self, engine, monkeypatch):
+        monkeypatch.setattr(synthesis_engine, "invoke_claude_json", FakeBedrock(hang="faq"))
+        monkeypatch.setattr(synthesis_engine, "BLOCK_BATCH_TIMEOUT_SECONDS", 0.5)
+
+        started = time.perf_counter()
+        result = _synthesize(engine)
+
+        assert time.perf_counter() - started < 1.5
+        configs = {b.type: b.config for b in result.blocks}
+        assert configs["hero"]["headline"] == "Generated hero"
+        assert configs["faq"]["title"] == "Frequently Asked Questions"
+
+    def test_queued_batches_share_the_stage_deadline(self, engine, monkeypatch):
+        bedrock = FakeBedrock(delay=0.4)
+        monkeypatch.setattr(synthesis_engine, "invoke_claude_json", bedrock)
+        monkeypatch.setattr(synthesis_engine, "BLOCK_BATCH_CONCURRENCY", 1)
+        monkeypatch.setattr(synthesis_engine, "BLOCK_BATCH_TIMEOUT_SECONDS", 0.5)
+
+        result = _synthesize(engine)
+
+        # The second batch starts at 0.4s but must not get a fresh 0.5s deadline
+        assert result.metadata.stage_timings_ms["block_batches"] < 700
+        generated = [b for b in result.blocks if b.config.get("headline", "").startswith("Generated")]
+        assert 0 < len(generated) <= 3
+
+    def test_stage_timings_reported(self, engine, monkeypatch):
+        monkeypatch.setattr(synthesis_engine, "invoke_claude_json", FakeBedrock(delay=0.05))
+
+        timings = _synthesize(engine).metadata.stage_timings_ms
+
+        for stage in ("intent_analysis", "brand_foundation", "block_batches",
+                      "content_synthesis", "block_configuration", "total"):
+            assert stage in timings
+        assert timings["block_batches"] >= 50
+        assert timings["total"] >= timings["content_synthesis"] >= timings["block_batches"]
@@ -0,0 +1,94 @@
+"""Tests for workspace placement in the tenant router."""
+
+import hashlib
+from collections import Counter
+from unittest.mock import MagicMock
+
+from complens.queue.tenant_router import HashRing, QueueMessage, TenantRouter
+
+WORKSPACES = [f"ws-{i}" for i in range(5000)]
+SHARD_URLS = {i: f"https://sqs.us-east-1.amazonaws.com/123456789012/shard-{i}" for i in range(5)}
+
+
+def _router(**kwargs) -> TenantRouter:
+    kwargs.setdefault("shard_count", 4)
+    return TenantRouter(shard_queue_urls=SHARD_URLS, priority_queue_url="", **kwargs)
+
+
+def _message(workspace_id: str, group: str | None = None) -> QueueMessage:
+    return QueueMessage(workspace_id=workspace_id, message_body={}, message_group_id=group)
+
+
+class TestHashRing:
+    """Tests for the ring itself."""
+
+    def test_load_is_balanced(self):
+        ring = HashRing(shard_count=4)
+
+        counts = Counter(ring.get_shard(ws) for ws in WORKSPACES)
+
+        assert set(counts) == {0, 1, 2, 3}
+        assert max(counts.values()) < 1.15 * len(WORKSPACES) / 4
+
+    def test_adding_a_shard_moves_few_workspaces(self):
+        before, after = HashRing(shard_count=4), HashRing(shard_count=5)
+
+        moved = [ws for ws in WORKSPACES if before.get_shard(ws) != after.get_shard(ws)]
+
+        # Ideal is 1/5; modulo hashing would move about 4/5
+        assert len(moved) < 0.25 * len(WORKSPACES)
+        assert all(after.get_shard(ws) == 4 for ws in moved)
+
+
+class TestTenantRouter:
+    """Tests for placement and overrides."""
+
+    def test_pinned_workspace(self):
+        router = _router(overrides={"ws-pinned": 3})
+
+        assert router.get_shard_for_workspace("ws-pinned") == 3
+        assert router.get_shard_for_message(_message("ws-pinned")) == 3
+
+    def test_spread_workspace_rotates_and_keeps_groups_together(self):
+        router = _router(overrides={"ws-hot": [1, 2, 3]})
+
+        rotated = [router.get_shard_for_message(_message("ws-hot")) for _ in range(6)]
+        grouped = {router.get_shard_for_message(_message("ws-hot", "contact-1")) for _ in range(6)}
+
+        assert rotated == [1, 2, 3, 1, 2, 3]
+        assert len(grouped) == 1
+
+    def test_out_of_range_overrides_ignored(self):
+        router = _router(overrides={"ws-a": 9, "ws-b": [2, 7]})
+
+        assert router.overrides == {"ws-b": [2]}
+
+    def test_route_batch_spreads_hot_tenant(self):
+        router = _router(overrides={"ws-hot": [0, 1]})
+        router._sqs_client = MagicMock()
+        router._sqs_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": e["Id"], "MessageId": f"m-{e['Id']}"} for e in Entries],
+        }
+
+        results = router.route_batch([_message("ws-hot") for _ in range(4)])
+
+        assert Counter(r.shard_index for r in results) == {0: 2, 1: 2}
+
+    def test_modulo_placement_is_the_default(self, monkeypatch):
+        monkeypatch.delenv("SHARD_PLACEMENT", raising=False)
+        router = _router()
+
+        def baseline(ws):
+            return int.from_bytes(hashlib.md5(ws.encode()).digest()[:8], byteorder="big") % 4
+
+        assert router.placement == "modulo"
+        assert all(router.get_shard_for_workspace(ws) == baseline(ws) for ws in WORKSPACES)
+
+    def test_ring_placement(self):
+        router = _router(placement="ring")
+        ring = HashRing(shard_count=4)
+
+        assert all(router.get_shard_for_workspace(ws) == ring.get_shard(ws) for ws in WORKSPACES)
+
+    def test_invalid_placement_falls_back_to_modulo(self):
+        assert _router(placement="bogus").placement == "modulo"
@@ -0,0 +1,145 @@
+"""Tests for the compiled workflow trigger index."""
+
+from complens.models.workflow import Workflow, WorkflowEdge, WorkflowStatus
+from complens.models.workflow_node import WorkflowNode
+from complens.queue.trigger_index import TriggerIndex, TriggerIndexCache
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+def _workflow(workflow_id, trigger_type, config, status=WorkflowStatus.ACTIVE):
+    """Build a two-node workflow with the given trigger."""
+    return Workflow(
+        id=workflow_id,
+        workspace_id=WORKSPACE_ID,
+        name=f"Workflow {workflow_id}",
+        status=status,
+        nodes=[
+            WorkflowNode(id="t1", node_type=trigger_type, data={"config": config}),
+            WorkflowNode(id="a1", node_type="action_send_email", data={"config": {}}),
+        ],
+        edges=[WorkflowEdge(id="e1", source="t1", target="a1")],
+    )
+
+
+class TestTriggerIndex:
+    """Tests for TriggerIndex compilation and lookup."""
+
+    def test_lookup_by_tag(self):
+        """Tag triggers are keyed by tag name, plus untagged wildcards."""
+        index = TriggerIndex.build(WORKSPACE_ID, [
+            _workflow("wf-hot", "trigger_tag_added", {"tag_name": "hot"}),
+            _workflow("wf-cold", "trigger_tag_added", {"tag_name": "cold"}),
+            _workflow("wf-any", "trigger_tag_added", {}),
+            _workflow("wf-form", "trigger_form_submitted", {"form_id": "f1"}),
+        ])
+
+        ids = {e.workflow_id for e in index.lookup("trigger_tag_added", {"tag": "hot"})}
+
+        assert ids == {"wf-hot", "wf-any"}
+
+    def test_lookup_webhook_path_normalized(self):
+        """Webhook paths match regardless of surrounding slashes."""
+        index = TriggerIndex.build(WORKSPACE_ID, [
+            _workflow("wf-hook", "trigger_webhook", {"webhook_path": "/orders/"}),
+        ])
+
+        entries = index.lookup("trigger_webhook", {"webhook_path": "orders"})
+
+        assert [e.workflow_id for e in entries] == ["wf-hook"]
+
+    def test_lookup_unknown_type_returns_nothing(self):
+        """Trigger types with no workflows return no candidates."""
+        index = TriggerIndex.build(WORKSPACE_ID, [
+            _workflow("wf-hot", "trigger_tag_added", {"tag_name": "hot"}),
+        ])
+
+        assert index.lookup("trigger_page_visit", {"page_id": "p1"}) == []
+
+    def test_item_round_trip(self):
+        """Index survives serialization to a DynamoDB item."""
+        index = TriggerIndex.build(WORKSPACE_ID, [
+            _workflow("wf-form", "trigger_form_submitted", {"form_id": "f1"}),
+        ])
+
+        restored = TriggerIndex.from_item(index.to_item())
+
+        assert restored.version == index.version
+        entries = restored.lookup("trigger_form_submitted", {"form_id": "f1"})
+        assert entries[0].workflow_id == "wf-form"
+        assert entries[0].trigger_node.get_config() == {"form_id": "f1"}
+
+
+class TestTriggerIndexMaintenance:
+    """Tests for index rebuilds on workflow writes and the container cache."""
+
+    def test_index_rebuilt_on_create_and_pause(self, dynamodb_table):
+        """Creating and pausing workflows updates the stored index."""
+        from complens.repositories.workflow import WorkflowRepository
+
+        repo = WorkflowRepository()
+        repo.create_workflow(_workflow("wf-1", "trigger_tag_added", {"tag_name": "vip"}))
+
+        index = repo.get_trigger_index(WORKSPACE_ID)
+        assert [e.workflow_id for e in index.lookup("trigger_tag_added", {"tag": "vip"})] == [
+            "wf-1"
+        ]
+
+        repo.pause(WORKSPACE_ID, "wf-1")
+
+        paused_index = repo.get_trigger_index(WORKSPACE_ID)
+        assert paused_index.version != index.version
+        assert paused_index.lookup("trigger_tag_added", {"tag": "vip"}) == []
+
+    def test_stale_rebuild_cannot_overwrite_newer_index(self, dynamodb_table, monkeypatch):
+        """A rebuild that started earlier loses to one that already stored."""
+        from complens.repositories import workflow as workflow_module
+        from complens.repositories.workflow import WorkflowRepository
+
+        repo = WorkflowRepository()
+        repo.create_workflow(_workflow("wf-5", "trigger_tag_added", {"tag_name": "vip"}))
+        newer = repo.get_trigger_index(WORKSPACE_ID)
+
+        # Simulate a rebuild that started before the one above finished
+        monkeypatch.setattr(workflow_module.time, "time_ns", lambda: 1)
+        result = repo.rebuild_trigger_index(WORKSPACE_ID)
+
+        assert result.version == newer.version
+        assert repo.get_trigger_index(WORKSPACE_ID).version == newer.version
+
+    def test_cache_reloads_on_version_change(self, dynamodb_table):
+        """The cache serves the stored index until its version changes."""
+        from complens.repositories.workflow import WorkflowRepository
+
+        repo = WorkflowRepository()
+        cache = TriggerIndexCache(ttl_seconds=0, repository=repo)
+
+        first = cache.get(WORKSPACE_ID)
+        assert first.entries == []
+
+        # Unchanged version: served from cache
+        assert cache.get(WORKSPACE_ID) is first
+
+        repo.create_workflow(_workflow("wf-2", "trigger_form_submitted", {"form_id": "f9"}))
+
+        refreshed = cache.get(WORKSPACE_ID)
+        assert refreshed is not first
+        assert [e.workflow_id for e in refreshed.entries] == ["wf-2"]
+
+    def test_workspace_delete_drops_index(self, dynamodb_table, monkeypatch):
+        """The admin cascade delete removes the index and the cached copy."""
+        from complens.queue import trigger_index
+        from complens.repositories.workflow import WorkflowRepository
+        from complens.services.admin_service import AdminService
+
+        repo = WorkflowRepository()
+        repo.create_workflow(_workflow("wf-3", "trigger_tag_added", {"tag_name": "vip"}))
+
+        cache = TriggerIndexCache(repository=repo)
+        monkeypatch.setattr(trigger_index, "_trigger_index_cache", cache)
+        assert cache.get(WORKSPACE_ID).entries
+
+        AdminService().delete_workspace_data(WORKSPACE_ID, "agency-1")
+
+        assert repo.get_trigger_index(WORKSPACE_ID) is None
+        assert WORKSPACE_ID not in cache._indexes
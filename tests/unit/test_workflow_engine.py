@@ -0,0 +1,86 @@
+"""Tests for WorkflowEngine graph traversal."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from complens.models.contact import Contact
+from complens.models.workflow import Workflow, WorkflowEdge
+from complens.models.workflow_node import WorkflowNode
+from complens.models.workflow_run import WorkflowRun
+from complens.nodes.base import NodeResult
+from complens.services import workflow_engine
+from complens.services.workflow_engine import WorkflowEngine
+
+WORKSPACE_ID = "test-workspace-456"
+
+
+class _CountingNode:
+    """Node stub that counts executions and completes."""
+
+    def __init__(self, node_id):
+        self.node_id = node_id
+
+    async def execute(self, context):
+        return NodeResult.completed(variables={"count": context.variables.get("count", 0) + 1})
+
+
+def _chain(length, loop_back=False):
+    """Build a linear workflow, optionally looping the last node to the first."""
+    nodes = [WorkflowNode(id="n0", node_type="trigger_tag_added")] + [
+        WorkflowNode(id=f"n{i}", node_type="action_update_contact") for i in range(1, length)
+    ]
+    edges = [
+        WorkflowEdge(id=f"e{i}", source=f"n{i}", target=f"n{i + 1}") for i in range(length - 1)
+    ]
+    if loop_back:
+        edges.append(WorkflowEdge(id="loop", source=f"n{length - 1}", target="n1"))
+    return Workflow(id="wf-1", workspace_id=WORKSPACE_ID, name="Chain", nodes=nodes, edges=edges)
+
+
+def _run(workflow, engine):
+    """Traverse a workflow from its trigger and return the recorded steps."""
+    run = WorkflowRun(workflow_id=workflow.id, workspace_id=WORKSPACE_ID, trigger_type="manual")
+    asyncio.run(engine._execute_from_node(
+        workflow=workflow,
+        run=run,
+        contact=Contact(workspace_id=WORKSPACE_ID),
+        conversation=None,
+        current_node_id="n0",
+        variables={},
+        trigger_data={},
+        step_sequence=0,
+    ))
+    return engine.step_repo.create_step.call_args_list
+
+
+@pytest.fixture
+def engine():
+    """WorkflowEngine with mock repositories and counting nodes."""
+    with patch.object(
+        workflow_engine,
+        "_get_node_for_type",
+        side_effect=lambda node_id, node_type, config: _CountingNode(node_id),
+    ):
+        yield WorkflowEngine(
+            workflow_repo=MagicMock(), run_repo=MagicMock(), step_repo=MagicMock()
+        )
+
+
+class TestWorkflowTraversal:
+    """Tests for iterative traversal."""
+
+    def test_long_chain_runs_without_recursion(self, engine):
+        """Long chains complete without growing the call stack."""
+        steps = _run(_chain(900), engine)
+
+        assert len(steps) == 900
+        assert steps[-1].args[0].sequence == 899
+
+    def test_go_to_loop_is_bounded(self, engine):
+        """A loop with no exit fails cleanly at the step limit."""
+        with pytest.raises(Exception, match="exceeded"):
+            _run(_chain(3, loop_back=True), engine)
+
+        assert engine.step_repo.create_step.call_count == workflow_engine.MAX_EXECUTION_STEPS
@@ -0,0 +1,204 @@
+"""Tests for WebSocket fan-out of workflow events."""
+
+import json
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from complens.services import workflow_events
+from complens.services.workflow_events import (
+    EventCoalescer,
+    broadcast_to_workspace,
+    broadcast_workflow_events,
+    emit_workflow_event,
+)
+
+TABLE = "complens-test-connections"
+ENDPOINT = "https://ws.example.com/test"
+
+
+class GoneException(Exception):
+    """Stand-in for the API Gateway GoneException."""
+
+
+@pytest.fixture
+def connections(aws_credentials, monkeypatch):
+    """Moto connections table plus a fake management API client."""
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        table = dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "connectionId", "KeyType": "HASH"}],
+            AttributeDefinitions=[
+                {"AttributeName": "connectionId", "AttributeType": "S"},
+                {"AttributeName": "workspaceId", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[{
+                "IndexName": "WorkspaceIdIndex",
+                "KeySchema": [{"AttributeName": "workspaceId", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        monkeypatch.setattr(workflow_events, "_dynamodb", dynamodb)
+
+        apigw = MagicMock()
+        apigw.exceptions.GoneException = GoneException
+        monkeypatch.setitem(workflow_events._apigw_clients, ENDPOINT, apigw)
+        yield table, apigw
+
+
+def _connect(table, *connection_ids, workspace_id="ws-1", subscriptions=None):
+    for connection_id in connection_ids:
+        item = {"connectionId": connection_id, "workspaceId": workspace_id}
+        if subscriptions:
+            item["subscriptions"] = set(subscriptions)
+        table.put_item(Item=item)
+
+
+def _node_event(run_id, timestamp, node_id="n1", status="completed"):
+    return {
+        "workspace_id": "ws-1",
+        "message": {
+            "action": "workflow_event",
+            "event": f"node.{status}",
+            "workflow_id": "wf-1",
+            "workspace_id": "ws-1",
+            "run_id": run_id,
+            "node_id": node_id,
+            "status": status,
+            "timestamp": timestamp,
+        },
+        "connections_table": TABLE,
+        "ws_endpoint": ENDPOINT,
+    }
+
+
+def _posts(apigw):
+    return [
+        (call.kwargs["ConnectionId"], json.loads(call.kwargs["Data"]))
+        for call in apigw.post_to_connection.call_args_list
+    ]
+
+
+class TestBroadcast:
+    """Tests for direct broadcasts."""
+
+    def test_posts_to_every_connection_and_caches_the_list(self, connections):
+        table, apigw = connections
+        _connect(table, *(f"c{i}" for i in range(20)))
+
+        assert broadcast_to_workspace("ws-1", {"event": "a"}, TABLE, ENDPOINT) == 20
+
+        # A dashboard opened within the cache TTL is picked up when it expires
+        _connect(table, "late")
+        assert broadcast_to_workspace("ws-1", {"event": "b"}, TABLE, ENDPOINT) == 20
+        assert apigw.post_to_connection.call_count == 40
+
+    def test_gone_connections_deleted_and_forgotten(self, connections):
+        table, apigw = connections
+        _connect(table, "live", "gone-1", "gone-2")
+
+        def post(ConnectionId, Data):
+            if ConnectionId.startswith("gone"):
+                raise GoneException()
+
+        apigw.post_to_connection.side_effect = post
+
+        assert broadcast_to_workspace("ws-1", {"event": "a"}, TABLE, ENDPOINT) == 1
+        assert [item["connectionId"] for item in table.scan()["Items"]] == ["live"]
+
+        apigw.post_to_connection.reset_mock()
+        broadcast_to_workspace("ws-1", {"event": "b"}, TABLE, ENDPOINT)
+        apigw.post_to_connection.assert_called_once()
+
+
+class TestQueuedBroadcast:
+    """Tests for handing broadcasts off to the broadcast queue."""
+
+    def test_queued_event_broadcast_by_worker(self, connections, monkeypatch):
+        table, apigw = connections
+        _connect(table, "c1", "c2")
+        sqs = boto3.client("sqs", region_name="us-east-1")
+        queue_url = sqs.create_queue(QueueName="complens-test-broadcast")["QueueUrl"]
+        monkeypatch.setattr(workflow_events, "_sqs_client", sqs)
+        monkeypatch.setenv("BROADCAST_QUEUE_URL", queue_url)
+        monkeypatch.setenv("WEBSOCKET_ENDPOINT", ENDPOINT)
+        monkeypatch.setenv("CONNECTIONS_TABLE", TABLE)
+
+        assert emit_workflow_event("ws-1", "node.executing", "wf-1", run_id="run-1") == 0
+        apigw.post_to_connection.assert_not_called()
+
+        from workflow_event_broadcaster import handler
+
+        message = sqs.receive_message(QueueUrl=queue_url)["Messages"][0]
+        result = handler({"Records": [{"body": message["Body"]}]}, None)
+
+        assert result == {"events": 1, "sent": 2, "invalid": 0}
+        data = json.loads(apigw.post_to_connection.call_args.kwargs["Data"])
+        assert data["event"] == "node.executing"
+        assert data["run_id"] == "run-1"
+
+
+class TestCoalescing:
+    """Tests for summarizing high-frequency workflow events."""
+
+    def test_events_over_allowance_become_one_summary_frame(self, connections):
+        table, apigw = connections
+        _connect(table, "dash-1", "dash-2")
+        coalescer = EventCoalescer(window_seconds=1, full_events=2, clock=lambda: 1_000.5)
+
+        batch = [_node_event(f"run-{i}", 1_000_000 + i) for i in range(50)]
+        batch += [_node_event(f"run-{i}", 1_000_100 + i, status="failed") for i in range(5)]
+        sent = broadcast_workflow_events(batch, coalescer)
+
+        messages = [message for _, message in _posts(apigw)]
+        assert sent == len(messages) == 2 * 3
+        summary = messages[-1]
+        assert summary["action"] == "workflow_summary"
+        assert summary["window_start"] == 1_000_000
+        assert summary["events"] == 53
+        assert sorted((c["status"], c["count"]) for c in summary["counts"]) == [
+            ("completed", 48),
+            ("failed", 5),
+        ]
+
+        # The allowance is per window and carries across batches
+        apigw.post_to_connection.reset_mock()
+        broadcast_workflow_events([_node_event("run-x", 1_000_900)], coalescer)
+        assert [m["action"] for _, m in _posts(apigw)] == ["workflow_summary"] * 2
+        apigw.post_to_connection.reset_mock()
+        broadcast_workflow_events([_node_event("run-y", 1_001_000)], coalescer)
+        assert [m["action"] for _, m in _posts(apigw)] == ["workflow_event"] * 2
+
+    def test_run_subscribers_get_every_event_of_their_run(self, connections):
+        table, apigw = connections
+        _connect(table, "dash")
+        _connect(table, "watcher", subscriptions={"workflow:ws-1", "run:run-7"})
+        coalescer = EventCoalescer(window_seconds=1, full_events=0, clock=lambda: 1_000.5)
+
+        batch = [_node_event(f"run-{i}", 1_000_000, node_id=f"n{i % 3}") for i in range(10)]
+        broadcast_workflow_events(batch, coalescer)
+
+        posts = _posts(apigw)
+        full = [(connection_id, m["run_id"]) for connection_id, m in posts
+                if m["action"] == "workflow_event"]
+        assert full == [("watcher", "run-7")]
+        summaries = [connection_id for connection_id, m in posts
+                     if m["action"] == "workflow_summary"]
+        assert sorted(summaries) == ["dash", "watcher"]
+
+    def test_other_actions_are_never_coalesced(self, connections):
+        table, apigw = connections
+        _connect(table, "dash")
+        coalescer = EventCoalescer(full_events=0)
+
+        progress = {
+            "workspace_id": "ws-1",
+            "message": {"action": "import_progress", "workspace_id": "ws-1"},
+            "connections_table": TABLE,
+            "ws_endpoint": ENDPOINT,
+        }
+        assert broadcast_workflow_events([progress] * 3, coalescer) == 3
@@ -40,6 +40,27 @@ export interface WorkflowEvent {
   timestamp: number;
 }
 
+/**
+ * Per-second counts of workflow events that were not sent individually.
+ *
+ * During bulk runs the broadcaster only sends the first few events per
+ * second in full; subscribe to a run's channel for all of its events.
+ */
+export interface WorkflowSummary {
+  action: 'workflow_summary';
+  workspace_id: string;
+  window_start: number;
+  window_seconds: number;
+  events: number;
+  counts: {
+    workflow_id: string;
+    node_id: string | null;
+    status: string;
+    count: number;
+  }[];
+  timestamp: number;
+}
+
 interface UseWorkflowEventsOptions {
   /** Workspace ID to subscribe to */
   workspaceId: string;
@@ -57,6 +78,8 @@ interface UseWorkflowEventsOptions {
   onNodeCompleted?: (event: WorkflowEvent) => void;
   /** Called when a node fails */
   onNodeFailed?: (event: WorkflowEvent) => void;
+  /** Called with counts of events coalesced during bulk runs */
+  onSummary?: (summary: WorkflowSummary) => void;
   /** Whether to auto-invalidate workflow queries on events */
   autoInvalidate?: boolean;
   /** Whether to auto-connect (default: true) */
@@ -100,6 +123,7 @@ export function useWorkflowEvents(
     onNodeExecuting,
     onNodeCompleted,
     onNodeFailed,
+    onSummary,
     autoInvalidate = true,
     enabled = true,
   } = options;
@@ -178,6 +202,22 @@ export function useWorkflowEvents(
     ]
   );
 
+  const handleSummary = useCallback(
+    (summary: WorkflowSummary) => {
+      onSummary?.(summary);
+
+      if (autoInvalidate) {
+        const workflowIds = new Set(summary.counts.map((c) => c.workflow_id));
+        workflowIds.forEach((workflowId) => {
+          queryClient.invalidateQueries({
+            queryKey: ['workflows', workspaceId, workflowId, 'runs'],
+          });
+        });
+      }
+    },
+    [onSummary, autoInvalidate, queryClient, workspaceId]
+  );
+
   const connect = useCallback(async () => {
     if (!WS_URL || !enabled || !user) return;
 
@@ -226,6 +266,10 @@ export function useWorkflowEvents(
             if (data.workspace_id === workspaceId) {
               handleEvent(data as WorkflowEvent);
             }
+          } else if (data.action === 'workflow_summary') {
+            if (data.workspace_id === workspaceId) {
+              handleSummary(data as WorkflowSummary);
+            }
           } else if (data.action === 'pong') {
             // Heartbeat response, ignore
           }
@@ -254,7 +298,7 @@ export function useWorkflowEvents(
     } catch (e) {
       console.error('Failed to connect WebSocket:', e);
     }
-  }, [WS_URL, enabled, user, workspaceId, handleEvent]);
+  }, [WS_URL, enabled, user, workspaceId, handleEvent, handleSummary]);
 
   const reconnect = useCallback(() => {
     reconnectAttempts.current = 0;